@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from functools import partial
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.adaptive_concurrency import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitChange,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import run_tasks
+
+
+def test_unit_adaptive_limiter_grows_by_one_per_round_of_successes():
+    limiter = AdaptiveConcurrencyLimiter(2, AdaptiveConcurrency(max_limit=4))
+
+    for _ in range(2 + 3 + 4 + 4):
+        limiter.record_response(200, latency=0.1)
+
+    assert [change.limit for change in limiter.history] == [2, 3, 4]
+    assert limiter.limit == 4
+
+
+def test_unit_adaptive_limiter_shrinks_once_per_congestion_burst():
+    changes: list[ConcurrencyLimitChange] = []
+    limiter = AdaptiveConcurrencyLimiter(
+        8,
+        AdaptiveConcurrency(on_limit_change=changes.append),
+        operation_id="operation",
+    )
+
+    limiter.record_response(503, latency=10.0)
+    # Started before the decrease, so it reports the same overload.
+    limiter.record_error(httpx.ReadTimeout("timed out"), latency=10.0)
+    assert limiter.limit == 4
+
+    limiter.record_error(httpx.ReadTimeout("timed out"), latency=0.0)
+    # Client errors say nothing about the server load.
+    limiter.record_response(422, latency=0.0)
+
+    assert [(change.limit, change.reason) for change in changes] == [
+        (8, "initial"),
+        (4, "status_503"),
+        (2, "transport_error"),
+    ]
+    assert changes == limiter.history
+    assert changes[1].previous_limit == 8
+    assert changes[1].operation_id == "operation"
+
+
+def test_unit_adaptive_limiter_shrinks_on_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(10, AdaptiveConcurrency(min_limit=6))
+
+    for _ in range(3):
+        limiter.record_response(200, latency=1.0)
+    limiter.record_response(200, latency=5.0)
+
+    assert (limiter.limit, limiter.history[-1].reason) == (6, "latency_spike")
+
+
+def test_unit_adaptive_concurrency_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(min_limit=5, max_limit=4)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(decrease_ratio=1.0)
+
+
+@pytest.mark.asyncio
+async def test_unit_run_tasks_adapts_requests_in_flight():
+    in_flight = 0
+    max_in_flight: list[int] = []
+
+    async def _overloaded_request(
+        async_client: httpx.AsyncClient,
+        limiter: AdaptiveConcurrencyLimiter,
+        index: int,
+    ) -> httpx.Response:
+        nonlocal in_flight
+        async with limiter:
+            in_flight += 1
+            max_in_flight.append(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            status_code = 503 if index == 1 else 200
+            limiter.record_response(status_code, latency=0.01)
+            return httpx.Response(status_code)
+
+    responses = await run_tasks(
+        [partial(_overloaded_request, index=index) for index in range(1, 9)],
+        allow_failed=True,
+        concurrency_level=4,
+        adaptive_concurrency=AdaptiveConcurrency(),
+    )
+
+    assert len(responses) == 8
+    assert max_in_flight[:4] == [1, 2, 3, 4]
+    # The 503 halved the limit, so only two requests ran at once afterwards.
+    assert max(max_in_flight[4:6]) <= 2
+
+
+@pytest.mark.asyncio
+async def test_unit_call_api_async_reports_attempts_to_adaptive_limiter():
+    limiter = AdaptiveConcurrencyLimiter(1, AdaptiveConcurrency())
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])),
+    ) as client:
+        response = await request_utils.call_api_async(
+            client=client,
+            pdf_chunk_request=httpx.Request("POST", "http://localhost:8888/general/v0/general"),
+            pdf_chunk_file=io.BytesIO(b"%PDF"),
+            limiter=limiter,
+        )
+
+    assert response.status_code == 200
+    assert [(change.limit, change.reason) for change in limiter.history] == [
+        (1, "initial"),
+        (2, "success"),
+    ]
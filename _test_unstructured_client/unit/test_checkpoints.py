@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import io
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.checkpoints import (
+    CHECKPOINT_MAX_AGE_SECONDS,
+    CHECKPOINTS_DIR_NAME,
+    SplitCheckpoint,
+    get_operation_fingerprint,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import SplitPdfHook
+
+
+def test_unit_operation_fingerprint_ignores_how_the_chunks_are_sent():
+    pdf_file = io.BytesIO(b"%PDF-1.7 document")
+    pdf_file.seek(5)
+    form_data = {"strategy": "hi_res", "split_pdf_concurrency_level": "5"}
+
+    fingerprint = get_operation_fingerprint(pdf_file, "document.pdf", form_data)
+
+    assert pdf_file.tell() == 5
+    assert fingerprint == get_operation_fingerprint(
+        pdf_file,
+        "document.pdf",
+        {
+            "strategy": "hi_res",
+            "split_pdf_concurrency_level": "10",
+            "split_pdf_allow_failed": "true",
+            "split_pdf_page_range[]": ["3", "9"],
+        },
+    )
+    assert fingerprint != get_operation_fingerprint(
+        pdf_file, "document.pdf", {"strategy": "fast"}
+    )
+    assert fingerprint != get_operation_fingerprint(
+        io.BytesIO(b"%PDF-1.7 other document"), "document.pdf", form_data
+    )
+
+
+def test_unit_checkpoint_journal_survives_until_every_chunk_completed(tmp_path):
+    checkpoint = SplitCheckpoint.open(tmp_path, "fingerprint", chunk_count=2)
+    checkpoint.record((0, 10), b'[{"type": "Title"}]')
+    assert not checkpoint.is_complete
+
+    resumed = SplitCheckpoint.open(tmp_path, "fingerprint", chunk_count=2)
+    assert resumed.journaled_chunk_count == 1
+    assert resumed.load((0, 10)) == b'[{"type": "Title"}]'
+    assert resumed.load((10, 20)) is None
+
+    resumed.record((10, 20), b"[]")
+    assert resumed.is_complete
+    resumed.discard()
+    assert not resumed.directory.exists()
+
+
+def test_unit_checkpoint_deletes_expired_journals(tmp_path):
+    expired = SplitCheckpoint.open(tmp_path, "expired", chunk_count=1).directory
+    expired_at = time.time() - CHECKPOINT_MAX_AGE_SECONDS - 1
+    os.utime(expired, (expired_at, expired_at))
+
+    SplitCheckpoint.open(tmp_path, "current", chunk_count=1)
+
+    assert sorted(path.name for path in (tmp_path / CHECKPOINTS_DIR_NAME).iterdir()) == [
+        "current"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unit_call_api_partial_resumes_and_records_chunks(tmp_path):
+    checkpoint = SplitCheckpoint.open(tmp_path, "fingerprint", chunk_count=2)
+    checkpoint.record((0, 2), b'[{"type": "Title"}]')
+    chunk_response = httpx.Response(200, json=[{"type": "NarrativeText"}])
+
+    async def _call_api_partial(page_range):
+        return await SplitPdfHook().call_api_partial(
+            pdf_chunk_request=httpx.Request("POST", "http://localhost:8000/general/v0/general"),
+            pdf_chunk_file=io.BytesIO(b"%PDF"),
+            limiter=None,
+            _operation_id="operation",
+            chunk_index=page_range[0] // 2 + 1,
+            page_number=page_range[0] + 1,
+            async_client=None,
+            retry_config=None,
+            cache_tmp_data_feature=False,
+            temp_dir_path=None,
+            checkpoint=checkpoint,
+            page_range=page_range,
+        )
+
+    with patch.object(
+        request_utils, "call_api_async", new=AsyncMock(return_value=chunk_response)
+    ) as call_api:
+        resumed = await _call_api_partial((0, 2))
+        sent = await _call_api_partial((2, 4))
+
+    call_api.assert_called_once()
+    assert resumed.json() == [{"type": "Title"}]
+    assert sent.json() == [{"type": "NarrativeText"}]
+    assert checkpoint.is_complete
+    assert checkpoint.load((2, 4)) == chunk_response.content
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom.chunk_planner import (
+    ChunkPlan,
+    estimate_page_costs,
+    get_page_cost,
+    plan_chunks,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import LazyChunkTasks, run_tasks
+
+SAMPLE_DOCS_DIR = Path(__file__).parents[2] / "_sample_docs"
+
+
+def test_unit_plan_chunks_balances_cost_and_dispatches_heaviest_first():
+    page_costs = [1.0] * 6 + [5.0] * 2 + [1.0] * 4
+
+    chunk_plan = plan_chunks(page_costs, page_offset=2, chunk_count=3, max_pages=20)
+
+    assert chunk_plan == ChunkPlan(
+        page_ranges=[(2, 8), (8, 9), (9, 14)],
+        chunk_costs=[6.0, 5.0, 9.0],
+        dispatch_order=[3, 1, 2],
+    )
+    assert chunk_plan.dispatch_page_ranges == [(9, 14), (2, 8), (8, 9)]
+
+
+def test_unit_plan_chunks_respects_max_pages():
+    chunk_plan = plan_chunks([1.0] * 10, page_offset=0, chunk_count=5, max_pages=2)
+
+    assert chunk_plan.page_ranges == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10)]
+
+
+def test_unit_page_cost_weighs_images_by_strategy():
+    letter_page_area = 612 * 792
+
+    text_page = get_page_cost("hi_res", letter_page_area, 100, 0)
+    scanned_page = get_page_cost("hi_res", letter_page_area, 0, letter_page_area)
+
+    assert text_page == pytest.approx(1.2)
+    assert scanned_page > 4 * text_page
+    assert get_page_cost("fast", letter_page_area, 0, letter_page_area) < text_page
+
+
+def test_unit_estimate_page_costs_reads_page_content():
+    text_pdf = (SAMPLE_DOCS_DIR / "layout-parser-paper-fast.pdf").read_bytes()
+    image_pdf = (SAMPLE_DOCS_DIR / "list-item-example-1.pdf").read_bytes()
+
+    text_costs = estimate_page_costs(text_pdf, (0, 2), "hi_res")
+    image_costs = estimate_page_costs(image_pdf, (0, 1), "hi_res")
+
+    assert len(text_costs) == 2
+    assert image_costs[0] > max(text_costs)
+
+
+@pytest.mark.asyncio
+async def test_unit_results_keep_page_order_when_chunks_are_dispatched_out_of_order():
+    dispatched: list[int] = []
+
+    async def _send(chunk_index: int, async_client, limiter) -> httpx.Response:
+        dispatched.append(chunk_index)
+        await asyncio.sleep(0)
+        return httpx.Response(200, json=[{"chunk_index": chunk_index}])
+
+    chunk_tasks = LazyChunkTasks(
+        [(io.BytesIO(b"%PDF"), page_index) for page_index in range(3)],
+        chunk_count=3,
+        build_task=lambda _file, _page_index, chunk_index: partial(_send, chunk_index),
+        chunk_indices=[3, 1, 2],
+    )
+
+    results = await run_tasks(chunk_tasks, concurrency_level=1)
+
+    assert dispatched == [3, 1, 2]
+    assert [index for index, _ in results] == [1, 2, 3]
+    assert [response.json() for _, response in results] == [
+        [{"chunk_index": 1}], [{"chunk_index": 2}], [{"chunk_index": 3}]
+    ]
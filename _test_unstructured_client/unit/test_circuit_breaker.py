@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom import circuit_breaker as circuit_breaker_module
+from unstructured_client._hooks.custom.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    CircuitStateChange,
+)
+from unstructured_client._hooks.types import CircuitStateChangeHook
+from unstructured_client.models import errors, operations
+
+BASE_URL = "http://localhost:8000"
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeMonotonic()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", clock)
+    return clock
+
+
+def _fail(breaker: CircuitBreaker, times: int = 1):
+    changes = []
+    for _ in range(times):
+        changes.append(breaker.record(breaker.acquire(BASE_URL), True))
+    return changes
+
+
+def test_unit_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    _fail(breaker, 2)
+    breaker.record(breaker.acquire(BASE_URL), False)
+
+    # A success resets the count.
+    assert _fail(breaker, 3)[-1].state is CircuitState.OPEN
+    with pytest.raises(errors.CircuitOpenError) as exc_info:
+        breaker.acquire(BASE_URL)
+    assert exc_info.value.retry_in == 10
+    # Other base URLs have their own circuit.
+    breaker.acquire("http://other:8000")
+
+
+@pytest.mark.parametrize(
+    ("probe_failed", "expected_state"),
+    [(False, CircuitState.CLOSED), (True, CircuitState.OPEN)],
+)
+def test_unit_circuit_probes_once_reset_timeout_passed(clock, probe_failed, expected_state):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    _fail(breaker)
+    clock.now = 10
+
+    probe = breaker.acquire(BASE_URL)
+    assert probe.change is not None and probe.change.state is CircuitState.HALF_OPEN
+    # One probe at a time.
+    with pytest.raises(errors.CircuitOpenError):
+        breaker.acquire(BASE_URL)
+
+    change = breaker.record(probe, probe_failed)
+    assert change is not None and change.state is expected_state
+    assert breaker.state(BASE_URL) is expected_state
+
+
+class RecordingHook(CircuitStateChangeHook):
+    def __init__(self) -> None:
+        self.changes: list[CircuitStateChange] = []
+
+    def circuit_state_change(self, hook_ctx, change):
+        self.changes.append(change)
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_unit_open_circuit_fails_calls_fast(clock, is_async):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(503, request=request)
+
+    session = UnstructuredClient(
+        server_url=BASE_URL,
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30),
+    )
+    hook = RecordingHook()
+    session.sdk_configuration.__dict__["_hooks"].register_circuit_state_change_hook(hook)
+
+    def list_jobs():
+        request = operations.ListJobsRequest()
+        if is_async:
+            return asyncio.run(session.jobs.list_jobs_async(request=request, retries=None))
+        return session.jobs.list_jobs(request=request, retries=None)
+
+    for _ in range(2):
+        with pytest.raises(errors.SDKError):
+            list_jobs()
+    with pytest.raises(errors.CircuitOpenError):
+        list_jobs()
+
+    assert len(sent) == 2
+    assert [(c.base_url, c.state) for c in hook.changes] == [(BASE_URL, CircuitState.OPEN)]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent import futures
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom.client_pool import (
+    DEFAULT_SPLIT_PDF_LIMITS,
+    POOL_LOOP_THREAD_NAME,
+    SplitPdfClientPool,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import SplitPdfHook
+from unstructured_client._hooks.sdkhooks import SDKHooks
+
+
+def _pool_threads() -> list[threading.Thread]:
+    return [thread for thread in threading.enumerate() if thread.name == POOL_LOOP_THREAD_NAME]
+
+
+def test_unit_pool_reuses_background_client_across_submissions():
+    pool = SplitPdfClientPool()
+
+    async def _get_client() -> httpx.AsyncClient:
+        return pool.get_client()
+
+    try:
+        first_client = pool.submit(_get_client()).future.result(timeout=5)
+        second_client = pool.submit(_get_client()).future.result(timeout=5)
+    finally:
+        pool.close()
+
+    assert first_client is second_client
+    assert first_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_unit_pool_keeps_one_client_per_event_loop():
+    pool = SplitPdfClientPool()
+
+    async def _get_client() -> httpx.AsyncClient:
+        return pool.get_client()
+
+    try:
+        caller_client = pool.get_client()
+        background_client = pool.submit(_get_client()).future.result(timeout=5)
+
+        assert pool.get_client() is caller_client
+        assert background_client is not caller_client
+    finally:
+        pool.close()
+        await asyncio.sleep(0)
+
+    assert background_client.is_closed
+    assert caller_client.is_closed
+
+
+def test_unit_pool_applies_configured_limits_to_new_clients():
+    pool = SplitPdfClientPool()
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+
+    assert pool.limits == DEFAULT_SPLIT_PDF_LIMITS
+    pool.configure(limits)
+
+    assert pool.limits == limits
+
+
+def test_unit_pool_close_stops_background_loop():
+    pool = SplitPdfClientPool()
+
+    async def _noop() -> None:
+        return None
+
+    task = pool.submit(_noop())
+    task.future.result(timeout=5)
+    loop = task._loop  # pylint: disable=protected-access
+
+    finalizer = pool._loop_finalizer  # pylint: disable=protected-access
+    pool.close()
+
+    assert loop.is_closed()
+    assert task.cancel() is False
+    # The loop is not stopped a second time at exit.
+    assert finalizer is not None and not finalizer.alive
+
+
+def test_unit_pooled_task_cancel_resolves_future_after_task_unwinds():
+    pool = SplitPdfClientPool()
+    started = threading.Event()
+    unwound = threading.Event()
+
+    async def _pending() -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            unwound.set()
+
+    try:
+        task = pool.submit(_pending())
+        assert started.wait(timeout=5)
+        assert task.cancel() is True
+
+        with pytest.raises(futures.CancelledError):
+            task.future.result(timeout=5)
+        assert unwound.is_set()
+    finally:
+        pool.close()
+
+
+def test_unit_sdk_hooks_close_closes_each_hook_once():
+    hooks = SDKHooks()
+    hook = MagicMock()
+    hooks.register_before_request_hook(hook)
+    hooks.register_after_success_hook(hook)
+
+    hooks.close()
+
+    hook.close.assert_called_once()
+
+
+def test_unit_client_exit_closes_split_pdf_pool():
+    threads_before = set(_pool_threads())
+    with UnstructuredClient(
+        api_key_auth="",
+        split_pdf_limits=httpx.Limits(max_connections=4),
+    ) as client:
+        assert client.sdk_configuration.split_pdf_limits == httpx.Limits(max_connections=4)
+        split_hook = next(
+            hook
+            for hook in client.sdk_configuration.__dict__["_hooks"].after_success_hooks
+            if isinstance(hook, SplitPdfHook)
+        )
+
+        async def _noop() -> None:
+            return None
+
+        split_hook.chunk_client_pool.submit(_noop()).future.result(timeout=5)
+        assert set(_pool_threads()) - threads_before
+
+    assert not set(_pool_threads()) - threads_before
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -10,6 +11,9 @@ from httpx import Response, ConnectError
 
 from _test_unstructured_client.unit_utils import FixtureRequest, Mock, method_mock
 from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom import LoggerHook, RetryCountHook, SplitPdfHook
+from unstructured_client._hooks.sdkhooks import SDKHooks
+from unstructured_client._hooks.types import AfterErrorContext, BeforeRequestContext, HookContext
 from unstructured_client.models import shared, operations
 from unstructured_client.models.errors import SDKError
 from unstructured_client.utils.retries import BackoffStrategy, RetryConfig
@@ -174,6 +178,32 @@ def test_unit_backoff_strategy_logs_retries_connection_error(caplog):
     assert bool(pattern.search(caplog.text))
 
 
+def test_unit_logger_hook_counts_retries_per_request(caplog):
+    caplog.set_level(logging.INFO)
+    hook = LoggerHook()
+    hook_ctx = HookContext(
+        config=MagicMock(),
+        base_url="",
+        operation_id="partition",
+        oauth2_scopes=[],
+        security_source=None,
+    )
+    first = httpx.Request("POST", "https://api.unstructuredapp.io/general/v0/general")
+    second = httpx.Request("POST", "https://api.unstructuredapp.io/general/v0/general")
+    for request in (first, second):
+        RetryCountHook().before_request(BeforeRequestContext(hook_ctx), request)
+    # Other hooks may send a copy of the request, with the same extensions.
+    first_copy = httpx.Request(first.method, first.url, extensions=first.extensions)
+
+    for request in (first, second, first_copy):
+        hook.after_error(AfterErrorContext(hook_ctx), Response(503, request=request), None)
+
+    retry_numbers = [
+        int(number) for number in re.findall(r"Attempting retry number (\d+)", caplog.text)
+    ]
+    assert retry_numbers == [1, 1, 2]
+
+
 @pytest.mark.parametrize(
     "server_url",
     [
@@ -254,6 +284,59 @@ def test_after_error_hook_logs(caplog, session_: Mock, response_: requests.Sessi
     )
 
 
+
+def test_unit_sdk_hooks_skip_hooks_for_operations_they_do_not_handle():
+    calls: list[str] = []
+
+    class PartitionHook:
+        operation_ids = frozenset({"partition"})
+
+        def before_request(self, hook_ctx, request):
+            calls.append(f"partition:{hook_ctx.operation_id}")
+            return request
+
+    class EveryOperationHook:
+        def before_request(self, hook_ctx, request):
+            calls.append(f"every:{hook_ctx.operation_id}")
+            return request
+
+    hooks = SDKHooks()
+    hooks.before_request_hooks = [PartitionHook()]  # type: ignore[list-item]
+    request = httpx.Request("GET", "http://localhost:8000/api/v1/jobs/")
+    hook_ctx = MagicMock(operation_id="list_jobs")
+
+    assert not hooks.has_before_request_hooks("list_jobs")
+    assert hooks.before_request(hook_ctx, request) is request
+
+    hooks.register_before_request_hook(EveryOperationHook())  # type: ignore[arg-type]
+    hooks.before_request(hook_ctx, request)
+    hook_ctx.operation_id = "partition"
+    hooks.before_request(hook_ctx, request)
+
+    assert calls == ["every:list_jobs", "partition:partition", "every:partition"]
+
+
+def test_unit_platform_calls_skip_split_pdf_hook():
+    def mock_send(request):
+        return Response(200, json=[], request=request)
+
+    client = httpx.Client(transport=httpx.MockTransport(mock_send))
+    session = UnstructuredClient(api_key_auth=FAKE_KEY, client=client)
+    split_pdf_hook = next(
+        hook
+        for hook in session.sdk_configuration.__dict__["_hooks"].before_request_hooks
+        if isinstance(hook, SplitPdfHook)
+    )
+
+    with patch.object(BeforeRequestContext, "__init__") as context_init, patch.object(
+        split_pdf_hook, "after_success", wraps=split_pdf_hook.after_success
+    ) as after_success:
+        session.jobs.list_jobs(request=operations.ListJobsRequest())
+
+    context_init.assert_not_called()
+    after_success.assert_not_called()
+
+
 # -- fixtures --------------------------------------------------------------------------------
 
 
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from unstructured_client import UnstructuredClient, utils
+from unstructured_client._hooks.custom import SplitPdfHook
+from unstructured_client._hooks.custom.split_pdf_hook import _get_batch_timeout
+from unstructured_client.models import errors, operations, shared
+from unstructured_client.utils import deadlines as deadlines_module
+
+BASE_URL = "http://localhost:8000"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(deadlines_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_unit_nested_deadline_keeps_the_earlier_one(clock):
+    assert utils.get_deadline() is None
+    with utils.deadline(10) as outer:
+        with utils.deadline(60) as inner:
+            assert inner is outer
+        with utils.deadline(5) as inner:
+            assert utils.get_deadline() is inner
+        assert utils.get_deadline() is outer
+    assert utils.get_deadline() is None
+
+
+def test_unit_deadline_clamps_request_timeouts(clock):
+    deadline = utils.Deadline(10)
+    clock[0] = 4
+
+    assert deadline.clamp_timeout(None) == {
+        "connect": 6,
+        "read": 6,
+        "write": 6,
+        "pool": 6,
+    }
+    assert deadline.clamp_timeout({"connect": 2, "read": 30, "write": None}) == {
+        "connect": 2,
+        "read": 6,
+        "write": 6,
+    }
+    assert _get_batch_timeout(8, 2, 60, deadline) == (4, 6)
+
+    clock[0] = 12
+    assert deadline.expired
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_unit_calls_end_by_the_deadline(clock, is_async):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json=[], request=request)
+
+    session = UnstructuredClient(
+        server_url=BASE_URL,
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    def list_jobs():
+        request = operations.ListJobsRequest()
+        if is_async:
+            return asyncio.run(session.jobs.list_jobs_async(request=request))
+        return session.jobs.list_jobs(request=request)
+
+    with utils.deadline(10):
+        clock[0] = 7
+        list_jobs()
+        clock[0] = 10
+        with pytest.raises(errors.DeadlineExceededError):
+            list_jobs()
+
+    assert len(sent) == 1
+    assert sent[0].extensions["timeout"]["read"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unit_split_pdf_async_pages_end_by_the_deadline():
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json=[], request=request)
+
+    session = UnstructuredClient(
+        server_url=BASE_URL,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    filename = "_sample_docs/super_long_pages.pdf"
+    with open(filename, "rb") as f:
+        files = shared.Files(content=f.read(), file_name=filename)
+    request = operations.PartitionRequest(
+        partition_parameters=shared.PartitionParameters(
+            files=files,
+            strategy=shared.Strategy.FAST,
+            split_pdf_page=True,
+            split_pdf_concurrency_level=2,
+        )
+    )
+
+    with utils.deadline(2):
+        await session.general.partition_async(request=request, retries=None)
+
+    page_requests = [r for r in sent if r.url.path == "/general/v0/general"]
+    assert len(page_requests) == 2
+    # The split setup runs in a worker thread, in the caller's context.
+    assert all(r.extensions["timeout"]["read"] <= 2 for r in page_requests)
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_unit_split_pdf_deadline_during_page_requests_raises_deadline_exceeded(is_async):
+    def handler(request):
+        return httpx.Response(200, json=[], request=request)
+
+    async def slow_handler(request):
+        if request.url.path == "/general/v0/general":
+            # Mock transports ignore the read timeout the deadline sets.
+            await asyncio.sleep(5)
+        return handler(request)
+
+    session = UnstructuredClient(
+        server_url=BASE_URL,
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(slow_handler)),
+    )
+    split_pdf_hook = next(
+        hook
+        for hook in session.sdk_configuration.__dict__["_hooks"].after_success_hooks
+        if isinstance(hook, SplitPdfHook)
+    )
+    filename = "_sample_docs/super_long_pages.pdf"
+    with open(filename, "rb") as f:
+        files = shared.Files(content=f.read(), file_name=filename)
+    request = operations.PartitionRequest(
+        partition_parameters=shared.PartitionParameters(
+            files=files,
+            strategy=shared.Strategy.FAST,
+            split_pdf_page=True,
+            split_pdf_concurrency_level=2,
+        )
+    )
+
+    started_at = time.monotonic()
+    with utils.deadline(0.5), pytest.raises(errors.DeadlineExceededError):
+        if is_async:
+            asyncio.run(session.general.partition_async(request=request, retries=None))
+        else:
+            # Sync calls send the pages with the pool's client.
+            with patch.object(
+                split_pdf_hook.chunk_client_pool,
+                "get_client",
+                lambda: httpx.AsyncClient(transport=httpx.MockTransport(slow_handler)),
+            ):
+                session.general.partition(request=request, retries=None)
+
+    assert time.monotonic() - started_at < 5
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom.element_files import (
+    MERGE_TARGET_EXTENSION_KEY,
+    MERGED_OUTPUT_EXTENSION_KEY,
+    MergeTarget,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import (
+    OPERATION_ID_EXTENSION_KEY,
+    SplitPdfHook,
+)
+from unstructured_client._hooks.types import AfterSuccessContext
+from unstructured_client.models import errors, operations, shared
+
+CHUNK_RESULTS = [
+    [{"type": "Title", "text": "Line\nbreak", "metadata": {"page_number": 1}}, {"score": 1.5}],
+    [],
+    [{"type": "NarrativeText", "text": "naïve \"quoted\"", "metadata": {"page_number": 3}}],
+]
+
+
+def _write_chunk_files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for index, elements in enumerate(CHUNK_RESULTS):
+        path = tmp_path / f"chunk_{index}.json"
+        # Surrounding whitespace and indentation must survive the splice.
+        path.write_text(f" \n{json.dumps(elements, indent=2)}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _expected_elements() -> list[dict]:
+    return [element for elements in CHUNK_RESULTS for element in elements]
+
+
+@pytest.mark.parametrize("buffer_size", [3, 1024 * 1024])
+def test_unit_merge_target_splices_json_arrays(tmp_path: Path, buffer_size: int):
+    output_path = tmp_path / "elements.json"
+
+    with patch("unstructured_client._hooks.custom.element_files.COPY_BUFFER_SIZE", buffer_size), \
+            patch("unstructured_client._hooks.custom.element_files.json.loads") as json_loads:
+        MergeTarget(str(output_path)).write_files(_write_chunk_files(tmp_path))
+
+    json_loads.assert_not_called()
+    assert json.loads(output_path.read_text(encoding="utf-8")) == _expected_elements()
+
+
+@pytest.mark.parametrize("buffer_size", [3, 1024 * 1024])
+def test_unit_merge_target_writes_json_lines(tmp_path: Path, buffer_size: int):
+    output = io.BytesIO()
+
+    with patch("unstructured_client._hooks.custom.element_files.COPY_BUFFER_SIZE", buffer_size):
+        MergeTarget(output, "jsonl").write_files(_write_chunk_files(tmp_path))
+
+    lines = output.getvalue().decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == _expected_elements()
+
+
+def test_unit_merge_target_removes_partial_output_on_invalid_chunk(tmp_path: Path):
+    chunk_path = tmp_path / "chunk.json"
+    chunk_path.write_text('{"detail": "not a list"}', encoding="utf-8")
+    output_path = tmp_path / "elements.json"
+
+    with pytest.raises(ValueError):
+        MergeTarget(output_path).write_files([chunk_path])
+
+    assert not output_path.exists()
+
+
+def test_unit_merge_target_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        MergeTarget("elements.csv", "csv")  # type: ignore[arg-type]
+
+
+def test_unit_after_success_splices_cached_chunks_into_merge_target(tmp_path: Path):
+    hook = SplitPdfHook()
+    operation_id = "merge-operation"
+    chunk_paths = _write_chunk_files(tmp_path)
+    output_path = tmp_path / "elements.jsonl"
+
+    async def _cached_chunk(
+        async_client: httpx.AsyncClient,
+        limiter,
+        chunk_path: Path,
+    ) -> httpx.Response:
+        # Cached chunk responses carry the path of the result file.
+        return httpx.Response(status_code=200, content=str(chunk_path).encode())
+
+    hook.coroutines_to_execute[operation_id] = [
+        partial(_cached_chunk, chunk_path=chunk_path) for chunk_path in chunk_paths
+    ]
+    hook.cache_tmp_data_feature[operation_id] = True
+    request = httpx.Request(
+        "GET",
+        "http://localhost:8888/general/docs",
+        extensions={
+            OPERATION_ID_EXTENSION_KEY: operation_id,
+            MERGE_TARGET_EXTENSION_KEY: MergeTarget(output_path, "jsonl"),
+        },
+    )
+    hook_ctx = MagicMock(spec=AfterSuccessContext)
+    hook_ctx.operation_id = "partition"
+
+    try:
+        response = hook.after_success(hook_ctx, httpx.Response(status_code=200, request=request))
+    finally:
+        hook.close()
+
+    assert response.extensions[MERGED_OUTPUT_EXTENSION_KEY] == output_path
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == _expected_elements()
+    assert operation_id not in hook.coroutines_to_execute
+
+
+def test_unit_partition_to_file_writes_unsplit_response(tmp_path: Path):
+    elements = [{"type": "NarrativeText", "text": "hello"}]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=elements, request=request)
+
+    with UnstructuredClient(
+        api_key_auth="",
+        client=httpx.Client(transport=httpx.MockTransport(_handler)),
+    ) as client:
+        output = client.general.partition_to_file(
+            request=operations.PartitionRequest(
+                partition_parameters=shared.PartitionParameters(
+                    files=shared.Files(content=b"hello", file_name="hello.txt"),
+                )
+            ),
+            output=tmp_path / "elements.json",
+        )
+
+    assert output == tmp_path / "elements.json"
+    assert json.loads(output.read_text(encoding="utf-8")) == elements
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize(
+    ("status_code", "content", "error_type"),
+    [
+        (422, b'{"detail": []}', errors.HTTPValidationError),
+        (400, b"bad request", errors.SDKError),
+        (500, b'{"detail": "boom"}', errors.ServerError),
+    ],
+)
+def test_unit_partition_to_file_raises_partition_errors(
+    tmp_path: Path, status_code, content, error_type, is_async
+):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Content-Type": "application/json" if content.startswith(b"{") else "text/plain"}
+        return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+    client = UnstructuredClient(
+        api_key_auth="",
+        client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    kwargs = {
+        "request": operations.PartitionRequest(
+            partition_parameters=shared.PartitionParameters(
+                files=shared.Files(content=b"hello", file_name="hello.txt"),
+            )
+        ),
+        "output": tmp_path / "elements.json",
+        "retries": None,
+    }
+
+    with pytest.raises(error_type):
+        if is_async:
+            asyncio.run(client.general.partition_to_file_async(**kwargs))
+        else:
+            client.general.partition_to_file(**kwargs)
+    assert not (tmp_path / "elements.json").exists()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom.hedging import ChunkHedger, Hedging, HedgingStats
+from unstructured_client._hooks.custom.request_budget import BudgetedLimiter, ChunkRequestBudget
+
+
+class _ScriptedClient:
+    """Answers each send after the next of the given delays."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self._delays = iter(delays)
+        self.sent = 0
+        self.cancelled = 0
+
+    async def send(self, request: httpx.Request) -> httpx.Response:
+        self.sent += 1
+        delay = next(self._delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return httpx.Response(200, json={"delay": delay}, request=request)
+
+
+def _request() -> httpx.Request:
+    return httpx.Request("POST", "http://localhost:8000/general/v0/general")
+
+
+def test_unit_hedge_delay_follows_latency_percentile_of_siblings():
+    hedger = ChunkHedger(Hedging(latency_percentile=0.5, min_samples=3, min_delay=0.5))
+    assert hedger.get_hedge_delay() is None
+
+    hedger._latencies.extend([1.0, 3.0, 2.0])
+    assert hedger.get_hedge_delay() == 2.0
+
+    hedger._latencies.clear()
+    hedger._latencies.extend([0.1, 0.1, 0.1])
+    assert hedger.get_hedge_delay() == 0.5
+
+
+@pytest.mark.asyncio
+async def test_unit_hedged_request_takes_first_success_and_cancels_loser():
+    hedging = Hedging(latency_percentile=1.0, min_samples=2, max_hedge_ratio=1.0, min_delay=0)
+    hedger = ChunkHedger(hedging)
+    client = _ScriptedClient([0.01, 0.01, 10.0, 0.01])
+
+    for _ in range(2):
+        await hedger.send(client, _request())
+    response = await hedger.send(client, _request(), chunk_index=3)
+
+    assert response.json() == {"delay": 0.01}
+    assert client.sent == 4
+    assert client.cancelled == 1
+    assert hedging.stats == HedgingStats(requests=3, hedges_issued=1, hedges_won=1)
+
+
+@pytest.mark.asyncio
+async def test_unit_hedges_are_capped_by_ratio_of_requests():
+    hedging = Hedging(latency_percentile=1.0, min_samples=1, max_hedge_ratio=0.5, min_delay=0)
+    hedger = ChunkHedger(hedging)
+    # The original request wins whenever it is hedged.
+    client = _ScriptedClient([0.01, 0.05, 1.0, 0.05, 1.0])
+
+    for _ in range(3):
+        await hedger.send(client, _request())
+
+    assert (hedger.requests, hedger.hedges_issued, hedger.hedges_won) == (3, 1, 0)
+    assert hedging.stats.hedges_issued == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_hedge_needs_free_slot_of_limiter_and_budget():
+    hedging = Hedging(latency_percentile=1.0, min_samples=1, max_hedge_ratio=1.0, min_delay=0)
+    hedger = ChunkHedger(hedging, "op")
+    budget = ChunkRequestBudget(max_requests=2)
+    limiter = BudgetedLimiter(asyncio.Semaphore(2), budget, "op")
+    client = _ScriptedClient([0.01, 0.05, 1.0, 0.01])
+
+    async def send() -> httpx.Response:
+        async with limiter:
+            return await hedger.send(client, _request(), limiter=limiter)
+
+    await send()
+    # Another operation holds the remaining slot of the budget.
+    await budget.acquire("other")
+    await send()
+    assert hedger.hedges_issued == 0
+
+    budget.release("other")
+    response = await send()
+    assert response.json() == {"delay": 0.01}
+    assert hedger.hedges_issued == 1
+    assert budget.in_flight == 0
+    assert not limiter.limiter.locked()
+
+
+def test_unit_hedging_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        Hedging(latency_percentile=0)
+    with pytest.raises(ValueError):
+        Hedging(max_hedge_ratio=1.5)
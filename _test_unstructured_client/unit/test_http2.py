@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom.http2 import (
+    HTTP2,
+    MultiplexedTransport,
+    get_http2,
+)
+
+URL = "http://localhost:8000/general/v0/general"
+
+
+def test_unit_get_http2_falls_back_without_h2(caplog):
+    with patch(
+        "unstructured_client._hooks.custom.http2.is_http2_available", return_value=False
+    ), caplog.at_level(logging.WARNING):
+        assert get_http2(True) is None
+
+    assert "Falling back to HTTP/1.1" in caplog.text
+    assert get_http2(None) is None
+
+
+@pytest.mark.asyncio
+async def test_unit_multiplexed_transport_fills_connections_up_to_max_streams():
+    release = asyncio.Event()
+    connection_transports = []
+
+    def create_connection_transport():
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, extensions={"http_version": b"HTTP/2"})
+
+        connection_transports.append(httpx.MockTransport(handler))
+        return connection_transports[-1]
+
+    transport = MultiplexedTransport(HTTP2(max_streams=2), httpx.Limits(max_connections=2))
+    with patch.object(
+        transport, "_create_connection_transport", side_effect=create_connection_transport
+    ):
+        async with httpx.AsyncClient(transport=transport) as client:
+            requests = [asyncio.create_task(client.post(URL)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            # The fifth request waits for a stream, the two connections are full.
+            assert len(connection_transports) == 2
+            assert [c.streams for c in transport._connections[(b"http", b"localhost", 8000)]] == [2, 2]
+
+            release.set()
+            responses = await asyncio.gather(*requests)
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert len(connection_transports) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("prior_knowledge", "connection_response"),
+    [
+        (False, httpx.Response(200, extensions={"http_version": b"HTTP/1.1"})),
+        (True, httpx.RemoteProtocolError("Server disconnected")),
+    ],
+)
+async def test_unit_multiplexed_transport_falls_back_to_http1(
+    prior_knowledge, connection_response
+):
+    def connection_handler(request):
+        if isinstance(connection_response, Exception):
+            raise connection_response
+        return connection_response
+
+    http1_requests = []
+
+    def http1_handler(request):
+        http1_requests.append(request)
+        return httpx.Response(200, extensions={"http_version": b"HTTP/1.1"})
+
+    transport = MultiplexedTransport(HTTP2(prior_knowledge=prior_knowledge), httpx.Limits())
+    with patch.object(
+        transport,
+        "_create_connection_transport",
+        return_value=httpx.MockTransport(connection_handler),
+    ), patch.object(
+        transport, "_create_http1_transport", return_value=httpx.MockTransport(http1_handler)
+    ):
+        async with httpx.AsyncClient(transport=transport) as client:
+            first_response = await client.post(URL)
+            second_response = await client.post(URL)
+
+    assert (first_response.status_code, second_response.status_code) == (200, 200)
+    # Requests rejected by prior knowledge are resent over HTTP/1.1.
+    assert len(http1_requests) == (2 if prior_knowledge else 1)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.memory_budget import SplitMemoryBudget
+from unstructured_client._hooks.custom.split_pdf_hook import (
+    RESULT_FILE_EXTENSION_KEY,
+    SplitPdfHook,
+    load_chunk_elements,
+)
+
+
+def test_unit_memory_budget_accounts_for_all_operations():
+    budget = SplitMemoryBudget(max_bytes=10)
+
+    assert budget.try_reserve("first", 6)
+    assert not budget.try_reserve("second", 5)
+    assert budget.try_reserve("second", 4)
+
+    budget.release("first", 6)
+    assert budget.try_reserve("first", 3)
+    assert budget.reserved == 7
+
+    assert budget.release_operation("second") == 4
+    assert budget.release_operation("first") == 3
+    assert budget.reserved == 0
+
+
+def test_unit_budgeted_chunks_spill_to_temp_dir_once_budget_is_spent(tmp_path):
+    budget = SplitMemoryBudget(max_bytes=10)
+    chunks = [(io.BytesIO(b"%PDF-one"), 0), (io.BytesIO(b"%PDF-two"), 2)]
+
+    budgeted_chunks = list(
+        SplitPdfHook._get_budgeted_pdf_chunks(
+            chunks,
+            operation_id="operation",
+            memory_budget=budget,
+            temp_dir_path=str(tmp_path),
+        )
+    )
+
+    assert isinstance(budgeted_chunks[0][0], io.BytesIO)
+    spilled_chunk, page_offset = budgeted_chunks[1]
+    assert not isinstance(spilled_chunk, io.BytesIO)
+    assert (spilled_chunk.read(), page_offset) == (b"%PDF-two", 2)
+    assert chunks[1][0].closed
+    assert budget.reserved == len(b"%PDF-one")
+    spilled_chunk.close()
+
+
+@pytest.mark.asyncio
+async def test_unit_chunk_results_over_budget_are_spilled(tmp_path):
+    budget = SplitMemoryBudget(max_bytes=100)
+    chunk_response = httpx.Response(200, json=[{"type": "Title", "text": "x" * 100}])
+    assert budget.try_reserve("operation", 8)
+
+    with patch.object(
+        request_utils, "call_api_async", new=AsyncMock(return_value=chunk_response)
+    ):
+        response = await SplitPdfHook().call_api_partial(
+            pdf_chunk_request=httpx.Request("POST", "http://localhost:8000/general/v0/general"),
+            pdf_chunk_file=io.BytesIO(b"%PDF-one"),
+            limiter=None,
+            _operation_id="operation",
+            chunk_index=1,
+            page_number=1,
+            async_client=None,
+            retry_config=None,
+            cache_tmp_data_feature=False,
+            temp_dir_path=str(tmp_path),
+            memory_budget=budget,
+        )
+
+    assert response.extensions[RESULT_FILE_EXTENSION_KEY] is True
+    assert load_chunk_elements(response) == chunk_response.json()
+    # The chunk was released once sent, and the result was not reserved.
+    assert budget.reserved == 0
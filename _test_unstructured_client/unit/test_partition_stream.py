@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+from functools import partial
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom.partition_stream import (
+    ELEMENT_STREAM_EXTENSION_KEY,
+    STREAM_ELEMENTS_EXTENSION_KEY,
+    PartitionStream,
+    PartitionStreamAsync,
+    StreamEnd,
+)
+from unstructured_client._hooks.custom.split_pdf_hook import (
+    OPERATION_ID_EXTENSION_KEY,
+    SplitPdfHook,
+    run_tasks,
+)
+from unstructured_client._hooks.types import AfterSuccessContext
+from unstructured_client.models import errors, operations, shared
+
+
+def _chunk_response(page_number: int, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status_code=status_code,
+        json=[{"type": "Title", "metadata": {"page_number": page_number}}],
+        request=httpx.Request("POST", "http://localhost:8888/general/v0/general"),
+    )
+
+
+async def _chunk_request(
+    async_client: httpx.AsyncClient,
+    limiter: asyncio.Semaphore,
+    page_number: int,
+    delay: float,
+    status_code: int = 200,
+) -> httpx.Response:
+    await asyncio.sleep(delay)
+    return _chunk_response(page_number, status_code)
+
+
+def _stream_response(hook: SplitPdfHook, operation_id: str, tasks: list) -> httpx.Response:
+    hook.coroutines_to_execute[operation_id] = tasks
+    hook.concurrency_level[operation_id] = 2
+    request = httpx.Request(
+        "GET",
+        "http://localhost:8888/general/docs",
+        extensions={
+            OPERATION_ID_EXTENSION_KEY: operation_id,
+            STREAM_ELEMENTS_EXTENSION_KEY: True,
+        },
+    )
+    return httpx.Response(status_code=200, request=request)
+
+
+def _after_success_context() -> AfterSuccessContext:
+    hook_ctx = MagicMock(spec=AfterSuccessContext)
+    hook_ctx.operation_id = "partition"
+    return hook_ctx
+
+
+def test_unit_partition_stream_yields_chunks_in_order_as_prefix_completes():
+    results: queue.Queue = queue.Queue()
+    on_close = MagicMock()
+    stream = PartitionStream(
+        results,
+        chunk_count=3,
+        load_elements=lambda response: response.json(),
+        on_close=on_close,
+    )
+
+    results.put((2, _chunk_response(2)))
+    results.put((1, _chunk_response(1)))
+
+    # Chunks 1 and 2 are released before chunk 3 is done.
+    assert [next(stream).index, next(stream).index] == [1, 2]
+    on_close.assert_not_called()
+
+    results.put((3, _chunk_response(3, status_code=500)))
+    results.put(StreamEnd())
+    last_chunk = next(stream)
+
+    assert (last_chunk.index, last_chunk.succeeded, last_chunk.elements) == (3, False, [])
+    assert list(stream) == []
+    on_close.assert_called_once_with()
+
+
+def test_unit_partition_stream_raises_batch_error_and_closes():
+    results: queue.Queue = queue.Queue()
+    on_close = MagicMock()
+    stream = PartitionStream(
+        results,
+        chunk_count=2,
+        load_elements=lambda response: response.json(),
+        on_close=on_close,
+    )
+    results.put(StreamEnd(httpx.ConnectError("connect failed")))
+
+    with pytest.raises(httpx.ConnectError):
+        next(stream)
+    on_close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_unit_run_tasks_reports_results_as_they_complete():
+    completed: list[int] = []
+    tasks = [
+        partial(_chunk_request, page_number=1, delay=0.05),
+        partial(_chunk_request, page_number=2, delay=0),
+    ]
+
+    responses = await run_tasks(
+        tasks,
+        on_result=lambda index, response: completed.append(index),
+    )
+
+    assert completed == [2, 1]
+    assert [index for index, _ in responses] == [1, 2]
+
+
+def test_unit_after_success_returns_element_stream_for_stream_requests():
+    hook = SplitPdfHook()
+    operation_id = "stream-operation"
+    response = _stream_response(
+        hook,
+        operation_id,
+        [
+            partial(_chunk_request, page_number=1, delay=0.05),
+            partial(_chunk_request, page_number=3, delay=0),
+            partial(_chunk_request, page_number=5, delay=0, status_code=500),
+        ],
+    )
+    hook.allow_failed[operation_id] = True
+
+    try:
+        stream_response = hook.after_success(_after_success_context(), response)
+        stream = stream_response.extensions[ELEMENT_STREAM_EXTENSION_KEY]
+        assert isinstance(stream, PartitionStream)
+        # The stream owns the operation until it is exhausted.
+        assert operation_id in hook.coroutines_to_execute
+
+        with stream:
+            chunks = list(stream)
+    finally:
+        hook.close()
+
+    assert [chunk.index for chunk in chunks] == [1, 2, 3]
+    assert [chunk.succeeded for chunk in chunks] == [True, True, False]
+    assert [element["metadata"]["page_number"] for chunk in chunks for element in chunk.elements] == [1, 3]
+    assert operation_id not in hook.coroutines_to_execute
+    assert operation_id not in hook.operation_tasks
+
+
+@pytest.mark.asyncio
+async def test_unit_after_success_async_stream_close_cancels_remaining_chunks():
+    hook = SplitPdfHook()
+    operation_id = "async-stream-operation"
+    cancelled = asyncio.Event()
+
+    async def _pending_request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+    ) -> httpx.Response:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return _chunk_response(3)
+
+    response = _stream_response(
+        hook,
+        operation_id,
+        [partial(_chunk_request, page_number=1, delay=0), partial(_pending_request)],
+    )
+
+    try:
+        stream_response = await hook.after_success_async(_after_success_context(), response)
+        stream = stream_response.extensions[ELEMENT_STREAM_EXTENSION_KEY]
+        assert isinstance(stream, PartitionStreamAsync)
+
+        async with stream:
+            first_chunk = await stream.__anext__()
+    finally:
+        hook.close()
+
+    assert first_chunk.elements == [{"type": "Title", "metadata": {"page_number": 1}}]
+    assert cancelled.is_set()
+    assert operation_id not in hook.coroutines_to_execute
+
+
+def test_unit_partition_stream_yields_single_chunk_for_unsplit_requests():
+    elements = [{"type": "NarrativeText", "text": "hello"}]
+    seen_requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(200, json=elements, request=request)
+
+    with UnstructuredClient(
+        api_key_auth="",
+        client=httpx.Client(transport=httpx.MockTransport(_handler)),
+    ) as client:
+        with client.general.partition_stream(
+            request=operations.PartitionRequest(
+                partition_parameters=shared.PartitionParameters(
+                    files=shared.Files(content=b"hello", file_name="hello.txt"),
+                )
+            )
+        ) as stream:
+            chunks = list(stream)
+
+    assert [(chunk.index, chunk.chunk_count, chunk.elements) for chunk in chunks] == [(1, 1, elements)]
+    assert seen_requests[0].headers["Accept"] == "application/json"
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize(
+    ("response", "error_type"),
+    [
+        (httpx.Response(422, json={"detail": []}), errors.HTTPValidationError),
+        (httpx.Response(400, text="bad request"), errors.SDKError),
+        (httpx.Response(500, json={"detail": "boom"}), errors.ServerError),
+    ],
+)
+def test_unit_partition_stream_raises_partition_errors(response, error_type, is_async):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=response.content,
+            request=request,
+        )
+
+    client = UnstructuredClient(
+        api_key_auth="",
+        client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    request = operations.PartitionRequest(
+        partition_parameters=shared.PartitionParameters(
+            files=shared.Files(content=b"hello", file_name="hello.txt"),
+        )
+    )
+
+    with pytest.raises(error_type):
+        if is_async:
+            asyncio.run(client.general.partition_stream_async(request=request, retries=None))
+        else:
+            client.general.partition_stream(request=request, retries=None)
@@ -5,7 +5,7 @@ import io
 import pytest
 from pypdf import PdfReader
 
-from unstructured_client._hooks.custom.pdf_utils import check_pdf, PDFValidationError
+from unstructured_client._hooks.custom.pdf_utils import PdfInfo, check_pdf, read_pdf, PDFValidationError
 from _test_unstructured_client.unit_utils import sample_docs_path
 
 
@@ -51,3 +51,25 @@ def test_check_pdf_raises_pdf_validation_error(
         check_pdf(pdf)
 
     assert exc_info.value.message == expected_error_message
+
+
+def test_read_pdf_measures_pages_with_pdfium():
+    with open(sample_docs_path("super_long_pages.pdf"), "rb") as f:
+        pdf = read_pdf(f)
+
+        assert isinstance(pdf, PdfInfo)
+        assert f.tell() == 0
+
+    assert check_pdf(pdf) is pdf
+    assert pdf.get_num_pages() == 3
+    assert pdf.page_sizes[0] == (1511.0, 14400.0)
+    assert pdf.max_page_length == 14400.0
+
+
+def test_read_pdf_falls_back_to_pypdf_for_files_pdfium_rejects():
+    with open(sample_docs_path("failing-missing-root.pdf"), "rb") as f:
+        pdf = read_pdf(f.read())
+
+    assert isinstance(pdf, PdfReader)
+    with pytest.raises(PDFValidationError):
+        check_pdf(pdf)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from functools import partial
+
+import httpx
+import pytest
+
+from unstructured_client._hooks.custom.request_budget import ChunkRequestBudget
+from unstructured_client._hooks.custom.split_pdf_hook import SplitPdfHook, run_tasks
+
+
+async def _settle() -> None:
+    # Waiters are woken through `call_soon_threadsafe`, which takes a few loop
+    # iterations to reach them.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_unit_request_budget_caps_requests_across_operations():
+    budget = ChunkRequestBudget(3)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _request(async_client: httpx.AsyncClient, limiter) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        async with limiter:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        return httpx.Response(200)
+
+    await asyncio.gather(
+        *(
+            run_tasks(
+                [partial(_request) for _ in range(6)],
+                concurrency_level=3,
+                operation_id=operation_id,
+                request_budget=budget,
+            )
+            for operation_id in ["first", "second", "third"]
+        )
+    )
+
+    assert max_in_flight == 3
+    assert budget.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_unit_request_budget_hands_slots_to_least_served_operation():
+    budget = ChunkRequestBudget(2)
+    granted: list[str] = []
+
+    async def _acquire(operation_id: str) -> None:
+        await budget.acquire(operation_id)
+        granted.append(operation_id)
+
+    await budget.acquire("large")
+    await budget.acquire("large")
+    waiters = [asyncio.create_task(_acquire(operation_id)) for operation_id in ["large", "large", "small"]]
+    await asyncio.sleep(0)
+
+    budget.release("large")
+    await _settle()
+    # The small document started waiting last but has nothing in flight.
+    assert granted == ["small"]
+
+    budget.release("large")
+    budget.release("small")
+    await asyncio.gather(*waiters)
+    assert granted == ["small", "large", "large"]
+
+
+@pytest.mark.asyncio
+async def test_unit_request_budget_cancelled_waiter_keeps_no_slot():
+    budget = ChunkRequestBudget(1)
+    await budget.acquire("first")
+    waiter = asyncio.create_task(budget.acquire("second"))
+    await asyncio.sleep(0)
+
+    # The slot is handed over while the waiter is cancelled.
+    budget.release("first")
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert budget.in_flight == 0
+    await asyncio.wait_for(budget.acquire("third"), timeout=1)
+
+
+def test_unit_request_budget_wakes_waiters_on_other_event_loops():
+    budget = ChunkRequestBudget(1)
+    waiting = threading.Event()
+    acquired = threading.Event()
+
+    async def _wait_for_slot() -> None:
+        acquire = asyncio.create_task(budget.acquire("other-loop"))
+        await asyncio.sleep(0)
+        waiting.set()
+        await acquire
+        acquired.set()
+
+    asyncio.run(budget.acquire("holder"))
+    thread = threading.Thread(target=asyncio.run, args=(_wait_for_slot(),))
+    thread.start()
+    assert waiting.wait(timeout=5)
+
+    budget.release("holder")
+    thread.join(timeout=5)
+
+    assert acquired.is_set()
+    assert budget.in_flight == 1
+
+
+def test_unit_split_hook_shares_request_budget_per_base_url():
+    hook = SplitPdfHook()
+
+    budget = hook._get_request_budget("https://api.example.com", 5)
+
+    assert hook._get_request_budget("https://api.example.com", 5) is budget
+    assert hook._get_request_budget("https://other.example.com", 5) is not budget
+    assert hook._get_request_budget("https://api.example.com", None) is None
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+import pytest
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.result_cache import (
+    CHUNK_NAMESPACE,
+    PARTIAL_RESULT_EXTENSION_KEY,
+    CacheStats,
+    DirectoryResultCache,
+    MemoryResultCache,
+    create_chunk_cache_entry,
+    get_cacheable_content,
+    get_chunk_cache_key,
+    get_chunk_result,
+    get_partition_cache_key,
+)
+from unstructured_client._hooks.custom.split_engine import _export_pages
+from unstructured_client._hooks.custom.split_pdf_hook import SplitPdfHook
+from unstructured_client.models import operations, shared
+
+URL = "http://localhost:8000/general/v0/general"
+
+
+def _parameters(content, **kwargs) -> shared.PartitionParameters:
+    return shared.PartitionParameters(
+        files=shared.Files(content=content, file_name="document.pdf"),
+        **kwargs,
+    )
+
+
+def test_unit_memory_result_cache_evicts_least_recently_used():
+    cache = MemoryResultCache(max_bytes=10)
+    cache.set("partition", "a", b"aaaa")
+    cache.set("partition", "b", b"bbbb")
+    assert cache.get("partition", "a") == b"aaaa"
+
+    cache.set("chunk", "c", b"cccc")
+
+    assert cache.get("partition", "b") is None
+    assert cache.get("chunk", "c") == b"cccc"
+    assert cache.size == 8
+    assert cache.stats("partition") == CacheStats(hits=1, misses=1)
+    assert cache.stats().hit_ratio == pytest.approx(2 / 3)
+
+
+def test_unit_directory_result_cache_evicts_by_size_and_persists(tmp_path):
+    cache = DirectoryResultCache(tmp_path, max_bytes=10)
+    cache.set("chunk", "a", b"aaaa")
+    cache.set("chunk", "b", b"bbbb")
+    cache.set("chunk", "b", b"bbbb")
+    assert cache.get("chunk", "a") == b"aaaa"
+
+    reopened = DirectoryResultCache(tmp_path, max_bytes=10)
+    reopened.set("chunk", "c", b"cccc")
+
+    assert reopened.get("chunk", "a") == b"aaaa"
+    assert reopened.get("chunk", "c") == b"cccc"
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 10
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unit_partition_cache_key_covers_content_and_result_parameters():
+    key = get_partition_cache_key(_parameters(b"%PDF-1", strategy="fast"), URL)
+
+    assert key == get_partition_cache_key(_parameters(b"%PDF-1", strategy="fast"), URL)
+    # The concurrency only changes how the request is sent.
+    assert key == get_partition_cache_key(
+        _parameters(b"%PDF-1", strategy="fast", split_pdf_concurrency_level=3), URL
+    )
+    assert key != get_partition_cache_key(_parameters(b"%PDF-2", strategy="fast"), URL)
+    assert key != get_partition_cache_key(_parameters(b"%PDF-1", strategy="hi_res"), URL)
+    # Other deployments have their own results.
+    assert key != get_partition_cache_key(
+        _parameters(b"%PDF-1", strategy="fast"),
+        "https://other.example.com/general/v0/general",
+    )
+
+    file = io.BufferedReader(io.BytesIO(b"%PDF-1"))
+    assert get_partition_cache_key(_parameters(file, strategy="fast"), URL) == key
+    assert file.tell() == 0
+
+
+def _export(pdf: pdfium.PdfDocument, page_range: tuple[int, int]) -> io.BytesIO:
+    chunk = io.BytesIO()
+    _export_pages(pdf, page_range, chunk)
+    return chunk
+
+
+def test_unit_chunk_cache_key_matches_same_pages_of_other_documents():
+    document = pdfium.PdfDocument.new()
+    for page_number in range(3):
+        document.new_page(100 + page_number, 200).close()
+    # The last two pages of `document`, as another document.
+    other_document = pdfium.PdfDocument(_export(document, (1, 3)))
+
+    def key(pdf, page_range, page_number, **form_data):
+        return get_chunk_cache_key(
+            _export(pdf, page_range),
+            URL,
+            request_utils.create_pdf_chunk_request_params(
+                {"strategy": "fast", **form_data}, page_number
+            ),
+        )
+
+    assert key(document, (1, 3), 2) == key(other_document, (0, 2), 1)
+    assert key(document, (1, 3), 2) != key(document, (0, 2), 1)
+    assert key(document, (1, 3), 2) != key(document, (1, 3), 2, strategy="hi_res")
+
+
+def test_unit_chunk_result_is_rewritten_for_other_documents_and_offsets():
+    elements = [
+        {"element_id": "a" * 32, "metadata": {"page_number": 3, "filename": "first.pdf"}},
+        {
+            "element_id": "b" * 32,
+            "metadata": {"page_number": 4, "filename": "first.pdf", "parent_id": "a" * 32},
+        },
+    ]
+    entry = create_chunk_cache_entry(json.dumps(elements).encode(), 3, "docs/first.pdf")
+
+    assert json.loads(get_chunk_result(entry, 3, "docs/first.pdf")) == elements
+
+    rewritten = json.loads(get_chunk_result(entry, 1, "second.pdf"))
+    assert [e["metadata"]["page_number"] for e in rewritten] == [1, 2]
+    assert {e["metadata"]["filename"] for e in rewritten} == {"second.pdf"}
+    assert rewritten[0]["element_id"] not in ("a" * 32, "b" * 32)
+    assert len(rewritten[0]["element_id"]) == 32
+    assert rewritten[1]["metadata"]["parent_id"] == rewritten[0]["element_id"]
+    assert get_chunk_result(b"[]", 1, "second.pdf") is None
+
+
+def test_unit_partial_results_are_not_cached():
+    response = httpx.Response(200, json=[{"type": "Title"}])
+    assert get_cacheable_content(response) == b'[{"type":"Title"}]'
+
+    response.extensions[PARTIAL_RESULT_EXTENSION_KEY] = True
+    assert get_cacheable_content(response) is None
+    assert get_cacheable_content(httpx.Response(500, json=[])) is None
+
+
+def test_unit_partition_serves_repeated_documents_from_cache():
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"type": "Title", "text": "Cover"}])
+
+    cache = MemoryResultCache()
+    client = UnstructuredClient(
+        server_url="http://localhost:8000",
+        client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        partition_cache=cache,
+    )
+    request = operations.PartitionRequest(
+        partition_parameters=_parameters(b"cover page", split_pdf_page=False),
+    )
+
+    first = client.general.partition(request=request)
+    second = client.general.partition(request=request)
+
+    assert len(requests) == 1
+    assert second.elements == first.elements == [{"type": "Title", "text": "Cover"}]
+    assert cache.stats("partition") == CacheStats(hits=1, misses=1)
+
+
+@pytest.mark.asyncio
+async def test_unit_call_api_partial_serves_cached_chunk_without_request():
+    cache = MemoryResultCache()
+    cache.set(
+        CHUNK_NAMESPACE,
+        "key",
+        create_chunk_cache_entry(json.dumps([{"type": "Title"}]).encode(), 1, "a.pdf"),
+    )
+    chunk_file = io.BytesIO(b"%PDF")
+
+    with patch.object(request_utils, "call_api_async", new=AsyncMock()) as call_api:
+        response = await SplitPdfHook().call_api_partial(
+            pdf_chunk_request=httpx.Request("POST", "http://localhost:8000/general/v0/general"),
+            pdf_chunk_file=chunk_file,
+            limiter=None,
+            _operation_id="operation",
+            chunk_index=0,
+            page_number=1,
+            async_client=None,
+            retry_config=None,
+            cache_tmp_data_feature=False,
+            temp_dir_path=None,
+            result_cache=cache,
+            result_cache_key="key",
+            filename="a.pdf",
+        )
+
+    call_api.assert_not_called()
+    assert response.json() == [{"type": "Title"}]
+    assert cache.stats(CHUNK_NAMESPACE) == CacheStats(hits=1, misses=0)
@@ -5,13 +5,20 @@ from unittest.mock import MagicMock
 import httpx
 import pytest
 
+from unstructured_client.utils import deadlines as deadlines_module
 from unstructured_client.utils import retries as retries_module
+from unstructured_client.utils.deadlines import Deadline
 from unstructured_client.utils.retries import (
     BackoffStrategy,
     PermanentError,
     Retries,
+    RetryAfterGate,
+    RetryBudget,
+    RetryBudgetStats,
     RetryConfig,
     TemporaryError,
+    get_backoff_seconds,
+    get_retry_after,
     retry,
     retry_async,
 )
@@ -58,6 +65,9 @@ def _retries(
     absolute_max_elapsed_time_ms=None,
     retry_connection_errors: bool = True,
     status_codes=None,
+    budget=None,
+    jitter: str = "additive",
+    deadline=None,
 ) -> Retries:
     return Retries(
         config=RetryConfig(
@@ -69,10 +79,13 @@ def _retries(
                 max_elapsed_time=max_elapsed_time,
                 min_attempts=min_attempts,
                 absolute_max_elapsed_time_ms=absolute_max_elapsed_time_ms,
+                jitter=jitter,
             ),
             retry_connection_errors=retry_connection_errors,
         ),
         status_codes=status_codes or [],
+        budget=budget,
+        deadline=deadline,
     )
 
 
@@ -208,6 +221,16 @@ class TestBackoffStrategyValidation:
                 absolute_max_elapsed_time_ms=5_000,
             )
 
+    def test_unknown_jitter_rejected(self):
+        with pytest.raises(ValueError, match="jitter must be one of"):
+            BackoffStrategy(
+                initial_interval=100,
+                max_interval=200,
+                exponent=1.5,
+                max_elapsed_time=5_000,
+                jitter="random",
+            )
+
     def test_min_attempts_zero_accepted(self):
         BackoffStrategy(
             initial_interval=100,
@@ -555,3 +578,232 @@ class TestPermanentErrorShortCircuit:
         with pytest.raises(ValueError, match="permanent"):
             asyncio.run(retry_async(func, retries_config))
         assert call_count == 1
+
+
+def _make_rate_limited_response(headers, status_code: int = 429) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.example.com/general/v0/general"),
+    )
+
+
+class TestRetryAfter:
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"Retry-After": "7"}, 7.0),
+            ({"Retry-After": "Thu, 01 Jan 1970 00:00:30 GMT"}, 20.0),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}, 12.0),
+            ({"RateLimit-Remaining": "0", "RateLimit-Reset": "1700000030"}, 20.0),
+            ({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "12"}, None),
+            ({}, None),
+        ],
+    )
+    def test_get_retry_after(self, monkeypatch, headers, expected):
+        now = 1_700_000_010 if "RateLimit-Reset" in headers else 10
+        monkeypatch.setattr(retries_module.time, "time", lambda: now)
+
+        assert get_retry_after(_make_rate_limited_response(headers)) == expected
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_retry_waits_as_long_as_the_server_asks(self, fake_clock, monkeypatch, is_async):
+        monkeypatch.setattr(retries_module, "retry_after_gate", RetryAfterGate())
+        retries_config = _retries(max_interval=200, max_elapsed_time=60_000, status_codes=["429"])
+        responses = [_make_rate_limited_response({"Retry-After": "7"}), _make_ok_response()]
+
+        def func():
+            return responses.pop(0)
+
+        async def func_async():
+            return func()
+
+        if is_async:
+            result = asyncio.run(retry_async(func_async, retries_config))
+        else:
+            result = retry(func, retries_config)
+
+        assert result.status_code == 200
+        # Past max_interval, the backoff would have retried after 0.1s.
+        assert fake_clock.now_ms == 7_000
+
+    def test_retry_after_past_max_elapsed_time_returns_response(self, fake_clock, monkeypatch):
+        monkeypatch.setattr(retries_module, "retry_after_gate", RetryAfterGate())
+        retries_config = _retries(max_elapsed_time=5_000, status_codes=["429"])
+        call_count = 0
+
+        def func():
+            nonlocal call_count
+            call_count += 1
+            return _make_rate_limited_response({"Retry-After": "60"})
+
+        result = retry(func, retries_config)
+
+        assert result.status_code == 429
+        assert call_count == 1
+        assert fake_clock.now_ms == 0
+
+    @pytest.mark.parametrize("cap", ["max_elapsed_time", "budget"])
+    def test_retry_not_made_keeps_no_slot(self, fake_clock, monkeypatch, cap):
+        gate = RetryAfterGate()
+        monkeypatch.setattr(retries_module, "retry_after_gate", gate)
+        if cap == "budget":
+            budget = RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+            assert budget.try_retry()
+            retries_config = _retries(status_codes=["429"], budget=budget)
+        else:
+            retries_config = _retries(status_codes=["429"], max_elapsed_time=2_000)
+
+        result = retry(
+            lambda: _make_rate_limited_response({"Retry-After": "5"}), retries_config
+        )
+
+        assert result.status_code == 429
+        # Other requests to the host still retry as soon as it allows.
+        assert gate.schedule("api.example.com", 0.5, None) == 5.0
+
+    def test_gate_spreads_retries_to_a_host_that_asked_to_wait(self, fake_clock):
+        gate = RetryAfterGate()
+
+        assert gate.schedule("api.example.com", 0.5, 5.0) == 5.0
+        # Other requests to the host wait as well, one after the other.
+        assert gate.schedule("api.example.com", 0.5, None) == pytest.approx(5.1)
+        assert gate.schedule("api.example.com", 0.5, 5.0) == pytest.approx(5.2)
+        assert gate.schedule("other.example.com", 0.5, None) == 0.5
+
+        fake_clock.advance(10_000)
+        assert gate.schedule("api.example.com", 0.5, None) == 0.5
+
+
+class TestRetryBudget:
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_spent_budget_returns_last_response(self, fake_clock, is_async):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+        retries_config = _retries(min_attempts=5, status_codes=["5XX"], budget=budget)
+        call_count = 0
+
+        def func():
+            nonlocal call_count
+            call_count += 1
+            return _make_ok_response(503)
+
+        async def func_async():
+            return func()
+
+        if is_async:
+            result = asyncio.run(retry_async(func_async, retries_config))
+        else:
+            result = retry(func, retries_config)
+
+        # The budget wins over min_attempts.
+        assert result.status_code == 503
+        assert call_count == 2
+        assert budget.stats == RetryBudgetStats(successes=0, retries=1, exhausted=1)
+
+    def test_successes_earn_retries(self, fake_clock):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+        retry(_make_ok_response, _retries(budget=budget))
+        retry(_make_ok_response, _retries(budget=budget))
+
+        assert budget.tokens == 1
+        assert budget.try_retry()
+        assert budget.stats == RetryBudgetStats(successes=2, retries=2, exhausted=1)
+
+    def test_budget_refills_over_time(self, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr(retries_module.time, "monotonic", lambda: now)
+        budget = RetryBudget(ratio=0, min_retries_per_second=2, max_tokens=3)
+        for _ in range(3):
+            assert budget.try_retry()
+        assert not budget.try_retry()
+
+        now = 0.5
+        assert budget.try_retry()
+        now = 60.0
+        assert budget.tokens == 3
+
+
+class TestJitter:
+
+    @pytest.mark.parametrize(
+        "jitter,retries,previous_seconds,expected_range",
+        [
+            # 1s * 2**3 = 8s, capped at 10s.
+            ("additive", 3, None, (8.0, 9.0)),
+            ("additive", 4, None, (10.0, 10.0)),
+            ("full_jitter", 3, None, (0.0, 8.0)),
+            ("full_jitter", 4, None, (0.0, 10.0)),
+            ("equal_jitter", 3, None, (4.0, 8.0)),
+            ("decorrelated_jitter", 0, None, (1.0, 3.0)),
+            ("decorrelated_jitter", 5, 2.0, (1.0, 6.0)),
+            ("decorrelated_jitter", 5, 6.0, (1.0, 10.0)),
+        ],
+    )
+    def test_get_backoff_seconds(self, monkeypatch, jitter, retries, previous_seconds, expected_range):
+        backoffs = []
+        for pick in (lambda a, b: a, lambda a, b: b):
+            monkeypatch.setattr(retries_module.random, "uniform", pick)
+            backoffs.append(
+                get_backoff_seconds(1_000, 10_000, 2.0, retries, jitter, previous_seconds)
+            )
+
+        assert tuple(backoffs) == expected_range
+
+    @pytest.mark.parametrize(
+        "jitter,expected_sleep_ms",
+        [
+            ("full_jitter", [100, 150, 200]),
+            ("equal_jitter", [100, 150, 200]),
+            # Up to three times the last sleep, capped at 200ms.
+            ("decorrelated_jitter", [200, 200, 200]),
+        ],
+    )
+    def test_retry_sleeps_follow_the_jitter(self, fake_clock, monkeypatch, jitter, expected_sleep_ms):
+        monkeypatch.setattr(retries_module.random, "uniform", lambda a, b: b)
+        retries_config = _retries(min_attempts=3, status_codes=["5XX"], jitter=jitter)
+        responses = [_make_ok_response(503)] * 3 + [_make_ok_response()]
+        attempt_times = []
+
+        def func():
+            attempt_times.append(fake_clock.now_ms)
+            return responses.pop(0)
+
+        result = retry(func, retries_config)
+
+        assert result.status_code == 200
+        sleeps = [b - a for a, b in zip(attempt_times, attempt_times[1:])]
+        assert sleeps == expected_sleep_ms
+
+
+class TestDeadline:
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_no_retry_past_the_deadline(self, fake_clock, monkeypatch, is_async):
+        monkeypatch.setattr(deadlines_module.time, "monotonic", fake_clock.time)
+        retries_config = _retries(
+            min_attempts=10, status_codes=["5XX"], deadline=Deadline(0.5)
+        )
+        call_count = 0
+
+        def func():
+            nonlocal call_count
+            call_count += 1
+            return _make_ok_response(503)
+
+        async def func_async():
+            return func()
+
+        if is_async:
+            result = asyncio.run(retry_async(func_async, retries_config))
+        else:
+            result = retry(func, retries_config)
+
+        # Slept 100 + 150 + 200 ms, the next 200 ms backoff ends past 500 ms.
+        assert result.status_code == 503
+        assert call_count == 4
+        assert fake_clock.now_ms == 450
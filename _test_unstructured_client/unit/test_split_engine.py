@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import io
+import mmap
+from concurrent import futures
+from pathlib import Path
+from unittest.mock import patch
+
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+import pytest
+
+from unstructured_client._hooks.custom.pdf_utils import get_pdf_buffer
+from unstructured_client._hooks.custom.split_engine import (
+    PDFIUM_LOCK,
+    PdfSplitEngine,
+    _export_pages,
+    get_page_ranges,
+)
+
+
+def _make_pdf(num_pages: int) -> bytes:
+    pdf = pdfium.PdfDocument.new()
+    try:
+        for page_number in range(num_pages):
+            # Vary the width so chunk pages can be traced back to their source page.
+            pdf.new_page(100 + page_number, 200).close()
+        buffer = io.BytesIO()
+        pdf.save(buffer)
+        return buffer.getvalue()
+    finally:
+        pdf.close()
+
+
+def _page_widths(pdf_source) -> list[int]:
+    with PDFIUM_LOCK, pdfium.PdfDocument(pdf_source) as pdf:
+        return [round(pdf[index].get_width()) for index in range(len(pdf))]
+
+
+@pytest.mark.parametrize(
+    ("split_size", "page_start", "page_end", "expected"),
+    [
+        (2, 1, 5, [(0, 2), (2, 4), (4, 5)]),
+        (3, 2, 7, [(1, 4), (4, 7)]),
+        (4, 3, 3, [(2, 3)]),
+    ],
+)
+def test_unit_get_page_ranges(split_size, page_start, page_end, expected):
+    assert get_page_ranges(split_size, page_start, page_end) == expected
+
+
+def test_unit_split_to_buffers_in_process():
+    engine = PdfSplitEngine()
+    pdf_bytes = _make_pdf(5)
+
+    chunk_buffers = engine.split_to_buffers(pdf_bytes, get_page_ranges(2, 1, 5))
+
+    assert [_page_widths(chunk_buffer) for chunk_buffer in chunk_buffers] == [
+        [100, 101],
+        [102, 103],
+        [104],
+    ]
+
+
+def test_unit_split_memory_mapped_file_in_place(tmp_path: Path):
+    pdf_path = tmp_path / "document.pdf"
+    pdf_path.write_bytes(_make_pdf(5))
+
+    with open(pdf_path, "rb") as pdf_file:
+        pdf_map = get_pdf_buffer(pdf_file)
+        assert isinstance(pdf_map, mmap.mmap)
+        chunk_buffers = PdfSplitEngine().split_to_buffers(pdf_map, get_page_ranges(3, 1, 5))
+        # The map can be closed once the document is released.
+        pdf_map.close()
+
+    assert [_page_widths(chunk_buffer) for chunk_buffer in chunk_buffers] == [
+        [100, 101, 102],
+        [103, 104],
+    ]
+    assert get_pdf_buffer(io.BytesIO(b"%PDF-1.7")) == b"%PDF-1.7"
+
+
+def test_unit_iter_buffers_splits_on_demand():
+    engine = PdfSplitEngine()
+    pdf_bytes = _make_pdf(5)
+
+    with patch(
+        "unstructured_client._hooks.custom.split_engine._export_pages",
+        wraps=_export_pages,
+    ) as export_pages:
+        chunk_buffers = engine.iter_buffers(pdf_bytes, get_page_ranges(2, 1, 5))
+        first_chunk = next(chunk_buffers)
+        chunk_buffers.close()
+
+    assert _page_widths(first_chunk) == [100, 101]
+    export_pages.assert_called_once()
+
+
+def test_unit_split_in_process_is_safe_across_threads():
+    engine = PdfSplitEngine()
+    documents = [_make_pdf(num_pages) for num_pages in range(3, 11)]
+
+    def _split(pdf_bytes: bytes) -> list[list[int]]:
+        page_ranges = get_page_ranges(2, 1, len(_page_widths(pdf_bytes)))
+        return [
+            _page_widths(chunk_buffer)
+            for chunk_buffer in engine.split_to_buffers(pdf_bytes, page_ranges)
+        ]
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_split, documents * 4))
+
+    for pdf_bytes, chunks in zip(documents * 4, results):
+        widths = _page_widths(pdf_bytes)
+        assert chunks == [widths[start:start + 2] for start in range(0, len(widths), 2)]
+
+
+def test_unit_split_with_worker_processes(tmp_path: Path):
+    engine = PdfSplitEngine(workers=2)
+    pdf_bytes = _make_pdf(5)
+    page_ranges = get_page_ranges(2, 2, 5)
+
+    try:
+        chunk_buffers = engine.split_to_buffers(pdf_bytes, page_ranges)
+        chunk_paths = engine.split_to_files(pdf_bytes, page_ranges, tmp_path)
+    finally:
+        engine.close()
+
+    expected = [[101, 102], [103, 104]]
+    assert [_page_widths(chunk_buffer) for chunk_buffer in chunk_buffers] == expected
+    assert [_page_widths(str(chunk_path)) for chunk_path in chunk_paths] == expected
+    # Only the chunks are left behind, the spilled source file is removed.
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["chunk_1.pdf", "chunk_2.pdf"]
+
+
+def test_unit_export_pages_writes_fixed_file_id(tmp_path: Path):
+    pdf = pdfium.PdfDocument(_make_pdf(3))
+    first, second = io.BytesIO(), io.BytesIO()
+    _export_pages(pdf, (0, 2), first)
+    _export_pages(pdf, (0, 2), second)
+    _export_pages(pdf, (0, 2), str(tmp_path / "chunk.pdf"))
+
+    # PDFium writes a random file ID, the same pages must give the same bytes.
+    assert first.getvalue() == second.getvalue()
+    assert (tmp_path / "chunk.pdf").read_bytes() == first.getvalue()
+    assert b"/ID[<" + b"0" * 32 + b">" in first.getvalue()
+    assert len(pdfium.PdfDocument(first.getvalue())) == 2
+
+
+def test_unit_split_engine_rejects_negative_workers():
+    with pytest.raises(ValueError):
+        PdfSplitEngine(workers=-1)
+
+    engine = PdfSplitEngine()
+    with pytest.raises(ValueError):
+        engine.configure(-1)
+    assert engine.workers == 0
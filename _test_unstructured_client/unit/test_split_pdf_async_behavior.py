@@ -185,7 +185,7 @@ async def test_partition_async_split_collects_chunks_in_order_without_executor()
 
     assert response.json() == [{"page_number": 1}, {"page_number": 3}]
     assert max_active_chunks == 2
-    assert operation_id not in split_hook.executors
+    assert operation_id not in split_hook.operation_tasks
     assert operation_id not in split_hook.coroutines_to_execute
 
 
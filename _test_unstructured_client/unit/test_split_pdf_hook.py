@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import io
+import json
 import logging
 import threading
 from collections import Counter
@@ -16,7 +17,9 @@ import pytest
 import requests  # type: ignore[import-untyped]
 from requests_toolbelt import MultipartDecoder  # type: ignore[import-untyped]
 
+from unstructured_client import UnstructuredClient
 from unstructured_client._hooks.custom import form_utils, pdf_utils, request_utils
+from unstructured_client._hooks.custom.client_pool import PooledTask
 from unstructured_client._hooks.custom.form_utils import (
     FormData,
     PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
@@ -24,6 +27,7 @@ from unstructured_client._hooks.custom.form_utils import (
     PARTITION_FORM_PAGE_RANGE_KEY,
 )
 from unstructured_client._hooks.custom.split_pdf_hook import (
+    CHUNK_LOOKAHEAD,
     DEFAULT_CACHE_TMP_DATA_DIR,
     DEFAULT_CONCURRENCY_LEVEL,
     DEFAULT_STARTING_PAGE_NUMBER,
@@ -31,6 +35,7 @@ from unstructured_client._hooks.custom.split_pdf_hook import (
     MAX_PAGES_PER_SPLIT,
     MIN_PAGES_PER_SPLIT,
     SPLIT_PDF_HEADER_PREFIX,
+    LazyChunkTasks,
     SplitPdfHook,
     _get_request_timeout_seconds,
     get_optimal_split_size,
@@ -39,10 +44,10 @@ from unstructured_client._hooks.custom.split_pdf_hook import (
 from unstructured_client._hooks.sdkhooks import SDKHooks
 from unstructured_client._hooks.types import AfterErrorContext, AfterSuccessContext, BeforeRequestContext
 from unstructured_client.basesdk import BaseSDK
-from unstructured_client.models import shared
+from unstructured_client.models import operations, shared
 from unstructured_client.sdkconfiguration import SDKConfiguration
 from unstructured_client.types import UNSET
-from unstructured_client.utils import BackoffStrategy, RetryConfig
+from unstructured_client.utils import BackoffStrategy, RetryBudget, RetryConfig
 
 
 def test_unit_clear_operation():
@@ -115,19 +120,50 @@ def test_unit_prepare_request_headers():
     assert dict(headers) == expected_headers
 
 
-def test_unit_create_response():
-    """Test create response method properly overrides body elements and Content-Length header."""
+def test_unit_create_elements_response_serializes_only_when_read():
     test_elements = [{"key": "value"}, {"key_2": "value"}]
 
-    expected_status_code = 200
-    expected_content = b'[{"key": "value"}, {"key_2": "value"}]'
-    expected_content_length = "38"
+    with patch(
+        "unstructured_client._hooks.custom.request_utils.json.dumps",
+        wraps=json.dumps,
+    ) as dumps:
+        response = request_utils.create_elements_response(test_elements)
+
+        assert response.status_code == 200
+        assert response.extensions[request_utils.PARSED_ELEMENTS_EXTENSION_KEY] is test_elements
+        dumps.assert_not_called()
+
+        assert response.json() == test_elements
+        assert response.content == b'[{"key": "value"}, {"key_2": "value"}]'
+        dumps.assert_called_once()
 
-    response = request_utils.create_response(test_elements)
 
-    assert response.status_code == expected_status_code
-    assert response._content == expected_content
-    assert response.headers.get("Content-Length") == expected_content_length
+def test_unit_partition_uses_parsed_elements_without_json_round_trip():
+    test_elements = [{"type": "Title", "text": "parsed"}]
+
+    class _ElementsHook:
+        def after_success(self, hook_ctx, response):
+            return request_utils.create_elements_response(test_elements)
+
+    client = UnstructuredClient(
+        api_key_auth="",
+        client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        ),
+    )
+    client.sdk_configuration.__dict__["_hooks"].register_after_success_hook(_ElementsHook())
+
+    with patch("unstructured_client.general.unmarshal_json_response") as unmarshal:
+        res = client.general.partition(
+            request=operations.PartitionRequest(
+                partition_parameters=shared.PartitionParameters(
+                    files=shared.Files(content=b"text", file_name="test.txt"),
+                )
+            )
+        )
+
+    unmarshal.assert_not_called()
+    assert res.elements == test_elements
 
 
 def test_unit_decode_content_disposition():
@@ -588,6 +624,21 @@ def _httpx_json_response(payload: list[dict], status_code: int = 200) -> httpx.R
     )
 
 
+def _fake_pooled_task(future: futures.Future, cancel_result: bool = True) -> MagicMock:
+    pooled_task = MagicMock()
+    pooled_task.future = future
+    pooled_task.cancel.return_value = cancel_result
+    return pooled_task
+
+
+def _submit_fake_pooled_task(pooled_task: MagicMock):
+    def _submit(coro):
+        coro.close()
+        return pooled_task
+
+    return _submit
+
+
 async def _transport_error_request(
     async_client: httpx.AsyncClient,  # pragma: no cover - signature compatibility
     limiter: asyncio.Semaphore,  # pragma: no cover - signature compatibility
@@ -622,6 +673,7 @@ def _make_hook_with_split_request(
     timeout_extension: object = _MISSING,
     config_timeout_ms: int | None = 12_000,
     retry_config: RetryConfig | object = UNSET,
+    retry_budget: RetryBudget | None = None,
     allow_failed: str | None = None,
     cache_tmp_data: str | None = None,
     pdf_chunks: list[tuple[io.BytesIO, int]] | None = None,
@@ -636,6 +688,7 @@ def _make_hook_with_split_request(
     hook_ctx.config = MagicMock()
     hook_ctx.config.timeout_ms = config_timeout_ms
     hook_ctx.config.retry_config = retry_config
+    hook_ctx.config.retry_budget = retry_budget
 
     request_extensions: dict[str, object] = {}
     if timeout_extension is not _MISSING and timeout_extension is not None:
@@ -921,7 +974,7 @@ def test_before_request_logs_split_plan(caplog: pytest.LogCaptureFixture):
 
     operation_id = result.headers["operation_id"]
     assert f"event=plan_created operation_id={operation_id}" in caplog.text
-    assert "chunk_count=2" in caplog.text
+    assert "split_size=10 chunk_count=10" in caplog.text
     assert "allow_failed=True" in caplog.text
     assert "cache_mode=disabled" in caplog.text
 
@@ -931,7 +984,7 @@ def test_after_error_cleans_up_split_state():
     hook, mock_hook_ctx, result = _make_hook_with_split_request()
     operation_id = result.headers["operation_id"]
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id in hook.coroutines_to_execute
 
     error_ctx = MagicMock(spec=AfterErrorContext)
@@ -939,7 +992,7 @@ def test_after_error_cleans_up_split_state():
 
     hook.after_error(error_ctx, None, httpx.ConnectError("DNS failed", request=result))
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.operation_timeouts
     assert operation_id not in hook.pending_operation_ids
@@ -1054,6 +1107,108 @@ async def test_unit_run_tasks_disallow_failed_transport_exception_cancels_remain
     assert cancelled_counter["cancelled"] > 0
 
 
+def _lazy_chunk_tasks(
+    chunk_count: int,
+    request: Any,
+    produced: list[int],
+) -> LazyChunkTasks:
+    def _chunks():
+        for page_index in range(chunk_count):
+            produced.append(page_index)
+            yield io.BytesIO(b"chunk"), page_index
+
+    return LazyChunkTasks(
+        _chunks(),
+        chunk_count=chunk_count,
+        build_task=lambda pdf_chunk_file, page_index, chunk_index: partial(
+            request,
+            chunk_index=chunk_index,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_unit_run_tasks_splits_lazy_chunks_ahead_of_free_slots():
+    produced: list[int] = []
+    finished: list[int] = []
+    chunks_alive: list[int] = []
+
+    async def _request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+        chunk_index: int,
+    ) -> httpx.Response:
+        chunks_alive.append(len(produced) - len(finished))
+        await asyncio.sleep(0.01)
+        finished.append(chunk_index)
+        return _httpx_response(str(chunk_index))
+
+    tasks = _lazy_chunk_tasks(10, _request, produced)
+    responses = await run_tasks(tasks, concurrency_level=2)
+
+    assert [response.text for _, response in responses] == [str(index) for index in range(1, 11)]
+    # The first upload starts before the document is fully split, and no more
+    # than the look-ahead window of chunks is held at once.
+    assert chunks_alive[0] < 10
+    assert max(chunks_alive) <= 2 + CHUNK_LOOKAHEAD
+
+
+@pytest.mark.asyncio
+async def test_unit_run_tasks_stops_splitting_lazy_chunks_after_failure():
+    produced: list[int] = []
+
+    async def _request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+        chunk_index: int,
+    ) -> httpx.Response:
+        if chunk_index == 1:
+            return _httpx_response("failure", status_code=500)
+        await asyncio.sleep(0.5)
+        return _httpx_response(str(chunk_index))
+
+    tasks = _lazy_chunk_tasks(20, _request, produced)
+    responses = await run_tasks(tasks, concurrency_level=2, allow_failed=False)
+
+    assert [response.status_code for _, response in responses] == [500]
+    assert len(produced) <= 2 + CHUNK_LOOKAHEAD
+
+
+def test_unit_lazy_chunk_tasks_close_releases_unsent_chunks(tmp_path: Path):
+    chunk_files = []
+    source_released = threading.Event()
+
+    def _chunks():
+        try:
+            for page_index in range(3):
+                chunk_path = tmp_path / f"chunk_{page_index}.pdf"
+                chunk_path.write_bytes(b"chunk")
+                chunk_files.append(open(chunk_path, "rb"))
+                yield chunk_files[-1], page_index
+        finally:
+            source_released.set()
+
+    tasks = LazyChunkTasks(
+        _chunks(),
+        chunk_count=3,
+        build_task=lambda pdf_chunk_file, page_index, chunk_index: partial(
+            _request_mock,
+            fails=False,
+            content=str(chunk_index),
+        ),
+    )
+    next(tasks)
+    next(tasks)
+    # The first chunk was sent, which closes its file.
+    chunk_files[0].close()
+
+    assert tasks.close() == 1
+    assert source_released.is_set()
+    assert all(chunk_file.closed for chunk_file in chunk_files)
+    assert list(tasks) == []
+    assert len(tasks) == 3
+
+
 def test_unit_concurrent_operations_use_independent_state():
     hook = SplitPdfHook()
     hook.sdk_init(base_url="http://localhost:8888", client=httpx.Client())
@@ -1098,10 +1253,10 @@ def test_unit_after_error_cleans_only_matching_operation_on_transport_failure():
         httpx.ConnectError("DNS failed", request=first_result),
     )
 
-    assert first_operation_id not in hook.executors
+    assert first_operation_id not in hook.operation_tasks
     assert first_operation_id not in hook.coroutines_to_execute
     assert first_operation_id not in hook.pending_operation_ids
-    assert second_operation_id not in hook.executors
+    assert second_operation_id not in hook.operation_tasks
     assert second_operation_id in hook.coroutines_to_execute
     assert second_operation_id in hook.pending_operation_ids
 
@@ -1219,29 +1374,16 @@ async def test_unit_sdk_hooks_before_request_async_runs_sync_hooks_off_loop():
 
 
 @pytest.mark.asyncio
-async def test_unit_sdk_hooks_before_request_async_serializes_same_sync_hook_instance():
-    release_hooks = threading.Event()
-    first_hook_started = threading.Event()
-    active_lock = threading.Lock()
-    active_hooks = 0
-    max_active_hooks = 0
+async def test_unit_sdk_hooks_before_request_async_runs_same_sync_hook_instance_concurrently():
+    both_hooks_started = threading.Barrier(2, timeout=1)
 
     class SyncHook:
         def before_request(self, hook_ctx, request):
-            nonlocal active_hooks, max_active_hooks
             del hook_ctx
-            with active_lock:
-                active_hooks += 1
-                max_active_hooks = max(max_active_hooks, active_hooks)
-                if active_hooks == 1:
-                    first_hook_started.set()
-            try:
-                release_hooks.wait(timeout=1)
-                request.headers["X-Sync-Before-Hook"] = "called"
-                return request
-            finally:
-                with active_lock:
-                    active_hooks -= 1
+            # Both calls must be inside the hook at once to pass the barrier.
+            both_hooks_started.wait()
+            request.headers["X-Sync-Before-Hook"] = "called"
+            return request
 
     hooks = SDKHooks()
     hooks.before_request_hooks = [SyncHook()]  # type: ignore[list-item]
@@ -1249,24 +1391,19 @@ async def test_unit_sdk_hooks_before_request_async_serializes_same_sync_hook_ins
     first_request = httpx.Request("GET", "http://localhost/first")
     second_request = httpx.Request("GET", "http://localhost/second")
 
-    first_task = asyncio.create_task(hooks.before_request_async(hook_ctx, first_request))
-    await asyncio.to_thread(first_hook_started.wait, 1)
-    second_task = asyncio.create_task(hooks.before_request_async(hook_ctx, second_request))
-    await asyncio.sleep(0.01)
-    assert max_active_hooks == 1
-    release_hooks.set()
-
-    returned_first, returned_second = await asyncio.gather(first_task, second_task)
+    returned_first, returned_second = await asyncio.gather(
+        hooks.before_request_async(hook_ctx, first_request),
+        hooks.before_request_async(hook_ctx, second_request),
+    )
 
     assert returned_first is first_request
     assert returned_second is second_request
     assert first_request.headers["X-Sync-Before-Hook"] == "called"
     assert second_request.headers["X-Sync-Before-Hook"] == "called"
-    assert max_active_hooks == 1
 
 
 @pytest.mark.asyncio
-async def test_unit_split_pdf_before_request_async_serializes_setup():
+async def test_unit_split_pdf_before_request_async_runs_setups_concurrently():
     release_first_setup = threading.Event()
     first_setup_started = threading.Event()
     active_lock = threading.Lock()
@@ -1293,56 +1430,80 @@ async def test_unit_split_pdf_before_request_async_serializes_setup():
     first_request = httpx.Request("GET", "http://localhost/first")
     second_request = httpx.Request("GET", "http://localhost/second")
 
-    with patch.object(hook, "_before_request_unlocked", side_effect=slow_setup):
+    with patch.object(hook, "_prepare_split_request", side_effect=slow_setup):
         first_task = asyncio.create_task(hook.before_request_async(hook_ctx, first_request))
         await asyncio.to_thread(first_setup_started.wait, 1)
         second_task = asyncio.create_task(hook.before_request_async(hook_ctx, second_request))
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
         release_first_setup.set()
 
         returned_first, returned_second = await asyncio.gather(first_task, second_task)
 
     assert returned_first is first_request
     assert returned_second is second_request
-    assert max_active_setups == 1
+    assert max_active_setups == 2
 
 
-def test_unit_pdfium_helpers_require_split_setup_lock(tmp_path: Path):
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("split_pdf_page", "expected_setups"),
+    [("false", 0), ("true", 1)],
+)
+async def test_unit_split_pdf_before_request_async_skips_setup_thread_when_not_split(
+    split_pdf_page: str, expected_setups: int
+):
     hook = SplitPdfHook()
+    request = httpx.Request(
+        "POST",
+        "http://localhost:8888/general/v0/general",
+        data={"split_pdf_page": split_pdf_page},
+        files={"files": ("test.pdf", b"%PDF", "application/pdf")},
+    )
+    loop = asyncio.get_running_loop()
+
+    with patch.object(hook, "_prepare_split_request", return_value=request), \
+         patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as run_in_executor:
+        returned_request = await hook.before_request_async(
+            MagicMock(spec=BeforeRequestContext), request
+        )
+
+    assert returned_request is request
+    assert run_in_executor.call_count == expected_setups
 
-    with pytest.raises(RuntimeError, match="pypdfium split setup must run"):
-        hook._get_pdf_chunks_in_memory(b"%PDF", split_size=1)
 
-    with pytest.raises(RuntimeError, match="pypdfium split setup must run"):
-        hook._get_pdf_chunk_paths(
-            b"%PDF",
-            operation_id="operation-id",
-            cache_tmp_data_dir=str(tmp_path),
-            split_size=1,
+@pytest.mark.asyncio
+async def test_unit_run_tasks_arms_built_tasks_on_event_loop():
+    async def _request(index: int, async_client, limiter) -> httpx.Response:
+        return httpx.Response(200, json=[{"index": index}])
+
+    results: list[int] = []
+    with patch("asyncio.to_thread", side_effect=AssertionError("thread handoff")):
+        responses = await run_tasks(
+            [partial(_request, index) for index in range(3)],
+            async_client=MagicMock(),
+            on_result=lambda index, _response: results.append(index),
         )
 
+    assert [index for index, _ in responses] == [1, 2, 3]
+    assert sorted(results) == [1, 2, 3]
+
 
 def test_unit_pdfium_new_document_closes_when_in_memory_split_fails():
     hook = SplitPdfHook()
     new_pdf = MagicMock()
     new_pdf.import_pages.side_effect = RuntimeError("import failed")
     pdf_document = MagicMock()
-    pdf_document.__enter__.return_value = [MagicMock()]
-    pdf_document.__exit__.return_value = None
     pdf_document_factory = MagicMock(return_value=pdf_document)
     pdf_document_factory.new.return_value = new_pdf
 
-    hook._split_pdf_setup_state.locked = True
-    try:
-        with patch(
-            "unstructured_client._hooks.custom.split_pdf_hook.pdfium.PdfDocument",
-            pdf_document_factory,
-        ), pytest.raises(RuntimeError, match="import failed"):
-            hook._get_pdf_chunks_in_memory(b"%PDF", split_size=1)
-    finally:
-        hook._split_pdf_setup_state.locked = False
+    with patch(
+        "unstructured_client._hooks.custom.split_engine.pdfium.PdfDocument",
+        pdf_document_factory,
+    ), pytest.raises(RuntimeError, match="import failed"):
+        list(hook._get_pdf_chunks_in_memory(b"%PDF", page_ranges=[(0, 1)]))
 
     new_pdf.close.assert_called_once_with()
+    pdf_document.close.assert_called_once_with()
 
 
 def test_unit_pdfium_new_document_closes_when_cached_split_fails(tmp_path: Path):
@@ -1350,27 +1511,24 @@ def test_unit_pdfium_new_document_closes_when_cached_split_fails(tmp_path: Path)
     new_pdf = MagicMock()
     new_pdf.save.side_effect = RuntimeError("save failed")
     pdf_document = MagicMock()
-    pdf_document.__enter__.return_value = [MagicMock()]
-    pdf_document.__exit__.return_value = None
     pdf_document_factory = MagicMock(return_value=pdf_document)
     pdf_document_factory.new.return_value = new_pdf
 
-    hook._split_pdf_setup_state.locked = True
-    try:
-        with patch(
-            "unstructured_client._hooks.custom.split_pdf_hook.pdfium.PdfDocument",
-            pdf_document_factory,
-        ), pytest.raises(RuntimeError, match="save failed"):
+    with patch(
+        "unstructured_client._hooks.custom.split_engine.pdfium.PdfDocument",
+        pdf_document_factory,
+    ), pytest.raises(RuntimeError, match="save failed"):
+        list(
             hook._get_pdf_chunk_paths(
                 b"%PDF",
                 operation_id="operation-id",
                 cache_tmp_data_dir=str(tmp_path),
-                split_size=1,
+                page_ranges=[(0, 1)],
             )
-    finally:
-        hook._split_pdf_setup_state.locked = False
+        )
 
     new_pdf.close.assert_called_once_with()
+    pdf_document.close.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -1399,7 +1557,7 @@ async def test_unit_split_pdf_before_request_async_cancellation_cleans_prepared_
     hook_ctx.operation_id = "partition"
     request = httpx.Request("POST", "http://localhost:8888/general/v0/general")
 
-    with patch.object(hook, "_before_request_unlocked", side_effect=slow_setup):
+    with patch.object(hook, "_prepare_split_request", side_effect=slow_setup):
         task = asyncio.create_task(hook.before_request_async(hook_ctx, request))
         await asyncio.to_thread(setup_started.wait, 1)
         task.cancel()
@@ -1413,41 +1571,10 @@ async def test_unit_split_pdf_before_request_async_cancellation_cleans_prepared_
     assert operation_id not in hook.tempdirs
     tempdir.cleanup.assert_called_once()
 
-    with patch.object(hook, "_before_request_unlocked", return_value=request):
+    with patch.object(hook, "_prepare_split_request", return_value=request):
         assert await asyncio.wait_for(hook.before_request_async(hook_ctx, request), timeout=1) is request
 
 
-@pytest.mark.asyncio
-async def test_unit_split_pdf_before_request_async_cancellation_before_admission_does_not_queue():
-    setup_started = threading.Event()
-    release_setup = threading.Event()
-    hook = SplitPdfHook()
-    hook_ctx = MagicMock(spec=BeforeRequestContext)
-    hook_ctx.operation_id = "partition"
-    request = httpx.Request("POST", "http://localhost:8888/general/v0/general")
-
-    def slow_setup(hook_ctx_arg, request_arg):
-        del hook_ctx_arg
-        setup_started.set()
-        release_setup.wait(timeout=1)
-        return request_arg
-
-    with patch.object(hook, "_before_request_unlocked", side_effect=slow_setup) as mock_setup:
-        first_task = asyncio.create_task(hook.before_request_async(hook_ctx, request))
-        await asyncio.to_thread(setup_started.wait, 1)
-        second_task = asyncio.create_task(hook.before_request_async(hook_ctx, request))
-        await asyncio.sleep(0)
-
-        second_task.cancel()
-        with pytest.raises(asyncio.CancelledError):
-            await second_task
-
-        release_setup.set()
-        assert await asyncio.wait_for(first_task, timeout=1) is request
-
-    assert mock_setup.call_count == 1
-
-
 @pytest.mark.asyncio
 async def test_unit_do_request_async_cancellation_during_before_request_cancels_setup():
     setup_started = threading.Event()
@@ -1507,12 +1634,14 @@ async def test_unit_before_request_threads_client_retry_config_into_chunk_execut
         BackoffStrategy(1, 2, 3.0, 4),
         retry_connection_errors=False,
     )
+    retry_budget = RetryBudget()
     hook, _, result = _make_hook_with_split_request(
         retry_config=retry_config,
+        retry_budget=retry_budget,
         pdf_chunks=[(io.BytesIO(b"chunk"), 0)],
     )
     operation_id = result.headers["operation_id"]
-    coroutine = hook.coroutines_to_execute[operation_id][0]
+    coroutine = next(iter(hook.coroutines_to_execute[operation_id]))
 
     with patch(
         "unstructured_client._hooks.custom.request_utils.call_api_async",
@@ -1522,6 +1651,7 @@ async def test_unit_before_request_threads_client_retry_config_into_chunk_execut
             await coroutine(async_client=client, limiter=asyncio.Semaphore(1))
 
     assert mock_call_api_async.await_args.kwargs["retry_config"] is retry_config
+    assert mock_call_api_async.await_args.kwargs["retry_budget"] is retry_budget
 
 
 def test_unit_after_success_clears_on_await_elements_exception():
@@ -1535,7 +1665,7 @@ def test_unit_after_success_clears_on_await_elements_exception():
         with pytest.raises(RuntimeError):
             hook.after_success(success_ctx, response)
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.pending_operation_ids
 
@@ -1552,7 +1682,7 @@ async def test_unit_after_success_async_clears_on_await_elements_exception():
         with pytest.raises(RuntimeError):
             await hook.after_success_async(success_ctx, response)
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.pending_operation_ids
 
@@ -1567,7 +1697,7 @@ async def test_unit_after_success_async_collects_chunks_without_sync_executor():
     success_ctx = MagicMock(spec=AfterSuccessContext)
     success_ctx.operation_id = "partition"
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
 
     with patch(
         "unstructured_client._hooks.custom.request_utils.call_api_async",
@@ -1582,11 +1712,98 @@ async def test_unit_after_success_async_collects_chunks_without_sync_executor():
 
     assert returned_response.json() == [{"page_number": 1}, {"page_number": 3}]
     assert mock_call_api_async.await_count == 2
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.pending_operation_ids
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_client_supplied", [True, False])
+async def test_unit_after_success_async_reuses_sdk_async_client_when_supplied(
+    async_client_supplied: bool,
+):
+    hook = SplitPdfHook()
+    operation_id = "supplied-async-client"
+    seen_clients: list[httpx.AsyncClient] = []
+
+    async def _record_request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+    ) -> httpx.Response:
+        del limiter
+        seen_clients.append(async_client)
+        return _httpx_json_response([{"page_number": 1}])
+
+    hook.coroutines_to_execute[operation_id] = [partial(_record_request)]
+    hook.cache_tmp_data_feature[operation_id] = False
+    response = httpx.Response(
+        status_code=200,
+        request=httpx.Request(
+            "GET",
+            "http://localhost:8888/general/docs",
+            extensions={"split_pdf_operation_id": operation_id},
+        ),
+    )
+    sdk_async_client = httpx.AsyncClient()
+    success_ctx = MagicMock(spec=AfterSuccessContext)
+    success_ctx.operation_id = "partition"
+    success_ctx.config = MagicMock()
+    success_ctx.config.async_client = sdk_async_client
+    success_ctx.config.async_client_supplied = async_client_supplied
+
+    try:
+        await hook.after_success_async(success_ctx, response)
+    finally:
+        hook.close()
+        await sdk_async_client.aclose()
+
+    assert (seen_clients[0] is sdk_async_client) is async_client_supplied
+
+
+def test_unit_after_success_warns_once_that_sync_calls_skip_supplied_async_client(
+    caplog: pytest.LogCaptureFixture,
+):
+    caplog.set_level(logging.WARNING, logger="unstructured-client")
+    hook = SplitPdfHook()
+    seen_clients: list[httpx.AsyncClient] = []
+
+    async def _record_request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+    ) -> httpx.Response:
+        del limiter
+        seen_clients.append(async_client)
+        return _httpx_json_response([{"page_number": 1}])
+
+    sdk_async_client = httpx.AsyncClient()
+    success_ctx = MagicMock(spec=AfterSuccessContext)
+    success_ctx.operation_id = "partition"
+    success_ctx.config = MagicMock()
+    success_ctx.config.async_client = sdk_async_client
+    success_ctx.config.async_client_supplied = True
+
+    try:
+        for operation_id in ("sync-call-1", "sync-call-2"):
+            hook.coroutines_to_execute[operation_id] = [partial(_record_request)]
+            hook.cache_tmp_data_feature[operation_id] = False
+            response = httpx.Response(
+                status_code=200,
+                request=httpx.Request(
+                    "GET",
+                    "http://localhost:8888/general/docs",
+                    extensions={"split_pdf_operation_id": operation_id},
+                ),
+            )
+            hook.after_success(success_ctx, response)
+    finally:
+        hook.close()
+        asyncio.run(sdk_async_client.aclose())
+
+    assert len(seen_clients) == 2
+    assert all(client is not sdk_async_client for client in seen_clients)
+    assert caplog.text.count("event=sync_pool_client") == 1
+
+
 @pytest.mark.asyncio
 async def test_unit_after_success_async_cancels_pending_chunks_and_clears_state():
     hook, _, result = _make_hook_with_split_request(
@@ -1624,7 +1841,7 @@ async def test_unit_after_success_async_cancels_pending_chunks_and_clears_state(
         await task
 
     assert cancelled_counter["cancelled"] == 2
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.pending_operation_ids
 
@@ -1668,32 +1885,51 @@ async def test_unit_after_success_async_timeout_cancels_chunks_and_clears_state(
     tempdir.cleanup.assert_called_once()
 
 
-def test_unit_after_success_sync_lazily_creates_and_cleans_executor():
-    hook, _, result = _make_hook_with_split_request(
-        pdf_chunks=[(io.BytesIO(b"chunk"), 0)],
-    )
-    operation_id = result.headers["operation_id"]
-    response = httpx.Response(status_code=200, request=result)
+def test_unit_after_success_sync_reuses_pooled_client_across_operations():
+    hook = SplitPdfHook()
     success_ctx = MagicMock(spec=AfterSuccessContext)
     success_ctx.operation_id = "partition"
-    fake_executor = MagicMock()
-    fake_future = MagicMock()
-    fake_future.done.return_value = True
-    fake_future.result.return_value = [(1, _httpx_json_response([{"page_number": 1}]))]
-    fake_executor.submit.return_value = fake_future
+    seen_clients: list[httpx.AsyncClient] = []
+    seen_threads: list[str] = []
 
-    with patch(
-        "unstructured_client._hooks.custom.split_pdf_hook.futures.ThreadPoolExecutor",
-        return_value=fake_executor,
-    ):
-        returned_response = hook.after_success(success_ctx, response)
+    async def _record_request(
+        async_client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+        page_number: int,
+    ) -> httpx.Response:
+        del limiter
+        seen_clients.append(async_client)
+        seen_threads.append(threading.current_thread().name)
+        return _httpx_json_response([{"page_number": page_number}])
 
-    assert returned_response.json() == [{"page_number": 1}]
-    fake_executor.submit.assert_called_once()
-    fake_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
-    assert operation_id not in hook.executors
-    assert operation_id not in hook.coroutines_to_execute
-    assert operation_id not in hook.pending_operation_ids
+    try:
+        for operation_id in ("pooled-op-1", "pooled-op-2"):
+            hook.coroutines_to_execute[operation_id] = [
+                partial(_record_request, page_number=1),
+                partial(_record_request, page_number=2),
+            ]
+            hook.cache_tmp_data_feature[operation_id] = False
+            response = httpx.Response(
+                status_code=200,
+                request=httpx.Request(
+                    "GET",
+                    "http://localhost:8888/general/docs",
+                    extensions={"split_pdf_operation_id": operation_id},
+                ),
+            )
+
+            returned_response = hook.after_success(success_ctx, response)
+
+            assert returned_response.json() == [{"page_number": 1}, {"page_number": 2}]
+            assert operation_id not in hook.operation_tasks
+            assert operation_id not in hook.coroutines_to_execute
+    finally:
+        hook.close()
+
+    assert len(seen_clients) == 4
+    assert len({id(client) for client in seen_clients}) == 1
+    assert seen_clients[0].is_closed
+    assert set(seen_threads) == {"split-pdf-io"}
 
 
 def test_unit_future_timeout_triggers_cleanup(caplog: pytest.LogCaptureFixture):
@@ -1710,36 +1946,29 @@ def test_unit_future_timeout_triggers_cleanup(caplog: pytest.LogCaptureFixture):
         raise futures.TimeoutError()
 
     fake_future.result = _raise_timeout  # type: ignore[method-assign]
-    fake_executor = MagicMock()
+    pooled_task = _fake_pooled_task(fake_future)
     tempdir = MagicMock()
     tempdir.name = "/tmp/test-split-timeout"
-    loop = MagicMock()
-
-    def _submit_side_effect(*args, **kwargs):
-        args[1].close()
-        loop_holder = args[2]
-        loop_holder["loop"] = loop
-        return fake_future
-
-    fake_executor.submit.side_effect = _submit_side_effect
-    hook.executors[operation_id] = fake_executor
     hook.tempdirs[operation_id] = tempdir
 
-    with pytest.raises(futures.TimeoutError):
-        hook.after_success(success_ctx, response)
+    with patch.object(
+        hook.chunk_client_pool,
+        "submit",
+        side_effect=_submit_fake_pooled_task(pooled_task),
+    ):
+        with pytest.raises(futures.TimeoutError):
+            hook.after_success(success_ctx, response)
 
-    assert operation_id not in hook.executors
+    assert operation_id not in hook.operation_tasks
     assert operation_id not in hook.coroutines_to_execute
     assert operation_id not in hook.pending_operation_ids
-    loop.call_soon_threadsafe.assert_called()
+    pooled_task.cancel.assert_called()
     tempdir.cleanup.assert_not_called()
-    fake_executor.shutdown.assert_not_called()
     assert f"event=batch_timeout operation_id={operation_id}" in caplog.text
 
     fake_future.set_exception(futures.CancelledError())
 
     tempdir.cleanup.assert_called_once()
-    fake_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
 
 
 def test_unit_future_timeout_preserves_timeout_when_loop_is_closed(
@@ -1758,50 +1987,40 @@ def test_unit_future_timeout_preserves_timeout_when_loop_is_closed(
         raise futures.TimeoutError()
 
     fake_future.result = _raise_timeout  # type: ignore[method-assign]
-    fake_executor = MagicMock()
+    pooled_task = _fake_pooled_task(fake_future, cancel_result=False)
     tempdir = MagicMock()
     tempdir.name = "/tmp/test-split-timeout-closed-loop"
-    loop = MagicMock()
-    loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
-
-    def _submit_side_effect(*args, **kwargs):
-        loop_holder = args[2]
-        loop_holder["loop"] = loop
-        return fake_future
-
-    fake_executor.submit.side_effect = _submit_side_effect
-    hook.executors[operation_id] = fake_executor
     hook.tempdirs[operation_id] = tempdir
 
-    with pytest.raises(futures.TimeoutError):
-        hook.after_success(success_ctx, response)
+    with patch.object(
+        hook.chunk_client_pool,
+        "submit",
+        side_effect=_submit_fake_pooled_task(pooled_task),
+    ):
+        with pytest.raises(futures.TimeoutError):
+            hook.after_success(success_ctx, response)
 
     assert "event=loop_closed_during_cancel" in caplog.text
-    fake_future.set_exception(futures.CancelledError())
+    # No loop is left to run the chunk tasks, so cleanup does not wait for them.
     tempdir.cleanup.assert_called_once()
-    fake_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
 
 
 def test_unit_clear_operation_does_not_raise_when_loop_is_closed():
     hook = SplitPdfHook()
     operation_id = "loop-closed-clear-operation"
-    future: futures.Future[list[tuple[int, httpx.Response]]] = futures.Future()
-    executor = MagicMock()
+    loop = asyncio.new_event_loop()
+    loop.close()
+    pooled_task = PooledTask(loop)
     tempdir = MagicMock()
-    loop = MagicMock()
-    loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
 
     hook.coroutines_to_execute[operation_id] = [MagicMock()]
-    hook.executors[operation_id] = executor
     hook.tempdirs[operation_id] = tempdir
-    hook.operation_futures[operation_id] = future
-    hook.operation_loops[operation_id] = {"loop": loop}
+    hook.operation_tasks[operation_id] = pooled_task
 
     hook._clear_operation(operation_id)
 
-    future.set_result([])
+    assert pooled_task.cancel() is False
     tempdir.cleanup.assert_called_once()
-    executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
 
 
 @pytest.mark.asyncio
@@ -1859,18 +2078,19 @@ def test_unit_allow_failed_partial_results(caplog: pytest.LogCaptureFixture):
     hook.concurrency_level[operation_id] = 3
     hook.allow_failed[operation_id] = True
     hook.cache_tmp_data_feature[operation_id] = False
-    executor = MagicMock()
-    hook.executors[operation_id] = executor
-
-    fake_future = MagicMock()
-    fake_future.result.return_value = [
+    fake_future: futures.Future[list[tuple[int, httpx.Response]]] = futures.Future()
+    fake_future.set_result([
         (1, _httpx_json_response([{"page_number": 1}])),
         (2, _httpx_response("boom", status_code=500)),
         (3, _httpx_json_response([{"page_number": 3}])),
-    ]
-    executor.submit.return_value = fake_future
+    ])
 
-    elements = hook._await_elements(operation_id)
+    with patch.object(
+        hook.chunk_client_pool,
+        "submit",
+        side_effect=_submit_fake_pooled_task(_fake_pooled_task(fake_future)),
+    ):
+        elements = hook._await_elements(operation_id)
 
     assert elements == [{"page_number": 1}, {"page_number": 3}]
     assert len(hook.api_failed_responses[operation_id]) == 1
@@ -1886,16 +2106,18 @@ def test_unit_allow_failed_all_fail_records_failures():
     hook.concurrency_level[operation_id] = 2
     hook.allow_failed[operation_id] = True
     hook.cache_tmp_data_feature[operation_id] = False
-    hook.executors[operation_id] = MagicMock()
-
-    fake_future = MagicMock()
-    fake_future.result.return_value = [
+    fake_future: futures.Future[list[tuple[int, httpx.Response]]] = futures.Future()
+    fake_future.set_result([
         (1, _httpx_response("boom", status_code=500)),
         (2, _httpx_response("boom", status_code=500)),
-    ]
-    hook.executors[operation_id].submit.return_value = fake_future
+    ])
 
-    assert hook._await_elements(operation_id) == []
+    with patch.object(
+        hook.chunk_client_pool,
+        "submit",
+        side_effect=_submit_fake_pooled_task(_fake_pooled_task(fake_future)),
+    ):
+        assert hook._await_elements(operation_id) == []
     assert len(hook.api_failed_responses[operation_id]) == 2
 
 
@@ -1954,7 +2176,6 @@ def test_unit_disallow_failed_after_success_returns_first_failed_response():
 def test_before_request_failure_after_state_setup_cleans_partial_operation():
     hook = SplitPdfHook()
     hook.sdk_init(base_url="http://localhost:8888", client=httpx.Client())
-    executor = MagicMock()
     tempdir = MagicMock()
     tempdir.name = "/tmp/before-request-failure"
     hook_ctx = MagicMock(spec=BeforeRequestContext)
@@ -1992,11 +2213,9 @@ def test_before_request_failure_after_state_setup_cleans_partial_operation():
          patch("unstructured_client._hooks.custom.pdf_utils.read_pdf") as mock_read_pdf, \
          patch("unstructured_client._hooks.custom.pdf_utils.check_pdf") as mock_check_pdf, \
          patch("unstructured_client._hooks.custom.request_utils.get_base_url") as mock_get_base_url, \
-         patch("unstructured_client._hooks.custom.split_pdf_hook.futures.ThreadPoolExecutor", return_value=executor), \
-         patch("unstructured_client._hooks.custom.request_utils.create_pdf_chunk_request", side_effect=RuntimeError("chunk build failed")), \
          patch.object(hook, "_trim_large_pages", side_effect=lambda pdf, fd: pdf), \
          patch.object(hook, "_get_pdf_chunk_paths", side_effect=_chunk_paths_side_effect), \
-         patch.object(hook, "_get_pdf_chunk_files", return_value=[(io.BytesIO(b"chunk"), 0)]):
+         patch.object(hook, "_get_pdf_chunk_files", side_effect=RuntimeError("chunk build failed")):
         mock_get_fields.return_value = mock_form_data
         mock_read_pdf.return_value = mock_pdf_reader
         mock_check_pdf.return_value = mock_pdf_reader
@@ -2006,7 +2225,7 @@ def test_before_request_failure_after_state_setup_cleans_partial_operation():
             hook.before_request(hook_ctx, request)
 
     assert hook.coroutines_to_execute == {}
-    assert hook.executors == {}
+    assert hook.operation_tasks == {}
     assert hook.tempdirs == {}
     assert hook.operation_timeouts == {}
     assert hook.operation_retry_configs == {}
@@ -2014,4 +2233,3 @@ def test_before_request_failure_after_state_setup_cleans_partial_operation():
     assert hook.cache_tmp_data_feature == {}
     assert hook.cache_tmp_data_dir == {}
     tempdir.cleanup.assert_called_once()
-    executor.shutdown.assert_not_called()
\ No newline at end of file
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import gzip
+import io
+import os
+
+import httpx
+import pytest
+from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.upload_compression import (
+    UploadCompression,
+    compress_file,
+)
+from unstructured_client._hooks.custom.upload_compression_hook import (
+    compress_partition_request,
+)
+
+TEXT = b"The quick brown fox jumps over the lazy dog.\n" * 2000
+
+
+def _get_parts(request: httpx.Request) -> dict[str, tuple[str, bytes]]:
+    decoder = MultipartDecoder(request.read(), request.headers["Content-Type"])
+    parts = {}
+    for part in decoder.parts:
+        disposition = part.headers[b"Content-Disposition"].decode()
+        name = disposition.split('name="')[1].split('"')[0]
+        parts[name] = (disposition, part.content)
+    return parts
+
+
+@pytest.mark.parametrize(
+    ("content", "content_type", "expected"),
+    [
+        (TEXT, "text/markdown", True),
+        (TEXT, "application/pdf", True),
+        (TEXT[:1024], "text/markdown", False),
+        (TEXT, "image/png", False),
+        (os.urandom(len(TEXT)), "application/pdf", False),
+    ],
+)
+def test_unit_should_compress(content, content_type, expected):
+    assert UploadCompression().should_compress(content, content_type) is expected
+
+
+def test_unit_compress_file_round_trip(monkeypatch):
+    module = "unstructured_client._hooks.custom.upload_compression"
+    monkeypatch.setattr(f"{module}.MAX_IN_MEMORY_SIZE", 64 * 1024)
+    monkeypatch.setattr(f"{module}.READ_BLOCK_SIZE", 16 * 1024)
+    content = TEXT + os.urandom(256 * 1024)
+
+    compressed = compress_file(io.BytesIO(content))
+
+    # Past the in-memory size, the stream is spooled to a temporary file.
+    assert isinstance(compressed, io.BufferedReader)
+    assert gzip.decompress(compressed.read()) == content
+    compressed.close()
+
+
+def test_unit_compress_partition_request_sends_gzip_file():
+    request = httpx.Request(
+        "POST",
+        "http://localhost:8000/general/v0/general",
+        data={"strategy": "fast"},
+        files={"files": ("notes.md", TEXT, "text/markdown")},
+    )
+
+    compressed_request = compress_partition_request(request, UploadCompression())
+
+    parts = _get_parts(compressed_request)
+    assert 'filename="notes.md.gz"' in parts["files"][0]
+    assert gzip.decompress(parts["files"][1]) == TEXT
+    assert parts["gz_uncompressed_content_type"][1] == b"text/markdown"
+    assert parts["strategy"][1] == b"fast"
+    # Compressed requests are left as they are.
+    assert compress_partition_request(compressed_request, UploadCompression()) is compressed_request
+
+
+def test_unit_create_pdf_chunk_request_compresses_chunk():
+    original_request = httpx.Request("POST", "http://localhost:8000/general/v0/general")
+
+    chunk_request = request_utils.create_pdf_chunk_request(
+        form_data={"strategy": "fast"},
+        pdf_chunk=(io.BytesIO(TEXT), 3),
+        original_request=original_request,
+        filename="document.pdf",
+        upload_compression=UploadCompression(),
+    )
+
+    parts = _get_parts(chunk_request)
+    assert 'filename="document.pdf.gz"' in parts["files"][0]
+    assert gzip.decompress(parts["files"][1]) == TEXT
+    assert parts["gz_uncompressed_content_type"][1] == b"application/pdf"
+    assert parts["starting_page_number"][1] == b"3"
@@ -0,0 +1,125 @@
+"""Measures the throughput of hook dispatch for threads sharing one client.
+
+Each caller thread runs its own event loop and sends `partition_async` calls,
+the way threads of a server sharing an `UnstructuredClient` would. The calls go
+through `SDKHooks` with a sync-only hook that blocks for `--hook-ms`, such as a
+hook fetching a token or writing an audit log. `serialized` holds a lock per
+hook instance around every call, like the former `SDKHooks` dispatch did, so
+only one thread at a time runs the hook. `concurrent` is `SDKHooks` as it is.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/hook_dispatch.py --threads 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent import futures
+from typing import Union
+
+import httpx
+
+from unstructured_client._hooks.sdkhooks import SDKHooks
+from unstructured_client._hooks.types import (
+    AfterSuccessContext,
+    AfterSuccessHook,
+    BeforeRequestContext,
+    BeforeRequestHook,
+    HookContext,
+)
+
+
+class BlockingHook(BeforeRequestHook, AfterSuccessHook):
+    """A sync-only hook that blocks for a fixed time on every call."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        time.sleep(self.seconds)
+        return request
+
+    def after_success(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> Union[httpx.Response, Exception]:
+        time.sleep(self.seconds)
+        return response
+
+
+class SerializedHook(BlockingHook):
+    """`BlockingHook` behind a lock held for the whole call."""
+
+    def __init__(self, seconds: float) -> None:
+        super().__init__(seconds)
+        self._lock = threading.Lock()
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        with self._lock:
+            return super().before_request(hook_ctx, request)
+
+    def after_success(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> Union[httpx.Response, Exception]:
+        with self._lock:
+            return super().after_success(hook_ctx, response)
+
+
+async def _send_calls(hooks: SDKHooks, calls: int) -> None:
+    context = HookContext(
+        config=None,  # type: ignore[arg-type]
+        base_url="http://localhost:8000",
+        operation_id="partition",
+        oauth2_scopes=None,
+        security_source=None,
+    )
+    hook_ctx = BeforeRequestContext(context)
+    success_ctx = AfterSuccessContext(context)
+    request = httpx.Request("POST", "http://localhost:8000/general/v0/general")
+    for _ in range(calls):
+        await hooks.before_request_async(hook_ctx, request)
+        await hooks.after_success_async(success_ctx, httpx.Response(200, request=request))
+
+
+def run(hook: BlockingHook, threads: int, calls_per_thread: int) -> float:
+    hooks = SDKHooks()
+    hooks.before_request_hooks = [hook]
+    hooks.after_success_hooks = [hook]
+
+    started_at = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        callers = [
+            executor.submit(asyncio.run, _send_calls(hooks, calls_per_thread))
+            for _ in range(threads)
+        ]
+        for caller in callers:
+            caller.result()
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--calls-per-thread", type=int, default=50)
+    parser.add_argument("--hook-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    seconds = args.hook_ms / 1000
+    for threads in args.threads:
+        total_calls = threads * args.calls_per_thread
+        baseline = run(SerializedHook(seconds), threads, args.calls_per_thread)
+        elapsed = run(BlockingHook(seconds), threads, args.calls_per_thread)
+        print(
+            f"threads={threads:>3} serialized={total_calls / baseline:8.0f} calls/s "
+            f"concurrent={total_calls / elapsed:8.0f} calls/s {baseline / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Compares split-PDF page requests over HTTP/1.1 and HTTP/2.
+
+A local stand-in for the partition API speaks HTTP/1.1 and HTTP/2 without TLS
+(h2c). It counts the connections it accepts, waits `--connect-ms` before it
+reads from a new connection, like a TCP and TLS handshake over a long link,
+and `--request-ms` before it answers each page request. Each mode partitions
+`--documents` documents one after the other with a new client, split in
+`--concurrency` page requests, and reports the connections opened and the
+latency of the first document and of the following ones.
+
+Requires the h2 package (`pip install httpx[http2]`).
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/http2_multiplexing.py --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import h11
+import h2.config  # type: ignore[import-not-found]
+import h2.connection  # type: ignore[import-not-found]
+import h2.events  # type: ignore[import-not-found]
+import h2.settings  # type: ignore[import-not-found]
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+
+from unstructured_client import UnstructuredClient
+from unstructured_client._hooks.custom.http2 import HTTP2
+from unstructured_client.models import operations, shared
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+READ_SIZE = 65536
+# Like envoy and nginx, the server advertises flow control windows larger than
+# the chunks, see `HTTP2`.
+WINDOW_SIZE = 2**24
+ELEMENTS = json.dumps([{"type": "NarrativeText", "text": "Lorem ipsum", "metadata": {}}]).encode()
+DEFAULT_PDF = Path(__file__).resolve().parents[2] / "_sample_docs" / "layout-parser-paper-fast.pdf"
+
+
+class StandInServer:
+    """HTTP/1.1 and h2c server answering every request with the same elements."""
+
+    def __init__(self, connect_delay: float, request_delay: float) -> None:
+        self.connect_delay = connect_delay
+        self.request_delay = request_delay
+        self.connections = 0
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._server: Optional[asyncio.Server] = None
+        self._handlers: set[asyncio.Task[None]] = set()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        for handler in self._handlers:
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        assert handler is not None
+        self._handlers.add(handler)
+        handler.add_done_callback(self._handlers.discard)
+        await asyncio.sleep(self.connect_delay)
+        try:
+            data = await reader.read(READ_SIZE)
+            if data.startswith(H2_PREFACE):
+                await self._serve_http2(data, reader, writer)
+            else:
+                await self._serve_http1(data, reader, writer)
+        except (ConnectionError, asyncio.CancelledError):
+            # The client went away or the server is stopping.
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h11.Connection(h11.SERVER)
+        connection.receive_data(data)
+        method = b""
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(READ_SIZE))
+            elif isinstance(event, h11.Request):
+                method = event.method
+            elif isinstance(event, h11.EndOfMessage):
+                if method == b"POST":
+                    await asyncio.sleep(self.request_delay)
+                headers = [("content-type", "application/json"), ("content-length", str(len(ELEMENTS)))]
+                writer.write(connection.send(h11.Response(status_code=200, headers=headers)))
+                writer.write(connection.send(h11.Data(data=ELEMENTS)))
+                writer.write(connection.send(h11.EndOfMessage()))
+                await writer.drain()
+                connection.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+    async def _serve_http2(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        connection.update_settings({h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: WINDOW_SIZE})
+        connection.increment_flow_control_window(WINDOW_SIZE)
+        responses: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.request_delay)
+            headers = [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(ELEMENTS))),
+            ]
+            connection.send_headers(stream_id, headers)
+            connection.send_data(stream_id, ELEMENTS, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    responses.add(task)
+                    task.add_done_callback(responses.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            await writer.drain()
+            data = await reader.read(READ_SIZE)
+
+
+def build_document(source: Path, num_pages: int, destination: Path) -> None:
+    """Repeats the pages of `source` until the document has `num_pages` pages."""
+    with pdfium.PdfDocument(str(source)) as src, pdfium.PdfDocument.new() as dst:
+        while len(dst) < num_pages:
+            pages = list(range(min(len(src), num_pages - len(dst))))
+            dst.import_pages(src, pages=pages)
+        dst.save(str(destination))
+
+
+def run(
+    http2: Optional[HTTP2],
+    document: Path,
+    documents: int,
+    concurrency: int,
+    connect_delay: float,
+    request_delay: float,
+) -> tuple[int, list[float]]:
+    content = document.read_bytes()
+    latencies = []
+    with StandInServer(connect_delay, request_delay) as server:
+        with UnstructuredClient(server_url=f"http://127.0.0.1:{server.port}", http2=http2) as client:
+            for _ in range(documents):
+                started_at = time.perf_counter()
+                client.general.partition(
+                    request=operations.PartitionRequest(
+                        partition_parameters=shared.PartitionParameters(
+                            files=shared.Files(content=content, file_name=document.name),
+                            strategy="fast",
+                            split_pdf_page=True,
+                            split_pdf_concurrency_level=concurrency,
+                        )
+                    )
+                )
+                latencies.append(time.perf_counter() - started_at)
+        return server.connections, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--documents", type=int, default=5)
+    parser.add_argument("--connect-ms", type=float, default=50.0)
+    parser.add_argument("--request-ms", type=float, default=200.0)
+    parser.add_argument("--max-streams", type=int, nargs="+", default=[100, 10])
+    args = parser.parse_args()
+
+    modes: list[tuple[str, Optional[HTTP2]]] = [("http1", None)]
+    modes += [
+        (f"http2 max_streams={max_streams}", HTTP2(max_streams=max_streams, prior_knowledge=True))
+        for max_streams in args.max_streams
+    ]
+    with tempfile.TemporaryDirectory() as tempdir:
+        document = Path(tempdir) / "document.pdf"
+        build_document(args.pdf, 2 * args.concurrency, document)
+        print(f"pages={2 * args.concurrency} concurrency={args.concurrency} documents={args.documents}")
+        for name, http2 in modes:
+            connections, latencies = run(
+                http2,
+                document,
+                args.documents,
+                args.concurrency,
+                args.connect_ms / 1000,
+                args.request_ms / 1000,
+            )
+            following = statistics.mean(latencies[1:]) if len(latencies) > 1 else float("nan")
+            print(
+                f"{name:>22}: connections={connections:>4} "
+                f"first={latencies[0]:6.3f}s following={following:6.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measures merging split-PDF chunk results into a `PartitionResponse`.
+
+`round_trip` is the former merge: the parsed chunk elements are serialized into
+one JSON body, which `General.partition` parses again. `parsed` hands the parsed
+elements to the response as they are.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/merge_results.py --chunks 50 --elements-per-chunk 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client.models import operations
+from unstructured_client.utils.unmarshal_json_response import unmarshal_json_response
+
+
+def build_chunks(num_chunks: int, elements_per_chunk: int) -> list[bytes]:
+    chunks = []
+    for chunk_index in range(num_chunks):
+        elements = [
+            {
+                "type": "NarrativeText",
+                "element_id": f"{chunk_index}-{element_index}",
+                "text": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+                "metadata": {
+                    "page_number": chunk_index + 1,
+                    "filename": "document.pdf",
+                    "languages": ["eng"],
+                    "filetype": "application/pdf",
+                },
+            }
+            for element_index in range(elements_per_chunk)
+        ]
+        chunks.append(json.dumps(elements).encode())
+    return chunks
+
+
+def _parse_chunks(chunks: list[bytes]) -> list:
+    return [element for chunk in chunks for element in json.loads(chunk)]
+
+
+def _to_partition_response(http_res: httpx.Response) -> operations.PartitionResponse:
+    elements = http_res.extensions.get(request_utils.PARSED_ELEMENTS_EXTENSION_KEY)
+    return operations.PartitionResponse(
+        elements=elements
+        if elements is not None
+        else unmarshal_json_response(Optional[List[Dict[str, Any]]], http_res),
+        status_code=http_res.status_code,
+        content_type=http_res.headers.get("Content-Type") or "",
+        raw_response=http_res,
+    )
+
+
+def _create_json_response(elements: list) -> httpx.Response:
+    # The response the former merge built: the elements serialized into one body.
+    return httpx.Response(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        content=json.dumps(elements).encode(),
+    )
+
+
+def merge_round_trip(chunks: list[bytes]) -> operations.PartitionResponse:
+    return _to_partition_response(_create_json_response(_parse_chunks(chunks)))
+
+
+def merge_parsed(chunks: list[bytes]) -> operations.PartitionResponse:
+    return _to_partition_response(request_utils.create_elements_response(_parse_chunks(chunks)))
+
+
+def measure(merge: Callable[[list[bytes]], operations.PartitionResponse], chunks: list[bytes]) -> tuple[float, int]:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    response = merge(chunks)
+    elapsed = time.perf_counter() - started_at
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert response.elements
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--elements-per-chunk", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chunks = build_chunks(args.chunks, args.elements_per_chunk)
+    payload_mb = sum(len(chunk) for chunk in chunks) / 2**20
+    print(f"chunks={args.chunks} elements={args.chunks * args.elements_per_chunk} payload={payload_mb:.1f}MB")
+
+    results = {}
+    for name, merge in [("round_trip", merge_round_trip), ("parsed", merge_parsed)]:
+        runs = [measure(merge, chunks) for _ in range(args.repeat)]
+        elapsed = min(run[0] for run in runs)
+        peak_mb = max(run[1] for run in runs) / 2**20
+        results[name] = elapsed
+        print(
+            f"{name:>12}: {elapsed:7.3f}s peak={peak_mb:7.1f}MB "
+            f"{results['round_trip'] / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measures the setup of a split PDF operation: reading, validating and measuring
+the pages of the document before it is split.
+
+`pypdf` is the former setup, which parsed the document with pypdf, listed its
+pages in `check_pdf` and walked their mediaboxes for `hi_res` trimming.
+`pdfium` is `read_pdf` and `check_pdf` as the split hook calls them, which read
+the page count and page sizes with PDFium in one pass.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/pdf_setup.py --pages 100 1000 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+from pathlib import Path
+from typing import Callable
+
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+from pypdf import PdfReader
+
+from unstructured_client._hooks.custom import pdf_utils
+
+DEFAULT_PDF = Path(__file__).resolve().parents[2] / "_sample_docs" / "layout-parser-paper-fast.pdf"
+MAX_PAGE_LENGTH = 4000
+
+
+def build_document(source: Path, num_pages: int) -> bytes:
+    """Repeats the pages of `source` until the document has `num_pages` pages."""
+    with pdfium.PdfDocument(str(source)) as src, pdfium.PdfDocument.new() as dst:
+        while len(dst) < num_pages:
+            pages = list(range(min(len(src), num_pages - len(dst))))
+            dst.import_pages(src, pages=pages)
+        buffer = io.BytesIO()
+        dst.save(buffer)
+        return buffer.getvalue()
+
+
+def setup_with_pypdf(pdf_bytes: bytes) -> int:
+    pdf = PdfReader(io.BytesIO(pdf_bytes), strict=False)
+    pdf.metadata  # pylint: disable=pointless-statement
+    pdf.root_object  # pylint: disable=pointless-statement
+    list(pdf.pages)
+    any(page.mediabox.height >= MAX_PAGE_LENGTH for page in pdf.pages)
+    return pdf.get_num_pages()
+
+
+def setup_with_pdfium(pdf_bytes: bytes) -> int:
+    pdf = pdf_utils.read_pdf(io.BytesIO(pdf_bytes))
+    assert isinstance(pdf, pdf_utils.PdfInfo)
+    pdf = pdf_utils.check_pdf(pdf)
+    pdf.max_page_length >= MAX_PAGE_LENGTH  # pylint: disable=expression-not-assigned
+    return pdf.get_num_pages()
+
+
+def run(setup: Callable[[bytes], int], pdf_bytes: bytes, repeat: int) -> float:
+    """Returns the fastest of `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        setup(pdf_bytes)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000, 3000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for num_pages in args.pages:
+        pdf_bytes = build_document(args.pdf, num_pages)
+        assert setup_with_pypdf(pdf_bytes) == setup_with_pdfium(pdf_bytes) == num_pages
+        baseline = run(setup_with_pypdf, pdf_bytes, args.repeat)
+        elapsed = run(setup_with_pdfium, pdf_bytes, args.repeat)
+        print(
+            f"pages={num_pages:>5} size={len(pdf_bytes) / 2**20:6.1f}MiB "
+            f"pypdf={baseline * 1000:8.1f}ms pdfium={elapsed * 1000:7.1f}ms "
+            f"{baseline / elapsed:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
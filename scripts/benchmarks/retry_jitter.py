@@ -0,0 +1,118 @@
+"""Simulates how the backoff jitters spread the retries of many clients.
+
+`--clients` clients send a request at the start of an outage of `--outage-s`
+seconds, such as the page requests of many split documents. Every request
+during the outage fails, and afterwards the server answers at most
+`--capacity` requests per 100 ms window and fails the rest, like an overloaded
+API. Clients retry with `get_backoff_seconds` until they succeed. The clock is
+simulated, so no time passes and no requests are sent.
+
+For each jitter the benchmark reports the requests sent, the peak retries
+per window, the time by which half and all clients succeeded, and the retries
+per second over the first seconds.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/retry_jitter.py --clients 1000 --capacity 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import math
+import random
+import statistics
+from collections import Counter
+from typing import Optional
+
+from unstructured_client.utils.retries import JITTERS, get_backoff_seconds
+
+WINDOW_SECONDS = 0.1
+
+
+def simulate(
+    jitter: str,
+    clients: int,
+    outage: float,
+    capacity: int,
+    initial_interval: int,
+    max_interval: int,
+    exponent: float,
+    seed: int,
+) -> tuple[int, Counter[int], list[float]]:
+    """Returns the requests sent, the retries per window and the time each
+    client succeeded."""
+    random.seed(seed)
+    # (time, client, retries, last backoff)
+    attempts: list[tuple[float, int, int, Optional[float]]] = [
+        (0.0, client, 0, None) for client in range(clients)
+    ]
+    heapq.heapify(attempts)
+    load: Counter[int] = Counter()
+    retry_load: Counter[int] = Counter()
+    done_at = []
+    requests = 0
+    while attempts:
+        now, client, retries, backoff = heapq.heappop(attempts)
+        window = int(now / WINDOW_SECONDS)
+        load[window] += 1
+        if retries:
+            retry_load[window] += 1
+        requests += 1
+        if now >= outage and load[window] <= capacity:
+            done_at.append(now)
+            continue
+        backoff = get_backoff_seconds(
+            initial_interval, max_interval, exponent, retries, jitter, backoff
+        )
+        heapq.heappush(attempts, (now + backoff, client, retries + 1, backoff))
+    return requests, retry_load, done_at
+
+
+def sparkline(load: Counter[int], seconds: int) -> str:
+    per_second = [
+        sum(load[window] for window in range(int(second / WINDOW_SECONDS), int((second + 1) / WINDOW_SECONDS)))
+        for second in range(seconds)
+    ]
+    peak = max(per_second) or 1
+    blocks = " .:-=+*#%@"
+    return "".join(blocks[math.ceil(count / peak * (len(blocks) - 1))] for count in per_second)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--outage-s", type=float, default=5.0)
+    parser.add_argument("--capacity", type=int, default=20)
+    parser.add_argument("--initial-interval-ms", type=int, default=500)
+    parser.add_argument("--max-interval-ms", type=int, default=30_000)
+    parser.add_argument("--exponent", type=float, default=2.0)
+    parser.add_argument("--seconds", type=int, default=40, help="Seconds shown in the retries column")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"clients={args.clients} outage={args.outage_s}s capacity={args.capacity}/{WINDOW_SECONDS}s "
+        f"initial_interval={args.initial_interval_ms}ms max_interval={args.max_interval_ms}ms "
+        f"exponent={args.exponent}"
+    )
+    for jitter in JITTERS:
+        requests, retry_load, done_at = simulate(
+            jitter,
+            args.clients,
+            args.outage_s,
+            args.capacity,
+            args.initial_interval_ms,
+            args.max_interval_ms,
+            args.exponent,
+            args.seed,
+        )
+        print(
+            f"{jitter:>20}: requests={requests:>6} retry_peak={max(retry_load.values()):>4}/window "
+            f"p50_done={statistics.median(done_at):6.1f}s all_done={max(done_at):6.1f}s "
+            f"retries/s |{sparkline(retry_load, args.seconds)}|"
+        )
+
+
+if __name__ == "__main__":
+    main()
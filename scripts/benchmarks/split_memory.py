@@ -0,0 +1,148 @@
+"""Measures the peak memory of splitting a PDF file passed as an open file.
+
+`read` is the former input path, which read the whole file into `bytes` before
+splitting it. `mmap` is `get_pdf_buffer` as the split hook calls it, which
+memory-maps the file so PDFium reads it in place. Each mode runs in a fresh
+process that splits the document into in-memory chunks, dropping each chunk
+once it is produced, like the chunks of a finished page request.
+
+Pages of a mapped file count towards the resident set size, but they belong to
+the page cache and are not copied. `private` is the peak of the memory that is
+not backed by a file, sampled every few milliseconds (Linux only).
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/split_memory.py --pages 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+
+from unstructured_client._hooks.custom import pdf_utils
+from unstructured_client._hooks.custom.split_engine import PdfBuffer, PdfSplitEngine, get_page_ranges
+
+DEFAULT_PDF = Path(__file__).resolve().parents[2] / "_sample_docs" / "layout-parser-paper-fast.pdf"
+MODES = ("read", "mmap")
+SAMPLE_INTERVAL_SECONDS = 0.005
+
+
+def build_document(source: Path, num_pages: int, destination: Path) -> None:
+    """Repeats the pages of `source` until the document has `num_pages` pages."""
+    with pdfium.PdfDocument(str(source)) as src, pdfium.PdfDocument.new() as dst:
+        while len(dst) < num_pages:
+            pages = list(range(min(len(src), num_pages - len(dst))))
+            dst.import_pages(src, pages=pages)
+        dst.save(str(destination))
+
+
+def _private_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            _, resident, shared = (int(value) for value in statm.read().split()[:3])
+    except OSError:
+        return None
+    return (resident - shared) * mmap.PAGESIZE
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def split_file(mode: str, pdf_path: Path, split_size: int) -> dict[str, Optional[int]]:
+    peak_private = _private_bytes()
+    done = threading.Event()
+
+    def _sample() -> None:
+        nonlocal peak_private
+        while not done.wait(SAMPLE_INTERVAL_SECONDS):
+            private = _private_bytes()
+            if private is not None and peak_private is not None:
+                peak_private = max(peak_private, private)
+
+    sampler = threading.Thread(target=_sample, daemon=True)
+    sampler.start()
+    try:
+        with open(pdf_path, "rb") as pdf_file:
+            pdf_buffer: PdfBuffer
+            if mode == "read":
+                pdf_buffer = pdf_file.read()
+            else:
+                pdf_buffer = pdf_utils.get_pdf_buffer(pdf_file)
+            engine = PdfSplitEngine()
+            page_count = engine.count_pages(pdf_buffer)
+            chunks = engine.iter_buffers(pdf_buffer, get_page_ranges(split_size, 1, page_count))
+            for chunk in chunks:
+                chunk.close()
+            del chunks
+            if isinstance(pdf_buffer, mmap.mmap):
+                pdf_buffer.close()
+    finally:
+        done.set()
+        sampler.join()
+    return {"max_rss": _max_rss_bytes(), "private": peak_private}
+
+
+def _format_mib(value: Optional[int]) -> str:
+    return "n/a" if value is None else f"{value / 2**20:8.1f}MiB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--pages", type=int, default=3000)
+    parser.add_argument("--split-size", type=int, default=20)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--document", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(split_file(args.child, args.document, args.split_size)))
+        return
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        document = Path(tempdir) / "document.pdf"
+        build_document(args.pdf, args.pages, document)
+        print(f"pages={args.pages} size={document.stat().st_size / 2**20:.1f}MiB split_size={args.split_size}")
+        for mode in MODES:
+            started_at = time.perf_counter()
+            child = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--child",
+                    mode,
+                    "--document",
+                    str(document),
+                    "--split-size",
+                    str(args.split_size),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=os.environ,
+            )
+            elapsed = time.perf_counter() - started_at
+            peaks = json.loads(child.stdout)
+            print(
+                f"{mode:>5}: max_rss={_format_mib(peaks['max_rss'])} "
+                f"private={_format_mib(peaks['private'])} {elapsed:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
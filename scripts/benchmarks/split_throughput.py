@@ -0,0 +1,113 @@
+"""Measures split-PDF throughput for concurrent callers.
+
+Each caller thread splits copies of the same document, the way concurrent
+`partition` calls would. Every configuration is compared against `serialized`,
+which holds the pdfium lock for the whole document like the former class-wide
+split setup lock did.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmarks/split_throughput.py --threads 16 --workers 0 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import time
+from concurrent import futures
+from pathlib import Path
+from typing import Callable
+
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+
+from unstructured_client._hooks.custom.split_engine import (
+    PDFIUM_LOCK,
+    PdfSplitEngine,
+    get_page_ranges,
+)
+
+DEFAULT_PDF = Path(__file__).resolve().parents[2] / "_sample_docs" / "layout-parser-paper-fast.pdf"
+
+
+def build_document(source: Path, num_pages: int) -> bytes:
+    """Repeats the pages of `source` until the document has `num_pages` pages."""
+    with pdfium.PdfDocument(str(source)) as src, pdfium.PdfDocument.new() as dst:
+        while len(dst) < num_pages:
+            pages = list(range(min(len(src), num_pages - len(dst))))
+            dst.import_pages(src, pages=pages)
+        buffer = io.BytesIO()
+        dst.save(buffer)
+        return buffer.getvalue()
+
+
+def run(
+    split: Callable[[bytes], None],
+    pdf_bytes: bytes,
+    threads: int,
+    docs_per_thread: int,
+) -> float:
+    def _caller() -> None:
+        for _ in range(docs_per_thread):
+            split(pdf_bytes)
+
+    started_at = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(_caller) for _ in range(threads)]:
+            future.result()
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--split-size", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=min(16, os.cpu_count() or 1))
+    parser.add_argument("--docs-per-thread", type=int, default=4)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({0, max(1, (os.cpu_count() or 1) // 2), os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+
+    pdf_bytes = build_document(args.pdf, args.pages)
+    page_ranges = get_page_ranges(args.split_size, 1, args.pages)
+    total_pages = args.pages * args.threads * args.docs_per_thread
+    print(
+        f"cpus={os.cpu_count()} threads={args.threads} docs={args.threads * args.docs_per_thread} "
+        f"pages_per_doc={args.pages} chunks_per_doc={len(page_ranges)}"
+    )
+
+    baseline_engine = PdfSplitEngine()
+
+    def _split_serialized(document: bytes) -> None:
+        with PDFIUM_LOCK:
+            baseline_engine.split_to_buffers(document, page_ranges)
+
+    baseline = run(_split_serialized, pdf_bytes, args.threads, args.docs_per_thread)
+    print(f"{'serialized':>12}: {baseline:7.2f}s {total_pages / baseline:9.0f} pages/s  1.00x")
+
+    for workers in args.workers:
+        engine = PdfSplitEngine(workers=workers)
+        try:
+            # Start the worker processes outside of the measurement.
+            engine.split_to_buffers(pdf_bytes, page_ranges[:1])
+            elapsed = run(
+                lambda document: engine.split_to_buffers(document, page_ranges),
+                pdf_bytes,
+                args.threads,
+                args.docs_per_thread,
+            )
+        finally:
+            engine.close()
+        print(
+            f"{f'workers={workers}':>12}: {elapsed:7.2f}s {total_pages / elapsed:9.0f} pages/s "
+            f"{baseline / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .clean_server_url_hook import CleanServerUrlSDKInitHook
-from .logger_hook import LoggerHook
+from .logger_hook import LoggerHook, RetryCountHook
 from .split_pdf_hook import SplitPdfHook
+from .upload_compression_hook import UploadCompressionHook
 import logging
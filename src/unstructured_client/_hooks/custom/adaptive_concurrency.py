@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import httpx
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+# Matches the cap on `split_pdf_concurrency_level`.
+DEFAULT_MAX_LIMIT = 50
+# Weight of the newest response in the average latency.
+LATENCY_SMOOTHING = 0.2
+# Responses needed before latency spikes are detected.
+LATENCY_WARMUP_SAMPLES = 3
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimitChange:
+    """A change of the concurrency limit of a split PDF operation.
+
+    Attributes:
+        operation_id: The split PDF operation the limit belongs to.
+        limit: The new limit.
+        previous_limit: The limit before the change, `None` for the initial limit.
+        reason: `initial`, `success`, `status_<code>`, `transport_error` or
+            `latency_spike`.
+        timestamp: `time.monotonic()` at the time of the change.
+    """
+
+    operation_id: Optional[str]
+    limit: int
+    previous_limit: Optional[int]
+    reason: str
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """Settings of the adaptive concurrency limit for split PDF page requests.
+
+    The limit starts at `split_pdf_concurrency_level`. It grows by one after
+    each round of fast successful responses and is multiplied by
+    `decrease_ratio` on 429 and 5xx responses, transport errors such as
+    timeouts, and responses slower than `latency_spike_ratio` times the average.
+
+    Attributes:
+        min_limit: The lowest the limit can shrink to.
+        max_limit: The highest the limit can grow to.
+        decrease_ratio: The factor the limit is multiplied by on congestion.
+        latency_spike_ratio: How many times slower than the average latency a
+            response must be to count as congestion.
+        on_limit_change: Called on the event loop whenever the limit changes,
+            for example to export it as a metric.
+    """
+
+    min_limit: int = 1
+    max_limit: int = DEFAULT_MAX_LIMIT
+    decrease_ratio: float = 0.5
+    latency_spike_ratio: float = 2.0
+    on_limit_change: Optional[Callable[[ConcurrencyLimitChange], None]] = None
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_limit <= self.max_limit:
+            raise ValueError("min_limit must be at least 1 and at most max_limit")
+        if not 0 < self.decrease_ratio < 1:
+            raise ValueError("decrease_ratio must be between 0 and 1")
+        if self.latency_spike_ratio <= 1:
+            raise ValueError("latency_spike_ratio must be greater than 1")
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits concurrent chunk requests with additive increase, multiplicative
+    decrease (AIMD). Used like `asyncio.Semaphore`, with every request attempt
+    reported through `record_response` or `record_error`.
+
+    A congestion signal from a request that started before the last decrease is
+    ignored, so a burst of failures from the same overload shrinks the limit
+    only once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        settings: AdaptiveConcurrency,
+        operation_id: Optional[str] = None,
+    ) -> None:
+        self._settings = settings
+        self._operation_id = operation_id
+        self._limit = min(max(initial_limit, settings.min_limit), settings.max_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._successes = 0
+        self._latency_average: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease_at = -math.inf
+        self.history: list[ConcurrencyLimitChange] = []
+        self._set_limit(self._limit, "initial")
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return self._limit
+
+    async def __aenter__(self) -> None:
+        while self._in_flight >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                self._waiters.remove(waiter)
+                # Pass the wake-up on in case it was meant for this request.
+                self._wake()
+                raise
+            self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def try_acquire(self) -> bool:
+        """Takes a slot without waiting, `False` if none is free. A slot taken
+        is given back with `__aexit__`."""
+        if self._waiters or self._in_flight >= self._limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def record_response(self, status_code: int, latency: float) -> None:
+        """Adjusts the limit to the response of a request that took `latency`
+        seconds."""
+        if status_code == 429 or status_code >= 500:
+            self._decrease(f"status_{status_code}", latency)
+            return
+        if status_code != 200:
+            return
+
+        is_spike = (
+            self._latency_average is not None
+            and self._latency_samples >= LATENCY_WARMUP_SAMPLES
+            and latency > self._latency_average * self._settings.latency_spike_ratio
+        )
+        self._update_latency_average(latency)
+        if is_spike:
+            self._decrease("latency_spike", latency)
+            return
+
+        self._successes += 1
+        # Grow by one once a full limit's worth of requests succeeded, which is
+        # about once per round trip.
+        if self._successes >= self._limit and self._limit < self._settings.max_limit:
+            self._set_limit(self._limit + 1, "success")
+
+    def record_error(self, error: BaseException, latency: float) -> None:
+        """Adjusts the limit to a request that failed after `latency` seconds."""
+        if isinstance(error, httpx.TransportError):
+            self._decrease("transport_error", latency)
+
+    def _update_latency_average(self, latency: float) -> None:
+        self._latency_samples += 1
+        if self._latency_average is None:
+            self._latency_average = latency
+        else:
+            self._latency_average += LATENCY_SMOOTHING * (latency - self._latency_average)
+
+    def _decrease(self, reason: str, latency: float) -> None:
+        started_at = time.monotonic() - latency
+        if started_at < self._last_decrease_at:
+            return
+        self._last_decrease_at = time.monotonic()
+        limit = max(
+            self._settings.min_limit,
+            math.floor(self._limit * self._settings.decrease_ratio),
+        )
+        if limit != self._limit:
+            self._set_limit(limit, reason)
+        self._successes = 0
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        change = ConcurrencyLimitChange(
+            operation_id=self._operation_id,
+            limit=limit,
+            previous_limit=self.history[-1].limit if self.history else None,
+            reason=reason,
+            timestamp=time.monotonic(),
+        )
+        self._limit = limit
+        self._successes = 0
+        self.history.append(change)
+        log = logger.debug if reason in ("initial", "success") else logger.info
+        log(
+            "split_pdf event=concurrency_limit_changed operation_id=%s limit=%d previous_limit=%s reason=%s",
+            self._operation_id,
+            limit,
+            change.previous_limit,
+            reason,
+        )
+        if self._settings.on_limit_change is not None:
+            self._settings.on_limit_change(change)
+        self._wake()
+
+    def _wake(self) -> None:
+        free_slots = self._limit - self._in_flight
+        for waiter in self._waiters:
+            if free_slots <= 0:
+                break
+            # Waiters woken earlier are about to take a slot as well.
+            if not waiter.done():
+                waiter.set_result(None)
+            free_slots -= 1
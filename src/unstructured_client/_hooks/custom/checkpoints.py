@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import IO, Any, BinaryIO, Mapping, Optional, Union
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.form_utils import (
+    PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
+    PARTITION_FORM_FILES_KEY,
+    PARTITION_FORM_PAGE_RANGE_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_DIR_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
+    PARTITION_FORM_SPLIT_PDF_ALLOW_FAILED_KEY,
+)
+from unstructured_client._hooks.custom.split_engine import PageRange
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+CHECKPOINTS_DIR_NAME = "unstructured-split-checkpoints"
+# Journals of documents that were never retried are deleted after a week.
+CHECKPOINT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+HASH_BUFFER_SIZE = 1024 * 1024
+# Form fields that do not change the results of the chunks. Chunks are journaled
+# by their page range, so a different page range resumes the overlapping chunks.
+FINGERPRINT_EXCLUDED_FORM_KEYS = (
+    PARTITION_FORM_FILES_KEY,
+    PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_DIR_KEY,
+    PARTITION_FORM_SPLIT_PDF_ALLOW_FAILED_KEY,
+    PARTITION_FORM_PAGE_RANGE_KEY,
+    PARTITION_FORM_PAGE_RANGE_KEY.replace("[]", ""),
+)
+
+
+def get_operation_fingerprint(
+    pdf_file: IO[bytes],
+    filename: str,
+    form_data: Mapping[str, Any],
+) -> str:
+    """Returns a hash of the document and the form fields that shape its
+    results, which identifies the journal of a split operation."""
+    digest = hashlib.sha256()
+    position = pdf_file.tell()
+    pdf_file.seek(0)
+    try:
+        while block := pdf_file.read(HASH_BUFFER_SIZE):
+            digest.update(block)
+    finally:
+        pdf_file.seek(position)
+    form_fields = {
+        key: value
+        for key, value in form_data.items()
+        if key not in FINGERPRINT_EXCLUDED_FORM_KEYS
+    }
+    digest.update(json.dumps([filename, form_fields], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class SplitCheckpoint:
+    """An on-disk journal of the completed chunks of a split PDF operation.
+
+    The results of successful chunks are written to a directory named after
+    the operation fingerprint. A later `partition` call with the same file and
+    parameters finds the journal and only sends the chunks missing from it. The
+    journal is deleted once every chunk of the document completed.
+
+    Journal writes are best effort: a failed write is logged, and the chunk is
+    sent again on the next attempt.
+    """
+
+    def __init__(self, directory: Path, chunk_count: int) -> None:
+        self.directory = directory
+        self.chunk_count = chunk_count
+        self._completed: set[PageRange] = set()
+
+    @classmethod
+    def open(
+        cls,
+        root_dir: Union[str, os.PathLike[str]],
+        fingerprint: str,
+        chunk_count: int,
+    ) -> SplitCheckpoint:
+        """Opens the journal of `fingerprint` under `root_dir`, creating it if
+        this is the first attempt."""
+        checkpoints_dir = Path(root_dir) / CHECKPOINTS_DIR_NAME
+        _delete_expired_journals(checkpoints_dir)
+        directory = checkpoints_dir / fingerprint
+        directory.mkdir(parents=True, exist_ok=True)
+        # Keeps the journal of a retried document from expiring.
+        os.utime(directory)
+        return cls(directory, chunk_count)
+
+    @property
+    def journaled_chunk_count(self) -> int:
+        """The number of chunk results in the journal."""
+        return sum(1 for path in self.directory.glob("*.json"))
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every chunk of the operation completed."""
+        return len(self._completed) >= self.chunk_count
+
+    def _path(self, page_range: PageRange) -> Path:
+        return self.directory / f"{page_range[0]}-{page_range[1]}.json"
+
+    def load(self, page_range: PageRange) -> Optional[bytes]:
+        """Returns the journaled result of the chunk of `page_range`, or `None`
+        if the chunk has not completed yet."""
+        try:
+            content = self._path(page_range).read_bytes()
+        except FileNotFoundError:
+            return None
+        self._completed.add(page_range)
+        return content
+
+    def record(self, page_range: PageRange, content: bytes) -> None:
+        """Journals the result of the completed chunk of `page_range`."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    temp_file.write(content)
+                os.replace(temp_path, self._path(page_range))
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as error:
+            logger.warning(
+                "split_pdf event=checkpoint_write_failed checkpoint=%s page_range=%s-%s error=%s",
+                self.directory.name,
+                page_range[0] + 1,
+                page_range[1],
+                error,
+            )
+            return
+        self._completed.add(page_range)
+
+    def discard(self) -> None:
+        """Deletes the journal."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        logger.debug("split_pdf event=checkpoint_discarded checkpoint=%s", self.directory.name)
+
+
+def _delete_expired_journals(checkpoints_dir: Path) -> None:
+    try:
+        journals = list(checkpoints_dir.iterdir())
+    except FileNotFoundError:
+        return
+    expires_before = time.time() - CHECKPOINT_MAX_AGE_SECONDS
+    for journal in journals:
+        try:
+            expired = journal.stat().st_mtime < expires_before
+        except FileNotFoundError:
+            continue
+        if expired:
+            shutil.rmtree(journal, ignore_errors=True)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import ctypes
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+import pypdfium2.raw as pdfium_c  # type: ignore[import-untyped]
+
+from unstructured_client._hooks.custom.split_engine import (
+    PDFIUM_LOCK,
+    PageRange,
+    PdfBuffer,
+    open_pdf,
+)
+
+# The estimated cost of a page is relative to a plain page of text. A page costs
+# PAGE_BASE_COST, plus TEXT_OBJECT_COST per text object, plus the cost of a page
+# covered by images times the share of the page its images cover.
+PAGE_BASE_COST = 1.0
+TEXT_OBJECT_COST = 0.002
+# Strategies other than `fast` rasterize pages and run layout detection and OCR on
+# the images, which dominates the processing time of scanned pages.
+FAST_STRATEGY = "fast"
+IMAGE_PAGE_COSTS = {
+    FAST_STRATEGY: 0.1,
+    "od_only": 3.0,
+}
+DEFAULT_IMAGE_PAGE_COST = 4.0
+# Rasterized pages cost more the larger they are, relative to a US Letter page.
+REFERENCE_PAGE_AREA = 612 * 792
+MAX_PAGE_AREA_RATIO = 4.0
+# Form XObjects are looked into this deep for text and image objects.
+MAX_FORM_DEPTH = 2
+BISECTION_STEPS = 40
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    """The chunks of a split PDF operation.
+
+    Attributes:
+        page_ranges: The page ranges of the chunks, in page order.
+        chunk_costs: The estimated cost of each chunk, in page order.
+        dispatch_order: One-based positions of the chunks in `page_ranges`,
+            heaviest first.
+    """
+
+    page_ranges: list[PageRange]
+    chunk_costs: list[float]
+    dispatch_order: list[int]
+
+    @property
+    def dispatch_page_ranges(self) -> list[PageRange]:
+        """The page ranges of the chunks in the order they are sent."""
+        return [self.page_ranges[chunk_index - 1] for chunk_index in self.dispatch_order]
+
+
+def _count_page_objects(
+    container: ctypes.c_void_p,
+    count_objects: Callable[..., int],
+    get_object: Callable[..., Any],
+    depth: int = 0,
+) -> tuple[int, list[ctypes.c_void_p]]:
+    text_objects = 0
+    image_objects: list[ctypes.c_void_p] = []
+    for object_index in range(count_objects(container)):
+        page_object = get_object(container, object_index)
+        object_type = pdfium_c.FPDFPageObj_GetType(page_object)
+        if object_type == pdfium_c.FPDF_PAGEOBJ_TEXT:
+            text_objects += 1
+        elif object_type == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+            image_objects.append(page_object)
+        elif object_type == pdfium_c.FPDF_PAGEOBJ_FORM and depth < MAX_FORM_DEPTH:
+            form_text_objects, form_image_objects = _count_page_objects(
+                page_object,
+                pdfium_c.FPDFFormObj_CountObjects,
+                pdfium_c.FPDFFormObj_GetObject,
+                depth + 1,
+            )
+            text_objects += form_text_objects
+            image_objects.extend(form_image_objects)
+    return text_objects, image_objects
+
+
+def _get_object_area(page_object: ctypes.c_void_p) -> float:
+    left, bottom, right, top = (ctypes.c_float() for _ in range(4))
+    if not pdfium_c.FPDFPageObj_GetBounds(
+        page_object,
+        ctypes.byref(left),
+        ctypes.byref(bottom),
+        ctypes.byref(right),
+        ctypes.byref(top),
+    ):
+        return 0.0
+    return max(0.0, right.value - left.value) * max(0.0, top.value - bottom.value)
+
+
+def get_page_cost(
+    strategy: Optional[str],
+    page_area: float,
+    text_object_count: int,
+    image_area: float,
+) -> float:
+    """Estimates the relative processing time of a page from its content."""
+    image_page_cost = IMAGE_PAGE_COSTS.get(strategy or "", DEFAULT_IMAGE_PAGE_COST)
+    base_cost = PAGE_BASE_COST
+    if strategy != FAST_STRATEGY:
+        base_cost *= min(page_area / REFERENCE_PAGE_AREA, MAX_PAGE_AREA_RATIO)
+    image_coverage = min(image_area / page_area, 1.0) if page_area > 0 else 0.0
+    return base_cost + TEXT_OBJECT_COST * text_object_count + image_page_cost * image_coverage
+
+
+def estimate_page_costs(
+    pdf_bytes: PdfBuffer,
+    page_range: PageRange,
+    strategy: Optional[str],
+) -> list[float]:
+    """Estimates the relative processing time of each page in `page_range` from
+    its size, its text objects and the area of its images."""
+    page_costs: list[float] = []
+    with PDFIUM_LOCK:
+        pdf = open_pdf(pdf_bytes)
+        try:
+            for page_index in range(*page_range):
+                page = pdf[page_index]
+                try:
+                    width, height = page.get_size()
+                    text_object_count, image_objects = _count_page_objects(
+                        page.raw,
+                        pdfium_c.FPDFPage_CountObjects,
+                        pdfium_c.FPDFPage_GetObject,
+                    )
+                    image_area = sum(_get_object_area(image) for image in image_objects)
+                finally:
+                    page.close()
+                page_costs.append(
+                    get_page_cost(strategy, width * height, text_object_count, image_area)
+                )
+        finally:
+            pdf.close()
+    return page_costs
+
+
+def _fill_chunks(
+    page_costs: Sequence[float],
+    max_chunk_cost: float,
+    max_pages: int,
+) -> list[int]:
+    """Greedily fills contiguous chunks up to `max_chunk_cost`, returning the
+    number of pages of each chunk."""
+    chunk_sizes: list[int] = []
+    chunk_cost = 0.0
+    chunk_size = 0
+    for page_cost in page_costs:
+        if chunk_size and (chunk_cost + page_cost > max_chunk_cost or chunk_size >= max_pages):
+            chunk_sizes.append(chunk_size)
+            chunk_cost = 0.0
+            chunk_size = 0
+        chunk_cost += page_cost
+        chunk_size += 1
+    if chunk_size:
+        chunk_sizes.append(chunk_size)
+    return chunk_sizes
+
+
+def plan_chunks(
+    page_costs: Sequence[float],
+    page_offset: int,
+    chunk_count: int,
+    max_pages: int,
+) -> ChunkPlan:
+    """Splits the pages into at most `chunk_count` contiguous chunks of at most
+    `max_pages` pages, minimizing the estimated cost of the heaviest chunk.
+
+    Args:
+        page_costs: The estimated cost of each page, see `estimate_page_costs`.
+        page_offset: The zero-based index of the first page.
+        chunk_count: The highest number of chunks.
+        max_pages: The highest number of pages of a chunk.
+
+    Returns:
+        The chunks, dispatched heaviest first so the longest requests do not
+        start last.
+    """
+    low = max(page_costs, default=0.0)
+    high = sum(page_costs)
+    for _ in range(BISECTION_STEPS):
+        middle = (low + high) / 2
+        if len(_fill_chunks(page_costs, middle, max_pages)) <= chunk_count:
+            high = middle
+        else:
+            low = middle
+
+    page_ranges: list[PageRange] = []
+    chunk_costs: list[float] = []
+    start = 0
+    for chunk_size in _fill_chunks(page_costs, high, max_pages):
+        page_ranges.append((page_offset + start, page_offset + start + chunk_size))
+        chunk_costs.append(sum(page_costs[start:start + chunk_size]))
+        start += chunk_size
+
+    dispatch_order = sorted(
+        range(1, len(page_ranges) + 1),
+        key=lambda chunk_index: -chunk_costs[chunk_index - 1],
+    )
+    return ChunkPlan(page_ranges, chunk_costs, dispatch_order)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Union
+
+import httpx
+
+from unstructured_client.models.errors import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitStateChange:
+    """A change of the state of the circuit of a base URL.
+
+    Attributes:
+        base_url: The base URL the circuit belongs to.
+        state: The new state.
+        previous_state: The state before the change.
+        failures: Consecutive failed requests at the time of the change.
+        timestamp: `time.monotonic()` at the time of the change.
+    """
+
+    base_url: str
+    state: CircuitState
+    previous_state: CircuitState
+    failures: int
+    timestamp: float
+
+
+@dataclass
+class CircuitPermit:
+    """Admission of one request attempt to the circuit of `base_url`."""
+
+    base_url: str
+    probe: bool
+    change: Optional[CircuitStateChange] = None
+    recorded: bool = field(default=False, repr=False)
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API at a base URL is down.
+
+    Each base URL has its own circuit. A closed circuit lets requests through
+    and opens after `failure_threshold` consecutive attempts failed with a
+    transport error or a 5xx response. While it is open, requests raise
+    `CircuitOpenError` without being sent, retries included. Once
+    `reset_timeout` seconds have passed, the circuit is half-open and the next
+    `half_open_max_requests` requests probe the API: it closes if a probe
+    succeeds and opens again if one fails. Requests run on different threads
+    and event loops, so the circuits are guarded by a lock.
+
+    Args:
+        failure_threshold: Consecutive failed attempts that open a circuit.
+        reset_timeout: Seconds a circuit stays open before it is probed.
+        half_open_max_requests: Probes in flight at a time while half-open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be positive")
+        if half_open_max_requests < 1:
+            raise ValueError("half_open_max_requests must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_requests = half_open_max_requests
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, base_url: str) -> CircuitState:
+        """The state of the circuit of `base_url`, as of its last request."""
+        with self._lock:
+            circuit = self._circuits.get(base_url)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def acquire(self, base_url: str) -> CircuitPermit:
+        """Admits a request attempt to `base_url`.
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with all its
+                probes in flight.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(base_url, _Circuit())
+            change = None
+            if circuit.state is CircuitState.OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(base_url, retry_in)
+                change = self._transition(base_url, circuit, CircuitState.HALF_OPEN)
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_max_requests:
+                    raise CircuitOpenError(base_url, 0.0)
+                circuit.probes += 1
+                return CircuitPermit(base_url, probe=True, change=change)
+            return CircuitPermit(base_url, probe=False)
+
+    def record(
+        self, permit: CircuitPermit, failure: Optional[bool]
+    ) -> Optional[CircuitStateChange]:
+        """Records the outcome of an admitted attempt, once per permit.
+        `failure` is `None` if the attempt says nothing of the API, for
+        example when it was cancelled."""
+        with self._lock:
+            if permit.recorded:
+                return None
+            permit.recorded = True
+            circuit = self._circuits.get(permit.base_url)
+            if circuit is None:
+                return None
+
+            if circuit.state is CircuitState.HALF_OPEN:
+                if not permit.probe:
+                    # Sent before the circuit opened.
+                    return None
+                circuit.probes = max(circuit.probes - 1, 0)
+                if failure is None:
+                    return None
+                if failure:
+                    circuit.failures += 1
+                    return self._transition(permit.base_url, circuit, CircuitState.OPEN)
+                return self._transition(permit.base_url, circuit, CircuitState.CLOSED)
+
+            if circuit.state is CircuitState.CLOSED and failure is not None:
+                if not failure:
+                    circuit.failures = 0
+                    return None
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    return self._transition(permit.base_url, circuit, CircuitState.OPEN)
+            return None
+
+    def _transition(
+        self, base_url: str, circuit: _Circuit, state: CircuitState
+    ) -> CircuitStateChange:
+        now = time.monotonic()
+        change = CircuitStateChange(
+            base_url=base_url,
+            state=state,
+            previous_state=circuit.state,
+            failures=circuit.failures,
+            timestamp=now,
+        )
+        circuit.state = state
+        if state is CircuitState.OPEN:
+            circuit.opened_at = now
+        elif state is CircuitState.HALF_OPEN:
+            circuit.probes = 0
+        else:
+            circuit.failures = 0
+        return change
+
+
+def get_circuit_breaker(
+    circuit_breaker: Union[bool, CircuitBreaker, None],
+) -> Optional[CircuitBreaker]:
+    """Resolves the `circuit_breaker` client option."""
+    if isinstance(circuit_breaker, CircuitBreaker):
+        return circuit_breaker
+    if circuit_breaker is True:
+        return CircuitBreaker()
+    return None
+
+
+def is_circuit_failure(
+    base_url: str,
+    response: Optional[httpx.Response],
+    error: Optional[BaseException],
+) -> Optional[bool]:
+    """Whether an attempt shows the API at `base_url` is failing, `None` if it
+    says nothing of it."""
+    if response is not None:
+        try:
+            url = str(response.request.url)
+        except RuntimeError:
+            return None
+        if not url.startswith(base_url):
+            # Answered without reaching the API, such as the no-op request of
+            # split PDFs.
+            return None
+        return response.status_code >= 500
+    if isinstance(error, httpx.TransportError):
+        return True
+    return None
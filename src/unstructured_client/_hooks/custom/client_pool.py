@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from concurrent import futures
+from typing import Any, Coroutine, Generic, Optional, TypeVar
+
+import httpx
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.http2 import HTTP2, MultiplexedTransport
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+T = TypeVar("T")
+
+DEFAULT_CLIENT_TIMEOUT_MINUTES = 60
+DEFAULT_SPLIT_PDF_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+POOL_CLOSE_TIMEOUT_SECONDS = 5
+POOL_LOOP_THREAD_NAME = "split-pdf-io"
+
+
+def get_default_client_timeout() -> httpx.Timeout:
+    """Returns the default timeout for split-PDF chunk requests.
+
+    Use the `UNSTRUCTURED_CLIENT_TIMEOUT_MINUTES` variable to adjust it, the
+    default is 60 minutes.
+    """
+    client_timeout_minutes = DEFAULT_CLIENT_TIMEOUT_MINUTES
+    if timeout_var := os.getenv("UNSTRUCTURED_CLIENT_TIMEOUT_MINUTES"):
+        client_timeout_minutes = int(timeout_var)
+    return httpx.Timeout(60 * client_timeout_minutes)
+
+
+class PooledTask(Generic[T]):
+    """Handle for a coroutine scheduled on the pool's background event loop.
+
+    `future` resolves only once the underlying asyncio task has finished, so
+    callers can defer cleanup until cancelled chunk requests have unwound.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.future: futures.Future[T] = futures.Future()
+        self._loop = loop
+        self._task: Optional[asyncio.Task[T]] = None
+        self._cancel_requested = False
+
+    def _start(self, coro: Coroutine[Any, Any, T]) -> None:
+        if self._cancel_requested:
+            coro.close()
+            self.future.cancel()
+            return
+        self._task = self._loop.create_task(coro)
+        self._task.add_done_callback(self._copy_result)
+
+    def _copy_result(self, task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            self.future.cancel()
+        elif (exc := task.exception()) is not None:
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(task.result())
+
+    def _cancel_task(self) -> None:
+        self._cancel_requested = True
+        if self._task is not None:
+            self._task.cancel()
+
+    def cancel(self) -> bool:
+        """Requests cancellation of the task.
+
+        Returns:
+            False if the background loop is already closed, True otherwise.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._cancel_task)
+            return True
+        except RuntimeError as exc:
+            if "Event loop is closed" in str(exc):
+                return False
+            raise
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.call_soon_threadsafe(loop.stop)
+    except RuntimeError:
+        # The loop is already closed.
+        pass
+
+
+class SplitPdfClientPool:
+    """Long-lived connection pool shared by the split-PDF chunk requests of a client.
+
+    Connections of an `httpx.AsyncClient` are bound to the event loop that opened
+    them, so the pool keeps one client per loop. Synchronous `partition` calls
+    run their chunk requests on a single background loop owned by the pool, which
+    lets every split operation reuse the same keep-alive connections instead of
+    opening (and tearing down) a new pool per document.
+
+    The pooled clients use the default transport. A user-supplied `async_client`
+    is bound to the caller's loop, so only `partition_async` sends through it.
+    """
+
+    def __init__(self, limits: Optional[httpx.Limits] = None) -> None:
+        self._limits = limits or DEFAULT_SPLIT_PDF_LIMITS
+        self._http2: Optional[HTTP2] = None
+        self._lock = threading.Lock()
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_finalizer: Optional[weakref.finalize] = None
+        self._closing_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return self._limits
+
+    def configure(self, limits: httpx.Limits) -> None:
+        """Sets the connection limits used for clients created from now on."""
+        with self._lock:
+            self._limits = limits
+
+    def configure_http2(self, http2: Optional[HTTP2]) -> None:
+        """Sets the HTTP/2 settings used for clients created from now on, None
+        for HTTP/1.1."""
+        with self._lock:
+            self._http2 = http2
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Returns the pooled client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                if self._http2 is not None:
+                    client = httpx.AsyncClient(
+                        timeout=get_default_client_timeout(),
+                        transport=MultiplexedTransport(self._http2, self._limits),
+                    )
+                else:
+                    client = httpx.AsyncClient(
+                        timeout=get_default_client_timeout(),
+                        limits=self._limits,
+                    )
+                self._clients[loop] = client
+                logger.debug(
+                    "split_pdf event=pool_client_created background_loop=%s http2=%s max_connections=%s max_keepalive_connections=%s keepalive_expiry=%s",
+                    loop is self._loop,
+                    self._http2 is not None,
+                    self._limits.max_connections,
+                    self._limits.max_keepalive_connections,
+                    self._limits.keepalive_expiry,
+                )
+            return client
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> PooledTask[T]:
+        """Schedules `coro` on the pool's background event loop."""
+        loop = self._ensure_loop()
+        task: PooledTask[T] = PooledTask(loop)
+        try:
+            loop.call_soon_threadsafe(task._start, coro)  # pylint: disable=protected-access
+        except RuntimeError:
+            coro.close()
+            raise
+        return task
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_run_loop,
+                args=(loop,),
+                name=POOL_LOOP_THREAD_NAME,
+                daemon=True,
+            )
+            thread.start()
+            # Stop the loop thread if the pool is dropped without being closed.
+            self._loop_finalizer = weakref.finalize(self, _stop_loop, loop)
+            self._loop = loop
+            self._loop_thread = thread
+            return loop
+
+    def close(self) -> None:
+        """Closes the pooled clients and stops the background loop.
+
+        Clients bound to other event loops are closed on their own loop when it
+        is still alive; connections of closed loops were already torn down.
+        """
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients = weakref.WeakKeyDictionary()
+            loop, thread = self._loop, self._loop_thread
+            loop_finalizer = self._loop_finalizer
+            self._loop = None
+            self._loop_thread = None
+            self._loop_finalizer = None
+
+        for client_loop, client in clients:
+            if client_loop is loop:
+                continue
+            self._close_client_on_loop(client, client_loop)
+
+        if loop is None:
+            return
+
+        background_client = next((client for client_loop, client in clients if client_loop is loop), None)
+        if background_client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(background_client.aclose(), loop).result(
+                    timeout=POOL_CLOSE_TIMEOUT_SECONDS
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug("Failed to close the split-PDF background client", exc_info=True)
+        # Stops the loop once; the finalizer does not run again at exit.
+        if loop_finalizer is not None:
+            loop_finalizer()
+        else:
+            _stop_loop(loop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=POOL_CLOSE_TIMEOUT_SECONDS)
+        logger.debug("split_pdf event=pool_closed client_count=%d", len(clients))
+
+    def _close_client_on_loop(
+        self,
+        client: httpx.AsyncClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        if loop.is_closed() or client.is_closed:
+            return
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        try:
+            if running_loop is loop:
+                closing_task = loop.create_task(client.aclose())
+                self._closing_tasks.add(closing_task)
+                closing_task.add_done_callback(self._closing_tasks.discard)
+            else:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        except RuntimeError:
+            # best effort
+            pass
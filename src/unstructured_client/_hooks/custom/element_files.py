@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Generator, Iterable, Iterator, Literal, Optional, TextIO, Union
+
+import httpx
+
+# Set on the partition request to ask the split hook to merge the chunk results
+# into a file, and on the response once the file is written.
+MERGE_TARGET_EXTENSION_KEY = "split_pdf_merge_target"
+MERGED_OUTPUT_EXTENSION_KEY = "split_pdf_merged_output"
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+OutputFormat = Literal["json", "jsonl"]
+Output = Union[str, os.PathLike[str], BinaryIO]
+
+_WHITESPACE = b" \t\r\n"
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+@dataclass(frozen=True)
+class MergeTarget:
+    """Where `partition_to_file` writes the elements.
+
+    Attributes:
+        output: A path, or a binary file-like object the elements are written to
+            at its current position.
+        output_format: `json` for a single JSON array, `jsonl` for one element
+            per line.
+    """
+
+    output: Output
+    output_format: OutputFormat = "json"
+
+    def __post_init__(self) -> None:
+        if self.output_format not in ("json", "jsonl"):
+            raise ValueError(
+                f"output_format must be 'json' or 'jsonl', got {self.output_format!r}"
+            )
+
+    @property
+    def result(self) -> Union[Path, BinaryIO]:
+        """The path of the output file, or the file-like object written to."""
+        if isinstance(self.output, (str, os.PathLike)):
+            return Path(self.output)
+        return self.output
+
+    def write_files(self, paths: Iterable[Path]) -> None:
+        """Merges the JSON array files of the chunk results into the output."""
+        self._write(open(path, "rb") for path in paths)
+
+    def write_response(self, response: httpx.Response) -> None:
+        """Writes the elements of a request that was not split to the output."""
+        self._write([io.BytesIO(response.content)])
+
+    def _write(self, sources: Iterable[BinaryIO]) -> None:
+        with _open_output(self.output) as output:
+            if self.output_format == "jsonl":
+                _write_json_lines(sources, output)
+            else:
+                _splice_json_arrays(sources, output)
+
+
+def get_merge_target(request: httpx.Request) -> Optional[MergeTarget]:
+    merge_target = request.extensions.get(MERGE_TARGET_EXTENSION_KEY)
+    return merge_target if isinstance(merge_target, MergeTarget) else None
+
+
+def create_merged_output_response(
+    response: httpx.Response,
+    merge_target: MergeTarget,
+) -> httpx.Response:
+    """Creates the response that tells `General` the merged output is written."""
+    return httpx.Response(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        content=b"[]",
+        request=response.request,
+        extensions={MERGED_OUTPUT_EXTENSION_KEY: merge_target.result},
+    )
+
+
+@contextmanager
+def _open_output(output: Output) -> Generator[BinaryIO, None, None]:
+    if not isinstance(output, (str, os.PathLike)):
+        yield output
+        return
+    path = Path(output)
+    try:
+        with open(path, "wb") as file:
+            yield file
+    except BaseException:
+        # Do not leave a truncated result behind.
+        path.unlink(missing_ok=True)
+        raise
+
+
+def _splice_json_arrays(sources: Iterable[BinaryIO], output: BinaryIO) -> None:
+    """Writes the items of the JSON arrays in `sources` as one JSON array.
+
+    The items are copied byte for byte, only the brackets and separators of
+    each array are rewritten, so no element is ever parsed.
+    """
+    output.write(b"[")
+    first = True
+    for source in sources:
+        with source:
+            start, end = _array_items_span(source)
+            if start == end:
+                continue
+            if not first:
+                output.write(b",")
+            first = False
+            source.seek(start)
+            _copy_bytes(source, output, end - start)
+    output.write(b"]")
+
+
+def _array_items_span(source: BinaryIO) -> tuple[int, int]:
+    """Returns the offsets of the first and past the last item of the JSON array
+    in `source`. They are equal if the array is empty."""
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    opening = _find_non_whitespace(source, 0, size)
+    closing = _find_non_whitespace(source, size, opening, backwards=True)
+    if not _byte_at(source, opening, b"[") or not _byte_at(source, closing, b"]"):
+        raise ValueError("Chunk result is not a JSON array")
+    start = _find_non_whitespace(source, opening + 1, closing)
+    return start, closing
+
+
+def _find_non_whitespace(
+    source: BinaryIO,
+    start: int,
+    stop: int,
+    *,
+    backwards: bool = False,
+) -> int:
+    """Returns the offset of the first non-whitespace byte between `start` and
+    `stop`, or `stop` if there is none. With `backwards`, returns the offset of
+    the last one before `start`."""
+    position = start
+    while position != stop:
+        size = min(COPY_BUFFER_SIZE, abs(stop - position))
+        source.seek(position - size if backwards else position)
+        block = source.read(size)
+        if not block:
+            break
+        stripped = block.rstrip(_WHITESPACE) if backwards else block.lstrip(_WHITESPACE)
+        if stripped:
+            if backwards:
+                return position - len(block) + len(stripped) - 1
+            return position + len(block) - len(stripped)
+        position = position - len(block) if backwards else position + len(block)
+    return stop
+
+
+def _byte_at(source: BinaryIO, offset: int, expected: bytes) -> bool:
+    source.seek(offset)
+    return source.read(1) == expected
+
+
+def _copy_bytes(source: BinaryIO, output: BinaryIO, length: int) -> None:
+    while length > 0:
+        block = source.read(min(COPY_BUFFER_SIZE, length))
+        if not block:
+            raise ValueError("Chunk result ended unexpectedly")
+        output.write(block)
+        length -= len(block)
+
+
+def _write_json_lines(sources: Iterable[BinaryIO], output: BinaryIO) -> None:
+    for source in sources:
+        with io.TextIOWrapper(source, encoding="utf-8") as text:
+            for item in _iter_array_items(text):
+                # Line breaks inside JSON strings are always escaped, so the
+                # ones left are whitespace between tokens.
+                output.write(item.replace("\r", " ").replace("\n", " ").encode("utf-8"))
+                output.write(b"\n")
+
+
+def _iter_array_items(text: TextIO) -> Iterator[str]:
+    """Yields the JSON text of each item of the JSON array in `text`, reading
+    one block at a time so only the current item is held in memory."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+
+    def _read_block() -> bool:
+        nonlocal buffer, position
+        block = text.read(COPY_BUFFER_SIZE)
+        if not block:
+            return False
+        buffer = buffer[position:] + block
+        position = 0
+        return True
+
+    def _next_token() -> str:
+        nonlocal position
+        while True:
+            match = _NON_WHITESPACE.search(buffer, position)
+            if match is not None:
+                position = match.start()
+                return buffer[position]
+            position = len(buffer)
+            if not _read_block():
+                raise ValueError("Chunk result ended unexpectedly")
+
+    if _next_token() != "[":
+        raise ValueError("Chunk result is not a JSON array")
+    position += 1
+    if _next_token() == "]":
+        return
+    while True:
+        try:
+            _, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if _read_block():
+                continue
+            raise
+        # A number at the end of the block may continue in the next one.
+        if end == len(buffer) and _read_block():
+            continue
+        yield buffer[position:end]
+        position = end
+        token = _next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise ValueError("Chunk result is not a JSON array")
+        position += 1
+        _next_token()
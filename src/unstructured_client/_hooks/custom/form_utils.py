@@ -24,6 +24,7 @@ PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY = "split_pdf_cache_tmp_data"
 PARTITION_FORM_SPLIT_CACHE_TMP_DATA_DIR_KEY = "split_pdf_cache_tmp_data_dir"
 PARTITION_FORM_STARTING_PAGE_NUMBER_KEY = "starting_page_number"
 PARTITION_FORM_CONCURRENCY_LEVEL_KEY = "split_pdf_concurrency_level"
+PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY = "gz_uncompressed_content_type"
 
 
 def get_page_range(form_data: FormData, key: str, max_pages: int) -> tuple[int, int]:
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import httpx
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.request_budget import ChunkLimiter, try_acquire_slot
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+# Latencies of the most recent successful chunks the hedge delay is taken from.
+LATENCY_SAMPLE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Counters of hedged split PDF page requests.
+
+    Attributes:
+        requests: Page requests sent, not counting hedges.
+        hedges_issued: Duplicate requests sent for slow page requests.
+        hedges_won: Hedges that succeeded before the request they duplicated.
+    """
+
+    requests: int = 0
+    hedges_issued: int = 0
+    hedges_won: int = 0
+
+
+class Hedging:
+    """Settings of hedged split PDF page requests, and counters of all the
+    operations that use them.
+
+    Once a page request has been running longer than `latency_percentile` of
+    the successful page requests of the same document, a duplicate request is
+    sent. The first successful response wins and the other request is
+    cancelled. Hedging starts after `min_samples` page requests succeeded, and
+    at most `max_hedge_ratio` of the page requests of a document are hedged.
+
+    Args:
+        latency_percentile: The percentile of sibling latencies, between 0 and
+            1, after which a page request is hedged.
+        min_samples: Successful page requests needed before hedging starts.
+        max_hedge_ratio: The highest share of page requests hedged.
+        min_delay: The shortest time in seconds a page request runs before it
+            is hedged.
+    """
+
+    def __init__(
+        self,
+        latency_percentile: float = 0.95,
+        min_samples: int = 5,
+        max_hedge_ratio: float = 0.1,
+        min_delay: float = 1.0,
+    ) -> None:
+        if not 0 < latency_percentile <= 1:
+            raise ValueError("latency_percentile must be between 0 and 1")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        if not 0 < max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+        if min_delay < 0:
+            raise ValueError("min_delay must not be negative")
+        self.latency_percentile = latency_percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay = min_delay
+        self._lock = threading.Lock()
+        self._stats = HedgingStats()
+
+    @property
+    def stats(self) -> HedgingStats:
+        """The counters of all operations hedged with these settings."""
+        return self._stats
+
+    def add_counts(self, requests: int = 0, hedges_issued: int = 0, hedges_won: int = 0) -> None:
+        """Adds to the counters, from any thread."""
+        with self._lock:
+            self._stats = HedgingStats(
+                requests=self._stats.requests + requests,
+                hedges_issued=self._stats.hedges_issued + hedges_issued,
+                hedges_won=self._stats.hedges_won + hedges_won,
+            )
+
+
+class ChunkHedger:
+    """Sends the page requests of one split PDF operation, hedging the slow
+    ones according to `Hedging`."""
+
+    def __init__(self, hedging: Hedging, operation_id: Optional[str] = None) -> None:
+        self.hedging = hedging
+        self._operation_id = operation_id
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.requests = 0
+        self.hedges_issued = 0
+        self.hedges_won = 0
+
+    def get_hedge_delay(self) -> Optional[float]:
+        """The time after which a page request is hedged, `None` until enough
+        page requests succeeded."""
+        if len(self._latencies) < self.hedging.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        rank = math.ceil(self.hedging.latency_percentile * len(latencies))
+        return max(self.hedging.min_delay, latencies[max(rank, 1) - 1])
+
+    async def _take_hedge(self, limiter: Optional[ChunkLimiter], chunk_index: Optional[int]) -> bool:
+        if self.hedges_issued + 1 > self.hedging.max_hedge_ratio * self.requests:
+            return False
+        # A hedge is a page request like any other, it needs a free slot of the
+        # operation's limiter and of the shared request budget.
+        if limiter is not None and not await try_acquire_slot(limiter):
+            logger.debug(
+                "split_pdf event=chunk_hedge_skipped operation_id=%s chunk_index=%s reason=no_free_slot",
+                self._operation_id,
+                chunk_index,
+            )
+            return False
+        self.hedges_issued += 1
+        self.hedging.add_counts(hedges_issued=1)
+        return True
+
+    async def send(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        chunk_index: Optional[int] = None,
+        limiter: Optional[ChunkLimiter] = None,
+    ) -> httpx.Response:
+        """Sends `request`, and a duplicate of it if it is slow. The request
+        body must be in memory, as both requests read it.
+
+        The caller holds a slot of `limiter` for `request`. The duplicate is
+        only sent if another slot is free, and holds it until it finishes."""
+        self.requests += 1
+        self.hedging.add_counts(requests=1)
+        started_at = time.monotonic()
+        tasks = [asyncio.ensure_future(client.send(request))]
+        try:
+            delay = self.get_hedge_delay()
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+                if not tasks[0].done() and await self._take_hedge(limiter, chunk_index):
+                    logger.info(
+                        "split_pdf event=chunk_hedged operation_id=%s chunk_index=%s delay_seconds=%.3f",
+                        self._operation_id,
+                        chunk_index,
+                        delay,
+                    )
+                    tasks.append(asyncio.ensure_future(_send_hedge(client, request, limiter)))
+            winner = await _first_success(tasks)
+        except BaseException:
+            await _cancel_tasks(tasks)
+            raise
+        await _cancel_tasks([task for task in tasks if task is not winner])
+
+        response = winner.result()
+        if winner is not tasks[0]:
+            self.hedges_won += 1
+            self.hedging.add_counts(hedges_won=1)
+            logger.info(
+                "split_pdf event=chunk_hedge_won operation_id=%s chunk_index=%s",
+                self._operation_id,
+                chunk_index,
+            )
+        if response.status_code == 200:
+            self._latencies.append(time.monotonic() - started_at)
+        return response
+
+
+async def _send_hedge(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    limiter: Optional[ChunkLimiter],
+) -> httpx.Response:
+    try:
+        return await client.send(request)
+    finally:
+        if limiter is not None:
+            await limiter.__aexit__(None, None, None)
+
+
+async def _cancel_tasks(tasks: Sequence[asyncio.Future[httpx.Response]]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _succeeded(task: asyncio.Future[httpx.Response]) -> bool:
+    return (
+        not task.cancelled()
+        and task.exception() is None
+        and task.result().status_code == 200
+    )
+
+
+async def _first_success(
+    tasks: Sequence[asyncio.Future[httpx.Response]],
+) -> asyncio.Future[httpx.Response]:
+    """Waits for the first of `tasks` to succeed. If none does, returns the
+    one that failed first."""
+    first_done: Optional[asyncio.Future[httpx.Response]] = None
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            if task not in done:
+                continue
+            if _succeeded(task):
+                return task
+            if first_done is None:
+                first_done = task
+    return first_done if first_done is not None else tasks[0]
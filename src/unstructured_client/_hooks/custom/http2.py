@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import AsyncIterator, Callable, Optional, Union
+
+import httpx
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+HTTP2_VERSION = b"HTTP/2"
+# scheme, host and port of a request
+Origin = tuple[bytes, bytes, Optional[int]]
+
+
+class HTTP2:
+    """Settings of HTTP/2 connections.
+
+    Split PDF page requests are multiplexed over few connections, with at most
+    `max_streams` requests in flight on each; more connections are opened, up to
+    the `max_connections` of `split_pdf_limits`, once they are all busy. The
+    `h2` package is required, without it the client keeps to HTTP/1.1.
+
+    The HTTP/2 client of httpcore can stall uploads that wait for the server to
+    widen its flow control windows. Use HTTP/2 with servers and proxies that
+    advertise windows larger than the chunks, as envoy and nginx do, not with
+    servers that keep the default of 64 KiB.
+
+    Args:
+        max_streams: The maximum number of concurrent split PDF page requests
+            per connection. Servers may allow fewer.
+        prior_knowledge: Speak HTTP/2 to `http://` URLs without negotiating it,
+            for servers and proxies known to support it (h2c). Page requests fall
+            back to HTTP/1.1 if the server does not. `https://` URLs negotiate
+            the protocol either way.
+    """
+
+    def __init__(self, max_streams: int = 100, prior_knowledge: bool = False) -> None:
+        if max_streams < 1:
+            raise ValueError("max_streams must be at least 1")
+        self.max_streams = max_streams
+        self.prior_knowledge = prior_knowledge
+
+
+def is_http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http2(http2: Union[bool, HTTP2, None]) -> Optional[HTTP2]:
+    """Resolves the `http2` client option, None if HTTP/1.1 is used."""
+    if isinstance(http2, HTTP2):
+        settings = http2
+    elif http2 is True:
+        settings = HTTP2()
+    else:
+        return None
+    if not is_http2_available():
+        logger.warning(
+            "HTTP/2 requires the h2 package, install it with `pip install httpx[http2]`. "
+            "Falling back to HTTP/1.1."
+        )
+        return None
+    return settings
+
+
+class _Connection:
+    """An HTTP/2 connection to one origin and the requests in flight on it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        self.streams = 0
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Frees the stream of a request once its response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class MultiplexedTransport(httpx.AsyncBaseTransport):
+    """Transport of the split PDF page requests over HTTP/2.
+
+    Requests to an origin fill its first connection up to `max_streams` before
+    the next one is used, so a document is sent over as few connections as its
+    concurrency needs. Origins that answer over HTTP/1.1, either negotiated or
+    by rejecting HTTP/2 with prior knowledge, are sent the rest of the requests
+    through a regular HTTP/1.1 pool with the same limits.
+    """
+
+    def __init__(self, http2: HTTP2, limits: httpx.Limits) -> None:
+        self._http2 = http2
+        self._limits = limits
+        self._connections: dict[Origin, list[_Connection]] = {}
+        self._slots: dict[Origin, asyncio.Semaphore] = {}
+        self._http2_origins: set[Origin] = set()
+        self._http1_origins: set[Origin] = set()
+        self._http1_transport: Optional[httpx.AsyncBaseTransport] = None
+
+    def _create_connection_transport(self) -> httpx.AsyncBaseTransport:
+        # The pool keeps a single HTTP/2 connection. It only opens more if the
+        # server negotiates HTTP/1.1, for the requests sent before that was
+        # known.
+        return httpx.AsyncHTTPTransport(
+            http1=not self._http2.prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self._http2.max_streams,
+                max_keepalive_connections=self._http2.max_streams,
+                keepalive_expiry=self._limits.keepalive_expiry,
+            ),
+        )
+
+    def _create_http1_transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.AsyncHTTPTransport(limits=self._limits)
+
+    def _get_http1_transport(self) -> httpx.AsyncBaseTransport:
+        transport = self._http1_transport
+        if transport is None:
+            transport = self._http1_transport = self._create_http1_transport()
+        return transport
+
+    async def _acquire(self, origin: Origin) -> _Connection:
+        max_connections = self._limits.max_connections
+        if max_connections is not None:
+            slots = self._slots.get(origin)
+            if slots is None:
+                slots = asyncio.Semaphore(max_connections * self._http2.max_streams)
+                self._slots[origin] = slots
+            await slots.acquire()
+
+        connections = self._connections.setdefault(origin, [])
+        connection = next(
+            (c for c in connections if c.streams < self._http2.max_streams), None
+        )
+        if connection is None:
+            connection = _Connection(self._create_connection_transport())
+            connections.append(connection)
+            logger.debug(
+                "split_pdf event=http2_connection_added host=%s connection_count=%d",
+                origin[1].decode(),
+                len(connections),
+            )
+        connection.streams += 1
+        return connection
+
+    def _release(self, origin: Origin, connection: _Connection) -> None:
+        connection.streams -= 1
+        if (slots := self._slots.get(origin)) is not None:
+            slots.release()
+
+    def _fall_back(self, origin: Origin, reason: str) -> None:
+        if origin in self._http1_origins:
+            return
+        self._http1_origins.add(origin)
+        logger.info(
+            "split_pdf event=http2_fallback host=%s reason=%s",
+            origin[1].decode(),
+            reason,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin: Origin = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+        if origin in self._http1_origins:
+            return await self._get_http1_transport().handle_async_request(request)
+
+        connection = await self._acquire(origin)
+        try:
+            response = await connection.transport.handle_async_request(request)
+        except httpx.RemoteProtocolError:
+            self._release(origin, connection)
+            if not self._http2.prior_knowledge or origin in self._http2_origins:
+                raise
+            # The server does not speak HTTP/2 without negotiating it.
+            self._fall_back(origin, "prior_knowledge_rejected")
+            return await self._get_http1_transport().handle_async_request(request)
+        except BaseException:
+            self._release(origin, connection)
+            raise
+
+        if response.extensions.get("http_version") == HTTP2_VERSION:
+            self._http2_origins.add(origin)
+        else:
+            self._fall_back(origin, "negotiated_http1")
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(
+                response.stream, lambda: self._release(origin, connection)
+            ),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        transports = [c.transport for cs in self._connections.values() for c in cs]
+        if self._http1_transport is not None:
+            transports.append(self._http1_transport)
+        self._connections = {}
+        self._http1_transport = None
+        for transport in transports:
+            await transport.aclose()
@@ -1,30 +1,83 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Tuple, Union, DefaultDict
+import threading
+from typing import Optional, Tuple, Union
 
 import httpx
 
+from unstructured_client._hooks.custom.circuit_breaker import (
+    CircuitState,
+    CircuitStateChange,
+)
 from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
 from unstructured_client._hooks.types import (
     AfterSuccessContext,
     AfterErrorContext,
     AfterErrorHook,
+    BeforeRequestContext,
+    BeforeRequestHook,
+    CircuitStateChangeHook,
+    HookContext,
     SDKInitHook,
     AfterSuccessHook,
 )
 from unstructured_client.httpclient import HttpClient
-from collections import defaultdict
 
 logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
 SPLIT_HEADER_PREFIX = "X-Unstructured-Split-"
+# Holds the retry count of a request. The requests other hooks build from it
+# copy its extensions, so they share the count.
+RETRY_COUNT_EXTENSION_KEY = "logger_retry_count"
 
 
-class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
-    """Hook providing custom logging"""
+# Hooks are called from concurrent threads, the retry counts are only read and
+# written under this lock.
+_retries_lock = threading.Lock()
 
+
+class _RetryCount:
     def __init__(self) -> None:
-        self.retries_counter: DefaultDict[str, int] = defaultdict(int)
+        self.value = 0
+
+
+def _get_request(
+    response: Optional[httpx.Response], error: Optional[Exception]
+) -> Optional[httpx.Request]:
+    source = response if response is not None else error
+    if not isinstance(source, (httpx.Response, httpx.RequestError)):
+        return None
+    try:
+        return source.request
+    except RuntimeError:
+        # Built without a request, such as the responses of the split hook.
+        return None
+
+
+class RetryCountHook(BeforeRequestHook):
+    """Gives each partition request its own retry count before other hooks
+    build the request that is sent from it."""
+
+    operation_ids = frozenset({"partition"})
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        # Every attempt of a call starts from the same request, so its retries
+        # share the count while concurrent calls get their own.
+        with _retries_lock:
+            request.extensions.setdefault(RETRY_COUNT_EXTENSION_KEY, _RetryCount())
+        return request
+
+    async def before_request_async(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        # Cheap enough for the event loop, unlike the worker thread fallback.
+        return self.before_request(hook_ctx, request)
+
+
+class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook, CircuitStateChangeHook):
+    """Hook providing custom logging"""
 
     @staticmethod
     def _split_response_context(response: Optional[httpx.Response]) -> str:
@@ -43,7 +96,7 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
             f" split_failure_count={failure_count}"
         )
 
-    def log_retries(self, response: Optional[httpx.Response],  error: Optional[Exception], operation_id: str,):
+    def log_retries(self, response: Optional[httpx.Response],  error: Optional[Exception], retry_number: int,):
         """Log retries to give users visibility into requests."""
         split_context = self._split_response_context(response)
 
@@ -52,7 +105,7 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
                 "Failed to process a request due to API server error with status code %d. "
                 "Attempting retry number %d after sleep.%s",
                 response.status_code,
-                self.retries_counter[operation_id],
+                retry_number,
                 split_context,
             )
             if response.text:
@@ -63,7 +116,7 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
                 "Failed to process a request due to transport error - %s. "
                 "Attempting retry number %d after sleep.",
                 error,
-                self.retries_counter[operation_id],
+                retry_number,
             )
 
 
@@ -76,7 +129,10 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
     def after_success(
         self, hook_ctx: AfterSuccessContext, response: httpx.Response
     ) -> Union[httpx.Response, Exception]:
-        self.retries_counter.pop(hook_ctx.operation_id, None)
+        request = _get_request(response, None)
+        if request is not None:
+            with _retries_lock:
+                request.extensions.pop(RETRY_COUNT_EXTENSION_KEY, None)
         # Note(austin) - pdf splitting returns a mock request
         # so we always reach the AfterSuccessHook
         # This doesn't mean the splits succeeded
@@ -91,8 +147,18 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
         error: Optional[Exception],
     ) -> Union[Tuple[Optional[httpx.Response], Optional[Exception]], Exception]:
         """Concrete implementation for AfterErrorHook."""
-        self.retries_counter[hook_ctx.operation_id] += 1
-        self.log_retries(response, error, hook_ctx.operation_id)
+        retry_number = 1
+        request = _get_request(response, error)
+        if request is not None:
+            # Requests of other operations are resent as they are, so their
+            # count is attached on the first failure.
+            with _retries_lock:
+                retry_count = request.extensions.setdefault(
+                    RETRY_COUNT_EXTENSION_KEY, _RetryCount()
+                )
+                retry_count.value += 1
+                retry_number = retry_count.value
+        self.log_retries(response, error, retry_number)
 
         if response and response.status_code == 200:
             # NOTE: Even though this is an after_error method, due to split_pdf_hook logic we may get
@@ -108,3 +174,19 @@ class LoggerHook(AfterErrorHook, AfterSuccessHook, SDKInitHook):
         if error is not None:
             logger.error("Following error occurred - %s", error, exc_info=error)
         return response, error
+
+    def circuit_state_change(
+        self, hook_ctx: HookContext, change: CircuitStateChange
+    ) -> None:
+        """Concrete implementation for CircuitStateChangeHook."""
+        if change.state is CircuitState.OPEN:
+            logger.warning(
+                "Circuit to %s opened after %d failed requests. "
+                "Requests fail without being sent until it is probed again.",
+                change.base_url,
+                change.failures,
+            )
+        elif change.state is CircuitState.HALF_OPEN:
+            logger.info("Circuit to %s is half-open, probing the API.", change.base_url)
+        else:
+            logger.info("Circuit to %s closed, the API is reachable again.", change.base_url)
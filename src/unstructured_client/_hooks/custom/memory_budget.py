@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+
+
+class SplitMemoryBudget:
+    """Caps the bytes of split PDF chunks and chunk results held in memory
+    across all operations of a client.
+
+    Operations reserve the size of a chunk or a chunk result before they keep
+    it in memory, and spill it to their temporary directory when the budget is
+    spent. Reservations are counted per operation, so everything an operation
+    still holds is released when it is cleared. Operations may run on different
+    threads, so the budget is guarded by a lock.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("The split PDF memory budget must not be negative")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._reserved: dict[str, int] = {}
+        self._total_reserved = 0
+
+    @property
+    def reserved(self) -> int:
+        """The number of bytes held in memory by all operations."""
+        return self._total_reserved
+
+    def try_reserve(self, operation_id: str, size: int) -> bool:
+        """Reserves `size` bytes for `operation_id`, if they fit in the budget."""
+        with self._lock:
+            if self._total_reserved + size > self.max_bytes:
+                return False
+            self._reserved[operation_id] = self._reserved.get(operation_id, 0) + size
+            self._total_reserved += size
+            return True
+
+    def release(self, operation_id: str, size: int) -> None:
+        """Releases `size` bytes reserved by `operation_id`."""
+        with self._lock:
+            reserved = self._reserved.get(operation_id, 0)
+            size = min(size, reserved)
+            if reserved - size:
+                self._reserved[operation_id] = reserved - size
+            else:
+                self._reserved.pop(operation_id, None)
+            self._total_reserved -= size
+
+    def release_operation(self, operation_id: str) -> int:
+        """Releases everything reserved by `operation_id`.
+
+        Returns:
+            The number of bytes released.
+        """
+        with self._lock:
+            reserved = self._reserved.pop(operation_id, 0)
+            self._total_reserved -= reserved
+            return reserved
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+# Set on the partition request to ask the split hook for a stream instead of the
+# combined elements, and on the response that carries the stream.
+STREAM_ELEMENTS_EXTENSION_KEY = "split_pdf_stream_elements"
+ELEMENT_STREAM_EXTENSION_KEY = "split_pdf_element_stream"
+
+ChunkResult = Tuple[int, httpx.Response]
+LoadElements = Callable[[httpx.Response], List[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class PartitionChunk:
+    """The elements of one chunk of a split `partition` call.
+
+    Attributes:
+        index: One-based position of the chunk in the document.
+        chunk_count: The number of chunks the document was split into.
+        elements: The elements of the chunk, empty if the chunk failed.
+        response: The response of the chunk request. Transport errors are
+            reported as a synthetic 500 response.
+    """
+
+    index: int
+    chunk_count: int
+    elements: List[Dict[str, Any]] = field(repr=False)
+    response: httpx.Response = field(repr=False)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.response.status_code == 200
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The transport error of the chunk request, if there was one."""
+        return self.response.extensions.get("transport_exception")
+
+
+@dataclass(frozen=True)
+class StreamEnd:
+    """Queued after the last chunk result. `error` is set if the chunk requests
+    stopped with an exception."""
+
+    error: Optional[BaseException] = None
+
+    @classmethod
+    def from_future(cls, future: Union[asyncio.Future[Any], Any]) -> StreamEnd:
+        if future.cancelled():
+            return cls()
+        return cls(future.exception())
+
+
+class _ChunkOrder:
+    """Releases chunk results in index order, as soon as every earlier chunk
+    is done."""
+
+    def __init__(self) -> None:
+        self._next_index = 1
+        self._held: dict[int, httpx.Response] = {}
+
+    def add(self, index: int, response: httpx.Response) -> list[ChunkResult]:
+        self._held[index] = response
+        ready = []
+        while self._next_index in self._held:
+            ready.append((self._next_index, self._held.pop(self._next_index)))
+            self._next_index += 1
+        return ready
+
+    def flush(self) -> list[ChunkResult]:
+        """Returns the held results, skipping chunks that never completed."""
+        ready = sorted(self._held.items())
+        self._held.clear()
+        return ready
+
+
+class _ChunkStreamBase:
+    def __init__(
+        self,
+        *,
+        chunk_count: int,
+        timeout: Optional[float],
+        operation_id: Optional[str],
+    ) -> None:
+        self.chunk_count = chunk_count
+        self._operation_id = operation_id
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self._order = _ChunkOrder()
+        self._ready: deque[ChunkResult] = deque()
+        self._ended = False
+        self._closed = False
+
+    def _accept(self, item: Union[ChunkResult, StreamEnd]) -> None:
+        if not isinstance(item, StreamEnd):
+            self._ready.extend(self._order.add(*item))
+            return
+        self._ended = True
+        if item.error is not None:
+            raise item.error
+        self._ready.extend(self._order.flush())
+
+    def _remaining_time(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._timeout_error()
+        return remaining
+
+    def _timeout_error(self) -> TimeoutError:
+        logger.error(
+            "split_pdf event=stream_timeout operation_id=%s chunk_count=%d",
+            self._operation_id,
+            self.chunk_count,
+        )
+        return TimeoutError("Timed out waiting for split PDF chunks")
+
+    def _make_chunk(
+        self,
+        result: ChunkResult,
+        elements: List[Dict[str, Any]],
+    ) -> PartitionChunk:
+        index, response = result
+        return PartitionChunk(
+            index=index,
+            chunk_count=self.chunk_count,
+            elements=elements,
+            response=response,
+        )
+
+
+class PartitionStream(_ChunkStreamBase):
+    """Iterates over the chunks of a `partition` call in page order.
+
+    A chunk is yielded as soon as it and every earlier chunk are done, so the
+    first elements are available long before the whole document is partitioned.
+    Failed chunks are yielded with no elements. Unless `split_pdf_allow_failed`
+    is set, the remaining chunk requests are cancelled after the first failure
+    and the stream ends with the failed chunk.
+
+    Close the stream, or use it as a context manager, when it is not read to the
+    end, so the remaining chunk requests are cancelled.
+    """
+
+    def __init__(
+        self,
+        results: queue.Queue[Union[ChunkResult, StreamEnd]],
+        *,
+        chunk_count: int,
+        load_elements: LoadElements,
+        on_close: Optional[Callable[[], None]] = None,
+        timeout: Optional[float] = None,
+        operation_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(chunk_count=chunk_count, timeout=timeout, operation_id=operation_id)
+        self._results = results
+        self._load_elements = load_elements
+        self._on_close = on_close
+
+    @classmethod
+    def from_elements(
+        cls,
+        response: httpx.Response,
+        elements: List[Dict[str, Any]],
+    ) -> PartitionStream:
+        """Wraps the response of a request that was not split into a stream
+        with a single chunk."""
+        results: queue.Queue[Union[ChunkResult, StreamEnd]] = queue.Queue()
+        results.put((1, response))
+        results.put(StreamEnd())
+        return cls(results, chunk_count=1, load_elements=lambda _: elements)
+
+    def __iter__(self) -> PartitionStream:
+        return self
+
+    def __next__(self) -> PartitionChunk:
+        try:
+            while not self._ready:
+                if self._ended or self._closed:
+                    raise StopIteration
+                try:
+                    item = self._results.get(timeout=self._remaining_time())
+                except queue.Empty:
+                    raise self._timeout_error() from None
+                self._accept(item)
+            result = self._ready.popleft()
+            elements = self._load_elements(result[1]) if result[1].status_code == 200 else []
+            return self._make_chunk(result, elements)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> PartitionStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancels the chunk requests that are still running and releases the
+        resources of the operation."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close is not None:
+            self._on_close()
+
+
+class PartitionStreamAsync(_ChunkStreamBase):
+    """Async equivalent of `PartitionStream` for `partition_stream_async`."""
+
+    def __init__(
+        self,
+        results: asyncio.Queue[Union[ChunkResult, StreamEnd]],
+        *,
+        chunk_count: int,
+        load_elements: LoadElements,
+        on_close: Optional[Callable[[], Awaitable[None]]] = None,
+        timeout: Optional[float] = None,
+        operation_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(chunk_count=chunk_count, timeout=timeout, operation_id=operation_id)
+        self._results = results
+        self._load_elements = load_elements
+        self._on_close = on_close
+
+    @classmethod
+    def from_elements(
+        cls,
+        response: httpx.Response,
+        elements: List[Dict[str, Any]],
+    ) -> PartitionStreamAsync:
+        """Wraps the response of a request that was not split into a stream
+        with a single chunk."""
+        results: asyncio.Queue[Union[ChunkResult, StreamEnd]] = asyncio.Queue()
+        results.put_nowait((1, response))
+        results.put_nowait(StreamEnd())
+        return cls(results, chunk_count=1, load_elements=lambda _: elements)
+
+    def __aiter__(self) -> PartitionStreamAsync:
+        return self
+
+    async def __anext__(self) -> PartitionChunk:
+        try:
+            while not self._ready:
+                if self._ended or self._closed:
+                    raise StopAsyncIteration
+                try:
+                    item = await asyncio.wait_for(
+                        self._results.get(),
+                        timeout=self._remaining_time(),
+                    )
+                except asyncio.TimeoutError:
+                    raise self._timeout_error() from None
+                self._accept(item)
+            result = self._ready.popleft()
+            elements = []
+            if result[1].status_code == 200:
+                # Parsing a large chunk would block the event loop.
+                elements = await asyncio.to_thread(self._load_elements, result[1])
+            return self._make_chunk(result, elements)
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def __aenter__(self) -> PartitionStreamAsync:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Cancels the chunk requests that are still running and releases the
+        resources of the operation."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close is not None:
+            await self._on_close()
+
+
+def create_element_stream_response(
+    response: httpx.Response,
+    stream: Union[PartitionStream, PartitionStreamAsync],
+) -> httpx.Response:
+    """Creates the response that hands the element stream back to `General`."""
+    return httpx.Response(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        content=b"[]",
+        request=response.request,
+        extensions={ELEMENT_STREAM_EXTENSION_KEY: stream},
+    )
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import ctypes
 import io
 import logging
-from typing import cast, Optional, BinaryIO, Union
+import mmap
+from typing import IO, cast, Optional, BinaryIO, Union
 
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+import pypdfium2.raw as pdfium_c  # type: ignore[import-untyped]
 from pypdf import PdfReader
 from pypdf.errors import FileNotDecryptedError, PdfReadError
 
 from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.split_engine import PDFIUM_LOCK, PdfBuffer
 from unstructured_client._hooks.custom.validation_errors import FileValidationError
 
 logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
@@ -25,35 +30,120 @@ class PDFValidationError(FileValidationError):
         super().__init__(message, file_type="PDF")
 
 
-def read_pdf(pdf_file: Union[BinaryIO, bytes]) -> Optional[PdfReader]:
+class PdfInfo:
+    """A PDF that PDFium loaded, with the page count and page sizes the split
+    hook needs. Implements the part of the `PdfReader` interface the hook uses,
+    without parsing the document in Python.
+
+    Attributes:
+        stream: The PDF file.
+        page_sizes: The width and height of each page in points.
+    """
+
+    def __init__(self, stream: BinaryIO, page_sizes: list[tuple[float, float]]) -> None:
+        self.stream = stream
+        self.page_sizes = page_sizes
+
+    def get_num_pages(self) -> int:
+        return len(self.page_sizes)
+
+    @property
+    def max_page_length(self) -> float:
+        """The longest side of any page in points."""
+        return max((max(page_size) for page_size in self.page_sizes), default=0.0)
+
+
+def inspect_pdf(pdf_file: BinaryIO) -> Optional[PdfInfo]:
+    """Validates the PDF and reads its page sizes with PDFium in one pass.
+
+    Page sizes are read from the page dictionaries, without parsing the page
+    contents. Returns `None` if PDFium cannot load the file or finds no pages,
+    so the caller can fall back to pypdf and its error messages.
+    """
+    position = pdf_file.tell()
+    page_size = pdfium_c.FS_SIZEF()
+    page_sizes: list[tuple[float, float]] = []
+    try:
+        with PDFIUM_LOCK:
+            pdf_file.seek(0)
+            pdf = pdfium.PdfDocument(pdf_file)
+            try:
+                for page_index in range(len(pdf)):
+                    if not pdfium_c.FPDF_GetPageSizeByIndexF(
+                        pdf.raw, page_index, ctypes.byref(page_size)
+                    ):
+                        return None
+                    page_sizes.append((page_size.width, page_size.height))
+            finally:
+                pdf.close()
+    except pdfium.PdfiumError:
+        return None
+    finally:
+        pdf_file.seek(position)
+    if not page_sizes:
+        return None
+    return PdfInfo(pdf_file, page_sizes)
+
+
+def get_pdf_buffer(pdf_file: IO[bytes]) -> PdfBuffer:
+    """Returns the content of the PDF file for splitting.
+
+    Files on disk are memory-mapped copy-on-write, so PDFium reads them in place
+    and the document is never copied into memory. Other streams are read. The
+    caller closes a returned map once the document is split, and the file must
+    not be truncated until then.
+    """
+    if isinstance(pdf_file, (io.BufferedReader, io.FileIO)):
+        try:
+            return mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError) as error:
+            # Empty files, pipes and other streams that cannot be mapped.
+            logger.debug("split_pdf event=pdf_map_failed error=%s", error)
+    pdf_file.seek(0)
+    return pdf_file.read()
+
+
+def read_pdf(pdf_file: Union[BinaryIO, bytes]) -> Optional[Union[PdfInfo, PdfReader]]:
     """Reads the given PDF file.
 
+    The file is loaded with PDFium, which validates it and counts its pages
+    without a full parse. Files PDFium cannot load are read with pypdf, which
+    tells which files are not PDFs, and reports why a PDF is invalid in
+    `check_pdf`.
+
     Args:
         pdf_file: The PDF file to be read.
 
     Returns:
-        The PdfReader object if the file is a PDF, None otherwise.
+        The PdfInfo or PdfReader object if the file is a PDF, None otherwise.
     """
 
     try:
         if isinstance(pdf_file, bytes):
             content = cast(bytes, pdf_file)
             pdf_file = io.BytesIO(content)
+        pdf_info = inspect_pdf(pdf_file)
+        if pdf_info is not None:
+            return pdf_info
         return PdfReader(pdf_file, strict=False)
     except (PdfReadError, UnicodeDecodeError):
         return None
 
 
-def check_pdf(pdf: PdfReader) -> PdfReader:
+def check_pdf(pdf: Union[PdfInfo, PdfReader]) -> Union[PdfInfo, PdfReader]:
     """
     Check if PDF is:
     - Encrypted
     - Has corrupted pages
     - Has corrupted root object
 
+    A `PdfInfo` was validated by PDFium when it was read and is returned as is.
+
     Throws:
     - PDFValidationError if file is encrypted or corrupted
     """
+    if isinstance(pdf, PdfInfo):
+        return pdf
     try:
         # This will raise if the file is encrypted
         pdf.metadata  # pylint: disable=pointless-statement
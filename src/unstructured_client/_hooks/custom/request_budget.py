@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Optional, Tuple, Union
+
+from unstructured_client._hooks.custom.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+Waiter = Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+
+
+class ChunkRequestBudget:
+    """Caps the split PDF page requests in flight across all operations.
+
+    Operations may run on different event loops, so the budget is guarded by a
+    thread lock and wakes waiters on their own loop. A free slot goes to the
+    waiting operation with the fewest requests in flight, so a large document
+    cannot starve the small ones started after it.
+    """
+
+    def __init__(self, max_requests: int) -> None:
+        if max_requests < 1:
+            raise ValueError("The split PDF request budget must be at least 1")
+        self.max_requests = max_requests
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, int] = {}
+        self._total_in_flight = 0
+        # Waiting operations, in the order they started waiting.
+        self._waiters: dict[str, deque[Waiter]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests holding a slot of the budget."""
+        return self._total_in_flight
+
+    async def acquire(self, operation_id: str) -> None:
+        """Waits for a slot of the budget for a request of `operation_id`."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._total_in_flight < self.max_requests:
+                self._take_slot(operation_id)
+                return
+            future: asyncio.Future[None] = loop.create_future()
+            self._waiters.setdefault(operation_id, deque()).append((loop, future))
+            logger.debug(
+                "split_pdf event=request_budget_wait operation_id=%s in_flight=%d max_requests=%d",
+                operation_id,
+                self._total_in_flight,
+                self.max_requests,
+            )
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not self._remove_waiter(operation_id, future):
+                    # The slot was handed over as the request was cancelled.
+                    self._release_slot(operation_id)
+            raise
+
+    def try_acquire(self, operation_id: str) -> bool:
+        """Takes a slot for a request of `operation_id` without waiting,
+        `False` if none is free."""
+        with self._lock:
+            if self._waiters or self._total_in_flight >= self.max_requests:
+                return False
+            self._take_slot(operation_id)
+            return True
+
+    def release(self, operation_id: str) -> None:
+        """Returns the slot of a finished request of `operation_id`."""
+        with self._lock:
+            self._release_slot(operation_id)
+
+    def _take_slot(self, operation_id: str) -> None:
+        self._in_flight[operation_id] = self._in_flight.get(operation_id, 0) + 1
+        self._total_in_flight += 1
+
+    def _return_slot(self, operation_id: str) -> None:
+        remaining = self._in_flight.get(operation_id, 0) - 1
+        if remaining > 0:
+            self._in_flight[operation_id] = remaining
+        else:
+            self._in_flight.pop(operation_id, None)
+        self._total_in_flight -= 1
+
+    def _release_slot(self, operation_id: str) -> None:
+        self._return_slot(operation_id)
+        self._hand_over_slots()
+
+    def _remove_waiter(self, operation_id: str, future: asyncio.Future[None]) -> bool:
+        waiters = self._waiters.get(operation_id)
+        if waiters is None:
+            return False
+        for waiter in waiters:
+            if waiter[1] is future:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[operation_id]
+                return True
+        return False
+
+    def _hand_over_slots(self) -> None:
+        while self._waiters and self._total_in_flight < self.max_requests:
+            # Fair share: the operation with the fewest requests in flight goes
+            # first, ties go to the one waiting longest.
+            operation_id = min(
+                self._waiters,
+                key=lambda waiting_id: self._in_flight.get(waiting_id, 0),
+            )
+            waiters = self._waiters[operation_id]
+            loop, future = waiters.popleft()
+            if not waiters:
+                del self._waiters[operation_id]
+            # A waiter that is being cancelled gives the slot back itself.
+            self._take_slot(operation_id)
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, future)
+            except RuntimeError:
+                # The loop of the waiter is closed, nobody will use the slot.
+                self._return_slot(operation_id)
+
+
+def _wake_waiter(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class BudgetedLimiter:
+    """Holds a slot of the operation's own limiter and then a slot of the
+    shared `ChunkRequestBudget` for each request."""
+
+    def __init__(
+        self,
+        limiter: Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter],
+        budget: ChunkRequestBudget,
+        operation_id: str,
+    ) -> None:
+        self.limiter = limiter
+        self._budget = budget
+        self._operation_id = operation_id
+
+    async def __aenter__(self) -> None:
+        await self.limiter.__aenter__()
+        try:
+            await self._budget.acquire(self._operation_id)
+        except BaseException:
+            await self.limiter.__aexit__(None, None, None)
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._budget.release(self._operation_id)
+        await self.limiter.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def try_acquire(self) -> bool:
+        """Takes a slot of both the limiter and the budget without waiting,
+        `False` if either has none free."""
+        if not await try_acquire_slot(self.limiter):
+            return False
+        if not self._budget.try_acquire(self._operation_id):
+            await self.limiter.__aexit__(None, None, None)
+            return False
+        return True
+
+
+ChunkLimiter = Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter, BudgetedLimiter]
+
+
+async def try_acquire_slot(limiter: ChunkLimiter) -> bool:
+    """Takes a slot of `limiter` without waiting, `False` if none is free. A
+    slot taken is given back with `limiter.__aexit__`."""
+    if isinstance(limiter, asyncio.Semaphore):
+        if limiter.locked():
+            return False
+        # A semaphore that is not locked is acquired without waiting.
+        await limiter.acquire()
+        return True
+    if isinstance(limiter, BudgetedLimiter):
+        return await limiter.try_acquire()
+    return limiter.try_acquire()
+
+
+def get_adaptive_limiter(limiter: ChunkLimiter) -> Optional[AdaptiveConcurrencyLimiter]:
+    """Returns the adaptive limiter the outcome of requests is reported to."""
+    if isinstance(limiter, BudgetedLimiter):
+        limiter = limiter.limiter
+    return limiter if isinstance(limiter, AdaptiveConcurrencyLimiter) else None
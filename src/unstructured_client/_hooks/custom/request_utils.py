@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import io
 import json
 import logging
+import time
 from typing import Tuple, Any, BinaryIO, Optional
 from urllib.parse import urlparse
 
@@ -12,8 +12,11 @@ from httpx import URL
 from httpx._multipart import DataField, FileField
 
 from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.hedging import ChunkHedger
+from unstructured_client._hooks.custom.request_budget import ChunkLimiter, get_adaptive_limiter
 from unstructured_client._hooks.custom.form_utils import (
     PARTITION_FORM_FILES_KEY,
+    PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY,
     PARTITION_FORM_SPLIT_PDF_PAGE_KEY,
     PARTITION_FORM_SPLIT_PDF_ALLOW_FAILED_KEY,
     PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
@@ -22,10 +25,19 @@ from unstructured_client._hooks.custom.form_utils import (
     PARTITION_FORM_STARTING_PAGE_NUMBER_KEY,
     FormData,
 )
+from unstructured_client._hooks.custom.upload_compression import (
+    GZIP_CONTENT_TYPE,
+    GZIP_FILE_EXTENSION,
+    UploadCompression,
+    compress_file,
+)
 from unstructured_client.models import shared
+from unstructured_client.models.errors import DeadlineExceededError
 from unstructured_client.utils import (
     BackoffStrategy,
+    Deadline,
     Retries,
+    RetryBudget,
     RetryConfig,
     retry_async,
     serialize_request_body,
@@ -136,6 +148,7 @@ def create_pdf_chunk_request(
     pdf_chunk: Tuple[BinaryIO, int],
     original_request: httpx.Request,
     filename: str,
+    upload_compression: Optional[UploadCompression] = None,
 ) -> httpx.Request:
     """Creates a new request object with the updated payload for the partition API.
 
@@ -145,6 +158,8 @@ def create_pdf_chunk_request(
             a file object created with e.g. open()) and the page number.
         original_request: The original request.
         filename: The filename.
+        upload_compression: If set, the chunk is gzip compressed when it is
+            worth it.
 
     Returns:
         The updated request object.
@@ -158,12 +173,25 @@ def create_pdf_chunk_request(
         if isinstance(pdf_chunk_file, io.BytesIO)
         else pdf_chunk_file
     )
+    content_type = "application/pdf"
+    if upload_compression is not None and upload_compression.should_compress(
+        pdf_chunk_content, content_type
+    ):
+        compressed_chunk = compress_file(pdf_chunk_content, upload_compression.level)
+        pdf_chunk_content = (
+            compressed_chunk.getvalue()
+            if isinstance(compressed_chunk, io.BytesIO)
+            else compressed_chunk
+        )
+        data[PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY] = content_type
+        filename += GZIP_FILE_EXTENSION
+        content_type = GZIP_CONTENT_TYPE
 
     pdf_chunk_partition_params = shared.PartitionParameters(
         files=shared.Files(
             content=pdf_chunk_content,
             file_name=filename,
-            content_type="application/pdf",
+            content_type=content_type,
         ),
         **data,
     )
@@ -190,17 +218,50 @@ async def call_api_async(
     client: httpx.AsyncClient,
     pdf_chunk_request: httpx.Request,
     pdf_chunk_file: BinaryIO,
-    limiter: asyncio.Semaphore,
+    limiter: ChunkLimiter,
     retry_config: Optional[RetryConfig] = None,
     operation_id: Optional[str] = None,
     chunk_index: Optional[int] = None,
     page_number: Optional[int] = None,
+    hedger: Optional[ChunkHedger] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    deadline: Optional[Deadline] = None,
 ) -> httpx.Response:
-    retryable_codes = ["5xx"]
+    # Rate limited page requests are retried after the wait the server asks for.
+    retryable_codes = ["429", "5xx"]
     effective_retry_config = create_split_retry_config(retry_config)
 
+    adaptive_limiter = get_adaptive_limiter(limiter)
+    if not isinstance(pdf_chunk_file, io.BytesIO):
+        # A hedge would read the chunk file while the first request streams it.
+        hedger = None
+
+    async def send():
+        if hedger is None:
+            return await client.send(pdf_chunk_request)
+        return await hedger.send(
+            client, pdf_chunk_request, chunk_index=chunk_index, limiter=limiter
+        )
+
     async def do_request():
-        return await client.send(pdf_chunk_request)
+        if deadline is not None:
+            # Checked per attempt, a chunk may wait for the limiter or a retry.
+            if deadline.expired:
+                raise DeadlineExceededError()
+            pdf_chunk_request.extensions["timeout"] = deadline.clamp_timeout(
+                pdf_chunk_request.extensions.get("timeout")
+            )
+        if adaptive_limiter is None:
+            return await send()
+        # Every attempt, retries included, tells the limiter about server load.
+        started_at = time.monotonic()
+        try:
+            response = await send()
+        except Exception as error:
+            adaptive_limiter.record_error(error, time.monotonic() - started_at)
+            raise
+        adaptive_limiter.record_response(response.status_code, time.monotonic() - started_at)
+        return response
 
     async with limiter:
         try:
@@ -213,7 +274,8 @@ async def call_api_async(
                 effective_retry_config.retry_connection_errors,
             )
             response = await retry_async(
-                do_request, Retries(effective_retry_config, retryable_codes)
+                do_request,
+                Retries(effective_retry_config, retryable_codes, retry_budget, deadline),
             )
             logger.debug(
                 "split_pdf event=chunk_request_response operation_id=%s chunk_index=%s page_number=%s status_code=%d",
@@ -256,25 +318,55 @@ def prepare_request_headers(
     return new_headers
 
 
-def create_response(elements: list) -> httpx.Response:
+# Holds the already parsed elements of a combined split-PDF response.
+PARSED_ELEMENTS_EXTENSION_KEY = "split_pdf_elements"
+
+
+class _SerializedElements(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, elements: list) -> None:
+        self._elements = elements
+
+    def __iter__(self):
+        yield json.dumps(self._elements).encode()
+
+    async def __aiter__(self):
+        yield json.dumps(self._elements).encode()
+
+
+class ElementsResponse(httpx.Response):
+    """A response with the combined elements of a split operation.
+
+    The parsed elements are kept in the `split_pdf_elements` extension, which
+    `General.partition` uses as is. The JSON body is only serialized when the
+    content is read.
     """
-    Creates a modified response object with updated content.
+
+    def __init__(self, elements: list) -> None:
+        super().__init__(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            stream=_SerializedElements(elements),
+            extensions={PARSED_ELEMENTS_EXTENSION_KEY: elements},
+        )
+
+    @property
+    def content(self) -> bytes:
+        if not hasattr(self, "_content"):
+            self.read()
+        return self._content
+
+
+def create_elements_response(elements: list) -> httpx.Response:
+    """
+    Creates a response for the given elements without serializing them.
 
     Args:
-        elements: The list of elements to be serialized and added to
-        the response.
+        elements: The list of elements of the response.
 
     Returns:
-        The modified response object with updated content.
+        The response object, see `ElementsResponse`.
     """
-    response = httpx.Response(
-        status_code=200, headers={"Content-Type": "application/json"}
-    )
-    content = json.dumps(elements).encode()
-    content_length = str(len(content))
-    response.headers.update({"Content-Length": content_length})
-    setattr(response, "_content", content)
-    return response
+    return ElementsResponse(elements)
 
 
 def get_base_url(url: str | URL) -> str:
@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Mapping, Optional, Union
+
+import httpx
+
+from unstructured_client import utils
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.form_utils import (
+    PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_DIR_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
+    PARTITION_FORM_STARTING_PAGE_NUMBER_KEY,
+)
+from unstructured_client.models import shared
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+# Results of whole `partition` calls and of split PDF chunks are counted apart.
+PARTITION_NAMESPACE = "partition"
+CHUNK_NAMESPACE = "chunk"
+# Set on the combined response of a split operation that omitted failed chunks.
+PARTIAL_RESULT_EXTENSION_KEY = "split_pdf_partial_result"
+DEFAULT_MEMORY_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_DIRECTORY_CACHE_BYTES = 1024 * 1024 * 1024
+HASH_BUFFER_SIZE = 1024 * 1024
+# Form fields that change how the client sends a request, not its result.
+CLIENT_ONLY_FORM_KEYS = (
+    PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
+    PARTITION_FORM_SPLIT_CACHE_TMP_DATA_DIR_KEY,
+)
+DIRECTORY_ENTRY_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Lookups of a `ResultCache`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that went to the API.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups answered from the cache, 0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache(ABC):
+    """A cache of partition results, keyed by the content of the document.
+
+    Whole `partition` calls are cached in the `partition` namespace and the
+    page requests of split PDFs in the `chunk` namespace, so the hit ratio of
+    each is reported by `stats`. Subclasses store the JSON body of the results.
+    """
+
+    def __init__(self) -> None:
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, CacheStats] = {}
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Returns the result stored under `key`, or `None` on a miss."""
+        value = self._load(f"{namespace}-{key}")
+        with self._stats_lock:
+            stats = self._stats.get(namespace, CacheStats())
+            self._stats[namespace] = CacheStats(
+                hits=stats.hits + (value is not None),
+                misses=stats.misses + (value is None),
+            )
+        return value
+
+    def set(self, namespace: str, key: str, value: bytes) -> None:
+        """Stores the result `value` under `key`."""
+        self._store(f"{namespace}-{key}", value)
+
+    def stats(self, namespace: Optional[str] = None) -> CacheStats:
+        """The lookups of `namespace`, or of all namespaces if it is `None`."""
+        with self._stats_lock:
+            if namespace is not None:
+                return self._stats.get(namespace, CacheStats())
+            return CacheStats(
+                hits=sum(stats.hits for stats in self._stats.values()),
+                misses=sum(stats.misses for stats in self._stats.values()),
+            )
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def _store(self, key: str, value: bytes) -> None:
+        ...
+
+
+class MemoryResultCache(ResultCache):
+    """Keeps results in memory, evicting the least recently used ones once
+    they take more than `max_bytes`."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_CACHE_BYTES) -> None:
+        super().__init__()
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The bytes of the stored results."""
+        return self._size
+
+    def _load(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class DirectoryResultCache(ResultCache):
+    """Keeps results as files in `directory`, evicting the least recently used
+    ones once they take more than `max_bytes`.
+
+    Files are replaced atomically, so several clients and processes can share
+    the directory. Reading a result updates its modification time, which
+    orders the eviction.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike[str]],
+        max_bytes: int = DEFAULT_DIRECTORY_CACHE_BYTES,
+    ) -> None:
+        super().__init__()
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Estimated from the writes of this instance, recounted before evicting.
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{DIRECTORY_ENTRY_SUFFIX}"
+
+    def _load(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            value = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            _touch(path)
+        except OSError:
+            pass
+        return value
+
+    def _store(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(value)
+            _touch(temp_path)
+            with self._lock:
+                try:
+                    previous_size = path.stat().st_size
+                except FileNotFoundError:
+                    previous_size = 0
+                os.replace(temp_path, path)
+                if self._size is None:
+                    self._size = self._evict()
+                else:
+                    self._size += len(value) - previous_size
+                    if self._size > self.max_bytes:
+                        self._size = self._evict()
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def _evict(self) -> int:
+        """Deletes the least recently used results until they fit `max_bytes`
+        and returns the bytes left."""
+        entries = []
+        size = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(DIRECTORY_ENTRY_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+            size += stat.st_size
+
+        for _, path, entry_size in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            logger.debug("split_pdf event=result_cache_evicted cache_file=%s", Path(path).name)
+        return size
+
+
+def _touch(path: Union[str, Path]) -> None:
+    # File systems keep coarse timestamps of writes, which would order the
+    # results written or read within a few milliseconds at random.
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _hash_file(file: Union[bytes, BinaryIO]) -> Optional[str]:
+    if isinstance(file, bytes):
+        return hashlib.sha256(file).hexdigest()
+    if not file.seekable():
+        return None
+    position = file.tell()
+    digest = hashlib.sha256()
+    try:
+        while block := file.read(HASH_BUFFER_SIZE):
+            digest.update(block)
+    finally:
+        file.seek(position)
+    return digest.hexdigest()
+
+
+def _get_cache_key(
+    file_hash: str,
+    url: str,
+    filename: Optional[str],
+    form_fields: Mapping[str, Any],
+) -> str:
+    # Deployments and API versions each have their own results.
+    normalized_fields = {
+        key: value for key, value in form_fields.items() if key not in CLIENT_ONLY_FORM_KEYS
+    }
+    digest = hashlib.sha256(file_hash.encode())
+    digest.update(json.dumps([url, filename, normalized_fields], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def get_partition_cache_key(
+    parameters: shared.PartitionParameters, url: str
+) -> Optional[str]:
+    """Returns the key of the result of partitioning with `parameters` at
+    `url`: a hash of the URL, the file and the form fields the request sends.
+    `None` if the file cannot be read without consuming it."""
+    body = utils.serialize_request_body(
+        parameters, False, False, "multipart", shared.PartitionParameters
+    )
+    if body is None:
+        return None
+    files = body.files
+    if not isinstance(files, list) or len(files) != 1:
+        return None
+    _, (filename, content, *_) = files[0]
+    file_hash = _hash_file(content)
+    if file_hash is None:
+        return None
+    data: Mapping[str, Any] = body.data or {}
+    # The filename ends up in the metadata of every element.
+    return _get_cache_key(file_hash, url, filename, data)
+
+
+def _hash_pdf_pages(pdf_chunk_file: BinaryIO) -> str:
+    # Chunks are written with a fixed file ID, so the same pages give the same
+    # bytes, see `split_engine._write_fixed_file_id`.
+    if isinstance(pdf_chunk_file, io.BytesIO):
+        return hashlib.sha256(pdf_chunk_file.getbuffer()).hexdigest()
+    file_hash = _hash_file(pdf_chunk_file)
+    if file_hash is None:
+        raise ValueError("PDF chunk files must be seekable")
+    return file_hash
+
+
+def get_chunk_cache_key(
+    pdf_chunk_file: BinaryIO,
+    url: str,
+    chunk_params: Mapping[str, Any],
+) -> str:
+    """Returns the key of the result of a split PDF chunk sent to `url`: a hash
+    of the URL, its pages and the form fields of its request.
+
+    The filename and the starting page number are left out, so the same pages
+    hit in other documents and at other offsets, see `get_chunk_result`.
+    """
+    fields = {
+        key: value
+        for key, value in chunk_params.items()
+        if key != PARTITION_FORM_STARTING_PAGE_NUMBER_KEY
+    }
+    return _get_cache_key(_hash_pdf_pages(pdf_chunk_file), url, None, fields)
+
+
+def create_chunk_cache_entry(content: bytes, page_number: int, filename: str) -> bytes:
+    """Returns the cache entry of the result of a chunk: the result, after a
+    line with the starting page number and filename it was partitioned with."""
+    header = json.dumps({"page_number": page_number, "filename": filename})
+    return header.encode() + b"\n" + content
+
+
+def get_chunk_result(entry: bytes, page_number: int, filename: str) -> Optional[bytes]:
+    """Returns the result of a chunk starting at `page_number` of `filename`
+    from its cache entry, `None` if the entry cannot be read.
+
+    Entries of the same pages of another document or offset are rewritten:
+    page numbers are shifted, filenames replaced, and element IDs derived
+    anew so they stay unique within the document.
+    """
+    header_end = entry.find(b"\n")
+    try:
+        header = json.loads(entry[:header_end])
+        cached_page_number = int(header["page_number"])
+        cached_filename = str(header["filename"])
+    except (ValueError, KeyError, TypeError):
+        return None
+    content = entry[header_end + 1:]
+    if cached_page_number == page_number and cached_filename == filename:
+        return content
+
+    try:
+        elements = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(elements, list) or not all(isinstance(e, dict) for e in elements):
+        return None
+    page_offset = page_number - cached_page_number
+    filenames = {
+        cached_filename: filename,
+        Path(cached_filename).name: Path(filename).name,
+    }
+    element_ids: dict[str, str] = {}
+    for element in elements:
+        element_id = element.get("element_id")
+        if isinstance(element_id, str):
+            element_ids[element_id] = hashlib.sha256(
+                f"{element_id}:{filename}:{page_number}".encode()
+            ).hexdigest()[: len(element_id)]
+    for element in elements:
+        if element.get("element_id") in element_ids:
+            element["element_id"] = element_ids[element["element_id"]]
+        metadata = element.get("metadata")
+        if not isinstance(metadata, dict):
+            continue
+        if isinstance(metadata.get("page_number"), int):
+            metadata["page_number"] += page_offset
+        if metadata.get("filename") in filenames:
+            metadata["filename"] = filenames[metadata["filename"]]
+        if metadata.get("parent_id") in element_ids:
+            metadata["parent_id"] = element_ids[metadata["parent_id"]]
+    return json.dumps(elements).encode()
+
+
+def create_cached_response(
+    content: bytes,
+    request: Optional[httpx.Request] = None,
+) -> httpx.Response:
+    """Creates the response of a result served from the cache."""
+    return httpx.Response(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        content=content,
+        request=request,
+    )
+
+
+def get_cacheable_content(response: httpx.Response) -> Optional[bytes]:
+    """Returns the body of `response` to cache, or `None` if it is not a
+    complete JSON result."""
+    if response.status_code != 200 or response.extensions.get(PARTIAL_RESULT_EXTENSION_KEY):
+        return None
+    if not utils.match_content_type(response.headers.get("Content-Type", ""), "application/json"):
+        return None
+    return response.content
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import ctypes
+import io
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent import futures
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator, Iterator, Optional, Sequence, Tuple, Union
+
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
+
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+# Splitting in worker processes is opt-in: `spawn` needs the entry point of the
+# program to be guarded, which cannot be checked here.
+DEFAULT_SPLIT_PDF_WORKERS = 0
+WORKER_DOCUMENT_CACHE_SIZE = 4
+
+# PDFium keeps process-global state and is not thread-safe, not even for calls on
+# different documents. Every in-process pypdfium call must hold this lock. It is
+# taken per chunk rather than per document, so concurrent splits interleave
+# instead of queueing behind whole documents.
+PDFIUM_LOCK = threading.RLock()
+
+# The file ID PDFium writes in the trailer, or the dictionary of a cross-reference
+# stream: two hex strings.
+FILE_ID_PATTERN = re.compile(rb"/ID\s*\[\s*<([0-9A-Fa-f]*)>\s*<([0-9A-Fa-f]*)>\s*\]")
+
+# A zero-based, end-exclusive range of pages.
+PageRange = Tuple[int, int]
+# The content of a document: bytes, or a memory map of the file it is read from.
+PdfBuffer = Union[bytes, mmap.mmap]
+
+
+def open_pdf(pdf_buffer: PdfBuffer) -> pdfium.PdfDocument:
+    """Loads the document from `pdf_buffer` without copying it. The caller must
+    hold `PDFIUM_LOCK`.
+
+    A memory map must be writable, such as a copy-on-write map, so PDFium can
+    read the mapped file in place. The map cannot be closed before the document.
+    """
+    if isinstance(pdf_buffer, mmap.mmap):
+        return pdfium.PdfDocument((ctypes.c_char * len(pdf_buffer)).from_buffer(pdf_buffer))
+    return pdfium.PdfDocument(pdf_buffer)
+
+
+def get_page_ranges(split_size: int, page_start: int, page_end: int) -> list[PageRange]:
+    """Returns the page ranges of the chunks for the given one-based, inclusive
+    page range."""
+    page_ranges: list[PageRange] = []
+    offset = page_start - 1
+    while offset < page_end:
+        page_ranges.append((offset, min(offset + split_size, page_end)))
+        offset += split_size
+    return page_ranges
+
+
+def _write_fixed_file_id(content: Union[memoryview, mmap.mmap]) -> None:
+    """Overwrites the file ID of a written chunk with zeros, in place.
+
+    PDFium gives every document it writes a random file ID, so chunks of the
+    same pages would differ from one split to the next. The ID has the same
+    length afterwards, so no offset of the file changes.
+    """
+    match = None
+    for match in FILE_ID_PATTERN.finditer(content):
+        pass
+    if match is None:
+        return
+    for group in (1, 2):
+        start, end = match.span(group)
+        content[start:end] = b"0" * (end - start)
+
+
+def _export_pages(
+    pdf: pdfium.PdfDocument,
+    page_range: PageRange,
+    destination: Union[str, io.BytesIO],
+) -> None:
+    new_pdf = pdfium.PdfDocument.new()
+    try:
+        new_pdf.import_pages(pdf, pages=list(range(*page_range)))
+        new_pdf.save(destination)
+    finally:
+        new_pdf.close()
+    if isinstance(destination, io.BytesIO):
+        with destination.getbuffer() as content:
+            _write_fixed_file_id(content)
+        return
+    with open(destination, "r+b") as chunk_file, mmap.mmap(chunk_file.fileno(), 0) as content:
+        _write_fixed_file_id(content)
+
+
+# Documents opened by a worker process, reused by the following chunks of the same
+# source file. Worker processes run one task at a time, so no lock is needed.
+_worker_documents: OrderedDict[Tuple[str, int, int], pdfium.PdfDocument] = OrderedDict()
+
+
+def _open_worker_document(source_path: str) -> pdfium.PdfDocument:
+    stat = os.stat(source_path)
+    key = (source_path, stat.st_size, stat.st_mtime_ns)
+    pdf = _worker_documents.get(key)
+    if pdf is not None:
+        _worker_documents.move_to_end(key)
+        return pdf
+
+    # Load the bytes instead of passing the path so no file handle stays open
+    # and the source can be removed while the document is cached.
+    pdf = pdfium.PdfDocument(Path(source_path).read_bytes())
+    _worker_documents[key] = pdf
+    while len(_worker_documents) > WORKER_DOCUMENT_CACHE_SIZE:
+        _, evicted = _worker_documents.popitem(last=False)
+        evicted.close()
+    return pdf
+
+
+def _split_page_range_in_worker(
+    source_path: str,
+    page_range: PageRange,
+    output_path: Optional[str],
+) -> Optional[bytes]:
+    pdf = _open_worker_document(source_path)
+    if output_path is not None:
+        _export_pages(pdf, page_range, output_path)
+        return None
+    chunk_buffer = io.BytesIO()
+    _export_pages(pdf, page_range, chunk_buffer)
+    return chunk_buffer.getvalue()
+
+
+class PdfSplitEngine:
+    """Splits PDF documents into page-range chunks with pypdfium.
+
+    With `workers=0` (the default) chunks are produced in the calling thread,
+    holding `PDFIUM_LOCK` for one chunk at a time. With `workers > 0` chunks are
+    produced in a pool of worker processes, each with its own copy of PDFium, so
+    splitting scales with the number of cores. Worker processes are started with
+    the `spawn` method, which requires the main module to be importable (guard the
+    entry point with `if __name__ == "__main__":`).
+    """
+
+    def __init__(self, workers: int = DEFAULT_SPLIT_PDF_WORKERS) -> None:
+        if workers < 0:
+            raise ValueError("The number of split workers must not be negative.")
+        self._workers = workers
+        self._executor: Optional[futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def configure(self, workers: int) -> None:
+        """Sets the number of worker processes, 0 splits in the calling thread."""
+        if workers < 0:
+            raise ValueError("The number of split workers must not be negative.")
+        with self._lock:
+            if workers == self._workers:
+                return
+            executor = self._executor
+            self._executor = None
+            self._workers = workers
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shuts down the worker processes, if any were started."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def count_pages(self, pdf_bytes: PdfBuffer) -> int:
+        with PDFIUM_LOCK:
+            with open_pdf(pdf_bytes) as pdf:
+                return len(pdf)
+
+    def split_to_buffers(
+        self,
+        pdf_bytes: PdfBuffer,
+        page_ranges: Sequence[PageRange],
+    ) -> list[io.BytesIO]:
+        """Splits the document into in-memory chunks, one per page range."""
+        return list(self.iter_buffers(pdf_bytes, page_ranges))
+
+    def split_to_files(
+        self,
+        pdf_bytes: PdfBuffer,
+        page_ranges: Sequence[PageRange],
+        output_dir: Path,
+    ) -> list[Path]:
+        """Splits the document into chunk files written to `output_dir`."""
+        return list(self.iter_files(pdf_bytes, page_ranges, output_dir))
+
+    def iter_buffers(
+        self,
+        pdf_bytes: PdfBuffer,
+        page_ranges: Sequence[PageRange],
+    ) -> Generator[io.BytesIO, None, None]:
+        """Lazily splits the document into in-memory chunks, one per page range.
+
+        A chunk is produced only when the next one is requested, so callers can
+        upload early chunks while later ones are still being split. Closing the
+        generator releases the source document.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            with _open_in_process(pdf_bytes) as pdf:
+                for page_range in page_ranges:
+                    chunk_buffer = io.BytesIO()
+                    with PDFIUM_LOCK:
+                        _export_pages(pdf, page_range, chunk_buffer)
+                    chunk_buffer.seek(0)
+                    yield chunk_buffer
+            return
+
+        with _spilled_source(pdf_bytes) as source_path:
+            for content in self._run_in_workers(
+                executor,
+                source_path,
+                page_ranges,
+                [None] * len(page_ranges),
+            ):
+                yield _as_chunk_buffer(content)
+
+    def iter_files(
+        self,
+        pdf_bytes: PdfBuffer,
+        page_ranges: Sequence[PageRange],
+        output_dir: Path,
+    ) -> Generator[Path, None, None]:
+        """Lazily splits the document into chunk files written to `output_dir`."""
+        chunk_paths = [
+            output_dir / f"chunk_{chunk_no}.pdf"
+            for chunk_no in range(1, len(page_ranges) + 1)
+        ]
+        executor = self._get_executor()
+        if executor is None:
+            with _open_in_process(pdf_bytes) as pdf:
+                for page_range, chunk_path in zip(page_ranges, chunk_paths):
+                    with PDFIUM_LOCK:
+                        _export_pages(pdf, page_range, str(chunk_path))
+                    yield chunk_path
+            return
+
+        with _spilled_source(pdf_bytes, directory=output_dir) as source_path:
+            for _, chunk_path in zip(
+                self._run_in_workers(
+                    executor,
+                    source_path,
+                    page_ranges,
+                    [str(chunk_path) for chunk_path in chunk_paths],
+                ),
+                chunk_paths,
+            ):
+                yield chunk_path
+
+    def _run_in_workers(
+        self,
+        executor: futures.ProcessPoolExecutor,
+        source_path: str,
+        page_ranges: Sequence[PageRange],
+        output_paths: Sequence[Optional[str]],
+    ) -> Generator[Optional[bytes], None, None]:
+        """Yields the worker results in order, keeping at most one chunk per
+        worker in flight ahead of the consumer."""
+        max_in_flight = max(1, self._workers)
+        pending: deque[futures.Future[Optional[bytes]]] = deque()
+        try:
+            for page_range, output_path in zip(page_ranges, output_paths):
+                pending.append(
+                    executor.submit(
+                        _split_page_range_in_worker,
+                        source_path,
+                        page_range,
+                        output_path,
+                    )
+                )
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_executor(self) -> Optional[futures.ProcessPoolExecutor]:
+        with self._lock:
+            if self._workers == 0:
+                return None
+            if self._executor is None:
+                self._executor = futures.ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.debug(
+                    "split_pdf event=split_workers_started workers=%d",
+                    self._workers,
+                )
+            return self._executor
+
+
+def _as_chunk_buffer(content: Optional[bytes]) -> io.BytesIO:
+    if content is None:
+        raise RuntimeError("Split worker returned no chunk content")
+    return io.BytesIO(content)
+
+
+@contextmanager
+def _open_in_process(pdf_bytes: PdfBuffer) -> Iterator[pdfium.PdfDocument]:
+    with PDFIUM_LOCK:
+        pdf = open_pdf(pdf_bytes)
+    try:
+        yield pdf
+    finally:
+        with PDFIUM_LOCK:
+            pdf.close()
+
+
+@contextmanager
+def _spilled_source(
+    pdf_bytes: PdfBuffer,
+    directory: Optional[Path] = None,
+) -> Iterator[str]:
+    """Writes the source document to a temporary file that worker processes can
+    open, so the document is not pickled once per chunk."""
+    fd, source_path = tempfile.mkstemp(
+        suffix=".pdf",
+        prefix="split_source_",
+        dir=directory,
+    )
+    try:
+        with os.fdopen(fd, "wb") as source_file:
+            source_file.write(pdf_bytes)
+        yield source_path
+    finally:
+        try:
+            os.unlink(source_path)
+        except OSError:
+            logger.debug("Failed to remove split source file", exc_info=True)
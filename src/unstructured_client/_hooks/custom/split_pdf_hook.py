@@ -1,30 +1,68 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import io
 import json
 import logging
 import math
+import mmap
+import queue
+import threading
 import time
-import os
 import tempfile
-import threading
 import uuid
-from collections import deque
-from collections.abc import Awaitable, Iterable
+from collections.abc import Awaitable, Iterable, Iterator
 from concurrent import futures
+from contextlib import closing
 from functools import partial
 from pathlib import Path
-from typing import Any, Coroutine, Optional, Tuple, Union, cast, Generator, BinaryIO
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Generator,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import aiofiles
 import httpx
 from httpx import AsyncClient
-from pypdf import PdfReader, PdfWriter
 import pypdfium2 as pdfium  # type: ignore[import-untyped]
+from pypdf import PdfReader, PdfWriter
 
 from unstructured_client._hooks.custom import form_utils, pdf_utils, request_utils
+from unstructured_client._hooks.custom.adaptive_concurrency import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+)
+from unstructured_client._hooks.custom.checkpoints import (
+    SplitCheckpoint,
+    get_operation_fingerprint,
+)
+from unstructured_client._hooks.custom.chunk_planner import (
+    ChunkPlan,
+    estimate_page_costs,
+    plan_chunks,
+)
+from unstructured_client._hooks.custom.client_pool import (
+    PooledTask,
+    SplitPdfClientPool,
+    get_default_client_timeout,
+)
 from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.element_files import (
+    MergeTarget,
+    create_merged_output_response,
+    get_merge_target,
+)
 from unstructured_client._hooks.custom.form_utils import (
     PARTITION_FORM_CONCURRENCY_LEVEL_KEY,
     PARTITION_FORM_FILES_KEY,
@@ -35,7 +73,39 @@ from unstructured_client._hooks.custom.form_utils import (
     PARTITION_FORM_SPLIT_PDF_PAGE_KEY,
     PARTITION_FORM_STARTING_PAGE_NUMBER_KEY,
 )
+from unstructured_client._hooks.custom.hedging import ChunkHedger, Hedging
+from unstructured_client._hooks.custom.http2 import get_http2
+from unstructured_client._hooks.custom.memory_budget import SplitMemoryBudget
+from unstructured_client._hooks.custom.partition_stream import (
+    STREAM_ELEMENTS_EXTENSION_KEY,
+    PartitionStream,
+    PartitionStreamAsync,
+    StreamEnd,
+    create_element_stream_response,
+)
+from unstructured_client._hooks.custom.request_budget import (
+    BudgetedLimiter,
+    ChunkLimiter,
+    ChunkRequestBudget,
+)
 from unstructured_client._hooks.custom.request_utils import get_base_url
+from unstructured_client._hooks.custom.result_cache import (
+    CHUNK_NAMESPACE,
+    PARTIAL_RESULT_EXTENSION_KEY,
+    ResultCache,
+    create_cached_response,
+    create_chunk_cache_entry,
+    get_cacheable_content,
+    get_chunk_cache_key,
+    get_chunk_result,
+)
+from unstructured_client._hooks.custom.split_engine import (
+    PageRange,
+    PdfBuffer,
+    PdfSplitEngine,
+    get_page_ranges,
+)
+from unstructured_client._hooks.custom.upload_compression import get_upload_compression
 from unstructured_client._hooks.types import (
     AfterErrorContext,
     AfterErrorHook,
@@ -46,7 +116,13 @@ from unstructured_client._hooks.types import (
     SDKInitHook,
 )
 from unstructured_client.httpclient import HttpClient, AsyncHttpClient
-from unstructured_client.utils import RetryConfig
+from unstructured_client.models.errors import DeadlineExceededError
+from unstructured_client.utils import (
+    Deadline,
+    RetryBudget,
+    RetryConfig,
+    get_deadline,
+)
 
 logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
 
@@ -62,9 +138,18 @@ HI_RES_STRATEGY = 'hi_res'
 MAX_PAGE_LENGTH = 4000
 TIMEOUT_BUFFER_SECONDS = 5
 DEFAULT_FUTURE_TIMEOUT_MINUTES = 60
+# Chunks split ahead of the free concurrency slots, so a slot never waits on the
+# splitter for long while at most `concurrency_level + CHUNK_LOOKAHEAD` chunks
+# are held in memory.
+CHUNK_LOOKAHEAD = 2
 OPERATION_ID_EXTENSION_KEY = "split_pdf_operation_id"
+# Marks chunk responses whose content is the path of the file their result was
+# spilled to, see `split_pdf_memory_budget`.
+RESULT_FILE_EXTENSION_KEY = "split_pdf_result_file"
 SPLIT_PDF_HEADER_PREFIX = "X-Unstructured-Split-"
 
+T = TypeVar("T")
+
 
 class ChunkExecutionError(Exception):
     def __init__(self, index: int, inner: BaseException):
@@ -73,65 +158,95 @@ class ChunkExecutionError(Exception):
         self.inner = inner
 
 
-class _AsyncThreadSafeBoundedSemaphore:
-    """A cancellable async gate that can be shared across event loops."""
+class LazyChunkTasks:
+    """The chunk requests of a split operation, built on demand.
 
-    def __init__(self, value: int) -> None:
-        if value <= 0:
-            raise ValueError("Semaphore value must be greater than zero")
-        self._initial_value = value
-        self._value = value
-        self._waiters: deque[asyncio.Future[None]] = deque()
+    Each step of the iteration splits the next chunk and wraps it into a request
+    partial, so `run_tasks` can upload the first chunks while later ones are still
+    being split, and only the chunks in flight are held in memory. The length is
+    the planned number of chunks. Iteration and `close` may happen on different
+    threads.
+
+    The chunks are produced in dispatch order. `chunk_indices` holds the one-based
+    page order position of each of them, when they are not sent in page order.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[Tuple[BinaryIO, int]],
+        chunk_count: int,
+        build_task: Callable[[BinaryIO, int, int], partial[Coroutine[Any, Any, httpx.Response]]],
+        chunk_indices: Optional[Sequence[int]] = None,
+    ) -> None:
+        self._chunks = iter(chunks)
+        self._chunk_count = chunk_count
+        self._build_task = build_task
+        self._chunk_indices = chunk_indices
+        self._produced = 0
+        self._closed = False
+        self._open_files: list[BinaryIO] = []
         self._lock = threading.Lock()
 
-    async def acquire(self) -> None:
-        loop = asyncio.get_running_loop()
-        waiter: Optional[asyncio.Future[None]] = None
-        with self._lock:
-            if self._value > 0:
-                self._value -= 1
-                return
-            waiter = loop.create_future()
-            self._waiters.append(waiter)
+    def __len__(self) -> int:
+        return self._chunk_count
 
-        try:
-            await waiter
-        except asyncio.CancelledError:
-            release_transferred_slot = False
-            with self._lock:
-                try:
-                    self._waiters.remove(waiter)
-                except ValueError:
-                    release_transferred_slot = waiter.done() and not waiter.cancelled()
-            if release_transferred_slot:
-                self.release()
-            raise
+    def __iter__(self) -> LazyChunkTasks:
+        return self
 
-    def release(self) -> None:
-        while True:
-            with self._lock:
-                while self._waiters:
-                    waiter = self._waiters.popleft()
-                    if not waiter.cancelled():
-                        break
-                else:
-                    if self._value >= self._initial_value:
-                        raise ValueError("Semaphore released too many times")
-                    self._value += 1
-                    return
-
-            def _wake_waiter() -> None:
-                if waiter.cancelled():
-                    self.release()
-                else:
-                    waiter.set_result(None)
+    def __next__(self) -> partial[Coroutine[Any, Any, httpx.Response]]:
+        return self._next_indexed()[1]
 
+    def indexed(self) -> Iterator[Tuple[int, partial[Coroutine[Any, Any, httpx.Response]]]]:
+        """Yields the chunk requests with the page order position of their chunk."""
+        while True:
             try:
-                waiter.get_loop().call_soon_threadsafe(_wake_waiter)
+                yield self._next_indexed()
+            except StopIteration:
                 return
-            except RuntimeError:
-                # The waiting loop closed before it could receive the slot.
-                continue
+
+    def _next_indexed(self) -> Tuple[int, partial[Coroutine[Any, Any, httpx.Response]]]:
+        with self._lock:
+            if self._closed:
+                raise StopIteration
+            pdf_chunk_file, page_index = next(self._chunks)
+            self._produced += 1
+            chunk_index = self._produced
+            if self._chunk_indices is not None:
+                chunk_index = self._chunk_indices[self._produced - 1]
+            if not isinstance(pdf_chunk_file, io.BytesIO):
+                # File handles are closed by their request; keep the ones that
+                # may never be sent so `close` can release them.
+                self._open_files = [file for file in self._open_files if not file.closed]
+                self._open_files.append(pdf_chunk_file)
+            try:
+                return chunk_index, self._build_task(pdf_chunk_file, page_index, chunk_index)
+            except BaseException:
+                pdf_chunk_file.close()
+                raise
+
+    def close(self) -> int:
+        """Stops splitting and closes the chunk files that were not sent.
+
+        Returns:
+            The number of chunk files closed.
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            self._closed = True
+            close_chunks = getattr(self._chunks, "close", None)
+            if callable(close_chunks):
+                close_chunks()
+            closed_chunk_files = 0
+            for pdf_chunk_file in self._open_files:
+                if not pdf_chunk_file.closed:
+                    pdf_chunk_file.close()
+                    closed_chunk_files += 1
+            self._open_files = []
+            return closed_chunk_files
+
+
+ChunkTasks = Union[list[partial[Coroutine[Any, Any, httpx.Response]]], LazyChunkTasks]
 
 
 def _get_request_timeout_seconds(request: httpx.Request) -> Optional[float]:
@@ -153,20 +268,6 @@ def _get_request_timeout_seconds(request: httpx.Request) -> Optional[float]:
 
     return None
 
-def _run_coroutines_in_separate_thread(
-        coroutines_task: Coroutine[Any, Any, list[tuple[int, httpx.Response]]],
-        loop_holder: dict[str, Optional[asyncio.AbstractEventLoop]],
-) -> list[tuple[int, httpx.Response]]:
-    async def runner() -> list[tuple[int, httpx.Response]]:
-        loop_holder["loop"] = asyncio.get_running_loop()
-        try:
-            return await coroutines_task
-        finally:
-            loop_holder["loop"] = None
-
-    return asyncio.run(runner())
-
-
 async def _order_keeper(index: int, coro: Awaitable) -> Tuple[int, httpx.Response]:
     try:
         response = await coro
@@ -178,65 +279,271 @@ async def _order_keeper(index: int, coro: Awaitable) -> Tuple[int, httpx.Respons
 
 
 async def run_tasks(
-    coroutines: list[partial[Coroutine[Any, Any, httpx.Response]]],
+    coroutines: Iterable[partial[Coroutine[Any, Any, httpx.Response]]],
     allow_failed: bool = False,
     concurrency_level: int = 10,
     client_timeout: Optional[httpx.Timeout] = None,
     operation_id: Optional[str] = None,
+    async_client: Optional[AsyncClient] = None,
+    on_result: Optional[Callable[[int, httpx.Response], None]] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+    request_budget: Optional[ChunkRequestBudget] = None,
 ) -> list[tuple[int, httpx.Response]]:
     """Run a list of coroutines in parallel and return the results in order.
 
     Args:
-        coroutines (list[Callable[[Coroutine], Awaitable]): A list of fuctions
-            parametrized with async_client that return Awaitable objects.
+        coroutines (Iterable[Callable[[Coroutine], Awaitable]): A list of fuctions
+            parametrized with async_client that return Awaitable objects. Any other
+            sized iterable, such as `LazyChunkTasks`, is consumed lazily: the next
+            function is only requested once a slot in the look-ahead window frees up.
         allow_failed (bool, optional): If True, failed responses will be included
             in the results. Otherwise, the first failed request breaks the
             process. Defaults to False.
+        async_client (AsyncClient, optional): A shared client bound to the running
+            event loop. It is not closed here. If not provided, a client is created
+            for this batch only.
+        on_result (Callable[[int, httpx.Response], None], optional): Called on the
+            event loop with the index and response of every chunk as it completes,
+            in completion order.
+        adaptive_concurrency (AdaptiveConcurrency, optional): If set, the number of
+            requests in flight starts at `concurrency_level` and adapts to the
+            server load instead of staying fixed.
+        request_budget (ChunkRequestBudget, optional): A budget of requests in
+            flight shared with other operations. Each request holds a slot of
+            the budget on top of its slot of `concurrency_level`.
     """
 
 
-    limiter = asyncio.Semaphore(concurrency_level)
-    if client_timeout is None:
-        # Use a variable to adjust the httpx client timeout, or default to 60 minutes.
-        # When we're able to reuse the SDK to make these calls, we can remove this var
-        # and let the SDK timeout flow through directly.
-        client_timeout_minutes = 60
-        if timeout_var := os.getenv("UNSTRUCTURED_CLIENT_TIMEOUT_MINUTES"):
-            client_timeout_minutes = int(timeout_var)
-        client_timeout = httpx.Timeout(60 * client_timeout_minutes)
+    operation_limiter: Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]
+    if adaptive_concurrency is not None:
+        operation_limiter = AdaptiveConcurrencyLimiter(
+            concurrency_level,
+            adaptive_concurrency,
+            operation_id=operation_id,
+        )
+    else:
+        operation_limiter = asyncio.Semaphore(concurrency_level)
+
+    limiter: ChunkLimiter = operation_limiter
+    if request_budget is not None:
+        limiter = BudgetedLimiter(
+            operation_limiter,
+            request_budget,
+            operation_id=operation_id or str(uuid.uuid4()),
+        )
+
+    def _get_window() -> int:
+        # The look-ahead window follows the limit as it adapts.
+        if isinstance(operation_limiter, AdaptiveConcurrencyLimiter):
+            return operation_limiter.limit + CHUNK_LOOKAHEAD
+        return concurrency_level + CHUNK_LOOKAHEAD
 
     logger.debug(
-        "split_pdf event=batch_async_start operation_id=%s chunk_count=%d concurrency=%d client_timeout=%s allow_failed=%s",
+        "split_pdf event=batch_async_start operation_id=%s chunk_count=%d concurrency=%d client_timeout=%s allow_failed=%s shared_client=%s",
         operation_id,
-        len(coroutines),
+        len(cast(Sized, coroutines)),
         concurrency_level,
         client_timeout,
         allow_failed,
+        async_client is not None,
     )
 
-    async with httpx.AsyncClient(timeout=client_timeout) as client:
-        armed_coroutines = [coro(async_client=client, limiter=limiter) for coro in coroutines] # type: ignore
-        tasks = [
-            asyncio.create_task(_order_keeper(index, coro))
-            for index, coro in enumerate(armed_coroutines, 1)
-        ]
-        try:
-            return await _collect_task_responses(
-                tasks,
-                allow_failed=allow_failed,
-                operation_id=operation_id,
-            )
-        except asyncio.CancelledError:
-            for task in tasks:
-                task.cancel()
-            remaining_tasks = sum(1 for task in tasks if not task.done())
-            await asyncio.gather(*tasks, return_exceptions=True)
-            logger.warning(
-                "split_pdf event=batch_cancel_remaining operation_id=%s reason=caller_cancelled remaining_tasks=%d",
-                operation_id,
-                remaining_tasks,
-            )
-            raise
+    run_armed_tasks = _run_armed_tasks
+    if not isinstance(coroutines, list) or on_result is not None:
+        run_armed_tasks = partial(
+            _run_pipelined_tasks,
+            window=_get_window,
+            on_result=on_result,
+        )
+
+    if async_client is not None:
+        return await run_armed_tasks(
+            coroutines,
+            async_client,
+            limiter,
+            allow_failed=allow_failed,
+            operation_id=operation_id,
+        )
+
+    async with httpx.AsyncClient(timeout=client_timeout or get_default_client_timeout()) as client:
+        return await run_armed_tasks(
+            coroutines,
+            client,
+            limiter,
+            allow_failed=allow_failed,
+            operation_id=operation_id,
+        )
+
+
+async def _run_armed_tasks(
+    coroutines: Iterable[partial[Coroutine[Any, Any, httpx.Response]]],
+    client: AsyncClient,
+    limiter: ChunkLimiter,
+    *,
+    allow_failed: bool,
+    operation_id: Optional[str],
+) -> list[tuple[int, httpx.Response]]:
+    armed_coroutines = [coro(async_client=client, limiter=limiter) for coro in coroutines] # type: ignore
+    tasks = [
+        asyncio.create_task(_order_keeper(index, coro))
+        for index, coro in enumerate(armed_coroutines, 1)
+    ]
+    try:
+        return await _collect_task_responses(
+            tasks,
+            allow_failed=allow_failed,
+            operation_id=operation_id,
+        )
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        remaining_tasks = sum(1 for task in tasks if not task.done())
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.warning(
+            "split_pdf event=batch_cancel_remaining operation_id=%s reason=caller_cancelled remaining_tasks=%d",
+            operation_id,
+            remaining_tasks,
+        )
+        raise
+
+
+async def _run_pipelined_tasks(
+    coroutines: Iterable[partial[Coroutine[Any, Any, httpx.Response]]],
+    client: AsyncClient,
+    limiter: ChunkLimiter,
+    *,
+    allow_failed: bool,
+    operation_id: Optional[str],
+    window: Callable[[], int],
+    on_result: Optional[Callable[[int, httpx.Response], None]] = None,
+) -> list[tuple[int, httpx.Response]]:
+    """Arms the coroutines as they are produced, keeping at most `window()` of
+    them in flight, so the first chunks upload while later chunks are still
+    being split.
+
+    Producing the next coroutine of `LazyChunkTasks` may split a PDF chunk, so it
+    runs in a worker thread and never blocks the event loop. Coroutines that are
+    already built are armed on the event loop.
+    """
+    indexed_coroutines: Iterator[Tuple[int, partial[Coroutine[Any, Any, httpx.Response]]]]
+    splits_chunks = isinstance(coroutines, LazyChunkTasks)
+    if isinstance(coroutines, LazyChunkTasks):
+        indexed_coroutines = coroutines.indexed()
+    else:
+        indexed_coroutines = enumerate(coroutines, start=1)
+    pending: dict[asyncio.Task[Tuple[int, httpx.Response]], int] = {}
+    results: list[tuple[int, httpx.Response]] = []
+    exhausted = False
+
+    def _add_result(result: tuple[int, httpx.Response]) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(*result)
+
+    try:
+        while True:
+            while not exhausted and len(pending) < window():
+                if splits_chunks:
+                    indexed_coro = await asyncio.to_thread(next, indexed_coroutines, None)
+                else:
+                    indexed_coro = next(indexed_coroutines, None)
+                if indexed_coro is None:
+                    exhausted = True
+                    break
+                index, coro = indexed_coro
+                armed_coroutine = coro(async_client=client, limiter=limiter)  # type: ignore
+                task = asyncio.create_task(_order_keeper(index, armed_coroutine))
+                pending[task] = index
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=pending.__getitem__):
+                index = pending.pop(task)
+                if allow_failed:
+                    _add_result(_normalize_task_result(index, task, operation_id))
+                    continue
+                try:
+                    _, response = task.result()
+                except ChunkExecutionError as exc:
+                    _log_chunk_transport_error(operation_id, exc.index, exc.inner)
+                    logger.warning(
+                        "split_pdf event=batch_cancel_remaining operation_id=%s reason=transport_exception failed_chunk_index=%d remaining_tasks=%d",
+                        operation_id,
+                        exc.index,
+                        len(pending),
+                    )
+                    await _cancel_tasks(pending)
+                    if isinstance(exc.inner, Exception):
+                        raise exc.inner
+                    raise RuntimeError("Split PDF chunk cancelled") from exc.inner
+                _add_result((index, response))
+                if response.status_code != 200:
+                    logger.warning(
+                        "split_pdf event=batch_cancel_remaining operation_id=%s reason=http_error failed_chunk_index=%d status_code=%d remaining_tasks=%d",
+                        operation_id,
+                        index,
+                        response.status_code,
+                        len(pending),
+                    )
+                    await _cancel_tasks(pending)
+                    return sorted(results, key=lambda x: x[0])
+    except asyncio.CancelledError:
+        remaining_tasks = sum(1 for task in pending if not task.done())
+        await _cancel_tasks(pending)
+        logger.warning(
+            "split_pdf event=batch_cancel_remaining operation_id=%s reason=caller_cancelled remaining_tasks=%d",
+            operation_id,
+            remaining_tasks,
+        )
+        raise
+    except BaseException:
+        await _cancel_tasks(pending)
+        raise
+    # return results in the original order
+    return sorted(results, key=lambda x: x[0])
+
+
+async def _cancel_tasks(tasks: Iterable[asyncio.Task[Any]]) -> None:
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _normalize_task_result(
+    index: int,
+    task: asyncio.Task[Tuple[int, httpx.Response]],
+    operation_id: Optional[str],
+) -> tuple[int, httpx.Response]:
+    """Turns a finished chunk task into a response, mapping transport errors and
+    cancellation to synthetic 500 responses."""
+    if task.cancelled():
+        error: BaseException = asyncio.CancelledError()
+    else:
+        exception = task.exception()
+        if exception is None:
+            return task.result()
+        error = exception
+    if isinstance(error, ChunkExecutionError):
+        index, error = error.index, error.inner
+    _log_chunk_transport_error(operation_id, index, error)
+    return index, _create_transport_error_response(error)
+
+
+def _log_chunk_transport_error(
+    operation_id: Optional[str],
+    chunk_index: int,
+    error: BaseException,
+) -> None:
+    logger.error(
+        "split_pdf event=chunk_transport_error operation_id=%s chunk_index=%d error_type=%s error=%s",
+        operation_id,
+        chunk_index,
+        type(error).__name__,
+        error,
+        exc_info=error,
+    )
 
 
 async def _collect_task_responses(
@@ -250,39 +557,15 @@ async def _collect_task_responses(
         normalized_responses: list[tuple[int, httpx.Response]] = []
         for index, result in enumerate(responses, 1):
             if isinstance(result, ChunkExecutionError):
-                logger.error(
-                    "split_pdf event=chunk_transport_error operation_id=%s chunk_index=%d error_type=%s error=%s",
-                    operation_id,
-                    result.index,
-                    type(result.inner).__name__,
-                    result.inner,
-                    exc_info=result.inner,
-                )
+                _log_chunk_transport_error(operation_id, result.index, result.inner)
                 normalized_responses.append(
                     (
                         result.index,
                         _create_transport_error_response(result.inner),
                     )
                 )
-            elif isinstance(result, asyncio.CancelledError):
-                logger.error(
-                    "split_pdf event=chunk_transport_error operation_id=%s chunk_index=%d error_type=%s error=%s",
-                    operation_id,
-                    index,
-                    type(result).__name__,
-                    result,
-                    exc_info=result,
-                )
-                normalized_responses.append((index, _create_transport_error_response(result)))
             elif isinstance(result, BaseException):
-                logger.error(
-                    "split_pdf event=chunk_transport_error operation_id=%s chunk_index=%d error_type=%s error=%s",
-                    operation_id,
-                    index,
-                    type(result).__name__,
-                    result,
-                    exc_info=result,
-                )
+                _log_chunk_transport_error(operation_id, index, result)
                 normalized_responses.append((index, _create_transport_error_response(result)))
             else:
                 normalized_responses.append(cast(tuple[int, httpx.Response], result))
@@ -294,14 +577,7 @@ async def _collect_task_responses(
         try:
             index, response = await future
         except ChunkExecutionError as exc:
-            logger.error(
-                "split_pdf event=chunk_transport_error operation_id=%s chunk_index=%d error_type=%s error=%s",
-                operation_id,
-                exc.index,
-                type(exc.inner).__name__,
-                exc.inner,
-                exc_info=exc.inner,
-            )
+            _log_chunk_transport_error(operation_id, exc.index, exc.inner)
             for remaining_task in remaining_tasks.values():
                 remaining_task.cancel()
             logger.warning(
@@ -347,32 +623,34 @@ def _create_transport_error_response(error: BaseException) -> httpx.Response:
     )
 
 
-def _cancel_running_tasks() -> None:
-    for task in asyncio.all_tasks():
-        if not task.done():
-            task.cancel()
+def _with_page_offsets(
+    chunks: Generator[T, None, None],
+    page_ranges: Sequence[PageRange],
+) -> Generator[Tuple[T, int], None, None]:
+    with closing(chunks):
+        for chunk, (page_offset, _) in zip(chunks, page_ranges):
+            yield chunk, page_offset
 
 
-def _request_task_cancellation(
-    loop: Optional[asyncio.AbstractEventLoop],
-    *,
-    operation_id: str,
-) -> bool:
-    if loop is None:
-        return False
-    try:
-        # This loop is private to the split-PDF worker thread, so all_tasks()
-        # only targets chunk requests for the current split operation.
-        loop.call_soon_threadsafe(_cancel_running_tasks)
-        return True
-    except RuntimeError as exc:
-        if "Event loop is closed" in str(exc):
-            logger.warning(
-                "split_pdf event=loop_closed_during_cancel operation_id=%s",
-                operation_id,
-            )
-            return False
-        raise
+def _get_batch_timeout(
+    chunk_count: int,
+    concurrency_level: int,
+    timeout_seconds: Optional[float],
+    deadline: Optional[Deadline] = None,
+) -> tuple[int, float]:
+    """Returns the number of waves and the timeout for a whole batch of chunks.
+
+    The per-chunk timeout bounds each HTTP call, but the batch may run in
+    multiple waves (ceil(chunks / concurrency)).  Scale the outer timeout
+    accordingly so healthy multi-wave batches aren't killed early. The batch
+    never outlives the deadline of the call.
+    """
+    num_waves = max(1, math.ceil(chunk_count / concurrency_level))
+    per_chunk = timeout_seconds or DEFAULT_FUTURE_TIMEOUT_MINUTES * 60
+    batch_timeout = per_chunk * num_waves + TIMEOUT_BUFFER_SECONDS
+    if deadline is not None:
+        batch_timeout = min(batch_timeout, deadline.remaining())
+    return num_waves, batch_timeout
 
 
 def get_optimal_split_size(num_pages: int, concurrency_level: int) -> int:
@@ -385,6 +663,14 @@ def get_optimal_split_size(num_pages: int, concurrency_level: int) -> int:
     return max(split_size, MIN_PAGES_PER_SPLIT)
 
 
+def load_chunk_elements(response: httpx.Response) -> list[dict]:
+    """Loads the elements of a chunk response kept in memory, or from the file
+    it was spilled to when the memory budget was spent."""
+    if response.extensions.get(RESULT_FILE_EXTENSION_KEY):
+        return load_elements_from_response(response)
+    return response.json()
+
+
 def load_elements_from_response(response: httpx.Response) -> list[dict]:
     """Loads elements from the response content - the response was modified
     to keep the path for the json file that should be loaded and returned
@@ -409,30 +695,35 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
     1. Create an instance of the `SplitPdfHook` class.
     2. Register SDK Init, Before Request, After Success and After Error hooks.
     """
-    _split_pdf_setup_lock = threading.Lock()
-    _split_pdf_setup_executor = futures.ThreadPoolExecutor(
-        max_workers=1,
-        thread_name_prefix="split-pdf-setup",
-    )
-    _split_pdf_setup_gate = _AsyncThreadSafeBoundedSemaphore(value=1)
-    # Thread-local flag shared by all hook instances to prove pypdfium work is under the setup lock.
-    _split_pdf_setup_state = threading.local()
+    # `SDKHooks` skips this hook for the operations of the platform API.
+    operation_ids = frozenset({"partition"})
 
     def __init__(self) -> None:
         self.client: Optional[HttpClient] = None
         self.async_client: Optional[AsyncHttpClient] = None
-        self.coroutines_to_execute: dict[
-            str, list[partial[Coroutine[Any, Any, httpx.Response]]]
-        ] = {}
+        self.coroutines_to_execute: dict[str, ChunkTasks] = {}
         self.concurrency_level: dict[str, int] = {}
         self.api_successful_responses: dict[str, list[httpx.Response]] = {}
         self.api_failed_responses: dict[str, list[httpx.Response]] = {}
-        self.executors: dict[str, futures.ThreadPoolExecutor] = {}
-        self.operation_futures: dict[str, futures.Future[list[tuple[int, httpx.Response]]]] = {}
+        self.chunk_client_pool = SplitPdfClientPool()
+        self.split_engine = PdfSplitEngine()
+        self.operation_tasks: dict[str, PooledTask[list[tuple[int, httpx.Response]]]] = {}
         self.tempdirs: dict[str, tempfile.TemporaryDirectory] = {}
         self.operation_timeouts: dict[str, Optional[float]] = {}
+        self.operation_deadlines: dict[str, Optional[Deadline]] = {}
         self.operation_retry_configs: dict[str, Optional[RetryConfig]] = {}
-        self.operation_loops: dict[str, dict[str, Optional[asyncio.AbstractEventLoop]]] = {}
+        self.operation_adaptive_concurrency: dict[str, Optional[AdaptiveConcurrency]] = {}
+        # Shared by all operations sent to the same API URL.
+        self.request_budgets: dict[str, ChunkRequestBudget] = {}
+        self.operation_request_budgets: dict[str, Optional[ChunkRequestBudget]] = {}
+        self.operation_checkpoints: dict[str, SplitCheckpoint] = {}
+        self.operation_pdf_maps: dict[str, mmap.mmap] = {}
+        # Shared by all operations of the client, created on first use.
+        self.memory_budget: Optional[SplitMemoryBudget] = None
+        self._memory_budget_lock = threading.Lock()
+        self._warned_sync_pool_client = False
+        self.operation_memory_budgets: dict[str, Optional[SplitMemoryBudget]] = {}
+        self.operation_hedgers: dict[str, Optional[ChunkHedger]] = {}
         self.pending_operation_ids: dict[str, str] = {}
         self.allow_failed: dict[str, bool] = {}
         self.cache_tmp_data_feature: dict[str, bool] = {}
@@ -466,6 +757,79 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
 
         return None
 
+    @staticmethod
+    def _get_adaptive_concurrency(
+        setting: Union[bool, AdaptiveConcurrency, None],
+    ) -> Optional[AdaptiveConcurrency]:
+        if isinstance(setting, AdaptiveConcurrency):
+            return setting
+        return AdaptiveConcurrency() if setting is True else None
+
+    @staticmethod
+    def _plan_chunks(
+        pdf_buffer: PdfBuffer,
+        page_ranges: Sequence[PageRange],
+        strategy: Optional[str],
+        operation_id: str,
+    ) -> Optional[ChunkPlan]:
+        """Rebalances the chunks of `page_ranges` by the estimated cost of their
+        pages, keeping their number. Returns `None` if the pages cannot be
+        analyzed, so the chunks keep the same number of pages."""
+        try:
+            page_costs = estimate_page_costs(
+                pdf_buffer,
+                (page_ranges[0][0], page_ranges[-1][1]),
+                strategy,
+            )
+        except pdfium.PdfiumError as error:
+            logger.warning(
+                "split_pdf event=chunk_planning_failed operation_id=%s error=%s",
+                operation_id,
+                error,
+            )
+            return None
+        chunk_plan = plan_chunks(
+            page_costs,
+            page_offset=page_ranges[0][0],
+            chunk_count=len(page_ranges),
+            max_pages=MAX_PAGES_PER_SPLIT,
+        )
+        logger.debug(
+            "split_pdf event=chunks_planned operation_id=%s chunk_count=%d max_chunk_cost=%.2f mean_chunk_cost=%.2f",
+            operation_id,
+            len(chunk_plan.page_ranges),
+            max(chunk_plan.chunk_costs),
+            sum(chunk_plan.chunk_costs) / len(chunk_plan.chunk_costs),
+        )
+        return chunk_plan
+
+    @staticmethod
+    def _get_hedging(setting: Union[bool, Hedging, None]) -> Optional[Hedging]:
+        if isinstance(setting, Hedging):
+            return setting
+        return Hedging() if setting is True else None
+
+    def _get_request_budget(
+        self,
+        base_url: str,
+        max_requests: Optional[int],
+    ) -> Optional[ChunkRequestBudget]:
+        if not isinstance(max_requests, int):
+            return None
+        budget = self.request_budgets.get(base_url)
+        if budget is None:
+            budget = self.request_budgets.setdefault(base_url, ChunkRequestBudget(max_requests))
+        return budget
+
+    def _get_memory_budget(self, max_bytes: Optional[int]) -> Optional[SplitMemoryBudget]:
+        if not isinstance(max_bytes, int):
+            return None
+        # Concurrent partition calls must share one budget.
+        with self._memory_budget_lock:
+            if self.memory_budget is None:
+                self.memory_budget = SplitMemoryBudget(max_bytes)
+            return self.memory_budget
+
     @staticmethod
     def _retry_config_observability_mode(retry_config: Optional[RetryConfig]) -> str:
         return "sdk_custom" if retry_config is not None else "sdk_default_or_unset"
@@ -586,7 +950,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         return base_url, self.client
 
     # pylint: disable=too-many-return-statements
-    def _before_request_unlocked(
+    def _prepare_split_request(
             self, hook_ctx: BeforeRequestContext, request: httpx.Request
     ) -> Union[httpx.Request, Exception]:
         """If `splitPdfPage` is set to `true` in the request, the PDF file is split into
@@ -673,6 +1037,9 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             key=PARTITION_FORM_SPLIT_CACHE_TMP_DATA_KEY,
             fallback_value=DEFAULT_CACHE_TMP_DATA,
         )
+        # `partition_to_file` splices the cached chunk results into its output.
+        if get_merge_target(request) is not None:
+            cache_tmp_data_feature = True
 
         cache_tmp_data_dir = form_utils.get_split_pdf_cache_tmp_data_dir(
             form_data,
@@ -694,7 +1061,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
 
         # If the doc is small enough, and we aren't slicing it with a page range:
         # do not split, just continue with the original request
-        if split_size >= page_count and page_count == len(pdf.pages):
+        if split_size >= page_count and page_count == pdf.get_num_pages():
             return request
 
         if operation_id in self.coroutines_to_execute:
@@ -709,28 +1076,97 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         if timeout_seconds is None and hook_ctx.config.timeout_ms is not None:
             timeout_seconds = hook_ctx.config.timeout_ms / 1000
         self.operation_timeouts[operation_id] = timeout_seconds
+        self.operation_deadlines[operation_id] = get_deadline()
         self.operation_retry_configs[operation_id] = (
             hook_ctx.config.retry_config
             if isinstance(hook_ctx.config.retry_config, RetryConfig)
             else None
         )
+        self.operation_adaptive_concurrency[operation_id] = self._get_adaptive_concurrency(
+            getattr(hook_ctx.config, "split_pdf_adaptive_concurrency", None),
+        )
+        self.operation_request_budgets[operation_id] = self._get_request_budget(
+            partition_base_url,
+            getattr(hook_ctx.config, "split_pdf_request_budget", None),
+        )
+        memory_budget = None
+        if not cache_tmp_data_feature:
+            memory_budget = self._get_memory_budget(
+                getattr(hook_ctx.config, "split_pdf_memory_budget", None),
+            )
+        self.operation_memory_budgets[operation_id] = memory_budget
+        hedging = self._get_hedging(getattr(hook_ctx.config, "split_pdf_hedging", None))
+        self.operation_hedgers[operation_id] = (
+            ChunkHedger(hedging, operation_id) if hedging is not None else None
+        )
+        split_pdf_limits = getattr(hook_ctx.config, "split_pdf_limits", None)
+        if isinstance(split_pdf_limits, httpx.Limits):
+            self.chunk_client_pool.configure(split_pdf_limits)
+        self.chunk_client_pool.configure_http2(
+            get_http2(getattr(hook_ctx.config, "http2", None))
+        )
+        split_pdf_workers = getattr(hook_ctx.config, "split_pdf_workers", None)
+        if isinstance(split_pdf_workers, int):
+            self.split_engine.configure(split_pdf_workers)
+        result_cache = getattr(hook_ctx.config, "partition_cache", None)
+        if not isinstance(result_cache, ResultCache):
+            result_cache = None
+        upload_compression = get_upload_compression(
+            getattr(hook_ctx.config, "upload_compression", None)
+        )
+        retry_budget = getattr(hook_ctx.config, "retry_budget", None)
+        if not isinstance(retry_budget, RetryBudget):
+            retry_budget = None
 
         try:
+            fingerprint = None
+            if getattr(hook_ctx.config, "split_pdf_checkpoints", False) is True:
+                # Fingerprinted before trimming, which rewrites the document.
+                fingerprint = get_operation_fingerprint(
+                    pdf.stream, pdf_file_meta["filename"], form_data
+                )
+
             pdf = self._trim_large_pages(pdf, form_data)
 
-            pdf.stream.seek(0)
-            pdf_bytes = pdf.stream.read()
+            pdf_buffer = pdf_utils.get_pdf_buffer(pdf.stream)
+            if isinstance(pdf_buffer, mmap.mmap):
+                self.operation_pdf_maps[operation_id] = pdf_buffer
+
+            page_ranges = get_page_ranges(split_size, page_range_start, page_range_end)
+            chunk_plan = None
+            if getattr(hook_ctx.config, "split_pdf_cost_aware_chunking", False) is True:
+                chunk_plan = self._plan_chunks(
+                    pdf_buffer, page_ranges, form_data.get("strategy"), operation_id
+                )
+            dispatch_page_ranges = page_ranges
+            if chunk_plan is not None:
+                page_ranges = chunk_plan.page_ranges
+                dispatch_page_ranges = chunk_plan.dispatch_page_ranges
+
+            checkpoint = None
+            if fingerprint is not None:
+                checkpoint = SplitCheckpoint.open(
+                    cache_tmp_data_dir,
+                    fingerprint,
+                    chunk_count=len(page_ranges),
+                )
+                self.operation_checkpoints[operation_id] = checkpoint
+                logger.info(
+                    "split_pdf event=checkpoint_opened operation_id=%s checkpoint=%s journaled_chunk_count=%d chunk_count=%d",
+                    operation_id,
+                    checkpoint.directory.name,
+                    checkpoint.journaled_chunk_count,
+                    len(page_ranges),
+                )
 
             temp_dir_path = None
-            pdf_chunks: Iterable[Tuple[BinaryIO, int]]
+            pdf_chunks: Iterator[Tuple[BinaryIO, int]]
             if cache_tmp_data_feature:
                 pdf_chunk_paths = self._get_pdf_chunk_paths(
-                    pdf_bytes,
+                    pdf_buffer,
                     operation_id=operation_id,
                     cache_tmp_data_dir=cache_tmp_data_dir,
-                    split_size=split_size,
-                    page_start=page_range_start,
-                    page_end=page_range_end
+                    page_ranges=dispatch_page_ranges,
                 )
                 temp_dir = self.tempdirs.get(operation_id)
                 temp_dir_path = temp_dir.name if temp_dir is not None else None
@@ -739,25 +1175,48 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 pdf_chunks = self._get_pdf_chunk_files(pdf_chunk_paths)
             else:
                 pdf_chunks = self._get_pdf_chunks_in_memory(
-                    pdf_bytes,
-                    split_size=split_size,
-                    page_start=page_range_start,
-                    page_end=page_range_end
+                    pdf_buffer,
+                    page_ranges=dispatch_page_ranges,
                 )
+                if memory_budget is not None:
+                    temp_dir_path = self._create_tempdir(operation_id, cache_tmp_data_dir)
+                    pdf_chunks = self._get_budgeted_pdf_chunks(
+                        pdf_chunks,
+                        operation_id=operation_id,
+                        memory_budget=memory_budget,
+                        temp_dir_path=temp_dir_path,
+                    )
 
-            self.coroutines_to_execute[operation_id] = []
-            for pdf_chunk_file, page_index in pdf_chunks:
-                chunk_index = len(self.coroutines_to_execute[operation_id]) + 1
+            def _build_chunk_task(
+                pdf_chunk_file: BinaryIO,
+                page_index: int,
+                chunk_index: int,
+            ) -> partial[Coroutine[Any, Any, httpx.Response]]:
                 page_number = page_index + starting_page_number
+                result_cache_key = None
+                if result_cache is not None:
+                    # Hashed here, on the thread that splits the chunks.
+                    result_cache_key = get_chunk_cache_key(
+                        pdf_chunk_file,
+                        url=str(request.url),
+                        chunk_params=request_utils.create_pdf_chunk_request_params(
+                            form_data, page_number
+                        ),
+                    )
                 pdf_chunk_request = request_utils.create_pdf_chunk_request(
                     form_data=form_data,
                     pdf_chunk=(pdf_chunk_file, page_number),
                     filename=pdf_file_meta["filename"],
                     original_request=request,
+                    upload_compression=upload_compression,
                 )
+                if timeout_seconds is not None:
+                    # Chunk requests share a pooled client, so the operation timeout
+                    # travels with each request instead of with the client.
+                    pdf_chunk_request.extensions["timeout"] = httpx.Timeout(timeout_seconds).as_dict()
                 # using partial as the shared client parameter must be passed in `run_tasks` function
                 # in `after_success`.
-                coroutine = partial(
+                return partial(
                     self.call_api_partial,
                     _operation_id=operation_id,
                     chunk_index=chunk_index,
@@ -765,13 +1224,29 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                     pdf_chunk_request=pdf_chunk_request,
                     pdf_chunk_file=pdf_chunk_file,
                     retry_config=self.operation_retry_configs.get(operation_id),
+                    retry_budget=retry_budget,
+                    deadline=self.operation_deadlines.get(operation_id),
                     cache_tmp_data_feature=cache_tmp_data_feature,
                     temp_dir_path=temp_dir_path,
+                    result_cache=result_cache,
+                    result_cache_key=result_cache_key,
+                    filename=pdf_file_meta["filename"],
+                    checkpoint=checkpoint,
+                    page_range=page_ranges[chunk_index - 1],
+                    hedger=self.operation_hedgers.get(operation_id),
+                    memory_budget=memory_budget,
                 )
-                self.coroutines_to_execute[operation_id].append(coroutine)
+
+            # Chunks are split while the requests run, see `run_tasks`.
+            self.coroutines_to_execute[operation_id] = LazyChunkTasks(
+                pdf_chunks,
+                chunk_count=len(page_ranges),
+                build_task=_build_chunk_task,
+                chunk_indices=chunk_plan.dispatch_order if chunk_plan is not None else None,
+            )
 
             logger.info(
-                "split_pdf event=plan_created operation_id=%s filename=%s strategy=%s page_range=%s-%s page_count=%d split_size=%d chunk_count=%d concurrency=%d allow_failed=%s cache_mode=%s timeout_seconds=%s retry_config_mode=%s",
+                "split_pdf event=plan_created operation_id=%s filename=%s strategy=%s page_range=%s-%s page_count=%d split_size=%d chunk_count=%d concurrency=%d allow_failed=%s cache_mode=%s timeout_seconds=%s retry_config_mode=%s adaptive_concurrency=%s request_budget=%s hedging=%s chunk_planning=%s memory_budget=%s upload_compression=%s",
                 operation_id,
                 Path(pdf_file_meta["filename"]).name,
                 form_data.get("strategy"),
@@ -782,7 +1257,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 len(self.coroutines_to_execute[operation_id]),
                 concurrency_level,
                 allow_failed,
-                self._cache_mode_observability_value(
+                "auto" if memory_budget is not None else self._cache_mode_observability_value(
                     cache_tmp_data_feature,
                     cache_tmp_data_dir,
                 ),
@@ -790,6 +1265,12 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 self._retry_config_observability_mode(
                     self.operation_retry_configs.get(operation_id),
                 ),
+                self.operation_adaptive_concurrency[operation_id] is not None,
+                getattr(self.operation_request_budgets[operation_id], "max_requests", None),
+                self.operation_hedgers[operation_id] is not None,
+                "cost" if chunk_plan is not None else "pages",
+                getattr(memory_budget, "max_bytes", None),
+                upload_compression is not None,
             )
 
             self.pending_operation_ids[operation_id] = operation_id
@@ -809,24 +1290,20 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
     def before_request(
             self, hook_ctx: BeforeRequestContext, request: httpx.Request
     ) -> Union[httpx.Request, Exception]:
-        # pypdfium is process-global and not thread-safe; serialize split setup across clients.
-        with self._split_pdf_setup_lock:
-            self._split_pdf_setup_state.locked = True
-            try:
-                return self._before_request_unlocked(hook_ctx, request)
-            finally:
-                self._split_pdf_setup_state.locked = False
+        return self._prepare_split_request(hook_ctx, request)
 
     async def before_request_async(
             self, hook_ctx: BeforeRequestContext, request: httpx.Request
     ) -> Union[httpx.Request, Exception]:
-        # Keep pypdfium setup off the event loop while preserving a single process-wide
-        # admission lane. pypdfium is not thread-safe, so cancelled callers must not
-        # leave queued setup work piling up behind the worker.
-        await self._acquire_split_pdf_setup_slot()
+        if not self._may_split_request(request):
+            return request
+        # Keep PDF parsing and splitting off the event loop. The setup keeps running
+        # if the caller is cancelled, so its prepared state can be cleaned up.
+        # The setup runs in the caller's context to see its deadline.
         loop = asyncio.get_running_loop()
         setup_future = loop.run_in_executor(
-            self._split_pdf_setup_executor,
+            None,
+            contextvars.copy_context().run,
             self.before_request,
             hook_ctx,
             request,
@@ -838,12 +1315,25 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             if isinstance(result, httpx.Request):
                 self._clear_prepared_split_request(result)
             raise
-        finally:
-            self._split_pdf_setup_gate.release()
 
-    @classmethod
-    async def _acquire_split_pdf_setup_slot(cls) -> None:
-        await cls._split_pdf_setup_gate.acquire()
+    @staticmethod
+    def _may_split_request(request: httpx.Request) -> bool:
+        """Whether the request may be split. Only the form fields are read, not the
+        file, so `partition_async` calls that turn splitting off return on the
+        event loop instead of handing the setup to a worker thread."""
+        try:
+            form_data = request_utils.get_multipart_stream_fields(request)
+        except ValueError:
+            # Let the setup raise it as for `partition`.
+            return True
+        if not form_data:
+            return True
+        split_pdf_page = form_data.get(PARTITION_FORM_SPLIT_PDF_PAGE_KEY)
+        return (
+            split_pdf_page is not None
+            and split_pdf_page != "false"
+            and form_data.get(PARTITION_FORM_FILES_KEY) is not None
+        )
 
     async def _finish_cancelled_split_setup(
         self,
@@ -879,7 +1369,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             self,
             pdf_chunk_request: httpx.Request,
             pdf_chunk_file: BinaryIO,
-            limiter: asyncio.Semaphore,
+            limiter: ChunkLimiter,
             _operation_id: str,
             chunk_index: int,
             page_number: int,
@@ -887,7 +1377,20 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             retry_config: Optional[RetryConfig],
             cache_tmp_data_feature: bool,
             temp_dir_path: Optional[str],
+            result_cache: Optional[ResultCache] = None,
+            result_cache_key: Optional[str] = None,
+            filename: str = "",
+            checkpoint: Optional[SplitCheckpoint] = None,
+            page_range: Optional[PageRange] = None,
+            hedger: Optional[ChunkHedger] = None,
+            memory_budget: Optional[SplitMemoryBudget] = None,
+            retry_budget: Optional[RetryBudget] = None,
+            deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
+        # In-memory chunks of a budgeted operation hold a reservation until sent.
+        reserved_chunk_size = 0
+        if memory_budget is not None and isinstance(pdf_chunk_file, io.BytesIO):
+            reserved_chunk_size = pdf_chunk_file.getbuffer().nbytes
         logger.debug(
             "split_pdf event=chunk_start operation_id=%s chunk_index=%d page_number=%d cache_mode=%s",
             _operation_id,
@@ -895,16 +1398,56 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             page_number,
             "cached" if cache_tmp_data_feature else "memory",
         )
-        response = await request_utils.call_api_async(
-            client=async_client,
-            limiter=limiter,
-            pdf_chunk_request=pdf_chunk_request,
-            pdf_chunk_file=pdf_chunk_file,
-            retry_config=retry_config,
-            operation_id=_operation_id,
-            chunk_index=chunk_index,
-            page_number=page_number,
-        )
+        cached_content = None
+        if checkpoint is not None and page_range is not None:
+            cached_content = await asyncio.to_thread(checkpoint.load, page_range)
+        if cached_content is not None:
+            logger.info(
+                "split_pdf event=chunk_resumed_from_checkpoint operation_id=%s chunk_index=%d page_number=%d",
+                _operation_id,
+                chunk_index,
+                page_number,
+            )
+            # Already journaled, nothing to record.
+            checkpoint = None
+        elif result_cache is not None and result_cache_key is not None:
+            cached_content = await asyncio.to_thread(
+                self._load_chunk_result,
+                result_cache,
+                result_cache_key,
+                page_number=page_number,
+                filename=filename,
+            )
+            if cached_content is not None:
+                logger.debug(
+                    "split_pdf event=chunk_result_cache_hit operation_id=%s chunk_index=%d page_number=%d",
+                    _operation_id,
+                    chunk_index,
+                    page_number,
+                )
+                # Already cached, nothing to store.
+                result_cache = None
+
+        if cached_content is not None:
+            if not isinstance(pdf_chunk_file, io.BytesIO) and not pdf_chunk_file.closed:
+                pdf_chunk_file.close()
+            response = create_cached_response(cached_content, pdf_chunk_request)
+        else:
+            response = await request_utils.call_api_async(
+                client=async_client,
+                limiter=limiter,
+                pdf_chunk_request=pdf_chunk_request,
+                pdf_chunk_file=pdf_chunk_file,
+                retry_config=retry_config,
+                retry_budget=retry_budget,
+                deadline=deadline,
+                operation_id=_operation_id,
+                chunk_index=chunk_index,
+                page_number=page_number,
+                hedger=hedger,
+            )
+        if reserved_chunk_size:
+            cast(SplitMemoryBudget, memory_budget).release(_operation_id, reserved_chunk_size)
 
         if response.status_code == 200:
             if cache_tmp_data_feature:
@@ -916,6 +1459,17 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                     # Avoid reading the entire response into memory
                     async for bytes_chunk in response.aiter_bytes():
                         await temp_file.write(bytes_chunk)
+                if checkpoint is not None or result_cache is not None:
+                    await asyncio.to_thread(
+                        self._store_chunk_result_file,
+                        Path(temp_file_name),
+                        result_cache=result_cache,
+                        result_cache_key=result_cache_key,
+                        checkpoint=checkpoint,
+                        page_range=page_range,
+                        page_number=page_number,
+                        filename=filename,
+                    )
                 # we save the path in content attribute to be used in after_success
                 response._content = temp_file_name.encode()  # pylint: disable=protected-access
                 logger.debug(
@@ -938,6 +1492,28 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                     content=response.content,
                     extensions=response.extensions,
                 )
+                content = get_cacheable_content(response)
+                if content is not None and (checkpoint is not None or result_cache is not None):
+                    await asyncio.to_thread(
+                        self._store_chunk_result,
+                        content,
+                        result_cache=result_cache,
+                        result_cache_key=result_cache_key,
+                        checkpoint=checkpoint,
+                        page_range=page_range,
+                        page_number=page_number,
+                        filename=filename,
+                    )
+                if memory_budget is not None and not memory_budget.try_reserve(
+                    _operation_id, len(response.content)
+                ):
+                    response = await self._spill_chunk_result(
+                        response,
+                        temp_dir_path,
+                        operation_id=_operation_id,
+                        chunk_index=chunk_index,
+                        reserved_bytes=memory_budget.reserved,
+                    )
         else:
             response = httpx.Response(
                 status_code=response.status_code,
@@ -956,11 +1532,93 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
 
         return response
 
-    def _trim_large_pages(self, pdf: PdfReader, form_data: dict[str, Any]) -> PdfReader:
+    @staticmethod
+    async def _spill_chunk_result(
+        response: httpx.Response,
+        temp_dir_path: Optional[str],
+        *,
+        operation_id: str,
+        chunk_index: int,
+        reserved_bytes: int,
+    ) -> httpx.Response:
+        """Writes the result of a chunk that does not fit in the memory budget
+        to a temporary file, and returns a response holding its path."""
+        if temp_dir_path is None:
+            raise RuntimeError("Temp directory path not found for budgeted split PDF operation")
+        temp_file_name = f"{temp_dir_path}/{uuid.uuid4()}.json"
+        async with aiofiles.open(temp_file_name, mode='wb') as temp_file:
+            await temp_file.write(response.content)
+        logger.debug(
+            "split_pdf event=chunk_result_spilled operation_id=%s chunk_index=%d size_bytes=%d reserved_bytes=%d",
+            operation_id,
+            chunk_index,
+            len(response.content),
+            reserved_bytes,
+        )
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=temp_file_name.encode(),
+            extensions={**response.extensions, RESULT_FILE_EXTENSION_KEY: True},
+        )
+
+    @staticmethod
+    def _load_chunk_result(
+        result_cache: ResultCache,
+        result_cache_key: str,
+        *,
+        page_number: int,
+        filename: str,
+    ) -> Optional[bytes]:
+        """Returns the cached result of a chunk, rewritten for this document and
+        offset, or `None` on a miss."""
+        entry = result_cache.get(CHUNK_NAMESPACE, result_cache_key)
+        if entry is None:
+            return None
+        return get_chunk_result(entry, page_number, filename)
+
+    @staticmethod
+    def _store_chunk_result(
+        content: bytes,
+        *,
+        result_cache: Optional[ResultCache],
+        result_cache_key: Optional[str],
+        checkpoint: Optional[SplitCheckpoint],
+        page_range: Optional[PageRange],
+        page_number: int,
+        filename: str,
+    ) -> None:
+        """Stores the result of a successful chunk in the result cache and the
+        checkpoint journal of the operation, where enabled."""
+        if result_cache is not None and result_cache_key is not None:
+            result_cache.set(
+                CHUNK_NAMESPACE,
+                result_cache_key,
+                create_chunk_cache_entry(content, page_number, filename),
+            )
+        if checkpoint is not None and page_range is not None:
+            checkpoint.record(page_range, content)
+
+    @classmethod
+    def _store_chunk_result_file(cls, path: Path, **kwargs: Any) -> None:
+        cls._store_chunk_result(path.read_bytes(), **kwargs)
+
+    def _trim_large_pages(
+        self,
+        pdf: Union[pdf_utils.PdfInfo, PdfReader],
+        form_data: dict[str, Any],
+    ) -> Union[pdf_utils.PdfInfo, PdfReader]:
         if form_data.get("strategy") != HI_RES_STRATEGY:
             return pdf
 
         max_page_length = MAX_PAGE_LENGTH
+        if isinstance(pdf, pdf_utils.PdfInfo):
+            # PDFium measured the pages; only parse with pypdf to rewrite them.
+            if pdf.max_page_length < max_page_length:
+                return pdf
+            pdf.stream.seek(0)
+            pdf = PdfReader(pdf.stream, strict=False)
+
         any_page_over_maximum_length = False
         for page in pdf.pages:
             if page.mediabox.height >= max_page_length:
@@ -986,122 +1644,118 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
 
     def _get_pdf_chunks_in_memory(
             self,
-            pdf_bytes: bytes,
-            split_size: int = 1,
-            page_start: int = 1,
-            page_end: Optional[int] = None
-    ) -> list[Tuple[BinaryIO, int]]:
-        """Reads given bytes of a pdf file and split it into n pdf-chunks, each
-        with `split_size` pages. The chunks are returned as in-memory buffers.
+            pdf_bytes: PdfBuffer,
+            page_ranges: Sequence[PageRange],
+    ) -> Generator[Tuple[BinaryIO, int], None, None]:
+        """Lazily splits given bytes of a pdf file into one pdf-chunk per page
+        range. The chunks are produced as in-memory buffers.
 
         Args:
-            file_content: Content of the PDF file.
-            split_size: Split size, e.g. if the given file has 10 pages
-                and this value is set to 2 it will yield 5 documents, each containing 2 pages
-                of the original document. By default it will split each page to a separate file.
-            page_start: Begin splitting at this page number
-            page_end: If provided, split up to and including this page number
+            pdf_bytes: Content of the PDF file, or a memory map of it.
+            page_ranges: Zero-based, end-exclusive page ranges of the chunks,
+                see `get_page_ranges`.
 
-        Returns:
-            The list of chunk buffers and their zero-based page offsets.
+        Yields:
+            The chunk buffers and their zero-based page offsets.
         """
-        self._assert_split_pdf_setup_locked()
-
-        pdf_chunks: list[Tuple[BinaryIO, int]] = []
-        with pdfium.PdfDocument(pdf_bytes) as pdf:
-            offset = page_start - 1
-            offset_end = page_end if page_end else len(pdf)
-
-            while offset < offset_end:
-                end = min(offset + split_size, offset_end)
-
-                new_pdf = pdfium.PdfDocument.new()
-                try:
-                    page_indices = list(range(offset, end))
-                    new_pdf.import_pages(pdf, pages=page_indices)
-
-                    chunk_buffer = io.BytesIO()
-                    new_pdf.save(chunk_buffer)
-                    chunk_buffer.seek(0)
-                finally:
-                    new_pdf.close()
-
-                pdf_chunks.append((chunk_buffer, offset))
-                offset += split_size
-
-        return pdf_chunks
+        chunk_buffers = self.split_engine.iter_buffers(pdf_bytes, page_ranges)
+        with closing(chunk_buffers):
+            for chunk_buffer, (page_offset, _) in zip(chunk_buffers, page_ranges):
+                yield chunk_buffer, page_offset
 
     def _get_pdf_chunk_paths(
         self,
-        pdf_bytes: bytes,
+        pdf_bytes: PdfBuffer,
         operation_id: str,
         cache_tmp_data_dir: str,
-        split_size: int = 1,
-        page_start: int = 1,
-        page_end: Optional[int] = None
-    ) -> list[Tuple[Path, int]]:
-        """Reads given bytes of a pdf file and split it into n pdf-chunks, each
-        with `split_size` pages. The chunks are written into temporary files in
-        a temporary directory corresponding to the operation_id.
+        page_ranges: Sequence[PageRange],
+    ) -> Generator[Tuple[Path, int], None, None]:
+        """Lazily splits given bytes of a pdf file into one pdf-chunk per page
+        range. The chunks are written into temporary files in a temporary
+        directory corresponding to the operation_id, which is created right away.
 
         Args:
-            file_content: Content of the PDF file.
-            split_size: Split size, e.g. if the given file has 10 pages
-                and this value is set to 2 it will yield 5 documents, each containing 2 pages
-                of the original document. By default it will split each page to a separate file.
-            page_start: Begin splitting at this page number
-            page_end: If provided, split up to and including this page number
+            pdf_bytes: Content of the PDF file, or a memory map of it.
+            operation_id: The ID of the operation owning the temporary directory.
+            cache_tmp_data_dir: The directory to create the temporary directory in.
+            page_ranges: Zero-based, end-exclusive page ranges of the chunks,
+                see `get_page_ranges`.
 
         Returns:
-            The list of temporary file paths.
+            A generator of the temporary file paths and their zero-based page offsets.
         """
-        self._assert_split_pdf_setup_locked()
+        tempdir_path = self._create_tempdir(operation_id, cache_tmp_data_dir)
+
+        chunk_paths = self.split_engine.iter_files(
+            pdf_bytes,
+            page_ranges,
+            Path(tempdir_path),
+        )
+        return _with_page_offsets(chunk_paths, page_ranges)
 
-        # Create temporary directory
+    def _create_tempdir(self, operation_id: str, cache_tmp_data_dir: str) -> str:
+        """Creates the temporary directory of the operation, which is removed
+        when the operation is cleared, and returns its path."""
         tempdir = tempfile.TemporaryDirectory(  # pylint: disable=consider-using-with
             dir=cache_tmp_data_dir,
             prefix="unstructured_client_"
         )
         self.tempdirs[operation_id] = tempdir
-        tempdir_path = Path(tempdir.name)
-
-        pdf_chunk_paths: list[Tuple[Path, int]] = []
-        with pdfium.PdfDocument(pdf_bytes) as pdf:
-            offset = page_start - 1
-            offset_end = page_end if page_end else len(pdf)
+        return tempdir.name
 
-            chunk_no = 0
+    @staticmethod
+    def _get_budgeted_pdf_chunks(
+        pdf_chunks: Iterable[Tuple[BinaryIO, int]],
+        operation_id: str,
+        memory_budget: SplitMemoryBudget,
+        temp_dir_path: str,
+    ) -> Generator[Tuple[BinaryIO, int], None, None]:
+        """Keeps the in-memory chunks that fit in the memory budget, and writes
+        the others into temporary files.
 
-            while offset < offset_end:
-                chunk_no += 1
-                end = min(offset + split_size, offset_end)
+        Args:
+            pdf_chunks: The in-memory chunks and their page offsets.
+            operation_id: The ID of the operation the chunks are reserved for.
+            memory_budget: The memory budget of the client.
+            temp_dir_path: The temporary directory of the operation.
 
-                new_pdf = pdfium.PdfDocument.new()
+        Yields:
+            The chunk buffers or files and their zero-based page offsets.
+        """
+        try:
+            for chunk_number, (pdf_chunk_file, page_offset) in enumerate(pdf_chunks, start=1):
+                chunk_view = cast(io.BytesIO, pdf_chunk_file).getbuffer()
+                chunk_size = chunk_view.nbytes
+                if memory_budget.try_reserve(operation_id, chunk_size):
+                    chunk_view.release()
+                    yield pdf_chunk_file, page_offset
+                    continue
+                chunk_path = Path(temp_dir_path) / f"chunk_{chunk_number}.pdf"
                 try:
-                    page_indices = list(range(offset, end))
-                    new_pdf.import_pages(pdf, pages=page_indices)
-
-                    chunk_path = tempdir_path / f"chunk_{chunk_no}.pdf"
-                    new_pdf.save(str(chunk_path))  # Convert Path to string
+                    chunk_path.write_bytes(chunk_view)
                 finally:
-                    new_pdf.close()
-
-                pdf_chunk_paths.append((chunk_path, offset))
-                offset += split_size
-
-        return pdf_chunk_paths
-
-    def _assert_split_pdf_setup_locked(self) -> None:
-        if not getattr(self._split_pdf_setup_state, "locked", False):
-            raise RuntimeError("pypdfium split setup must run under the split-PDF setup lock")
+                    chunk_view.release()
+                    pdf_chunk_file.close()
+                logger.debug(
+                    "split_pdf event=chunk_spilled operation_id=%s page_offset=%d size_bytes=%d reserved_bytes=%d",
+                    operation_id,
+                    page_offset,
+                    chunk_size,
+                    memory_budget.reserved,
+                )
+                yield open(chunk_path, mode="rb"), page_offset  # pylint: disable=consider-using-with
+        finally:
+            close_chunks = getattr(pdf_chunks, "close", None)
+            if callable(close_chunks):
+                close_chunks()
 
     def _get_pdf_chunk_files(
-        self, pdf_chunks: list[Tuple[Path, int]]
+        self, pdf_chunks: Iterable[Tuple[Path, int]]
     ) -> Generator[Tuple[BinaryIO, int], None, None]:
         """Yields the file objects for the given pdf chunk paths.
 
         Args:
-            pdf_chunks (list[Tuple[Path, int]]): The list of pdf chunk paths and
+            pdf_chunks (Iterable[Tuple[Path, int]]): The pdf chunk paths and
                 their page offsets.
 
         Yields:
@@ -1110,18 +1764,23 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         Raises:
             Exception: If the file cannot be opened.
         """
-        for pdf_chunk_filename, offset in pdf_chunks:
-            pdf_chunk_file = None
-            try:
-                pdf_chunk_file = open(  # pylint: disable=consider-using-with
-                    pdf_chunk_filename,
-                    mode="rb"
-                )
-            except (FileNotFoundError, IOError):
-                if pdf_chunk_file and not pdf_chunk_file.closed:
-                    pdf_chunk_file.close()
-                raise
-            yield pdf_chunk_file, offset
+        try:
+            for pdf_chunk_filename, offset in pdf_chunks:
+                pdf_chunk_file = None
+                try:
+                    pdf_chunk_file = open(  # pylint: disable=consider-using-with
+                        pdf_chunk_filename,
+                        mode="rb"
+                    )
+                except (FileNotFoundError, IOError):
+                    if pdf_chunk_file and not pdf_chunk_file.closed:
+                        pdf_chunk_file.close()
+                    raise
+                yield pdf_chunk_file, offset
+        finally:
+            close_chunks = getattr(pdf_chunks, "close", None)
+            if callable(close_chunks):
+                close_chunks()
 
     def _await_elements(self, operation_id: str) -> Optional[list]:
         """
@@ -1140,16 +1799,46 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             Optional[list]: The flattened elements if the partition requests are
             completed, otherwise None.
         """
+        started_at = time.perf_counter()
+        task_responses = self._await_task_responses(operation_id)
+        if task_responses is None:
+            return None
+
+        return self._elements_from_task_responses(
+            operation_id,
+            task_responses,
+            started_at=started_at,
+        )
+
+    def _await_merged_output(
+        self,
+        operation_id: str,
+        response: httpx.Response,
+        merge_target: MergeTarget,
+    ) -> httpx.Response:
+        """Waits for the partition requests to complete and splices the cached
+        chunk results into the output of `partition_to_file`."""
+        started_at = time.perf_counter()
+        task_responses = self._await_task_responses(operation_id)
+        if task_responses is None:
+            return response
+
+        self._record_task_responses(operation_id, task_responses, started_at=started_at)
+        return self._build_merged_output_response(operation_id, response, merge_target)
+
+    def _await_task_responses(
+        self,
+        operation_id: str,
+    ) -> Optional[list[tuple[int, httpx.Response]]]:
         tasks = self.coroutines_to_execute.get(operation_id)
         if tasks is None:
             return None
 
-        started_at = time.perf_counter()
         concurrency_level = self.concurrency_level.get(operation_id, DEFAULT_CONCURRENCY_LEVEL)
         timeout_seconds = self.operation_timeouts.get(operation_id)
         client_timeout = httpx.Timeout(timeout_seconds) if timeout_seconds is not None else None
         allow_failed = self.allow_failed.get(operation_id, DEFAULT_ALLOW_FAILED)
-        coroutines = run_tasks(
+        coroutines = self._run_chunk_tasks(
             tasks,
             allow_failed=allow_failed,
             concurrency_level=concurrency_level,
@@ -1157,40 +1846,30 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             operation_id=operation_id,
         )
 
-        # sending the coroutines to a separate thread to avoid blocking the current event loop
-        executor = self.executors.get(operation_id)
-        if executor is None:
-            executor = futures.ThreadPoolExecutor(max_workers=1)
-            self.executors[operation_id] = executor
-        loop_holder: dict[str, Optional[asyncio.AbstractEventLoop]] = {"loop": None}
-        self.operation_loops[operation_id] = loop_holder
+        # Chunk requests run on the pool's long-lived event loop, so they reuse its
+        # keep-alive connections and never block the caller's event loop.
+        pooled_task = self.chunk_client_pool.submit(coroutines)
+        self.operation_tasks[operation_id] = pooled_task
+
+        num_waves, future_timeout = _get_batch_timeout(
+            len(tasks),
+            concurrency_level,
+            timeout_seconds,
+            self.operation_deadlines.get(operation_id),
+        )
+        logger.info(
+            "split_pdf event=batch_start operation_id=%s chunk_count=%d concurrency=%d allow_failed=%s client_timeout_seconds=%s future_timeout_seconds=%s num_waves=%d",
+            operation_id,
+            len(tasks),
+            concurrency_level,
+            allow_failed,
+            timeout_seconds,
+            future_timeout,
+            num_waves,
+        )
         try:
-            task_responses_future = executor.submit(
-                _run_coroutines_in_separate_thread,
-                coroutines,
-                loop_holder,
-            )
-            self.operation_futures[operation_id] = task_responses_future
-
-            # The per-chunk timeout bounds each HTTP call, but the batch may run in
-            # multiple waves (ceil(chunks / concurrency)).  Scale the outer future
-            # timeout accordingly so healthy multi-wave batches aren't killed early.
-            num_waves = max(1, math.ceil(len(tasks) / concurrency_level))
-            per_chunk = timeout_seconds or DEFAULT_FUTURE_TIMEOUT_MINUTES * 60
-            future_timeout = per_chunk * num_waves + TIMEOUT_BUFFER_SECONDS
-            logger.info(
-                "split_pdf event=batch_start operation_id=%s chunk_count=%d concurrency=%d allow_failed=%s client_timeout_seconds=%s future_timeout_seconds=%s num_waves=%d",
-                operation_id,
-                len(tasks),
-                concurrency_level,
-                allow_failed,
-                timeout_seconds,
-                future_timeout,
-                num_waves,
-            )
-            task_responses = task_responses_future.result(timeout=future_timeout)
+            task_responses = pooled_task.future.result(timeout=future_timeout)
         except futures.TimeoutError:
-            loop = loop_holder.get("loop")
             logger.error(
                 "split_pdf event=batch_timeout operation_id=%s chunk_count=%d concurrency=%d allow_failed=%s client_timeout_seconds=%s future_timeout_seconds=%s",
                 operation_id,
@@ -1200,50 +1879,218 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 timeout_seconds,
                 future_timeout,
             )
-            cancellation_requested = _request_task_cancellation(
-                loop,
+            if not pooled_task.cancel():
+                logger.warning(
+                    "split_pdf event=loop_closed_during_cancel operation_id=%s",
+                    operation_id,
+                )
+            self._raise_if_deadline_expired(operation_id)
+            raise
+
+        return task_responses
+
+    def _raise_if_deadline_expired(self, operation_id: str) -> None:
+        """Raises `DeadlineExceededError` if the batch of `operation_id` timed
+        out because the deadline of the call passed."""
+        deadline = self.operation_deadlines.get(operation_id)
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError(
+                "Deadline passed before all pages of the document were partitioned"
+            ) from None
+
+    async def _run_chunk_tasks(
+        self,
+        tasks: ChunkTasks,
+        *,
+        allow_failed: bool,
+        concurrency_level: int,
+        client_timeout: Optional[httpx.Timeout],
+        operation_id: str,
+        async_client: Optional[AsyncClient] = None,
+        on_result: Optional[Callable[[int, httpx.Response], None]] = None,
+    ) -> list[tuple[int, httpx.Response]]:
+        if async_client is None:
+            async_client = self.chunk_client_pool.get_client()
+        return await run_tasks(
+            tasks,
+            allow_failed=allow_failed,
+            concurrency_level=concurrency_level,
+            client_timeout=client_timeout,
+            operation_id=operation_id,
+            async_client=async_client,
+            on_result=on_result,
+            adaptive_concurrency=self.operation_adaptive_concurrency.get(operation_id),
+            request_budget=self.operation_request_budgets.get(operation_id),
+        )
+
+    def _start_element_stream(self, operation_id: str) -> PartitionStream:
+        """Starts the chunk requests on the pool's event loop and returns a stream
+        of their results in page order. The stream owns the operation and clears
+        it once it is exhausted or closed."""
+        tasks = self.coroutines_to_execute[operation_id]
+        concurrency_level = self.concurrency_level.get(operation_id, DEFAULT_CONCURRENCY_LEVEL)
+        timeout_seconds = self.operation_timeouts.get(operation_id)
+        results: queue.Queue[Union[tuple[int, httpx.Response], StreamEnd]] = queue.Queue()
+        coroutines = self._run_chunk_tasks(
+            tasks,
+            allow_failed=self.allow_failed.get(operation_id, DEFAULT_ALLOW_FAILED),
+            concurrency_level=concurrency_level,
+            client_timeout=httpx.Timeout(timeout_seconds) if timeout_seconds is not None else None,
+            operation_id=operation_id,
+            on_result=lambda index, response: results.put((index, response)),
+        )
+        pooled_task = self.chunk_client_pool.submit(coroutines)
+        self.operation_tasks[operation_id] = pooled_task
+        pooled_task.future.add_done_callback(
+            lambda future: results.put(StreamEnd.from_future(future))
+        )
+        _, future_timeout = _get_batch_timeout(
+            len(tasks),
+            concurrency_level,
+            timeout_seconds,
+            self.operation_deadlines.get(operation_id),
+        )
+        logger.info(
+            "split_pdf event=stream_start operation_id=%s chunk_count=%d concurrency=%d future_timeout_seconds=%s",
+            operation_id,
+            len(tasks),
+            concurrency_level,
+            future_timeout,
+        )
+        return PartitionStream(
+            results,
+            chunk_count=len(tasks),
+            load_elements=self._get_chunk_elements_loader(operation_id),
+            on_close=partial(self._clear_operation, operation_id),
+            timeout=future_timeout,
+            operation_id=operation_id,
+        )
+
+    def _start_element_stream_async(
+        self,
+        operation_id: str,
+        async_client: Optional[AsyncClient] = None,
+    ) -> PartitionStreamAsync:
+        """Async equivalent of `_start_element_stream`. The chunk requests run
+        on the caller's event loop."""
+        tasks = self.coroutines_to_execute[operation_id]
+        concurrency_level = self.concurrency_level.get(operation_id, DEFAULT_CONCURRENCY_LEVEL)
+        timeout_seconds = self.operation_timeouts.get(operation_id)
+        results: asyncio.Queue[Union[tuple[int, httpx.Response], StreamEnd]] = asyncio.Queue()
+        chunk_task = asyncio.create_task(
+            self._run_chunk_tasks(
+                tasks,
+                allow_failed=self.allow_failed.get(operation_id, DEFAULT_ALLOW_FAILED),
+                concurrency_level=concurrency_level,
+                client_timeout=httpx.Timeout(timeout_seconds) if timeout_seconds is not None else None,
                 operation_id=operation_id,
+                async_client=async_client,
+                on_result=lambda index, response: results.put_nowait((index, response)),
             )
-            if not cancellation_requested:
-                coroutines.close()
-            raise
-        except Exception:
-            if loop_holder.get("loop") is None:
-                coroutines.close()
-            raise
-        finally:
-            if loop_holder.get("loop") is None:
-                coroutines.close()
+        )
+        chunk_task.add_done_callback(
+            lambda task: results.put_nowait(StreamEnd.from_future(task))
+        )
+
+        async def _close() -> None:
+            chunk_task.cancel()
+            await asyncio.gather(chunk_task, return_exceptions=True)
+            self._clear_operation(operation_id)
+
+        _, future_timeout = _get_batch_timeout(
+            len(tasks),
+            concurrency_level,
+            timeout_seconds,
+            self.operation_deadlines.get(operation_id),
+        )
+        logger.info(
+            "split_pdf event=stream_start operation_id=%s chunk_count=%d concurrency=%d future_timeout_seconds=%s",
+            operation_id,
+            len(tasks),
+            concurrency_level,
+            future_timeout,
+        )
+        return PartitionStreamAsync(
+            results,
+            chunk_count=len(tasks),
+            load_elements=self._get_chunk_elements_loader(operation_id),
+            on_close=_close,
+            timeout=future_timeout,
+            operation_id=operation_id,
+        )
+
+    def _get_chunk_elements_loader(
+        self,
+        operation_id: str,
+    ) -> Callable[[httpx.Response], list[dict]]:
+        if self.cache_tmp_data_feature.get(operation_id, DEFAULT_CACHE_TMP_DATA):
+            return load_elements_from_response
+        return load_chunk_elements
 
+    async def _await_elements_async(
+        self,
+        operation_id: str,
+        async_client: Optional[AsyncClient] = None,
+    ) -> Optional[list]:
+        started_at = time.perf_counter()
+        task_responses = await self._await_task_responses_async(operation_id, async_client)
         if task_responses is None:
             return None
 
-        return self._elements_from_task_responses(
+        return await asyncio.to_thread(
+            self._elements_from_task_responses,
             operation_id,
             task_responses,
             started_at=started_at,
         )
 
-    async def _await_elements_async(self, operation_id: str) -> Optional[list]:
+    async def _await_merged_output_async(
+        self,
+        operation_id: str,
+        response: httpx.Response,
+        merge_target: MergeTarget,
+        async_client: Optional[AsyncClient] = None,
+    ) -> httpx.Response:
+        started_at = time.perf_counter()
+        task_responses = await self._await_task_responses_async(operation_id, async_client)
+        if task_responses is None:
+            return response
+
+        self._record_task_responses(operation_id, task_responses, started_at=started_at)
+        return await asyncio.to_thread(
+            self._build_merged_output_response,
+            operation_id,
+            response,
+            merge_target,
+        )
+
+    async def _await_task_responses_async(
+        self,
+        operation_id: str,
+        async_client: Optional[AsyncClient] = None,
+    ) -> Optional[list[tuple[int, httpx.Response]]]:
         tasks = self.coroutines_to_execute.get(operation_id)
         if tasks is None:
             return None
 
-        started_at = time.perf_counter()
         concurrency_level = self.concurrency_level.get(operation_id, DEFAULT_CONCURRENCY_LEVEL)
         timeout_seconds = self.operation_timeouts.get(operation_id)
         client_timeout = httpx.Timeout(timeout_seconds) if timeout_seconds is not None else None
         allow_failed = self.allow_failed.get(operation_id, DEFAULT_ALLOW_FAILED)
-        coroutines = run_tasks(
+        coroutines = self._run_chunk_tasks(
             tasks,
             allow_failed=allow_failed,
             concurrency_level=concurrency_level,
             client_timeout=client_timeout,
             operation_id=operation_id,
+            async_client=async_client,
+        )
+        num_waves, future_timeout = _get_batch_timeout(
+            len(tasks),
+            concurrency_level,
+            timeout_seconds,
+            self.operation_deadlines.get(operation_id),
         )
-        num_waves = max(1, math.ceil(len(tasks) / concurrency_level))
-        per_chunk = timeout_seconds or DEFAULT_FUTURE_TIMEOUT_MINUTES * 60
-        future_timeout = per_chunk * num_waves + TIMEOUT_BUFFER_SECONDS
         logger.info(
             "split_pdf event=batch_start operation_id=%s chunk_count=%d concurrency=%d allow_failed=%s client_timeout_seconds=%s future_timeout_seconds=%s num_waves=%d",
             operation_id,
@@ -1256,7 +2103,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         )
         try:
             task_responses = await asyncio.wait_for(coroutines, timeout=future_timeout)
-        except TimeoutError:
+        except asyncio.TimeoutError:
             logger.error(
                 "split_pdf event=batch_timeout operation_id=%s chunk_count=%d concurrency=%d allow_failed=%s client_timeout_seconds=%s future_timeout_seconds=%s",
                 operation_id,
@@ -1266,14 +2113,10 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 timeout_seconds,
                 future_timeout,
             )
+            self._raise_if_deadline_expired(operation_id)
             raise
 
-        return await asyncio.to_thread(
-            self._elements_from_task_responses,
-            operation_id,
-            task_responses,
-            started_at=started_at,
-        )
+        return task_responses
 
     def _elements_from_task_responses(
         self,
@@ -1285,10 +2128,26 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         if task_responses is None:
             return None
 
+        successful_responses = self._record_task_responses(
+            operation_id,
+            task_responses,
+            started_at=started_at,
+        )
+        load_elements = self._get_chunk_elements_loader(operation_id)
+        return [element for res in successful_responses for element in load_elements(res)]
+
+    def _record_task_responses(
+        self,
+        operation_id: str,
+        task_responses: list[tuple[int, httpx.Response]],
+        *,
+        started_at: float,
+    ) -> list[httpx.Response]:
+        """Records the successful and failed chunk responses of the operation
+        and returns the successful ones in chunk order."""
         successful_responses = []
         failed_responses: list[tuple[int, httpx.Response]] = []
         transport_failure_count = 0
-        elements = []
         for response_number, res in task_responses:
             if res.status_code == 200:
                 logger.debug(
@@ -1297,10 +2156,6 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                     response_number,
                 )
                 successful_responses.append(res)
-                if self.cache_tmp_data_feature.get(operation_id, DEFAULT_CACHE_TMP_DATA):
-                    elements.append(load_elements_from_response(res))
-                else:
-                    elements.append(res.json())
             else:
                 error_message = f"Failed to partition set {response_number}."
 
@@ -1340,8 +2195,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
                 total_chunks=len(task_responses),
                 response=response,
             )
-        flattened_elements = [element for sublist in elements for element in sublist]
-        return flattened_elements
+        return successful_responses
 
     def _build_after_success_response(
         self,
@@ -1349,6 +2203,42 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         response: httpx.Response,
         elements: Optional[list],
     ) -> httpx.Response:
+        failed_response = self._get_top_level_failure(operation_id)
+        if failed_response is not None:
+            return failed_response
+
+        if elements is None:
+            return response
+
+        elements_response = request_utils.create_elements_response(elements)
+        if self.api_failed_responses.get(operation_id):
+            # Failed chunks were omitted, the result must not be cached.
+            elements_response.extensions[PARTIAL_RESULT_EXTENSION_KEY] = True
+        return elements_response
+
+    def _build_merged_output_response(
+        self,
+        operation_id: str,
+        response: httpx.Response,
+        merge_target: MergeTarget,
+    ) -> httpx.Response:
+        failed_response = self._get_top_level_failure(operation_id)
+        if failed_response is not None:
+            return failed_response
+
+        successful_responses = self.api_successful_responses.get(operation_id, [])
+        merge_target.write_files(Path(res.text) for res in successful_responses)
+        logger.info(
+            "split_pdf event=merged_output_written operation_id=%s chunk_count=%d output_format=%s",
+            operation_id,
+            len(successful_responses),
+            merge_target.output_format,
+        )
+        return create_merged_output_response(response, merge_target)
+
+    def _get_top_level_failure(self, operation_id: str) -> Optional[httpx.Response]:
+        """Returns the failed chunk response to return instead of the combined
+        result, if the operation failed."""
         # if fails are disallowed, return the first failed response
         if (
             not self.allow_failed.get(operation_id, DEFAULT_ALLOW_FAILED)
@@ -1371,25 +2261,29 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             )
             return self.api_failed_responses[operation_id][0]
 
-        if elements is None:
-            return response
-
-        return request_utils.create_response(elements)
+        return None
 
     @staticmethod
     def _finalize_operation_resources(
-        executor: Optional[futures.ThreadPoolExecutor],
         tempdir: Optional[tempfile.TemporaryDirectory],
         operation_id: Optional[str] = None,
+        pdf_map: Optional[mmap.mmap] = None,
     ) -> None:
-        if executor is not None:
-            executor.shutdown(wait=False, cancel_futures=True)
         if tempdir is not None:
             tempdir.cleanup()
+        if pdf_map is not None:
+            try:
+                pdf_map.close()
+            except BufferError:
+                # A document still reads the map, which is unmapped once the
+                # document is garbage collected.
+                logger.debug(
+                    "split_pdf event=pdf_map_close_deferred operation_id=%s",
+                    operation_id,
+                )
         logger.debug(
-            "split_pdf event=resources_finalized operation_id=%s executor_shutdown=%s tempdir_cleaned=%s",
+            "split_pdf event=resources_finalized operation_id=%s tempdir_cleaned=%s",
             operation_id,
-            executor is not None,
             tempdir is not None,
         )
 
@@ -1420,7 +2314,28 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         if operation_id is None or operation_id not in self.coroutines_to_execute:
             return response
 
+        if not self._warned_sync_pool_client and self._get_supplied_async_client(hook_ctx):
+            self._warned_sync_pool_client = True
+            logger.warning(
+                "split_pdf event=sync_pool_client operation_id=%s The page requests of "
+                "synchronous partition calls are sent with the client's own connection "
+                "pool, not with the async_client you provided. Its transport, proxies "
+                "and TLS settings only apply to partition_async.",
+                operation_id,
+            )
+
+        if self._is_element_stream_requested(response):
+            try:
+                stream = self._start_element_stream(operation_id)
+            except BaseException:
+                self._clear_operation(operation_id)
+                raise
+            return create_element_stream_response(response, stream)
+
+        merge_target = self._get_merge_target(response)
         try:
+            if merge_target is not None:
+                return self._await_merged_output(operation_id, response, merge_target)
             elements = self._await_elements(operation_id)
             return self._build_after_success_response(operation_id, response, elements)
         finally:
@@ -1435,13 +2350,34 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         This path awaits split chunk requests directly on the caller's event loop
         instead of creating a nested event loop in a worker thread.
         """
-        del hook_ctx
         operation_id = self._get_operation_id(response=response)
         if operation_id is None or operation_id not in self.coroutines_to_execute:
             return response
 
+        if self._is_element_stream_requested(response):
+            try:
+                async_stream = self._start_element_stream_async(
+                    operation_id,
+                    async_client=self._get_supplied_async_client(hook_ctx),
+                )
+            except BaseException:
+                self._clear_operation(operation_id)
+                raise
+            return create_element_stream_response(response, async_stream)
+
+        merge_target = self._get_merge_target(response)
         try:
-            elements = await self._await_elements_async(operation_id)
+            if merge_target is not None:
+                return await self._await_merged_output_async(
+                    operation_id,
+                    response,
+                    merge_target,
+                    async_client=self._get_supplied_async_client(hook_ctx),
+                )
+            elements = await self._await_elements_async(
+                operation_id,
+                async_client=self._get_supplied_async_client(hook_ctx),
+            )
             return await asyncio.to_thread(
                 self._build_after_success_response,
                 operation_id,
@@ -1452,6 +2388,44 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
             if operation_id is not None:
                 self._clear_operation(operation_id)
 
+    @staticmethod
+    def _is_element_stream_requested(response: httpx.Response) -> bool:
+        """Whether the call came from `partition_stream`, which takes the chunk
+        results as they complete instead of the combined elements."""
+        try:
+            request = response.request
+        except RuntimeError:
+            return False
+        return request.extensions.get(STREAM_ELEMENTS_EXTENSION_KEY) is True
+
+    @staticmethod
+    def _get_merge_target(response: httpx.Response) -> Optional[MergeTarget]:
+        """The output of `partition_to_file`, which takes the chunk results
+        merged into a file instead of the combined elements."""
+        try:
+            request = response.request
+        except RuntimeError:
+            return None
+        return get_merge_target(request)
+
+    @staticmethod
+    def _get_supplied_async_client(hook_ctx: AfterSuccessContext) -> Optional[AsyncClient]:
+        """Returns the user-supplied SDK async client, which chunk requests reuse
+        so they inherit its transport settings and connections."""
+        config = getattr(hook_ctx, "config", None)
+        async_client = getattr(config, "async_client", None)
+        if getattr(config, "async_client_supplied", False) is True and isinstance(
+            async_client, AsyncClient
+        ):
+            return async_client
+        return None
+
+    def close(self) -> None:
+        """Closes the pooled chunk clients and split workers. Called when the SDK
+        client is closed."""
+        self.chunk_client_pool.close()
+        self.split_engine.close()
+
     def after_error(
             self,
             hook_ctx: AfterErrorContext,
@@ -1462,7 +2436,7 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
 
         If `before_request` prepared a split operation but the subsequent
         dummy request errored (e.g. network failure on GET /general/docs),
-        we must release the executor, temp files, and coroutine list that
+        we must cancel pending chunk requests and release the temp files and coroutine list that
         were allocated for that operation.
         """
         operation_id = self._get_operation_id(response=response, error=error)
@@ -1489,52 +2463,65 @@ class SplitPdfHook(SDKInitHook, BeforeRequestHook, AfterSuccessHook, AfterErrorH
         self.api_failed_responses.pop(operation_id, None)
         self.concurrency_level.pop(operation_id, None)
         self.operation_timeouts.pop(operation_id, None)
+        self.operation_deadlines.pop(operation_id, None)
         self.operation_retry_configs.pop(operation_id, None)
+        self.operation_adaptive_concurrency.pop(operation_id, None)
+        self.operation_request_budgets.pop(operation_id, None)
+        checkpoint = self.operation_checkpoints.pop(operation_id, None)
+        pdf_map = self.operation_pdf_maps.pop(operation_id, None)
+        memory_budget = self.operation_memory_budgets.pop(operation_id, None)
+        if memory_budget is not None:
+            memory_budget.release_operation(operation_id)
+        hedger = self.operation_hedgers.pop(operation_id, None)
+        if hedger is not None and hedger.requests:
+            logger.info(
+                "split_pdf event=hedging_summary operation_id=%s requests=%d hedges_issued=%d hedges_won=%d",
+                operation_id,
+                hedger.requests,
+                hedger.hedges_issued,
+                hedger.hedges_won,
+            )
+        if checkpoint is not None and checkpoint.is_complete:
+            checkpoint.discard()
         self.allow_failed.pop(operation_id, None)
         self.cache_tmp_data_feature.pop(operation_id, None)
         self.cache_tmp_data_dir.pop(operation_id, None)
         self.pending_operation_ids.pop(operation_id, None)
-        future = self.operation_futures.pop(operation_id, None)
-        loop_holder = self.operation_loops.pop(operation_id, None)
-        executor = self.executors.pop(operation_id, None)
+        pooled_task = self.operation_tasks.pop(operation_id, None)
         tempdir = self.tempdirs.pop(operation_id, None)
+        task_running = pooled_task is not None and not pooled_task.future.done()
         logger.debug(
-            "split_pdf event=clear_operation operation_id=%s has_future=%s future_done=%s has_executor=%s has_tempdir=%s closed_chunk_files=%d",
+            "split_pdf event=clear_operation operation_id=%s has_task=%s task_done=%s has_tempdir=%s closed_chunk_files=%d",
             operation_id,
-            future is not None,
-            future.done() if future is not None else None,
-            executor is not None,
+            pooled_task is not None,
+            pooled_task.future.done() if pooled_task is not None else None,
             tempdir is not None,
             closed_chunk_files,
         )
-        if future is not None and not future.done():
-            loop = loop_holder.get("loop") if loop_holder is not None else None
-            cancellation_requested = _request_task_cancellation(
-                loop,
-                operation_id=operation_id,
-            )
-            if not cancellation_requested:
+        if pooled_task is not None and task_running:
+            if pooled_task.cancel():
                 logger.warning(
-                    "split_pdf event=clear_operation_deferred_no_loop operation_id=%s reason=worker_still_running",
+                    "split_pdf event=clear_operation_deferred operation_id=%s reason=chunk_tasks_still_running",
                     operation_id,
                 )
-            else:
-                logger.warning(
-                    "split_pdf event=clear_operation_deferred operation_id=%s reason=worker_still_running",
-                    operation_id,
+                pooled_task.future.add_done_callback(
+                    lambda _: self._finalize_operation_resources(tempdir, operation_id, pdf_map)
                 )
-            future.add_done_callback(
-                lambda _: self._finalize_operation_resources(executor, tempdir, operation_id)
+                return
+            logger.warning(
+                "split_pdf event=loop_closed_during_cancel operation_id=%s",
+                operation_id,
             )
-            return
-        self._finalize_operation_resources(executor, tempdir, operation_id)
+        self._finalize_operation_resources(tempdir, operation_id, pdf_map)
 
     @staticmethod
     def _close_unconsumed_chunk_files(
-        tasks: Optional[list[partial[Coroutine[Any, Any, httpx.Response]]]],
+        tasks: Optional[ChunkTasks],
     ) -> int:
         if tasks is None:
             return 0
+        if isinstance(tasks, LazyChunkTasks):
+            return tasks.close()
 
         closed_count = 0
         seen_files: set[int] = set()
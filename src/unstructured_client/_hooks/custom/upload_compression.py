@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import io
+import mimetypes
+import os
+import tempfile
+import zlib
+from typing import IO, BinaryIO, Optional, Union
+
+GZIP_CONTENT_TYPE = "application/gzip"
+GZIP_FILE_EXTENSION = ".gz"
+# Compressed files of up to this size stay in memory, larger ones are spooled
+# to a temporary file.
+MAX_IN_MEMORY_SIZE = 4 * 1024 * 1024
+READ_BLOCK_SIZE = 1024 * 1024
+# gzip wrapper of zlib streams, see `zlib.compressobj`.
+GZIP_WBITS = 31
+
+# Text formats always shrink.
+TEXT_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/xhtml+xml",
+    "application/rtf",
+    "message/",
+)
+# Formats that are compressed already, gzip does not shrink them.
+COMPRESSED_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/epub+zip",
+    "application/vnd.openxmlformats-officedocument.",
+    "application/vnd.oasis.opendocument.",
+)
+
+
+class UploadCompression:
+    """Settings of gzip compressed uploads of `partition` files and split PDF
+    chunks.
+
+    Text files are always compressed, and formats that are compressed already,
+    such as images and Office Open XML documents, never are. Other files, PDFs
+    included, are compressed if their first `sample_size` bytes shrink to at
+    most `max_ratio` of their size. The API decompresses the files and reads
+    their content type from `gz_uncompressed_content_type`.
+
+    Args:
+        level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        min_size: Files smaller than this number of bytes are sent as they are.
+        max_ratio: The highest compressed to original size ratio of the sample
+            for which a file is compressed.
+        sample_size: The number of bytes compressed to decide whether a file
+            is worth compressing.
+    """
+
+    def __init__(
+        self,
+        level: int = 6,
+        min_size: int = 16 * 1024,
+        max_ratio: float = 0.85,
+        sample_size: int = 64 * 1024,
+    ) -> None:
+        if not 1 <= level <= 9:
+            raise ValueError("level must be between 1 and 9")
+        if min_size < 0:
+            raise ValueError("min_size must not be negative")
+        if not 0 < max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        if sample_size < 1:
+            raise ValueError("sample_size must be at least 1")
+        self.level = level
+        self.min_size = min_size
+        self.max_ratio = max_ratio
+        self.sample_size = sample_size
+
+    def should_compress(self, file: Union[bytes, IO[bytes]], content_type: Optional[str]) -> bool:
+        """Whether a file of `content_type` is worth compressing."""
+        if content_type is not None and content_type.startswith(COMPRESSED_CONTENT_TYPES):
+            return False
+        try:
+            if get_size(file) < self.min_size:
+                return False
+            if content_type is not None and content_type.startswith(TEXT_CONTENT_TYPES):
+                return True
+            sample = _read_sample(file, self.sample_size)
+        except (OSError, ValueError):
+            # Streams that cannot seek are sent as they are.
+            return False
+        if not sample:
+            return False
+        compressed_sample = zlib.compress(sample, self.level)
+        return len(compressed_sample) <= len(sample) * self.max_ratio
+
+
+def get_upload_compression(
+    upload_compression: Union[bool, UploadCompression, None],
+) -> Optional[UploadCompression]:
+    """Resolves the `upload_compression` client option."""
+    if isinstance(upload_compression, UploadCompression):
+        return upload_compression
+    if upload_compression is True:
+        return UploadCompression()
+    return None
+
+
+def get_content_type(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """The content type of a file, guessed from its name if not given."""
+    if content_type and content_type != "application/octet-stream":
+        return content_type
+    if filename:
+        guessed_type, _ = mimetypes.guess_type(filename)
+        return guessed_type
+    return None
+
+
+def compress_file(file: Union[bytes, IO[bytes]], level: int = 6) -> BinaryIO:
+    """Compresses `file` into a gzip stream, reading it block by block.
+
+    The compressed stream is kept in memory up to `MAX_IN_MEMORY_SIZE` bytes
+    and written to a temporary file past that, which is deleted once closed.
+    Temporary files are returned opened for reading, as `shared.Files` takes
+    them.
+    """
+    source: IO[bytes] = io.BytesIO(file) if isinstance(file, bytes) else file
+    source.seek(0)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    compressed: BinaryIO = io.BytesIO()
+    try:
+        while block := source.read(READ_BLOCK_SIZE):
+            compressed.write(compressor.compress(block))
+            if isinstance(compressed, io.BytesIO) and compressed.tell() > MAX_IN_MEMORY_SIZE:
+                compressed = _spool_to_file(compressed)
+        compressed.write(compressor.flush())
+        if not isinstance(compressed, io.BytesIO):
+            compressed = _reopen_for_reading(compressed)
+    except BaseException:
+        compressed.close()
+        raise
+    compressed.seek(0)
+    return compressed
+
+
+def _spool_to_file(buffer: io.BytesIO) -> BinaryIO:
+    spooled = tempfile.TemporaryFile()  # pylint: disable=consider-using-with
+    spooled.write(buffer.getbuffer())
+    return spooled
+
+
+def _reopen_for_reading(file: BinaryIO) -> BinaryIO:
+    file.flush()
+    # The duplicated descriptor keeps the temporary file until it is closed.
+    reader = open(os.dup(file.fileno()), mode="rb")  # pylint: disable=consider-using-with
+    file.close()
+    return reader
+
+
+def get_size(file: Union[bytes, IO[bytes]]) -> int:
+    if isinstance(file, bytes):
+        return len(file)
+    position = file.tell()
+    size = file.seek(0, io.SEEK_END)
+    file.seek(position)
+    return size
+
+
+def _read_sample(file: Union[bytes, IO[bytes]], size: int) -> bytes:
+    if isinstance(file, bytes):
+        return file[:size]
+    position = file.tell()
+    file.seek(0)
+    sample = file.read(size)
+    file.seek(position)
+    return sample
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Optional, Union
+
+import httpx
+from httpx._multipart import DataField, FileField
+
+from unstructured_client._hooks.custom import request_utils
+from unstructured_client._hooks.custom.common import UNSTRUCTURED_CLIENT_LOGGER_NAME
+from unstructured_client._hooks.custom.form_utils import (
+    PARTITION_FORM_FILES_KEY,
+    PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY,
+)
+from unstructured_client._hooks.custom.upload_compression import (
+    GZIP_CONTENT_TYPE,
+    GZIP_FILE_EXTENSION,
+    UploadCompression,
+    compress_file,
+    get_content_type,
+    get_size,
+    get_upload_compression,
+)
+from unstructured_client._hooks.types import BeforeRequestContext, BeforeRequestHook
+
+logger = logging.getLogger(UNSTRUCTURED_CLIENT_LOGGER_NAME)
+
+
+def compress_partition_request(
+    request: httpx.Request,
+    upload_compression: UploadCompression,
+) -> httpx.Request:
+    """Returns `request` with its file gzip compressed, or `request` itself if
+    it has no file or the file is not worth compressing."""
+    stream_fields = getattr(request.stream, "fields", None)
+    if "multipart" not in request.headers.get("Content-Type", "") or not stream_fields:
+        return request
+
+    data: dict[str, list[Any]] = {}
+    file_field: Optional[FileField] = None
+    for field in stream_fields:
+        if isinstance(field, DataField):
+            data.setdefault(field.name, []).append(field.value)
+        elif isinstance(field, FileField) and field.name == PARTITION_FORM_FILES_KEY:
+            file_field = field
+    if file_field is None or file_field.filename is None:
+        return request
+    if PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY in data:
+        # The file is compressed already.
+        return request
+
+    file = file_field.file
+    if isinstance(file, str):
+        file = file.encode()
+    content_type = get_content_type(file_field.filename, file_field.headers.get("Content-Type"))
+    if not upload_compression.should_compress(file, content_type):
+        return request
+
+    compressed_file = compress_file(file, upload_compression.level)
+    if content_type is not None:
+        data[PARTITION_FORM_GZ_UNCOMPRESSED_CONTENT_TYPE_KEY] = [content_type]
+    logger.debug(
+        "upload_compression event=file_compressed filename=%s content_type=%s compressed_size=%d",
+        file_field.filename,
+        content_type,
+        get_size(compressed_file),
+    )
+    return httpx.Request(
+        method=request.method,
+        url=request.url,
+        headers=request_utils.prepare_request_headers(request.headers),
+        data=data,
+        files={
+            PARTITION_FORM_FILES_KEY: (
+                file_field.filename + GZIP_FILE_EXTENSION,
+                compressed_file,
+                GZIP_CONTENT_TYPE,
+            )
+        },
+        extensions=request.extensions,
+    )
+
+
+class UploadCompressionHook(BeforeRequestHook):
+    """Compresses the file of `partition` requests with the `upload_compression`
+    setting of the client. Split PDF chunks are compressed by `SplitPdfHook`.
+    """
+
+    operation_ids = frozenset({"partition"})
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        upload_compression = get_upload_compression(
+            getattr(hook_ctx.config, "upload_compression", None)
+        )
+        if upload_compression is None:
+            return request
+        return compress_partition_request(request, upload_compression)
+
+    async def before_request_async(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        if get_upload_compression(getattr(hook_ctx.config, "upload_compression", None)) is None:
+            return request
+        # Compression reads the whole file, keep it off the event loop.
+        return await asyncio.to_thread(self.before_request, hook_ctx, request)
@@ -3,7 +3,9 @@
 from .custom import (
     CleanServerUrlSDKInitHook,
     LoggerHook,
+    RetryCountHook,
     SplitPdfHook,
+    UploadCompressionHook,
 )
 from .types import Hooks
 
@@ -23,7 +25,9 @@ def init_hooks(hooks: Hooks):
     # Initialize custom hooks
     clean_server_url_hook = CleanServerUrlSDKInitHook()
     logger_hook = LoggerHook()
+    retry_count_hook = RetryCountHook()
     split_pdf_hook = SplitPdfHook()
+    upload_compression_hook = UploadCompressionHook()
 
     # NOTE: logger_hook should stay registered last as logs the status of
     # request and whether it will be retried which can be changed by e.g. split_pdf_hook
@@ -34,7 +38,11 @@ def init_hooks(hooks: Hooks):
     hooks.register_sdk_init_hook(split_pdf_hook)
 
     # Register Before Request hooks
+    # Runs first, so the requests rebuilt by the other hooks share its retry count
+    hooks.register_before_request_hook(retry_count_hook)
     hooks.register_before_request_hook(split_pdf_hook)
+    # Runs after split_pdf_hook, so only the requests that are not split reach it
+    hooks.register_before_request_hook(upload_compression_hook)
 
     # Register After Error hooks
     hooks.register_after_success_hook(split_pdf_hook)
@@ -43,3 +51,6 @@ def init_hooks(hooks: Hooks):
     # Register After Error hooks
     hooks.register_after_error_hook(split_pdf_hook)
     hooks.register_after_error_hook(logger_hook)  
+
+    # Register Circuit State Change hooks
+    hooks.register_circuit_state_change_hook(logger_hook)
@@ -2,8 +2,17 @@
 
 import asyncio
 import inspect
-import threading
-from typing import Any, Awaitable, Callable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 import httpx
 from .types import (
@@ -14,11 +23,16 @@ from .types import (
     AfterSuccessHook,
     AfterErrorContext,
     AfterErrorHook,
+    CircuitStateChangeHook,
+    HookContext,
     Hooks,
 )
 from .registration import init_hooks
 from unstructured_client.httpclient import HttpClient
 
+if TYPE_CHECKING:
+    from unstructured_client._hooks.custom.circuit_breaker import CircuitStateChange
+
 
 def _get_async_hook_method(
     hook: object,
@@ -32,57 +46,157 @@ def _get_async_hook_method(
     return None
 
 
+def _applies_to(hook: object, operation_id: Optional[str]) -> bool:
+    """Whether `hook` runs for `operation_id`. Hooks may set `operation_ids` to
+    the operation IDs they handle; hooks without it run for every operation."""
+    operation_ids: Optional[Collection[str]] = getattr(hook, "operation_ids", None)
+    return operation_ids is None or operation_id in operation_ids
+
+
 class SDKHooks(Hooks):
+    """Runs the registered hooks.
+
+    The hooks that apply to an operation are looked up once per operation ID
+    and hook method, so operations no registered hook handles skip the hooks.
+    """
+
     def __init__(self) -> None:
+        self._dispatch: dict[Tuple[str, Optional[str]], Tuple[Any, ...]] = {}
         self.sdk_init_hooks: List[SDKInitHook] = []
         self.before_request_hooks: List[BeforeRequestHook] = []
         self.after_success_hooks: List[AfterSuccessHook] = []
         self.after_error_hooks: List[AfterErrorHook] = []
-        self._sync_hook_locks_guard = threading.Lock()
-        self._sync_hook_locks: dict[int, threading.Lock] = {}
+        self.circuit_state_change_hooks: List[CircuitStateChangeHook] = []
         init_hooks(self)
 
-    def _get_sync_hook_lock(self, hook: object) -> threading.Lock:
-        hook_id = id(hook)
-        with self._sync_hook_locks_guard:
-            lock = self._sync_hook_locks.get(hook_id)
-            if lock is None:
-                lock = threading.Lock()
-                self._sync_hook_locks[hook_id] = lock
-            return lock
+    @property
+    def before_request_hooks(self) -> List[BeforeRequestHook]:
+        return self._before_request_hooks
 
-    def _run_sync_hook_method(
-        self,
-        hook: object,
-        method_name: str,
-        *args: object,
-    ) -> Any:
-        method = getattr(hook, method_name)
-        with self._get_sync_hook_lock(hook):
-            return method(*args)
+    @before_request_hooks.setter
+    def before_request_hooks(self, hooks: List[BeforeRequestHook]) -> None:
+        self._before_request_hooks = hooks
+        self._dispatch.clear()
+
+    @property
+    def after_success_hooks(self) -> List[AfterSuccessHook]:
+        return self._after_success_hooks
+
+    @after_success_hooks.setter
+    def after_success_hooks(self, hooks: List[AfterSuccessHook]) -> None:
+        self._after_success_hooks = hooks
+        self._dispatch.clear()
+
+    @property
+    def after_error_hooks(self) -> List[AfterErrorHook]:
+        return self._after_error_hooks
+
+    @after_error_hooks.setter
+    def after_error_hooks(self, hooks: List[AfterErrorHook]) -> None:
+        self._after_error_hooks = hooks
+        self._dispatch.clear()
 
     def register_sdk_init_hook(self, hook: SDKInitHook) -> None:
         self.sdk_init_hooks.append(hook)
 
     def register_before_request_hook(self, hook: BeforeRequestHook) -> None:
         self.before_request_hooks.append(hook)
+        self._dispatch.clear()
 
     def register_after_success_hook(self, hook: AfterSuccessHook) -> None:
         self.after_success_hooks.append(hook)
+        self._dispatch.clear()
 
     def register_after_error_hook(self, hook: AfterErrorHook) -> None:
         self.after_error_hooks.append(hook)
+        self._dispatch.clear()
+
+    def register_circuit_state_change_hook(self, hook: CircuitStateChangeHook) -> None:
+        self.circuit_state_change_hooks.append(hook)
+
+    def _get_hook_methods(
+        self,
+        method_name: str,
+        operation_id: Optional[str],
+    ) -> Tuple[Tuple[Callable[..., Any], bool], ...]:
+        """Returns the `method_name` methods of the hooks that apply to
+        `operation_id`, in registration order, with whether each is async.
+
+        `method_name` ending in `_async` falls back to the sync method, which
+        the caller runs in a worker thread.
+        """
+        key = (method_name, operation_id)
+        methods = self._dispatch.get(key)
+        if methods is not None:
+            return methods
+        sync_method_name = method_name.removesuffix("_async")
+        hooks_by_kind: Dict[str, Collection[object]] = {
+            "before_request": self.before_request_hooks,
+            "after_success": self.after_success_hooks,
+            "after_error": self.after_error_hooks,
+        }
+        hooks = hooks_by_kind[sync_method_name]
+        resolved: List[Tuple[Callable[..., Any], bool]] = []
+        for hook in hooks:
+            if not _applies_to(hook, operation_id):
+                continue
+            async_method = None
+            if method_name != sync_method_name:
+                async_method = _get_async_hook_method(hook, method_name)
+            if async_method is not None:
+                resolved.append((async_method, True))
+            else:
+                resolved.append((getattr(hook, sync_method_name), False))
+        methods = tuple(resolved)
+        # Racing threads compute the same table, so the last write wins.
+        self._dispatch[key] = methods
+        return methods
+
+    def has_before_request_hooks(self, operation_id: Optional[str]) -> bool:
+        """Whether any before request hook applies to `operation_id`, so callers
+        can skip building the hook context when none does."""
+        return bool(self._get_hook_methods("before_request", operation_id))
+
+    def has_after_success_hooks(self, operation_id: Optional[str]) -> bool:
+        """Whether any after success hook applies to `operation_id`."""
+        return bool(self._get_hook_methods("after_success", operation_id))
+
+    def close(self) -> None:
+        """Releases resources held by registered hooks, such as pooled clients."""
+        seen_hooks: set[int] = set()
+        for hook in [
+            *self.sdk_init_hooks,
+            *self.before_request_hooks,
+            *self.after_success_hooks,
+            *self.after_error_hooks,
+            *self.circuit_state_change_hooks,
+        ]:
+            if id(hook) in seen_hooks:
+                continue
+            seen_hooks.add(id(hook))
+            close = getattr(hook, "close", None)
+            if callable(close):
+                close()
 
     def sdk_init(self, base_url: str, client: HttpClient) -> Tuple[str, HttpClient]:
         for hook in self.sdk_init_hooks:
             base_url, client = hook.sdk_init(base_url, client)
         return base_url, client
 
+    def circuit_state_change(
+        self, hook_ctx: HookContext, change: "CircuitStateChange"
+    ) -> None:
+        """Tells the hooks the circuit of a base URL changed state. Circuits
+        are shared by all operations, so every hook is told."""
+        for hook in self.circuit_state_change_hooks:
+            hook.circuit_state_change(hook_ctx, change)
+
     def before_request(
         self, hook_ctx: BeforeRequestContext, request: httpx.Request
     ) -> httpx.Request:
-        for hook in self.before_request_hooks:
-            out = hook.before_request(hook_ctx, request)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, _ in self._get_hook_methods("before_request", operation_id):
+            out = method(hook_ctx, request)
             if isinstance(out, Exception):
                 raise out
             request = out
@@ -92,18 +206,12 @@ class SDKHooks(Hooks):
     async def before_request_async(
         self, hook_ctx: BeforeRequestContext, request: httpx.Request
     ) -> httpx.Request:
-        for hook in self.before_request_hooks:
-            async_method = _get_async_hook_method(hook, "before_request_async")
-            if async_method is not None:
-                out = await async_method(hook_ctx, request)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, is_async in self._get_hook_methods("before_request_async", operation_id):
+            if is_async:
+                out = await method(hook_ctx, request)
             else:
-                out = await asyncio.to_thread(
-                    self._run_sync_hook_method,
-                    hook,
-                    "before_request",
-                    hook_ctx,
-                    request,
-                )
+                out = await asyncio.to_thread(method, hook_ctx, request)
             if isinstance(out, Exception):
                 raise out
             request = out
@@ -113,8 +221,9 @@ class SDKHooks(Hooks):
     def after_success(
         self, hook_ctx: AfterSuccessContext, response: httpx.Response
     ) -> httpx.Response:
-        for hook in self.after_success_hooks:
-            out = hook.after_success(hook_ctx, response)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, _ in self._get_hook_methods("after_success", operation_id):
+            out = method(hook_ctx, response)
             if isinstance(out, Exception):
                 raise out
             response = out
@@ -123,18 +232,12 @@ class SDKHooks(Hooks):
     async def after_success_async(
         self, hook_ctx: AfterSuccessContext, response: httpx.Response
     ) -> httpx.Response:
-        for hook in self.after_success_hooks:
-            async_method = _get_async_hook_method(hook, "after_success_async")
-            if async_method is not None:
-                out = await async_method(hook_ctx, response)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, is_async in self._get_hook_methods("after_success_async", operation_id):
+            if is_async:
+                out = await method(hook_ctx, response)
             else:
-                out = await asyncio.to_thread(
-                    self._run_sync_hook_method,
-                    hook,
-                    "after_success",
-                    hook_ctx,
-                    response,
-                )
+                out = await asyncio.to_thread(method, hook_ctx, response)
             if isinstance(out, Exception):
                 raise out
             response = out
@@ -146,8 +249,9 @@ class SDKHooks(Hooks):
         response: Optional[httpx.Response],
         error: Optional[Exception],
     ) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
-        for hook in self.after_error_hooks:
-            result = hook.after_error(hook_ctx, response, error)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, _ in self._get_hook_methods("after_error", operation_id):
+            result = method(hook_ctx, response, error)
             if isinstance(result, Exception):
                 raise result
             response, error = result
@@ -159,19 +263,12 @@ class SDKHooks(Hooks):
         response: Optional[httpx.Response],
         error: Optional[Exception],
     ) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
-        for hook in self.after_error_hooks:
-            async_method = _get_async_hook_method(hook, "after_error_async")
-            if async_method is not None:
-                result = await async_method(hook_ctx, response, error)
+        operation_id = getattr(hook_ctx, "operation_id", None)
+        for method, is_async in self._get_hook_methods("after_error_async", operation_id):
+            if is_async:
+                result = await method(hook_ctx, response, error)
             else:
-                result = await asyncio.to_thread(
-                    self._run_sync_hook_method,
-                    hook,
-                    "after_error",
-                    hook_ctx,
-                    response,
-                    error,
-                )
+                result = await asyncio.to_thread(method, hook_ctx, response, error)
             if isinstance(result, Exception):
                 raise result
             response, error = result
@@ -2,10 +2,13 @@
 
 from abc import ABC, abstractmethod
 import httpx
-from typing import Any, Callable, List, Optional, Protocol, Tuple, Union
+from typing import Any, Callable, List, Optional, Protocol, Tuple, TYPE_CHECKING, Union
 from unstructured_client.httpclient import HttpClient
 from unstructured_client.sdkconfiguration import SDKConfiguration
 
+if TYPE_CHECKING:
+    from unstructured_client._hooks.custom.circuit_breaker import CircuitStateChange
+
 
 class HookContext:
     config: SDKConfiguration
@@ -119,6 +122,14 @@ class AsyncAfterErrorHook(Protocol):
         pass
 
 
+class CircuitStateChangeHook(ABC):
+    @abstractmethod
+    def circuit_state_change(
+        self, hook_ctx: HookContext, change: "CircuitStateChange"
+    ) -> None:
+        pass
+
+
 class Hooks(ABC):
     @abstractmethod
     def register_sdk_init_hook(self, hook: SDKInitHook):
@@ -136,6 +147,10 @@ class Hooks(ABC):
     def register_after_error_hook(self, hook: AfterErrorHook):
         pass
 
+    @abstractmethod
+    def register_circuit_state_change_hook(self, hook: CircuitStateChangeHook):
+        pass
+
     @abstractmethod
     async def before_request_async(
         self, hook_ctx: BeforeRequestContext, request: httpx.Request
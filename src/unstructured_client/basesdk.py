@@ -10,12 +10,18 @@ from unstructured_client._hooks import (
     AfterErrorContext,
     AfterSuccessContext,
     BeforeRequestContext,
+    HookContext,
+)
+from unstructured_client._hooks.custom.circuit_breaker import (
+    CircuitPermit,
+    is_circuit_failure,
 )
 from unstructured_client.models import errors
 from unstructured_client.utils import (
     RetryConfig,
     SerializedRequestBody,
     get_body_content,
+    get_deadline,
 )
 from urllib.parse import parse_qs, urlparse
 
@@ -46,6 +52,33 @@ class BaseSDK:
 
         return utils.template_url(base_url, url_variables)
 
+    def _acquire_circuit(self, hook_ctx: HookContext) -> Optional[CircuitPermit]:
+        circuit_breaker = self.sdk_configuration.circuit_breaker
+        if circuit_breaker is None or not hook_ctx.base_url:
+            return None
+        permit = circuit_breaker.acquire(hook_ctx.base_url)
+        if permit.change is not None:
+            hooks = self.sdk_configuration.__dict__["_hooks"]
+            hooks.circuit_state_change(hook_ctx, permit.change)
+        return permit
+
+    def _record_circuit(
+        self,
+        hook_ctx: HookContext,
+        permit: Optional[CircuitPermit],
+        response: Optional[httpx.Response],
+        error: Optional[BaseException],
+    ) -> None:
+        circuit_breaker = self.sdk_configuration.circuit_breaker
+        if permit is None or circuit_breaker is None:
+            return
+        change = circuit_breaker.record(
+            permit, is_circuit_failure(permit.base_url, response, error)
+        )
+        if change is not None:
+            hooks = self.sdk_configuration.__dict__["_hooks"]
+            hooks.circuit_state_change(hook_ctx, change)
+
     def _build_request_async(
         self,
         method,
@@ -233,13 +266,20 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.client
         logger = self.sdk_configuration.debug_logger
+        deadline = get_deadline()
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
         def do():
             http_res = None
+            if deadline is not None and deadline.expired:
+                raise errors.DeadlineExceededError()
+            # Raises without sending the request while the circuit is open.
+            permit = self._acquire_circuit(hook_ctx)
             try:
-                req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
+                req = request
+                if hooks.has_before_request_hooks(hook_ctx.operation_id):
+                    req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
                 logger.debug(
                     "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
                     req.method,
@@ -250,9 +290,15 @@ class BaseSDK:
 
                 if client is None:
                     raise ValueError("client is required")
+                if deadline is not None:
+                    req.extensions["timeout"] = deadline.clamp_timeout(
+                        req.extensions.get("timeout")
+                    )
 
                 http_res = client.send(req, stream=stream)
+                self._record_circuit(hook_ctx, permit, http_res, None)
             except Exception as e:
+                self._record_circuit(hook_ctx, permit, None, e)
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
                     logger.debug("Request Exception", exc_info=True)
@@ -286,11 +332,21 @@ class BaseSDK:
             return http_res
 
         if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
+            http_res = utils.retry(
+                do,
+                utils.Retries(
+                    retry_config[0],
+                    retry_config[1],
+                    self.sdk_configuration.retry_budget,
+                    deadline,
+                ),
+            )
         else:
             http_res = do()
 
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
+        if not utils.match_status_codes(
+            error_status_codes, http_res.status_code
+        ) and hooks.has_after_success_hooks(hook_ctx.operation_id):
             http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
 
         return http_res
@@ -305,6 +361,7 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.async_client
         logger = self.sdk_configuration.debug_logger
+        deadline = get_deadline()
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
@@ -342,8 +399,14 @@ class BaseSDK:
         async def do():
             http_res = None
             req = None
+            if deadline is not None and deadline.expired:
+                raise errors.DeadlineExceededError()
+            # Raises without sending the request while the circuit is open.
+            permit = self._acquire_circuit(hook_ctx)
             try:
-                req = await hooks.before_request_async(BeforeRequestContext(hook_ctx), request)
+                req = request
+                if hooks.has_before_request_hooks(hook_ctx.operation_id):
+                    req = await hooks.before_request_async(BeforeRequestContext(hook_ctx), request)
                 logger.debug(
                     "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
                     req.method,
@@ -354,12 +417,19 @@ class BaseSDK:
 
                 if client is None:
                     raise ValueError("client is required")
+                if deadline is not None:
+                    req.extensions["timeout"] = deadline.clamp_timeout(
+                        req.extensions.get("timeout")
+                    )
 
                 http_res = await client.send(req, stream=stream)
+                self._record_circuit(hook_ctx, permit, http_res, None)
             except asyncio.CancelledError as cancellation:
+                self._record_circuit(hook_ctx, permit, None, cancellation)
                 await cleanup_cancelled_request(req, None, cancellation)
                 raise
             except Exception as e:
+                self._record_circuit(hook_ctx, permit, None, e)
                 _, e = await hooks.after_error_async(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
                     logger.debug("Request Exception", exc_info=True)
@@ -398,12 +468,20 @@ class BaseSDK:
 
         if retry_config is not None:
             http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
+                do,
+                utils.Retries(
+                    retry_config[0],
+                    retry_config[1],
+                    self.sdk_configuration.retry_budget,
+                    deadline,
+                ),
             )
         else:
             http_res = await do()
 
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
+        if not utils.match_status_codes(
+            error_status_codes, http_res.status_code
+        ) and hooks.has_after_success_hooks(hook_ctx.operation_id):
             try:
                 http_res = await hooks.after_success_async(AfterSuccessContext(hook_ctx), http_res)
             except asyncio.CancelledError as cancellation:
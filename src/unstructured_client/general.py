@@ -1,13 +1,49 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from .basesdk import BaseSDK
+import asyncio
 from enum import Enum
-from typing import Any, Dict, List, Mapping, Optional, Union, cast
+from pathlib import Path
+import httpx
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from unstructured_client import utils
 from unstructured_client._hooks import HookContext
 from unstructured_client.models import errors, operations, shared
 from unstructured_client.types import BaseModel, OptionalNullable, UNSET
 from unstructured_client._hooks.custom.clean_server_url_hook import clean_server_url
+from unstructured_client._hooks.custom.element_files import (
+    MERGE_TARGET_EXTENSION_KEY,
+    MERGED_OUTPUT_EXTENSION_KEY,
+    MergeTarget,
+    Output,
+    OutputFormat,
+)
+from unstructured_client._hooks.custom.partition_stream import (
+    ELEMENT_STREAM_EXTENSION_KEY,
+    STREAM_ELEMENTS_EXTENSION_KEY,
+    PartitionStream,
+    PartitionStreamAsync,
+)
+from unstructured_client._hooks.custom.request_utils import (
+    PARSED_ELEMENTS_EXTENSION_KEY,
+)
+from unstructured_client._hooks.custom.result_cache import (
+    PARTITION_NAMESPACE,
+    create_cached_response,
+    get_cacheable_content,
+    get_partition_cache_key,
+)
 from unstructured_client.utils.unmarshal_json_response import unmarshal_json_response
 
 
@@ -16,6 +52,9 @@ class PartitionAcceptEnum(str, Enum):
     TEXT_CSV = "text/csv"
 
 
+_PartitionRetryConfig = Optional[Tuple[utils.RetryConfig, List[str]]]
+
+
 class General(BaseSDK):
     def partition(
         self,
@@ -40,130 +79,323 @@ class General(BaseSDK):
         :param accept_header_override: Override the default accept header for this method
         :param http_headers: Additional headers to set or replace on requests.
         """
-        base_url = None
-        url_variables = None
-        if timeout_ms is None:
-            timeout_ms = self.sdk_configuration.timeout_ms
+        base_url, request, req, retry_config = self._build_partition_request(
+            request=request,
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
+            accept_header_value=accept_header_override.value
+            if accept_header_override is not None
+            else "application/json;q=1, text/csv;q=0",
+            http_headers=http_headers,
+        )
 
-        if server_url is not None:
-            base_url = server_url
-        else:
-            base_url = self._get_url(base_url, url_variables)
+        cache_key, http_res = self._get_cached_partition(
+            request, req, accept_header_override
+        )
+        if http_res is None:
+            http_res = self._do_partition_request(base_url, req, retry_config)
+            self._cache_partition_result(cache_key, http_res)
 
-        # Note(austin): Add a custom check to handle the default server URL
-        # The SDK globally defaults to the platform URL.
-        # If that hasn't changed, we need to switch to the partition url here.
-        base_url = clean_server_url(base_url)
-        if base_url == "https://platform.unstructuredapp.io":
-            base_url = "https://api.unstructuredapp.io"
+        response = self._get_partition_response(http_res)
+        if response is not None:
+            return response
+        self._raise_partition_error(http_res)
 
-        if not isinstance(request, BaseModel):
-            request = utils.unmarshal(request, operations.PartitionRequest)
-        request = cast(operations.PartitionRequest, request)
+    async def partition_async(
+        self,
+        *,
+        request: Union[
+            operations.PartitionRequest, operations.PartitionRequestTypedDict
+        ],
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        accept_header_override: Optional[PartitionAcceptEnum] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> operations.PartitionResponse:
+        r"""Summary
 
-        req = self._build_request(
-            method="POST",
-            path="/general/v0/general",
-            base_url=base_url,
-            url_variables=url_variables,
+        Description
+
+        :param request: The request object to send.
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param accept_header_override: Override the default accept header for this method
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        base_url, request, req, retry_config = self._build_partition_request(
             request=request,
-            request_body_required=True,
-            request_has_path_params=False,
-            request_has_query_params=True,
-            user_agent_header="user-agent",
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
             accept_header_value=accept_header_override.value
             if accept_header_override is not None
             else "application/json;q=1, text/csv;q=0",
             http_headers=http_headers,
-            security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.partition_parameters,
-                False,
-                False,
-                "multipart",
-                shared.PartitionParameters,
-            ),
-            timeout_ms=timeout_ms,
+            is_async=True,
         )
 
-        if retries == UNSET:
-            if self.sdk_configuration.retry_config is not UNSET:
-                retries = self.sdk_configuration.retry_config
-            else:
-                retries = utils.RetryConfig(
-                    "backoff", utils.BackoffStrategy(3000, 720000, 1.88, 1800000), True
-                )
+        cache_key, http_res = await asyncio.to_thread(
+            self._get_cached_partition, request, req, accept_header_override
+        )
+        if http_res is None:
+            http_res = await self._do_partition_request_async(
+                base_url, req, retry_config
+            )
+            await asyncio.to_thread(self._cache_partition_result, cache_key, http_res)
 
-        retry_config = None
-        if isinstance(retries, utils.RetryConfig):
-            retry_config = (retries, ["5xx"])
+        response = self._get_partition_response(http_res)
+        if response is not None:
+            return response
+        await self._raise_partition_error_async(http_res)
 
-        http_res = self.do_request(
-            hook_ctx=HookContext(
-                config=self.sdk_configuration,
-                base_url=base_url or "",
-                operation_id="partition",
-                oauth2_scopes=[],
-                security_source=self.sdk_configuration.security,
-            ),
-            request=req,
-            error_status_codes=["422", "4XX", "5XX"],
-            retry_config=retry_config,
+    def _get_cached_partition(
+        self,
+        request: operations.PartitionRequest,
+        req: httpx.Request,
+        accept_header_override: Optional[PartitionAcceptEnum],
+    ) -> Tuple[Optional[str], Optional[httpx.Response]]:
+        """Looks the request up in the `partition_cache` of the client.
+
+        Returns the cache key, `None` if the result is not cached, and the
+        cached response, `None` on a miss.
+        """
+        partition_cache = self.sdk_configuration.partition_cache
+        if partition_cache is None or accept_header_override == PartitionAcceptEnum.TEXT_CSV:
+            return None, None
+        cache_key = get_partition_cache_key(request.partition_parameters, str(req.url))
+        if cache_key is None:
+            return None, None
+        content = partition_cache.get(PARTITION_NAMESPACE, cache_key)
+        if content is None:
+            return cache_key, None
+        return cache_key, create_cached_response(content, req)
+
+    def _cache_partition_result(
+        self, cache_key: Optional[str], http_res: httpx.Response
+    ) -> None:
+        partition_cache = self.sdk_configuration.partition_cache
+        if partition_cache is None or cache_key is None:
+            return
+        content = get_cacheable_content(http_res)
+        if content is not None:
+            partition_cache.set(PARTITION_NAMESPACE, cache_key, content)
+
+    def partition_stream(
+        self,
+        *,
+        request: Union[
+            operations.PartitionRequest, operations.PartitionRequestTypedDict
+        ],
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> PartitionStream:
+        r"""Partitions a document and streams the elements chunk by chunk.
+
+        With `split_pdf_page` enabled, the chunks of the PDF are yielded in page
+        order as soon as each chunk and all earlier chunks are done, instead of
+        after the whole document is partitioned. Other requests yield a single
+        chunk. Close the stream, or use it as a context manager, to cancel
+        the remaining chunk requests when it is not read to the end.
+
+        :param request: The request object to send.
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        base_url, _, req, retry_config = self._build_partition_request(
+            request=request,
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
+            accept_header_value="application/json",
+            http_headers=http_headers,
         )
 
-        response_data: Any = None
+        req.extensions[STREAM_ELEMENTS_EXTENSION_KEY] = True
+
+        http_res = self._do_partition_request(base_url, req, retry_config)
+
         if utils.match_response(http_res, "200", "application/json"):
-            return operations.PartitionResponse(
-                elements=unmarshal_json_response(
-                    Optional[List[Dict[str, Any]]], http_res
-                ),
-                status_code=http_res.status_code,
-                content_type=http_res.headers.get("Content-Type") or "",
-                raw_response=http_res,
+            stream = http_res.extensions.get(ELEMENT_STREAM_EXTENSION_KEY)
+            if isinstance(stream, PartitionStream):
+                return stream
+            return PartitionStream.from_elements(
+                http_res,
+                unmarshal_json_response(Optional[List[Dict[str, Any]]], http_res)
+                or [],
             )
-        if utils.match_response(http_res, "200", "text/csv"):
-            return operations.PartitionResponse(
-                csv_elements=http_res.text,
-                status_code=http_res.status_code,
-                content_type=http_res.headers.get("Content-Type") or "",
-                raw_response=http_res,
-            )
-        if utils.match_response(http_res, "422", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.HTTPValidationErrorData, http_res
+        self._raise_partition_error(http_res)
+
+    async def partition_stream_async(
+        self,
+        *,
+        request: Union[
+            operations.PartitionRequest, operations.PartitionRequestTypedDict
+        ],
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> PartitionStreamAsync:
+        r"""Partitions a document and streams the elements chunk by chunk.
+
+        With `split_pdf_page` enabled, the chunks of the PDF are yielded in page
+        order as soon as each chunk and all earlier chunks are done, instead of
+        after the whole document is partitioned. Other requests yield a single
+        chunk. Close the stream, or use it as an async context manager, to cancel
+        the remaining chunk requests when it is not read to the end.
+
+        :param request: The request object to send.
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        base_url, _, req, retry_config = self._build_partition_request(
+            request=request,
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            is_async=True,
+        )
+
+        req.extensions[STREAM_ELEMENTS_EXTENSION_KEY] = True
+
+        http_res = await self._do_partition_request_async(base_url, req, retry_config)
+
+        if utils.match_response(http_res, "200", "application/json"):
+            stream = http_res.extensions.get(ELEMENT_STREAM_EXTENSION_KEY)
+            if isinstance(stream, PartitionStreamAsync):
+                return stream
+            return PartitionStreamAsync.from_elements(
+                http_res,
+                unmarshal_json_response(Optional[List[Dict[str, Any]]], http_res)
+                or [],
             )
-            raise errors.HTTPValidationError(response_data, http_res)
-        if utils.match_response(http_res, "4XX", "*"):
-            http_res_text = utils.stream_to_text(http_res)
-            raise errors.SDKError("API error occurred", http_res, http_res_text)
-        if utils.match_response(http_res, "5XX", "application/json"):
-            response_data = unmarshal_json_response(errors.ServerErrorData, http_res)
-            raise errors.ServerError(response_data, http_res)
+        await self._raise_partition_error_async(http_res)
 
-        raise errors.SDKError("Unexpected response received", http_res)
+    def partition_to_file(
+        self,
+        *,
+        request: Union[
+            operations.PartitionRequest, operations.PartitionRequestTypedDict
+        ],
+        output: Output,
+        output_format: OutputFormat = "json",
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> Union[Path, BinaryIO]:
+        r"""Partitions a document and writes the elements to a file.
 
-    async def partition_async(
+        With `split_pdf_page` enabled, the chunk results are cached on disk and
+        spliced into the output byte for byte, without loading the elements into
+        memory, so large documents are partitioned with near-constant memory.
+
+        :param request: The request object to send.
+        :param output: The path to write the elements to, or a binary file-like object they are written to at its current position.
+        :param output_format: `json` to write a JSON array, `jsonl` to write one element per line.
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        :return: The path of the output file, or the file-like object written to.
+        """
+        merge_target = MergeTarget(output, output_format)
+        base_url, _, req, retry_config = self._build_partition_request(
+            request=request,
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
+            accept_header_value="application/json",
+            http_headers=http_headers,
+        )
+
+        req.extensions[MERGE_TARGET_EXTENSION_KEY] = merge_target
+
+        http_res = self._do_partition_request(base_url, req, retry_config)
+
+        if utils.match_response(http_res, "200", "application/json"):
+            if MERGED_OUTPUT_EXTENSION_KEY not in http_res.extensions:
+                merge_target.write_response(http_res)
+            return merge_target.result
+        self._raise_partition_error(http_res)
+
+    async def partition_to_file_async(
         self,
         *,
         request: Union[
             operations.PartitionRequest, operations.PartitionRequestTypedDict
         ],
+        output: Output,
+        output_format: OutputFormat = "json",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
-        accept_header_override: Optional[PartitionAcceptEnum] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> operations.PartitionResponse:
-        r"""Summary
+    ) -> Union[Path, BinaryIO]:
+        r"""Partitions a document and writes the elements to a file.
 
-        Description
+        With `split_pdf_page` enabled, the chunk results are cached on disk and
+        spliced into the output byte for byte, without loading the elements into
+        memory, so large documents are partitioned with near-constant memory.
 
         :param request: The request object to send.
+        :param output: The path to write the elements to, or a binary file-like object they are written to at its current position.
+        :param output_format: `json` to write a JSON array, `jsonl` to write one element per line.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
-        :param accept_header_override: Override the default accept header for this method
         :param http_headers: Additional headers to set or replace on requests.
+        :return: The path of the output file, or the file-like object written to.
+        """
+        merge_target = MergeTarget(output, output_format)
+        base_url, _, req, retry_config = self._build_partition_request(
+            request=request,
+            retries=retries,
+            server_url=server_url,
+            timeout_ms=timeout_ms,
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            is_async=True,
+        )
+
+        req.extensions[MERGE_TARGET_EXTENSION_KEY] = merge_target
+
+        http_res = await self._do_partition_request_async(base_url, req, retry_config)
+
+        if utils.match_response(http_res, "200", "application/json"):
+            if MERGED_OUTPUT_EXTENSION_KEY not in http_res.extensions:
+                await asyncio.to_thread(merge_target.write_response, http_res)
+            return merge_target.result
+        await self._raise_partition_error_async(http_res)
+
+    def _build_partition_request(
+        self,
+        *,
+        request: Union[
+            operations.PartitionRequest, operations.PartitionRequestTypedDict
+        ],
+        retries: OptionalNullable[utils.RetryConfig],
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        accept_header_value: str,
+        http_headers: Optional[Mapping[str, str]],
+        is_async: bool = False,
+    ) -> Tuple[str, operations.PartitionRequest, httpx.Request, _PartitionRetryConfig]:
+        """Builds the request of the `partition` methods.
+
+        Returns the base URL, the unmarshalled request, the HTTP request and
+        the retry config to send it with.
         """
         base_url = None
         url_variables = None
@@ -186,7 +418,8 @@ class General(BaseSDK):
             request = utils.unmarshal(request, operations.PartitionRequest)
         request = cast(operations.PartitionRequest, request)
 
-        req = self._build_request_async(
+        build_request = self._build_request_async if is_async else self._build_request
+        req = build_request(
             method="POST",
             path="/general/v0/general",
             base_url=base_url,
@@ -196,9 +429,7 @@ class General(BaseSDK):
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
-            accept_header_value=accept_header_override.value
-            if accept_header_override is not None
-            else "application/json;q=1, text/csv;q=0",
+            accept_header_value=accept_header_value,
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
@@ -223,25 +454,55 @@ class General(BaseSDK):
         if isinstance(retries, utils.RetryConfig):
             retry_config = (retries, ["5xx"])
 
-        http_res = await self.do_request_async(
-            hook_ctx=HookContext(
-                config=self.sdk_configuration,
-                base_url=base_url or "",
-                operation_id="partition",
-                oauth2_scopes=[],
-                security_source=self.sdk_configuration.security,
-            ),
+        return base_url, request, req, retry_config
+
+    def _get_partition_hook_context(self, base_url: Optional[str]) -> HookContext:
+        return HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="partition",
+            oauth2_scopes=[],
+            security_source=self.sdk_configuration.security,
+        )
+
+    def _do_partition_request(
+        self,
+        base_url: Optional[str],
+        req: httpx.Request,
+        retry_config: _PartitionRetryConfig,
+    ) -> httpx.Response:
+        return self.do_request(
+            hook_ctx=self._get_partition_hook_context(base_url),
             request=req,
             error_status_codes=["422", "4XX", "5XX"],
             retry_config=retry_config,
         )
 
-        response_data: Any = None
+    async def _do_partition_request_async(
+        self,
+        base_url: Optional[str],
+        req: httpx.Request,
+        retry_config: _PartitionRetryConfig,
+    ) -> httpx.Response:
+        return await self.do_request_async(
+            hook_ctx=self._get_partition_hook_context(base_url),
+            request=req,
+            error_status_codes=["422", "4XX", "5XX"],
+            retry_config=retry_config,
+        )
+
+    @staticmethod
+    def _get_partition_response(
+        http_res: httpx.Response,
+    ) -> Optional[operations.PartitionResponse]:
+        """The response of `partition`, `None` if the call failed."""
         if utils.match_response(http_res, "200", "application/json"):
+            # Split PDF results arrive already parsed, skip the JSON round trip.
+            elements = http_res.extensions.get(PARSED_ELEMENTS_EXTENSION_KEY)
             return operations.PartitionResponse(
-                elements=unmarshal_json_response(
-                    Optional[List[Dict[str, Any]]], http_res
-                ),
+                elements=elements
+                if elements is not None
+                else unmarshal_json_response(Optional[List[Dict[str, Any]]], http_res),
                 status_code=http_res.status_code,
                 content_type=http_res.headers.get("Content-Type") or "",
                 raw_response=http_res,
@@ -253,13 +514,32 @@ class General(BaseSDK):
                 content_type=http_res.headers.get("Content-Type") or "",
                 raw_response=http_res,
             )
+        return None
+
+    def _raise_partition_error(self, http_res: httpx.Response) -> NoReturn:
+        """Raises the error of a `partition*` response that is not a success."""
+        http_res_text = None
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = utils.stream_to_text(http_res)
+        self._raise_partition_error_with_text(http_res, http_res_text)
+
+    async def _raise_partition_error_async(self, http_res: httpx.Response) -> NoReturn:
+        http_res_text = None
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+        self._raise_partition_error_with_text(http_res, http_res_text)
+
+    @staticmethod
+    def _raise_partition_error_with_text(
+        http_res: httpx.Response, http_res_text: Optional[str]
+    ) -> NoReturn:
+        response_data: Any = None
         if utils.match_response(http_res, "422", "application/json"):
             response_data = unmarshal_json_response(
                 errors.HTTPValidationErrorData, http_res
             )
             raise errors.HTTPValidationError(response_data, http_res)
-        if utils.match_response(http_res, "4XX", "*"):
-            http_res_text = await utils.stream_to_text_async(http_res)
+        if http_res_text is not None:
             raise errors.SDKError("API error occurred", http_res, http_res_text)
         if utils.match_response(http_res, "5XX", "application/json"):
             response_data = unmarshal_json_response(errors.ServerErrorData, http_res)
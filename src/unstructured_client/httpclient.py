@@ -90,12 +90,18 @@ class ClientOwner(Protocol):
     async_client: Union[AsyncHttpClient, None]
 
 
+class Closeable(Protocol):
+    def close(self) -> None:
+        pass
+
+
 def close_clients(
     owner: ClientOwner,
     sync_client: Union[HttpClient, None],
     sync_client_supplied: bool,
     async_client: Union[AsyncHttpClient, None],
     async_client_supplied: bool,
+    hooks: Optional[Closeable] = None,
 ) -> None:
     """
     A finalizer function that is meant to be used with weakref.finalize to close
@@ -103,6 +109,12 @@ def close_clients(
     collected.
     """
 
+    if hooks is not None:
+        try:
+            hooks.close()
+        except Exception:
+            pass
+
     # Unset the client/async_client properties so there are no more references
     # to them from the owning SDK instance and they can be reaped.
     owner.client = None
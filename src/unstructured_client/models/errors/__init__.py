@@ -5,6 +5,8 @@ from importlib import import_module
 import builtins
 
 if TYPE_CHECKING:
+    from .circuit_open_error import CircuitOpenError
+    from .deadline_exceeded_error import DeadlineExceededError
     from .httpvalidationerror import (
         Detail,
         HTTPValidationError,
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
     from .unstructuredclienterror import UnstructuredClientError
 
 __all__ = [
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "Detail",
     "HTTPValidationError",
     "HTTPValidationErrorData",
@@ -29,6 +33,8 @@ __all__ = [
 ]
 
 _dynamic_imports: dict[str, str] = {
+    "CircuitOpenError": ".circuit_open_error",
+    "DeadlineExceededError": ".deadline_exceeded_error",
     "Detail": ".httpvalidationerror",
     "HTTPValidationError": ".httpvalidationerror",
     "HTTPValidationErrorData": ".httpvalidationerror",
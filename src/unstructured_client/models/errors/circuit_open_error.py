@@ -0,0 +1,21 @@
+from .no_response_error import NoResponseError
+
+
+class CircuitOpenError(NoResponseError):
+    """Error raised instead of sending a request while the circuit of its base
+    URL is open, see `CircuitBreaker`."""
+
+    base_url: str
+    retry_in: float
+
+    def __init__(self, base_url: str, retry_in: float):
+        self.base_url = base_url
+        self.retry_in = retry_in
+        if retry_in > 0:
+            message = (
+                f"Circuit to {base_url} is open after repeated failures, "
+                f"requests are sent again in {retry_in:.1f}s"
+            )
+        else:
+            message = f"Circuit to {base_url} is half-open and waiting for a probe request"
+        super().__init__(message)
@@ -0,0 +1,9 @@
+from .no_response_error import NoResponseError
+
+
+class DeadlineExceededError(NoResponseError):
+    """Error raised instead of sending a request once the deadline of the call
+    has passed, see `utils.deadline`."""
+
+    def __init__(self, message: str = "Deadline passed before the request was sent"):
+        super().__init__(message)
@@ -4,12 +4,21 @@ from .basesdk import BaseSDK
 from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
 from .sdkconfiguration import SDKConfiguration
 from .utils.logger import Logger, get_default_logger
-from .utils.retries import RetryConfig
+from .utils.retries import RetryBudget, RetryConfig, get_retry_budget
 import httpx
 import importlib
 from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union, cast
 from unstructured_client import utils
 from unstructured_client._hooks import SDKHooks
+from unstructured_client._hooks.custom.adaptive_concurrency import AdaptiveConcurrency
+from unstructured_client._hooks.custom.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+)
+from unstructured_client._hooks.custom.hedging import Hedging
+from unstructured_client._hooks.custom.http2 import HTTP2, get_http2
+from unstructured_client._hooks.custom.result_cache import ResultCache
+from unstructured_client._hooks.custom.upload_compression import UploadCompression
 from unstructured_client.models import shared
 from unstructured_client.types import OptionalNullable, UNSET
 import weakref
@@ -52,6 +61,19 @@ class UnstructuredClient(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        split_pdf_limits: Optional[httpx.Limits] = None,
+        split_pdf_workers: Optional[int] = None,
+        split_pdf_adaptive_concurrency: Union[bool, AdaptiveConcurrency, None] = None,
+        split_pdf_request_budget: Optional[int] = None,
+        split_pdf_checkpoints: bool = False,
+        split_pdf_hedging: Union[bool, Hedging, None] = None,
+        split_pdf_cost_aware_chunking: bool = False,
+        split_pdf_memory_budget: Optional[int] = None,
+        partition_cache: Optional[ResultCache] = None,
+        upload_compression: Union[bool, UploadCompression, None] = None,
+        http2: Union[bool, HTTP2, None] = None,
+        retry_budget: Union[bool, RetryBudget, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -63,10 +85,25 @@ class UnstructuredClient(BaseSDK):
         :param async_client: The Async HTTP client to use for all asynchronous methods
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
+        :param split_pdf_limits: Connection pool limits for the split PDF page requests, shared by all partition calls of this client
+        :param split_pdf_workers: Number of worker processes used to split PDFs into pages, 0 (the default) splits in the calling thread
+        :param split_pdf_adaptive_concurrency: Adapt the number of concurrent split PDF page requests to the server load, starting at `split_pdf_concurrency_level`. Pass `True` for the default settings or an `AdaptiveConcurrency`
+        :param split_pdf_request_budget: Maximum number of split PDF page requests in flight per API URL, shared fairly by all partition calls of this client
+        :param split_pdf_checkpoints: Journal the completed split PDF page requests in `split_pdf_cache_tmp_data_dir`, so a failed partition call of the same file and parameters resumes where it stopped
+        :param split_pdf_hedging: Send a duplicate of split PDF page requests that take longer than most pages of the same document, and use the first response. Pass `True` for the default settings or a `Hedging`
+        :param split_pdf_cost_aware_chunking: Balance the split PDF chunks by the estimated processing time of their pages instead of their page count, and send the heaviest chunks first
+        :param split_pdf_memory_budget: Maximum number of bytes of split PDF chunks and page results held in memory across all partition calls of this client. Calls without `split_pdf_cache_tmp_data` keep them in memory until the budget is spent and write the rest to `split_pdf_cache_tmp_data_dir`
+        :param partition_cache: Cache of partition results keyed by the document content and parameters, see `MemoryResultCache` and `DirectoryResultCache`. Split PDFs are cached per page request as well
+        :param upload_compression: Gzip compress the files of partition calls and the split PDF chunks when it makes them smaller, see `UploadCompression`. Pass `True` for the default settings
+        :param http2: Use HTTP/2 for the default clients and multiplex the split PDF page requests over few connections, falling back to HTTP/1.1 if the server or the installed packages do not support it. Pass `True` for the default settings or an `HTTP2`
+        :param retry_budget: Limit the retries of all requests of this client, split PDF page requests included, to a share of the requests that succeed, see `RetryBudget`. Pass `True` for the default settings
+        :param circuit_breaker: Fail requests fast, without sending them, while the API at their base URL keeps failing, and probe it again after a while, see `CircuitBreaker`. Pass `True` for the default settings
         """
+        http2 = get_http2(http2)
+
         client_supplied = True
         if client is None:
-            client = httpx.Client()
+            client = httpx.Client(http2=http2 is not None)
             client_supplied = False
 
         assert issubclass(
@@ -75,7 +112,7 @@ class UnstructuredClient(BaseSDK):
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient()
+            async_client = httpx.AsyncClient(http2=http2 is not None)
             async_client_supplied = False
 
         if debug_logger is None:
@@ -109,6 +146,19 @@ class UnstructuredClient(BaseSDK):
                 retry_config=retry_config,
                 timeout_ms=timeout_ms,
                 debug_logger=debug_logger,
+                split_pdf_limits=split_pdf_limits,
+                split_pdf_workers=split_pdf_workers,
+                split_pdf_adaptive_concurrency=split_pdf_adaptive_concurrency,
+                split_pdf_request_budget=split_pdf_request_budget,
+                split_pdf_checkpoints=split_pdf_checkpoints,
+                split_pdf_hedging=split_pdf_hedging,
+                split_pdf_cost_aware_chunking=split_pdf_cost_aware_chunking,
+                split_pdf_memory_budget=split_pdf_memory_budget,
+                partition_cache=partition_cache,
+                upload_compression=upload_compression,
+                http2=http2,
+                retry_budget=get_retry_budget(retry_budget),
+                circuit_breaker=get_circuit_breaker(circuit_breaker),
             ),
         )
 
@@ -132,6 +182,7 @@ class UnstructuredClient(BaseSDK):
             self.sdk_configuration.client_supplied,
             self.sdk_configuration.async_client,
             self.sdk_configuration.async_client_supplied,
+            hooks,
         )
 
     def __getattr__(self, name: str):
@@ -174,6 +225,7 @@ class UnstructuredClient(BaseSDK):
         ):
             self.sdk_configuration.client.close()
         self.sdk_configuration.client = None
+        self.sdk_configuration.__dict__["_hooks"].close()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if (
@@ -182,3 +234,4 @@ class UnstructuredClient(BaseSDK):
         ):
             await self.sdk_configuration.async_client.aclose()
         self.sdk_configuration.async_client = None
+        self.sdk_configuration.__dict__["_hooks"].close()
@@ -7,13 +7,26 @@ from ._version import (
     __version__,
 )
 from .httpclient import AsyncHttpClient, HttpClient
-from .utils import Logger, RetryConfig, remove_suffix
+from .utils import Logger, RetryBudget, RetryConfig, remove_suffix
 from dataclasses import dataclass
+import httpx
 from pydantic import Field
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, TYPE_CHECKING, Tuple, Union
 from unstructured_client.models import shared
 from unstructured_client.types import OptionalNullable, UNSET
 
+if TYPE_CHECKING:
+    from unstructured_client._hooks.custom.adaptive_concurrency import (
+        AdaptiveConcurrency,
+    )
+    from unstructured_client._hooks.custom.circuit_breaker import CircuitBreaker
+    from unstructured_client._hooks.custom.hedging import Hedging
+    from unstructured_client._hooks.custom.http2 import HTTP2
+    from unstructured_client._hooks.custom.result_cache import ResultCache
+    from unstructured_client._hooks.custom.upload_compression import (
+        UploadCompression,
+    )
+
 
 SERVER_PLATFORM_API = "platform-api"
 r"""Unstructured Platform API"""
@@ -40,6 +53,19 @@ class SDKConfiguration:
     user_agent: str = __user_agent__
     retry_config: OptionalNullable[RetryConfig] = Field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = None
+    split_pdf_limits: Optional[httpx.Limits] = None
+    split_pdf_workers: Optional[int] = None
+    split_pdf_adaptive_concurrency: Union[bool, "AdaptiveConcurrency", None] = None
+    split_pdf_request_budget: Optional[int] = None
+    split_pdf_checkpoints: bool = False
+    split_pdf_hedging: Union[bool, "Hedging", None] = None
+    split_pdf_cost_aware_chunking: bool = False
+    split_pdf_memory_budget: Optional[int] = None
+    partition_cache: Optional["ResultCache"] = None
+    upload_compression: Union[bool, "UploadCompression", None] = None
+    http2: Union[bool, "HTTP2", None] = None
+    retry_budget: Optional[RetryBudget] = None
+    circuit_breaker: Optional["CircuitBreaker"] = None
 
     def get_server_details(self) -> Tuple[str, Dict[str, str]]:
         if self.server_url is not None and self.server_url:
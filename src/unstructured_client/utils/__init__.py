@@ -7,6 +7,7 @@ import builtins
 if TYPE_CHECKING:
     from .annotations import get_discriminator
     from .datetimes import parse_datetime
+    from .deadlines import Deadline, deadline, get_deadline
     from .enums import OpenEnumMeta
     from .headers import get_headers, get_response_headers
     from .metadata import (
@@ -21,7 +22,14 @@ if TYPE_CHECKING:
         SecurityMetadata,
     )
     from .queryparams import get_query_params
-    from .retries import BackoffStrategy, Retries, retry, retry_async, RetryConfig
+    from .retries import (
+        BackoffStrategy,
+        Retries,
+        retry,
+        retry_async,
+        RetryBudget,
+        RetryConfig,
+    )
     from .requestbodies import serialize_request_body, SerializedRequestBody
     from .security import get_security
     from .serializers import (
@@ -54,6 +62,8 @@ if TYPE_CHECKING:
 
 __all__ = [
     "BackoffStrategy",
+    "Deadline",
+    "deadline",
     "FieldMetadata",
     "find_metadata",
     "FormMetadata",
@@ -62,6 +72,7 @@ __all__ = [
     "get_default_logger",
     "get_discriminator",
     "parse_datetime",
+    "get_deadline",
     "get_global_from_env",
     "get_headers",
     "get_pydantic_model",
@@ -82,6 +93,7 @@ __all__ = [
     "Retries",
     "retry",
     "retry_async",
+    "RetryBudget",
     "RetryConfig",
     "RequestMetadata",
     "SecurityMetadata",
@@ -107,6 +119,8 @@ __all__ = [
 
 _dynamic_imports: dict[str, str] = {
     "BackoffStrategy": ".retries",
+    "Deadline": ".deadlines",
+    "deadline": ".deadlines",
     "FieldMetadata": ".metadata",
     "find_metadata": ".metadata",
     "FormMetadata": ".metadata",
@@ -115,6 +129,7 @@ _dynamic_imports: dict[str, str] = {
     "get_default_logger": ".logger",
     "get_discriminator": ".annotations",
     "parse_datetime": ".datetimes",
+    "get_deadline": ".deadlines",
     "get_global_from_env": ".values",
     "get_headers": ".headers",
     "get_pydantic_model": ".serializers",
@@ -135,6 +150,7 @@ _dynamic_imports: dict[str, str] = {
     "Retries": ".retries",
     "retry": ".retries",
     "retry_async": ".retries",
+    "RetryBudget": ".retries",
     "RetryConfig": ".retries",
     "RequestMetadata": ".metadata",
     "SecurityMetadata": ".metadata",
@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Mapping, Optional
+
+
+class Deadline:
+    """A point in time by which calls must be done, `timeout` seconds from
+    now, see `deadline`."""
+
+    def __init__(self, timeout: float):
+        if timeout < 0:
+            raise ValueError(f"timeout must be >= 0, got {timeout}")
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """The seconds left until the deadline, 0 once it has passed."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def clamp_timeout(
+        self, timeout: Optional[Mapping[str, Optional[float]]]
+    ) -> Dict[str, Optional[float]]:
+        """Shortens the httpx `timeout` extension of a request so it ends by
+        the deadline."""
+        remaining = self.remaining()
+        if timeout is None:
+            timeout = dict.fromkeys(("connect", "read", "write", "pool"))
+        return {
+            key: remaining if value is None else min(value, remaining)
+            for key, value in timeout.items()
+        }
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "unstructured_client_deadline", default=None
+)
+
+
+def get_deadline() -> Optional[Deadline]:
+    """The deadline of the calls made in the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[Deadline]:
+    """Bounds every SDK call made in the block, sync or async, to end within
+    `timeout` seconds.
+
+    Retries that would sleep past the deadline are not made, the timeouts of
+    each request are shortened to the time left, and split PDF page requests
+    that have not finished by then are cancelled. Calls started after the
+    deadline raise `DeadlineExceededError` without sending anything. Nested
+    blocks keep the earlier deadline.
+    """
+    current = _current_deadline.get()
+    new_deadline = Deadline(timeout)
+    if current is not None and current.expires_at < new_deadline.expires_at:
+        new_deadline = current
+    token = _current_deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _current_deadline.reset(token)
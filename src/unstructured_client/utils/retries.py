@@ -2,11 +2,36 @@
 
 import asyncio
 import random
+import threading
 import time
-from typing import List
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Union
 
 import httpx
 
+from .deadlines import Deadline
+
+# Retries of concurrent requests to a host that asked to wait are spread this
+# many seconds apart once the wait is over.
+RETRY_AFTER_SPACING_SECONDS = 0.1
+# Reset values of rate limit headers above this are Unix timestamps.
+RATE_LIMIT_RESET_EPOCH_THRESHOLD = 10**9
+RATE_LIMIT_HEADERS = (
+    ("ratelimit-remaining", "ratelimit-reset"),
+    ("x-ratelimit-remaining", "x-ratelimit-reset"),
+)
+
+# Jitter of the backoff, see `get_backoff_seconds`.
+ADDITIVE_JITTER = "additive"
+FULL_JITTER = "full_jitter"
+EQUAL_JITTER = "equal_jitter"
+DECORRELATED_JITTER = "decorrelated_jitter"
+JITTERS = (ADDITIVE_JITTER, FULL_JITTER, EQUAL_JITTER, DECORRELATED_JITTER)
+# Decorrelated jitter draws the next sleep up to this many times the last one.
+DECORRELATED_JITTER_MULTIPLIER = 3
+
 
 class BackoffStrategy:
     initial_interval: int
@@ -15,6 +40,7 @@ class BackoffStrategy:
     max_elapsed_time: int
     min_attempts: int
     absolute_max_elapsed_time_ms: int | None
+    jitter: str
 
     def __init__(
         self,
@@ -24,10 +50,16 @@ class BackoffStrategy:
         max_elapsed_time: int,
         min_attempts: int = 0,
         absolute_max_elapsed_time_ms: int | None = None,
+        jitter: str = ADDITIVE_JITTER,
     ):
         # min_attempts counts retries (not the initial attempt).
         # absolute_max_elapsed_time_ms caps when a new retry can start;
         # it does not interrupt in-flight func() calls.
+        # jitter is one of JITTERS, see get_backoff_seconds.
+        if jitter not in JITTERS:
+            raise ValueError(
+                f"jitter must be one of {', '.join(JITTERS)}, got {jitter!r}"
+            )
         if min_attempts < 0:
             raise ValueError(
                 f"min_attempts must be >= 0, got {min_attempts}"
@@ -49,6 +81,7 @@ class BackoffStrategy:
         self.max_elapsed_time = max_elapsed_time
         self.min_attempts = min_attempts
         self.absolute_max_elapsed_time_ms = absolute_max_elapsed_time_ms
+        self.jitter = jitter
 
 
 class RetryConfig:
@@ -64,13 +97,134 @@ class RetryConfig:
         self.retry_connection_errors = retry_connection_errors
 
 
+@dataclass(frozen=True)
+class RetryBudgetStats:
+    """Counters of a `RetryBudget`.
+
+    Attributes:
+        successes: Attempts that did not need a retry.
+        retries: Retries the budget allowed.
+        exhausted: Retries refused because the budget was spent.
+    """
+
+    successes: int = 0
+    retries: int = 0
+    exhausted: int = 0
+
+
+class RetryBudget:
+    """A token bucket shared by the requests of a client that limits their
+    retries to a share of the successful traffic.
+
+    Every attempt that does not need a retry deposits `ratio` tokens and every
+    retry withdraws one. `min_retries_per_second` tokens are added over time, so
+    a client sending few requests can still retry, and the balance never
+    exceeds `max_tokens`, which it starts at. Once the bucket is empty a request
+    gives up instead of retrying, with the last response or error, even before
+    `min_attempts` retries. Requests may retry on different threads and event
+    loops, so the bucket is guarded by a lock.
+
+    Args:
+        ratio: Retries allowed per successful attempt.
+        min_retries_per_second: Retries allowed per second whatever the
+            traffic.
+        max_tokens: The most retries that can be saved up.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must not be negative")
+        if min_retries_per_second < 0:
+            raise ValueError("min_retries_per_second must not be negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._tokens = max_tokens
+        self._refilled_at = time.monotonic()
+        self._stats = RetryBudgetStats()
+
+    @property
+    def stats(self) -> RetryBudgetStats:
+        """The counters of all requests using this budget."""
+        return self._stats
+
+    @property
+    def tokens(self) -> float:
+        """The number of retries the budget allows right now."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def record_success(self) -> None:
+        """Deposits the share of a retry earned by a successful attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+            self._stats = RetryBudgetStats(
+                successes=self._stats.successes + 1,
+                retries=self._stats.retries,
+                exhausted=self._stats.exhausted,
+            )
+
+    def try_retry(self) -> bool:
+        """Withdraws a retry, False if the budget is spent."""
+        with self._lock:
+            self._refill()
+            allowed = self._tokens >= 1
+            if allowed:
+                self._tokens -= 1
+            self._stats = RetryBudgetStats(
+                successes=self._stats.successes,
+                retries=self._stats.retries + allowed,
+                exhausted=self._stats.exhausted + (not allowed),
+            )
+            return allowed
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(
+            self._tokens + elapsed * self.min_retries_per_second, self.max_tokens
+        )
+
+
+def get_retry_budget(
+    retry_budget: Union[bool, RetryBudget, None],
+) -> Optional[RetryBudget]:
+    """Resolves the `retry_budget` client option."""
+    if isinstance(retry_budget, RetryBudget):
+        return retry_budget
+    if retry_budget is True:
+        return RetryBudget()
+    return None
+
+
 class Retries:
     config: RetryConfig
     status_codes: List[str]
+    budget: Optional[RetryBudget]
+    deadline: Optional[Deadline]
 
-    def __init__(self, config: RetryConfig, status_codes: List[str]):
+    def __init__(
+        self,
+        config: RetryConfig,
+        status_codes: List[str],
+        budget: Optional[RetryBudget] = None,
+        deadline: Optional[Deadline] = None,
+    ):
         self.config = config
         self.status_codes = status_codes
+        self.budget = budget
+        self.deadline = deadline
 
 
 class TemporaryError(Exception):
@@ -128,6 +282,9 @@ def retry(func, retries: Retries):
             retries.config.backoff.max_elapsed_time,
             retries.config.backoff.min_attempts,
             retries.config.backoff.absolute_max_elapsed_time_ms,
+            retries.budget,
+            retries.config.backoff.jitter,
+            retries.deadline,
         )
 
     return func()
@@ -174,11 +331,178 @@ async def retry_async(func, retries: Retries):
             retries.config.backoff.max_elapsed_time,
             retries.config.backoff.min_attempts,
             retries.config.backoff.absolute_max_elapsed_time_ms,
+            retries.budget,
+            retries.config.backoff.jitter,
+            retries.deadline,
         )
 
     return await func()
 
 
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(retry_at.timestamp() - now, 0.0)
+
+
+def _parse_rate_limit_reset(value: str, now: float) -> Optional[float]:
+    try:
+        reset = float(value.strip())
+    except ValueError:
+        return None
+    if reset > RATE_LIMIT_RESET_EPOCH_THRESHOLD:
+        reset -= now
+    return max(reset, 0.0)
+
+
+def get_retry_after(response: httpx.Response) -> Optional[float]:
+    """Returns the seconds the server asked to wait before the next request,
+    from `Retry-After` or from the reset time of a spent rate limit."""
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, httpx.Headers):
+        return None
+    now = time.time()
+    if (retry_after := headers.get("retry-after")) is not None:
+        return _parse_retry_after(retry_after, now)
+    for remaining_header, reset_header in RATE_LIMIT_HEADERS:
+        remaining = headers.get(remaining_header)
+        reset = headers.get(reset_header)
+        if remaining is not None and reset is not None and remaining.strip() == "0":
+            return _parse_rate_limit_reset(reset, now)
+    return None
+
+
+def _get_host(response: httpx.Response) -> Optional[str]:
+    try:
+        netloc = response.request.url.netloc
+    except RuntimeError:
+        # The response was not sent by a client.
+        return None
+    return netloc.decode("ascii") if isinstance(netloc, bytes) else None
+
+
+class RetryAfterGate:
+    """Schedules retries to hosts that asked clients to wait.
+
+    Once a response of a host carries `Retry-After` or a spent rate limit, the
+    retries of every request to that host wait until the time it gave, and are
+    then spread `RETRY_AFTER_SPACING_SECONDS` apart so they do not all hit the
+    host at once. Requests may retry on different threads, so the schedule is
+    guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._not_before: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def schedule(
+        self,
+        host: Optional[str],
+        delay: float,
+        retry_after: Optional[float],
+        reserve: bool = True,
+    ) -> float:
+        """Returns the seconds to sleep before retrying a request to `host`,
+        at least `delay`. The retry takes the slot at that time unless
+        `reserve` is false, for retries that may not be made."""
+        if host is None:
+            return delay
+        with self._lock:
+            now = time.time()
+            if retry_after is not None:
+                self._not_before[host] = max(
+                    self._not_before.get(host, now), now + retry_after
+                )
+            not_before = self._not_before.get(host)
+            if not_before is None or not_before <= now:
+                self._not_before.pop(host, None)
+                self._next_slot.pop(host, None)
+                return delay
+            slot = max(not_before, self._next_slot.get(host, not_before))
+            retry_at = max(now + delay, slot)
+            if reserve:
+                self._next_slot[host] = retry_at + RETRY_AFTER_SPACING_SECONDS
+            return retry_at - now
+
+
+retry_after_gate = RetryAfterGate()
+
+
+def get_backoff_seconds(
+    initial_interval: int,
+    max_interval: int,
+    exponent: float,
+    retries: int,
+    jitter: str = ADDITIVE_JITTER,
+    previous_seconds: Optional[float] = None,
+) -> float:
+    """Returns the seconds to back off before retry number `retries` + 1.
+
+    The backoff grows from `initial_interval` by `exponent` per retry up to
+    `max_interval`, both in milliseconds, and `jitter` spreads it:
+
+    - `additive` adds up to a second, so clients that failed together retry
+      within the same second.
+    - `full_jitter` draws the backoff between 0 and the exponential value.
+    - `equal_jitter` keeps half of the exponential value and draws the rest.
+    - `decorrelated_jitter` draws between `initial_interval` and three times
+      `previous_seconds`, the last backoff, so it grows without a schedule
+      shared by the clients.
+    """
+    base = initial_interval / 1000
+    cap = max_interval / 1000
+    if jitter == DECORRELATED_JITTER:
+        previous = base if previous_seconds is None else previous_seconds
+        upper = max(previous * DECORRELATED_JITTER_MULTIPLIER, base)
+        return min(random.uniform(base, upper), cap)
+    if jitter == ADDITIVE_JITTER:
+        return min(base * exponent**retries + random.uniform(0, 1), cap)
+    exponential = min(base * exponent**retries, cap)
+    if jitter == FULL_JITTER:
+        return random.uniform(0, exponential)
+    if jitter == EQUAL_JITTER:
+        return exponential / 2 + random.uniform(0, exponential / 2)
+    raise ValueError(f"Unknown jitter {jitter!r}")
+
+
+def _get_sleep_seconds(exception, backoff_seconds):
+    """Returns the seconds to sleep before the next attempt, and whether the
+    server asked for them."""
+    sleep_seconds = backoff_seconds
+    if not isinstance(exception, TemporaryError):
+        return sleep_seconds, False
+
+    retry_after = get_retry_after(exception.response)
+    if retry_after is not None:
+        # The server knows when it can take the request, even past max_interval.
+        sleep_seconds = retry_after
+    # The slot is only taken once the retry is sure to be made.
+    sleep_seconds = retry_after_gate.schedule(
+        _get_host(exception.response), sleep_seconds, retry_after, reserve=False
+    )
+    return sleep_seconds, retry_after is not None
+
+
+def _reserve_sleep_seconds(exception, sleep_seconds):
+    """Takes the slot of the retry after `_get_sleep_seconds`, a later one if
+    another retry to the host took it meanwhile."""
+    if not isinstance(exception, TemporaryError):
+        return sleep_seconds
+    return retry_after_gate.schedule(
+        _get_host(exception.response), sleep_seconds, None
+    )
+
+
 def _cap_hit_after_attempt(
     elapsed_ms,
     retries,
@@ -212,13 +536,20 @@ def retry_with_backoff(
     max_elapsed_time=3600000,
     min_attempts=0,
     absolute_max_elapsed_time_ms=None,
+    budget=None,
+    jitter=ADDITIVE_JITTER,
+    deadline=None,
 ):
     start = round(time.time() * 1000)
     retries = 0
+    backoff_seconds = None
 
     while True:
         try:
-            return func()
+            res = func()
+            if budget is not None:
+                budget.record_success()
+            return res
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
@@ -237,11 +568,30 @@ def retry_with_backoff(
                 )
                 return result
 
-            sleep_seconds = (
-                (initial_interval / 1000) * exponent**retries
-                + random.uniform(0, 1)
+            backoff_seconds = get_backoff_seconds(
+                initial_interval,
+                max_interval,
+                exponent,
+                retries,
+                jitter,
+                backoff_seconds,
             )
-            sleep_seconds = min(sleep_seconds, max_interval / 1000)
+            sleep_seconds, server_directed = _get_sleep_seconds(
+                exception, backoff_seconds
+            )
+
+            if (
+                server_directed
+                and retries >= min_attempts
+                and elapsed + int(sleep_seconds * 1000) > max_elapsed_time
+            ):
+                result = _raise_or_return_after_cap(
+                    exception,
+                    elapsed,
+                    retries,
+                    " (Retry-After exceeds max_elapsed_time)",
+                )
+                return result
 
             if absolute_max_elapsed_time_ms is not None:
                 projected_elapsed = elapsed + int(sleep_seconds * 1000)
@@ -254,6 +604,22 @@ def retry_with_backoff(
                     )
                     return result
 
+            if deadline is not None and sleep_seconds >= deadline.remaining():
+                result = _raise_or_return_after_cap(
+                    exception,
+                    elapsed,
+                    retries,
+                    " (deadline would pass during backoff)",
+                )
+                return result
+
+            if budget is not None and not budget.try_retry():
+                result = _raise_or_return_after_cap(
+                    exception, elapsed, retries, " (retry budget exhausted)"
+                )
+                return result
+
+            sleep_seconds = _reserve_sleep_seconds(exception, sleep_seconds)
             time.sleep(sleep_seconds)
 
             if absolute_max_elapsed_time_ms is not None:
@@ -278,13 +644,20 @@ async def retry_with_backoff_async(
     max_elapsed_time=3600000,
     min_attempts=0,
     absolute_max_elapsed_time_ms=None,
+    budget=None,
+    jitter=ADDITIVE_JITTER,
+    deadline=None,
 ):
     start = round(time.time() * 1000)
     retries = 0
+    backoff_seconds = None
 
     while True:
         try:
-            return await func()
+            res = await func()
+            if budget is not None:
+                budget.record_success()
+            return res
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
@@ -303,11 +676,30 @@ async def retry_with_backoff_async(
                 )
                 return result
 
-            sleep_seconds = (
-                (initial_interval / 1000) * exponent**retries
-                + random.uniform(0, 1)
+            backoff_seconds = get_backoff_seconds(
+                initial_interval,
+                max_interval,
+                exponent,
+                retries,
+                jitter,
+                backoff_seconds,
             )
-            sleep_seconds = min(sleep_seconds, max_interval / 1000)
+            sleep_seconds, server_directed = _get_sleep_seconds(
+                exception, backoff_seconds
+            )
+
+            if (
+                server_directed
+                and retries >= min_attempts
+                and elapsed + int(sleep_seconds * 1000) > max_elapsed_time
+            ):
+                result = _raise_or_return_after_cap(
+                    exception,
+                    elapsed,
+                    retries,
+                    " (Retry-After exceeds max_elapsed_time)",
+                )
+                return result
 
             if absolute_max_elapsed_time_ms is not None:
                 projected_elapsed = elapsed + int(sleep_seconds * 1000)
@@ -320,6 +712,22 @@ async def retry_with_backoff_async(
                     )
                     return result
 
+            if deadline is not None and sleep_seconds >= deadline.remaining():
+                result = _raise_or_return_after_cap(
+                    exception,
+                    elapsed,
+                    retries,
+                    " (deadline would pass during backoff)",
+                )
+                return result
+
+            if budget is not None and not budget.try_retry():
+                result = _raise_or_return_after_cap(
+                    exception, elapsed, retries, " (retry budget exhausted)"
+                )
+                return result
+
+            sleep_seconds = _reserve_sleep_seconds(exception, sleep_seconds)
             await asyncio.sleep(sleep_seconds)
 
             if absolute_max_elapsed_time_ms is not None: